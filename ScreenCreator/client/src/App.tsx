@@ -57,7 +57,7 @@ function PageTracker() {
   const [location] = useLocation();
 
   useEffect(() => {
-    apiRequest("POST", "/api/view", { path: location }).catch(() => { });
+    apiRequest("POST", `/api/view?path=${encodeURIComponent(location)}`).catch(() => { });
   }, [location]);
 
   return null;
@@ -153,12 +153,13 @@ export default function ChatDialog({ profile, isOpen, onClose, currentFormData }
       if (response.ok) {
         const data = await response.json();
         console.log("Chat response data:", data);
-        // Replace all messages with server state to ensure consistency and get AI response
-        setMessages(data.messages || data || []);
+        // The server returns only this turn's messages: swap them in for the optimistic one
+        const turnMessages: ChatMessage[] = data.messages || [];
+        setMessages((prev) => [...prev.filter(msg => msg.id !== tempMessageId), ...turnMessages]);
 
         // Log the user message
         try {
-          const logRes = await fetch("/api/chat-logs", {
+          const logRes = await fetch("/api/chat/logs", {
             method: "POST",
             headers: { "Content-Type": "application/json" },
             body: JSON.stringify({
@@ -175,10 +176,10 @@ export default function ChatDialog({ profile, isOpen, onClose, currentFormData }
         }
 
         // Log the assistant's response
-        const lastMessage = data.messages[data.messages.length - 1];
+        const lastMessage = turnMessages[turnMessages.length - 1];
         if (lastMessage && lastMessage.role === "assistant") {
           try {
-            const logRes = await fetch("/api/chat-logs", {
+            const logRes = await fetch("/api/chat/logs", {
               method: "POST",
               headers: { "Content-Type": "application/json" },
               body: JSON.stringify({
@@ -1,6 +1,7 @@
 import { X } from "lucide-react";
 import type { ChatLog } from "@shared/schema";
 import { useEffect, useState } from "react";
+import { getChatLogs } from "@/lib/api";
 
 interface ChatLogsViewerProps {
   isOpen: boolean;
@@ -9,22 +10,22 @@ interface ChatLogsViewerProps {
 
 export default function ChatLogsViewer({ isOpen, onClose }: ChatLogsViewerProps) {
   const [logs, setLogs] = useState<ChatLog[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
 
   useEffect(() => {
     if (isOpen) {
-      loadLogs();
+      loadLogs(null);
     }
   }, [isOpen]);
 
-  const loadLogs = async () => {
+  // Pages of 100, newest first; older pages load on demand
+  const loadLogs = async (cursor: string | null) => {
     setLoading(true);
     try {
-      const response = await fetch("/api/chat-logs");
-      if (response.ok) {
-        const data = await response.json();
-        setLogs(data);
-      }
+      const page = await getChatLogs(cursor);
+      setLogs((prev) => (cursor ? [...prev, ...page.items] : page.items));
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error("Error loading chat logs:", error);
     } finally {
@@ -57,7 +58,7 @@ export default function ChatLogsViewer({ isOpen, onClose }: ChatLogsViewerProps)
         </div>
 
         <div className="flex-1 overflow-y-auto p-6 space-y-6">
-          {loading ? (
+          {loading && logs.length === 0 ? (
             <div className="flex items-center justify-center h-full">
               <p className="text-gray-500">Загрузка логов...</p>
             </div>
@@ -100,6 +101,15 @@ export default function ChatLogsViewer({ isOpen, onClose }: ChatLogsViewerProps)
               </div>
             ))
           )}
+          {nextCursor && (
+            <button
+              onClick={() => loadLogs(nextCursor)}
+              disabled={loading}
+              className="w-full py-3 text-blue-600 text-sm font-medium hover:underline disabled:text-gray-400"
+            >
+              {loading ? "Загрузка..." : "Показать более ранние"}
+            </button>
+          )}
         </div>
       </div>
     </div>
@@ -70,7 +70,7 @@ export default function SpecialistChatDialog({ profile, isOpen, onClose }: Speci
           
           // Log user message
           try {
-            const userLogRes = await fetch("/api/chat-logs", {
+            const userLogRes = await fetch("/api/chat/logs", {
               method: "POST",
               headers: { "Content-Type": "application/json" },
               body: JSON.stringify({
@@ -88,7 +88,7 @@ export default function SpecialistChatDialog({ profile, isOpen, onClose }: Speci
           
           // Log specialist reply
           try {
-            const specialistLogRes = await fetch("/api/chat-logs", {
+            const specialistLogRes = await fetch("/api/chat/logs", {
               method: "POST",
               headers: { "Content-Type": "application/json" },
               body: JSON.stringify({
@@ -0,0 +1,15 @@
+import { useEffect } from 'react';
+import { prefetchTraining } from '@/lib/prefetch';
+
+/**
+ * Prefetch a training's media while its intro screen is shown.
+ * Skipped in development, where files are served unhashed by Vite.
+ */
+export function usePrefetchTraining(trainingId: string, enabled: boolean = true) {
+    useEffect(() => {
+        if (!enabled || import.meta.env.DEV) return;
+        const controller = new AbortController();
+        prefetchTraining(trainingId, { signal: controller.signal });
+        return () => controller.abort();
+    }, [trainingId, enabled]);
+}
@@ -26,6 +26,28 @@ export async function updateProfile(id: string, data: any) {
     return res.json();
 }
 
+export interface ProfileListParams {
+    profileType?: string | null;
+    q?: string;
+    fields?: string[];
+    limit?: number;
+    cursor?: string | null;
+}
+
+export async function listProfiles({ profileType, q, fields, limit, cursor }: ProfileListParams = {}) {
+    const params = new URLSearchParams();
+    if (profileType) params.set("profileType", profileType);
+    if (q) params.set("q", q);
+    if (fields?.length) params.set("fields", fields.join(","));
+    if (limit) params.set("limit", String(limit));
+    if (cursor) params.set("cursor", cursor);
+    const res = await fetch(`/api/profiles?${params}`);
+    if (!res.ok) {
+        throw new Error("Failed to fetch profiles");
+    }
+    return res.json() as Promise<{ items: any[]; nextCursor: string | null }>;
+}
+
 export async function getProfile(id: string) {
     const res = await fetch(`/api/profiles/${id}`);
     if (!res.ok) {
@@ -68,10 +90,12 @@ export async function sendMessage(profileId: string, message: string, chatSystem
     return res.json();
 }
 
-export async function getChatLogs() {
-    const res = await fetch("/api/chat/logs");
+export async function getChatLogs(cursor?: string | null, limit = 100) {
+    const params = new URLSearchParams({ limit: String(limit) });
+    if (cursor) params.set("cursor", cursor);
+    const res = await fetch(`/api/chat/logs?${params}`);
     if (!res.ok) {
         throw new Error("Failed to fetch chat logs");
     }
-    return res.json();
+    return res.json() as Promise<{ items: any[]; nextCursor: string | null }>;
 }
@@ -0,0 +1,628 @@
+// Generated by scripts/publish_assets.py, do not edit by hand.
+
+export interface AssetEntry {
+    url: string;
+    size: number;
+    duration?: number;
+}
+
+export const assetManifest: Record<string, AssetEntry> = {
+    "/auditory-test/audio/airplane.mp3": { url: "/media/auditory-test/audio/airplane.affc7899.mp3", size: 9408, duration: 1.18 },
+    "/auditory-test/audio/animals/bat.mp3": { url: "/media/auditory-test/audio/animals/bat.a4dd8b30.mp3", size: 212322, duration: 13.27 },
+    "/auditory-test/audio/animals/bear.mp3": { url: "/media/auditory-test/audio/animals/bear.0fdce000.mp3", size: 71684, duration: 4.48 },
+    "/auditory-test/audio/animals/bee.mp3": { url: "/media/auditory-test/audio/animals/bee.086a7d9d.mp3", size: 45138, duration: 2.82 },
+    "/auditory-test/audio/animals/bird.mp3": { url: "/media/auditory-test/audio/animals/bird.35f0dfe8.mp3", size: 22466, duration: 3.2 },
+    "/auditory-test/audio/animals/bird.wav": { url: "/media/auditory-test/audio/animals/bird.3737474a.wav", size: 132344, duration: 1.5 },
+    "/auditory-test/audio/animals/bird_2.mp3": { url: "/media/auditory-test/audio/animals/bird_2.5f05f8c6.mp3", size: 18877, duration: 2.69 },
+    "/auditory-test/audio/animals/bird_2.wav": { url: "/media/auditory-test/audio/animals/bird_2.922b6e43.wav", size: 132344, duration: 1.5 },
+    "/auditory-test/audio/animals/bird_3.mp3": { url: "/media/auditory-test/audio/animals/bird_3.514aa174.mp3", size: 37265, duration: 5.32 },
+    "/auditory-test/audio/animals/bird_3.wav": { url: "/media/auditory-test/audio/animals/bird_3.491df3d5.wav", size: 264644, duration: 3.0 },
+    "/auditory-test/audio/animals/bird_4.mp3": { url: "/media/auditory-test/audio/animals/bird_4.573320dd.mp3", size: 55609, duration: 7.94 },
+    "/auditory-test/audio/animals/bird_4.wav": { url: "/media/auditory-test/audio/animals/bird_4.84a65147.wav", size: 308744, duration: 3.5 },
+    "/auditory-test/audio/animals/butterfly.mp3": { url: "/media/auditory-test/audio/animals/butterfly.bae46770.mp3", size: 240743, duration: 15.05 },
+    "/auditory-test/audio/animals/camel.mp3": { url: "/media/auditory-test/audio/animals/camel.c7e0c7a4.mp3", size: 65618, duration: 4.1 },
+    "/auditory-test/audio/animals/cat.mp3": { url: "/media/auditory-test/audio/animals/cat.aacca9db.mp3", size: 60309, duration: 12.05 },
+    "/auditory-test/audio/animals/cat.wav": { url: "/media/auditory-test/audio/animals/cat.934ae215.wav", size: 358444, duration: 11.2 },
+    "/auditory-test/audio/animals/cat_2.mp3": { url: "/media/auditory-test/audio/animals/cat_2.1d3e1a6c.mp3", size: 63621, duration: 12.72 },
+    "/auditory-test/audio/animals/cat_2.wav": { url: "/media/auditory-test/audio/animals/cat_2.ef310a0a.wav", size: 300460, duration: 9.39 },
+    "/auditory-test/audio/animals/cat_3.mp3": { url: "/media/auditory-test/audio/animals/cat_3.c8b37453.mp3", size: 8793, duration: 1.75 },
+    "/auditory-test/audio/animals/cat_3.wav": { url: "/media/auditory-test/audio/animals/cat_3.f546361d.wav", size: 41436, duration: 1.29 },
+    "/auditory-test/audio/animals/cat_4.mp3": { url: "/media/auditory-test/audio/animals/cat_4.7bbface1.mp3", size: 61317, duration: 12.25 },
+    "/auditory-test/audio/animals/cat_4.wav": { url: "/media/auditory-test/audio/animals/cat_4.99244f7c.wav", size: 384044, duration: 12.0 },
+    "/auditory-test/audio/animals/chicken.mp3": { url: "/media/auditory-test/audio/animals/chicken.c92cc07c.mp3", size: 116397, duration: 14.54 },
+    "/auditory-test/audio/animals/chicken.wav": { url: "/media/auditory-test/audio/animals/chicken.482473b0.wav", size: 838334, duration: 8.73 },
+    "/auditory-test/audio/animals/chicken_2.mp3": { url: "/media/auditory-test/audio/animals/chicken_2.beabde27.mp3", size: 4221, duration: 1.39 },
+    "/auditory-test/audio/animals/chicken_2.wav": { url: "/media/auditory-test/audio/animals/chicken_2.38a3d295.wav", size: 5464, duration: 0.68 },
+    "/auditory-test/audio/animals/chicken_3.mp3": { url: "/media/auditory-test/audio/animals/chicken_3.274d762f.mp3", size: 3573, duration: 1.18 },
+    "/auditory-test/audio/animals/chicken_3.wav": { url: "/media/auditory-test/audio/animals/chicken_3.bd8d996d.wav", size: 13950, duration: 0.87 },
+    "/auditory-test/audio/animals/chicken_4.mp3": { url: "/media/auditory-test/audio/animals/chicken_4.e30c6e52.mp3", size: 14445, duration: 4.8 },
+    "/auditory-test/audio/animals/chicken_4.wav": { url: "/media/auditory-test/audio/animals/chicken_4.08c0b227.wav", size: 24327, duration: 3.04 },
+    "/auditory-test/audio/animals/cow.mp3": { url: "/media/auditory-test/audio/animals/cow.f039baa7.mp3", size: 5770, duration: 1.43 },
+    "/auditory-test/audio/animals/cow.wav": { url: "/media/auditory-test/audio/animals/cow.6a1a0dca.wav", size: 13982, duration: 1.26 },
+    "/auditory-test/audio/animals/cow_2.mp3": { url: "/media/auditory-test/audio/animals/cow_2.62730b40.mp3", size: 11259, duration: 1.6 },
+    "/auditory-test/audio/animals/cow_2.wav": { url: "/media/auditory-test/audio/animals/cow_2.33a7fa16.wav", size: 28332, duration: 1.28 },
+    "/auditory-test/audio/animals/cow_3.mp3": { url: "/media/auditory-test/audio/animals/cow_3.ebeabf24.mp3", size: 18564, duration: 4.63 },
+    "/auditory-test/audio/animals/cow_3.wav": { url: "/media/auditory-test/audio/animals/cow_3.2d8c1682.wav", size: 51259, duration: 4.65 },
+    "/auditory-test/audio/animals/cow_4.mp3": { url: "/media/auditory-test/audio/animals/cow_4.fdb80fa1.mp3", size: 6808, duration: 1.69 },
+    "/auditory-test/audio/animals/cow_4.wav": { url: "/media/auditory-test/audio/animals/cow_4.d6c82ebd.wav", size: 17314, duration: 1.57 },
+    "/auditory-test/audio/animals/crocodile.mp3": { url: "/media/auditory-test/audio/animals/crocodile.a4086f42.mp3", size: 102892, duration: 6.43 },
+    "/auditory-test/audio/animals/crow.mp3": { url: "/media/auditory-test/audio/animals/crow.171fae7d.mp3", size: 70216, duration: 4.39 },
+    "/auditory-test/audio/animals/crow_1.mp3": { url: "/media/auditory-test/audio/animals/crow_1.5853a62a.mp3", size: 63120, duration: 9.01 },
+    "/auditory-test/audio/animals/crow_1.wav": { url: "/media/auditory-test/audio/animals/crow_1.e75bd5e2.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_10.mp3": { url: "/media/auditory-test/audio/animals/crow_10.0be0f51f.mp3", size: 57465, duration: 8.2 },
+    "/auditory-test/audio/animals/crow_10.wav": { url: "/media/auditory-test/audio/animals/crow_10.315db3b9.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_11.mp3": { url: "/media/auditory-test/audio/animals/crow_11.3a80d15d.mp3", size: 59597, duration: 8.51 },
+    "/auditory-test/audio/animals/crow_11.wav": { url: "/media/auditory-test/audio/animals/crow_11.3ba19aee.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_12.mp3": { url: "/media/auditory-test/audio/animals/crow_12.37612eea.mp3", size: 59389, duration: 8.48 },
+    "/auditory-test/audio/animals/crow_12.wav": { url: "/media/auditory-test/audio/animals/crow_12.0e4abc59.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_13.mp3": { url: "/media/auditory-test/audio/animals/crow_13.ed5b999f.mp3", size: 60403, duration: 8.62 },
+    "/auditory-test/audio/animals/crow_13.wav": { url: "/media/auditory-test/audio/animals/crow_13.cc74156e.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_14.mp3": { url: "/media/auditory-test/audio/animals/crow_14.5a927792.mp3", size: 58141, duration: 8.3 },
+    "/auditory-test/audio/animals/crow_14.wav": { url: "/media/auditory-test/audio/animals/crow_14.5abd3754.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_15.mp3": { url: "/media/auditory-test/audio/animals/crow_15.7145613a.mp3", size: 61781, duration: 8.82 },
+    "/auditory-test/audio/animals/crow_15.wav": { url: "/media/auditory-test/audio/animals/crow_15.c8955af1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_16.mp3": { url: "/media/auditory-test/audio/animals/crow_16.dbddde6c.mp3", size: 58713, duration: 8.38 },
+    "/auditory-test/audio/animals/crow_16.wav": { url: "/media/auditory-test/audio/animals/crow_16.873a8b07.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_17.mp3": { url: "/media/auditory-test/audio/animals/crow_17.51360bea.mp3", size: 58765, duration: 8.39 },
+    "/auditory-test/audio/animals/crow_17.wav": { url: "/media/auditory-test/audio/animals/crow_17.4e50aa38.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_18.mp3": { url: "/media/auditory-test/audio/animals/crow_18.7aa3ef52.mp3", size: 61838, duration: 8.83 },
+    "/auditory-test/audio/animals/crow_18.wav": { url: "/media/auditory-test/audio/animals/crow_18.dc157127.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_19.mp3": { url: "/media/auditory-test/audio/animals/crow_19.9f0ec2d7.mp3", size: 36130, duration: 5.16 },
+    "/auditory-test/audio/animals/crow_19.wav": { url: "/media/auditory-test/audio/animals/crow_19.44569c70.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_2.mp3": { url: "/media/auditory-test/audio/animals/crow_2.5440c8d7.mp3", size: 66830, duration: 9.54 },
+    "/auditory-test/audio/animals/crow_2.wav": { url: "/media/auditory-test/audio/animals/crow_2.403db280.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_20.mp3": { url: "/media/auditory-test/audio/animals/crow_20.e37de560.mp3", size: 27927, duration: 3.98 },
+    "/auditory-test/audio/animals/crow_20.wav": { url: "/media/auditory-test/audio/animals/crow_20.e4f9aa62.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_21.mp3": { url: "/media/auditory-test/audio/animals/crow_21.1adecaaa.mp3", size: 65630, duration: 9.37 },
+    "/auditory-test/audio/animals/crow_21.wav": { url: "/media/auditory-test/audio/animals/crow_21.b72e1e6a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_22.mp3": { url: "/media/auditory-test/audio/animals/crow_22.c4d60338.mp3", size: 65214, duration: 9.31 },
+    "/auditory-test/audio/animals/crow_22.wav": { url: "/media/auditory-test/audio/animals/crow_22.10fbfd19.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_23.mp3": { url: "/media/auditory-test/audio/animals/crow_23.66e1f72b.mp3", size: 63577, duration: 9.08 },
+    "/auditory-test/audio/animals/crow_23.wav": { url: "/media/auditory-test/audio/animals/crow_23.c4b01135.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_24.mp3": { url: "/media/auditory-test/audio/animals/crow_24.d575e8bd.mp3", size: 51575, duration: 7.36 },
+    "/auditory-test/audio/animals/crow_24.wav": { url: "/media/auditory-test/audio/animals/crow_24.df942fd4.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_25.mp3": { url: "/media/auditory-test/audio/animals/crow_25.d0a4402c.mp3", size: 40246, duration: 5.74 },
+    "/auditory-test/audio/animals/crow_25.wav": { url: "/media/auditory-test/audio/animals/crow_25.6b0bfda3.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_26.mp3": { url: "/media/auditory-test/audio/animals/crow_26.215b1066.mp3", size: 60432, duration: 8.63 },
+    "/auditory-test/audio/animals/crow_26.wav": { url: "/media/auditory-test/audio/animals/crow_26.67b10b27.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_27.mp3": { url: "/media/auditory-test/audio/animals/crow_27.fe77377f.mp3", size: 58298, duration: 8.32 },
+    "/auditory-test/audio/animals/crow_27.wav": { url: "/media/auditory-test/audio/animals/crow_27.f293cc39.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_28.mp3": { url: "/media/auditory-test/audio/animals/crow_28.33cdb5f6.mp3", size: 58193, duration: 8.31 },
+    "/auditory-test/audio/animals/crow_28.wav": { url: "/media/auditory-test/audio/animals/crow_28.d34e7eb1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_29.mp3": { url: "/media/auditory-test/audio/animals/crow_29.e3db6f82.mp3", size: 41507, duration: 5.92 },
+    "/auditory-test/audio/animals/crow_29.wav": { url: "/media/auditory-test/audio/animals/crow_29.4d97268c.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_3.mp3": { url: "/media/auditory-test/audio/animals/crow_3.5dd96250.mp3", size: 66305, duration: 9.47 },
+    "/auditory-test/audio/animals/crow_3.wav": { url: "/media/auditory-test/audio/animals/crow_3.c48f8bdd.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_30.mp3": { url: "/media/auditory-test/audio/animals/crow_30.353df666.mp3", size: 77616, duration: 11.08 },
+    "/auditory-test/audio/animals/crow_30.wav": { url: "/media/auditory-test/audio/animals/crow_30.26ec1e8d.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_31.mp3": { url: "/media/auditory-test/audio/animals/crow_31.ab63ca32.mp3", size: 68292, duration: 9.75 },
+    "/auditory-test/audio/animals/crow_31.wav": { url: "/media/auditory-test/audio/animals/crow_31.0d60307a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_32.mp3": { url: "/media/auditory-test/audio/animals/crow_32.26c2556a.mp3", size: 42539, duration: 6.07 },
+    "/auditory-test/audio/animals/crow_32.wav": { url: "/media/auditory-test/audio/animals/crow_32.d5c647f2.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_33.mp3": { url: "/media/auditory-test/audio/animals/crow_33.e0c6a4c5.mp3", size: 62379, duration: 8.9 },
+    "/auditory-test/audio/animals/crow_33.wav": { url: "/media/auditory-test/audio/animals/crow_33.087ef97c.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_34.mp3": { url: "/media/auditory-test/audio/animals/crow_34.56e87a7d.mp3", size: 64381, duration: 9.19 },
+    "/auditory-test/audio/animals/crow_34.wav": { url: "/media/auditory-test/audio/animals/crow_34.864bef10.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_35.mp3": { url: "/media/auditory-test/audio/animals/crow_35.f7ef726c.mp3", size: 60897, duration: 8.69 },
+    "/auditory-test/audio/animals/crow_35.wav": { url: "/media/auditory-test/audio/animals/crow_35.c5b7355f.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_36.mp3": { url: "/media/auditory-test/audio/animals/crow_36.816ef37e.mp3", size: 70285, duration: 10.03 },
+    "/auditory-test/audio/animals/crow_36.wav": { url: "/media/auditory-test/audio/animals/crow_36.c447e893.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_37.mp3": { url: "/media/auditory-test/audio/animals/crow_37.4bbe835e.mp3", size: 61469, duration: 8.77 },
+    "/auditory-test/audio/animals/crow_37.wav": { url: "/media/auditory-test/audio/animals/crow_37.81758563.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_38.mp3": { url: "/media/auditory-test/audio/animals/crow_38.06058977.mp3", size: 58687, duration: 8.38 },
+    "/auditory-test/audio/animals/crow_38.wav": { url: "/media/auditory-test/audio/animals/crow_38.e862f494.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_39.mp3": { url: "/media/auditory-test/audio/animals/crow_39.ce16ba73.mp3", size: 58011, duration: 8.28 },
+    "/auditory-test/audio/animals/crow_39.wav": { url: "/media/auditory-test/audio/animals/crow_39.e1016531.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_4.mp3": { url: "/media/auditory-test/audio/animals/crow_4.bb48d2c9.mp3", size: 61281, duration: 8.75 },
+    "/auditory-test/audio/animals/crow_4.wav": { url: "/media/auditory-test/audio/animals/crow_4.9cb4e709.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_40.mp3": { url: "/media/auditory-test/audio/animals/crow_40.3fc72566.mp3", size: 58818, duration: 8.4 },
+    "/auditory-test/audio/animals/crow_40.wav": { url: "/media/auditory-test/audio/animals/crow_40.b2e3db27.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_5.mp3": { url: "/media/auditory-test/audio/animals/crow_5.18e9bd0a.mp3", size: 47998, duration: 6.85 },
+    "/auditory-test/audio/animals/crow_5.wav": { url: "/media/auditory-test/audio/animals/crow_5.6fda26eb.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_6.mp3": { url: "/media/auditory-test/audio/animals/crow_6.d3e47422.mp3", size: 45245, duration: 6.46 },
+    "/auditory-test/audio/animals/crow_6.wav": { url: "/media/auditory-test/audio/animals/crow_6.d7970b54.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_7.mp3": { url: "/media/auditory-test/audio/animals/crow_7.7adb4347.mp3", size: 57551, duration: 8.22 },
+    "/auditory-test/audio/animals/crow_7.wav": { url: "/media/auditory-test/audio/animals/crow_7.a199a681.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_8.mp3": { url: "/media/auditory-test/audio/animals/crow_8.fcff661f.mp3", size: 60872, duration: 8.69 },
+    "/auditory-test/audio/animals/crow_8.wav": { url: "/media/auditory-test/audio/animals/crow_8.dcfe51f3.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/crow_9.mp3": { url: "/media/auditory-test/audio/animals/crow_9.72170401.mp3", size: 64849, duration: 9.26 },
+    "/auditory-test/audio/animals/crow_9.wav": { url: "/media/auditory-test/audio/animals/crow_9.2da6b40b.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/deer.mp3": { url: "/media/auditory-test/audio/animals/deer.bf58e762.mp3", size: 117348, duration: 7.21 },
+    "/auditory-test/audio/animals/dog.mp3": { url: "/media/auditory-test/audio/animals/dog.9d5e9f10.mp3", size: 66717, duration: 13.33 },
+    "/auditory-test/audio/animals/dog.wav": { url: "/media/auditory-test/audio/animals/dog.ae8b5e0f.wav", size: 371244, duration: 11.6 },
+    "/auditory-test/audio/animals/dog_2.mp3": { url: "/media/auditory-test/audio/animals/dog_2.91676323.mp3", size: 14769, duration: 2.94 },
+    "/auditory-test/audio/animals/dog_2.wav": { url: "/media/auditory-test/audio/animals/dog_2.0f788714.wav", size: 79874, duration: 2.49 },
+    "/auditory-test/audio/animals/dog_3.mp3": { url: "/media/auditory-test/audio/animals/dog_3.a1f8aa8d.mp3", size: 10521, duration: 2.1 },
+    "/auditory-test/audio/animals/dog_3.wav": { url: "/media/auditory-test/audio/animals/dog_3.a774dae8.wav", size: 59374, duration: 1.85 },
+    "/auditory-test/audio/animals/dog_4.mp3": { url: "/media/auditory-test/audio/animals/dog_4.b2ee73ff.mp3", size: 49437, duration: 9.88 },
+    "/auditory-test/audio/animals/dog_4.wav": { url: "/media/auditory-test/audio/animals/dog_4.a2b7f1d9.wav", size: 297550, duration: 9.3 },
+    "/auditory-test/audio/animals/dolphin.mp3": { url: "/media/auditory-test/audio/animals/dolphin.dd2d167d.mp3", size: 174706, duration: 10.92 },
+    "/auditory-test/audio/animals/donkey.mp3": { url: "/media/auditory-test/audio/animals/donkey.6b5f559e.mp3", size: 11415, duration: 1.62 },
+    "/auditory-test/audio/animals/donkey.wav": { url: "/media/auditory-test/audio/animals/donkey.b67e93be.wav", size: 30144, duration: 1.37 },
+    "/auditory-test/audio/animals/donkey_2.mp3": { url: "/media/auditory-test/audio/animals/donkey_2.f19f77db.mp3", size: 14733, duration: 1.84 },
+    "/auditory-test/audio/animals/donkey_2.wav": { url: "/media/auditory-test/audio/animals/donkey_2.b398d0af.wav", size: 9094 },
+    "/auditory-test/audio/animals/donkey_3.mp3": { url: "/media/auditory-test/audio/animals/donkey_3.5c1036e9.mp3", size: 10090, duration: 2.51 },
+    "/auditory-test/audio/animals/donkey_3.wav": { url: "/media/auditory-test/audio/animals/donkey_3.73556d3f.wav", size: 6570 },
+    "/auditory-test/audio/animals/donkey_4.mp3": { url: "/media/auditory-test/audio/animals/donkey_4.3b4331e5.mp3", size: 9045, duration: 3.0 },
+    "/auditory-test/audio/animals/donkey_4.wav": { url: "/media/auditory-test/audio/animals/donkey_4.da533a2d.wav", size: 20956, duration: 2.61 },
+    "/auditory-test/audio/animals/dragonfly.mp3": { url: "/media/auditory-test/audio/animals/dragonfly.f16ee60b.mp3", size: 155479, duration: 9.72 },
+    "/auditory-test/audio/animals/duck.mp3": { url: "/media/auditory-test/audio/animals/duck.cd486c69.mp3", size: 45191, duration: 2.82 },
+    "/auditory-test/audio/animals/eagle.mp3": { url: "/media/auditory-test/audio/animals/eagle.6d700de9.mp3", size: 84426, duration: 5.28 },
+    "/auditory-test/audio/animals/elephant.mp3": { url: "/media/auditory-test/audio/animals/elephant.c40f5149.mp3", size: 303486, duration: 7.45 },
+    "/auditory-test/audio/animals/fish.mp3": { url: "/media/auditory-test/audio/animals/fish.c5ee4b03.mp3", size: 2122, duration: 0.26 },
+    "/auditory-test/audio/animals/fly.mp3": { url: "/media/auditory-test/audio/animals/fly.42f7d341.mp3", size: 161749, duration: 10.11 },
+    "/auditory-test/audio/animals/fox.mp3": { url: "/media/auditory-test/audio/animals/fox.e6c8ecfc.mp3", size: 195186, duration: 12.2 },
+    "/auditory-test/audio/animals/frog.mp3": { url: "/media/auditory-test/audio/animals/frog.a423f948.mp3", size: 2858, duration: 0.7 },
+    "/auditory-test/audio/animals/frog.wav": { url: "/media/auditory-test/audio/animals/frog.eb0da534.wav", size: 4884, duration: 0.44 },
+    "/auditory-test/audio/animals/frog_2.mp3": { url: "/media/auditory-test/audio/animals/frog_2.73d54a12.mp3", size: 35415, duration: 5.05 },
+    "/auditory-test/audio/animals/frog_2.wav": { url: "/media/auditory-test/audio/animals/frog_2.29c58085.wav", size: 326262, duration: 3.7 },
+    "/auditory-test/audio/animals/frog_3.mp3": { url: "/media/auditory-test/audio/animals/frog_3.b9fd16da.mp3", size: 13440, duration: 3.35 },
+    "/auditory-test/audio/animals/frog_3.wav": { url: "/media/auditory-test/audio/animals/frog_3.b953e258.wav", size: 27616, duration: 2.5 },
+    "/auditory-test/audio/animals/frog_4.mp3": { url: "/media/auditory-test/audio/animals/frog_4.da3696d1.mp3", size: 17445, duration: 4.32 },
+    "/auditory-test/audio/animals/frog_4.wav": { url: "/media/auditory-test/audio/animals/frog_4.fb21c4dd.wav", size: 78054, duration: 3.53 },
+    "/auditory-test/audio/animals/goat.mp3": { url: "/media/auditory-test/audio/animals/goat.d6d7ab86.mp3", size: 21732, duration: 1.36 },
+    "/auditory-test/audio/animals/goose.mp3": { url: "/media/auditory-test/audio/animals/goose.b6738bdb.mp3", size: 71052, duration: 4.44 },
+    "/auditory-test/audio/animals/grasshopper.mp3": { url: "/media/auditory-test/audio/animals/grasshopper.cd82777a.mp3", size: 415869, duration: 10.4 },
+    "/auditory-test/audio/animals/hen_1.mp3": { url: "/media/auditory-test/audio/animals/hen_1.9fa4ad84.mp3", size: 59727, duration: 8.53 },
+    "/auditory-test/audio/animals/hen_1.wav": { url: "/media/auditory-test/audio/animals/hen_1.26c99da1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_10.mp3": { url: "/media/auditory-test/audio/animals/hen_10.33559811.mp3", size: 46996, duration: 6.71 },
+    "/auditory-test/audio/animals/hen_10.wav": { url: "/media/auditory-test/audio/animals/hen_10.1f8830d0.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_11.mp3": { url: "/media/auditory-test/audio/animals/hen_11.64223102.mp3", size: 57698, duration: 8.24 },
+    "/auditory-test/audio/animals/hen_11.wav": { url: "/media/auditory-test/audio/animals/hen_11.b57d9172.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_12.mp3": { url: "/media/auditory-test/audio/animals/hen_12.f4d62c49.mp3", size: 33203, duration: 4.74 },
+    "/auditory-test/audio/animals/hen_12.wav": { url: "/media/auditory-test/audio/animals/hen_12.a0136c66.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_13.mp3": { url: "/media/auditory-test/audio/animals/hen_13.16c7831e.mp3", size: 59909, duration: 8.55 },
+    "/auditory-test/audio/animals/hen_13.wav": { url: "/media/auditory-test/audio/animals/hen_13.5e8fc0d2.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_14.mp3": { url: "/media/auditory-test/audio/animals/hen_14.f8bdf012.mp3", size: 63367, duration: 9.05 },
+    "/auditory-test/audio/animals/hen_14.wav": { url: "/media/auditory-test/audio/animals/hen_14.e3cb00be.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_15.mp3": { url: "/media/auditory-test/audio/animals/hen_15.d716fc51.mp3", size: 33203, duration: 4.74 },
+    "/auditory-test/audio/animals/hen_15.wav": { url: "/media/auditory-test/audio/animals/hen_15.892df1fa.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_16.mp3": { url: "/media/auditory-test/audio/animals/hen_16.23d31325.mp3", size: 61573, duration: 8.79 },
+    "/auditory-test/audio/animals/hen_16.wav": { url: "/media/auditory-test/audio/animals/hen_16.78e7fb95.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_17.mp3": { url: "/media/auditory-test/audio/animals/hen_17.6533c4f8.mp3", size: 64135, duration: 9.16 },
+    "/auditory-test/audio/animals/hen_17.wav": { url: "/media/auditory-test/audio/animals/hen_17.f41a1d63.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_18.mp3": { url: "/media/auditory-test/audio/animals/hen_18.97a9d927.mp3", size: 61840, duration: 8.83 },
+    "/auditory-test/audio/animals/hen_18.wav": { url: "/media/auditory-test/audio/animals/hen_18.b3d51f82.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_19.mp3": { url: "/media/auditory-test/audio/animals/hen_19.f59c9653.mp3", size: 62517, duration: 8.92 },
+    "/auditory-test/audio/animals/hen_19.wav": { url: "/media/auditory-test/audio/animals/hen_19.4e58de95.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_2.mp3": { url: "/media/auditory-test/audio/animals/hen_2.08f38d1d.mp3", size: 60484, duration: 8.63 },
+    "/auditory-test/audio/animals/hen_2.wav": { url: "/media/auditory-test/audio/animals/hen_2.68c54aac.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_20.mp3": { url: "/media/auditory-test/audio/animals/hen_20.f28e81a0.mp3", size: 58844, duration: 8.4 },
+    "/auditory-test/audio/animals/hen_20.wav": { url: "/media/auditory-test/audio/animals/hen_20.23dfcb56.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_21.mp3": { url: "/media/auditory-test/audio/animals/hen_21.5b5920a1.mp3", size: 54756, duration: 7.82 },
+    "/auditory-test/audio/animals/hen_21.wav": { url: "/media/auditory-test/audio/animals/hen_21.5511f3b0.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_22.mp3": { url: "/media/auditory-test/audio/animals/hen_22.a853ead5.mp3", size: 58219, duration: 8.31 },
+    "/auditory-test/audio/animals/hen_22.wav": { url: "/media/auditory-test/audio/animals/hen_22.55c86d13.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_23.mp3": { url: "/media/auditory-test/audio/animals/hen_23.141a1bc5.mp3", size: 61002, duration: 8.71 },
+    "/auditory-test/audio/animals/hen_23.wav": { url: "/media/auditory-test/audio/animals/hen_23.5a3a7708.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_24.mp3": { url: "/media/auditory-test/audio/animals/hen_24.5d601a9c.mp3", size: 39367, duration: 5.62 },
+    "/auditory-test/audio/animals/hen_24.wav": { url: "/media/auditory-test/audio/animals/hen_24.904c4bb1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_25.mp3": { url: "/media/auditory-test/audio/animals/hen_25.32ca29de.mp3", size: 63346, duration: 9.04 },
+    "/auditory-test/audio/animals/hen_25.wav": { url: "/media/auditory-test/audio/animals/hen_25.d0c5fbdc.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_26.mp3": { url: "/media/auditory-test/audio/animals/hen_26.4f6d0caf.mp3", size: 56270, duration: 8.03 },
+    "/auditory-test/audio/animals/hen_26.wav": { url: "/media/auditory-test/audio/animals/hen_26.b6cbe602.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_27.mp3": { url: "/media/auditory-test/audio/animals/hen_27.bd3492d1.mp3", size: 54384, duration: 7.76 },
+    "/auditory-test/audio/animals/hen_27.wav": { url: "/media/auditory-test/audio/animals/hen_27.af0d92d0.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_28.mp3": { url: "/media/auditory-test/audio/animals/hen_28.67d93226.mp3", size: 57519, duration: 8.21 },
+    "/auditory-test/audio/animals/hen_28.wav": { url: "/media/auditory-test/audio/animals/hen_28.9412bd67.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_29.mp3": { url: "/media/auditory-test/audio/animals/hen_29.6f9c186f.mp3", size: 68129, duration: 9.73 },
+    "/auditory-test/audio/animals/hen_29.wav": { url: "/media/auditory-test/audio/animals/hen_29.7d9e39ac.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_3.mp3": { url: "/media/auditory-test/audio/animals/hen_3.b945d44e.mp3", size: 57751, duration: 8.24 },
+    "/auditory-test/audio/animals/hen_3.wav": { url: "/media/auditory-test/audio/animals/hen_3.f9dc446b.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_30.mp3": { url: "/media/auditory-test/audio/animals/hen_30.3570df9f.mp3", size: 57830, duration: 8.26 },
+    "/auditory-test/audio/animals/hen_30.wav": { url: "/media/auditory-test/audio/animals/hen_30.32eb5a7d.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_31.mp3": { url: "/media/auditory-test/audio/animals/hen_31.afa76c47.mp3", size: 66241, duration: 9.46 },
+    "/auditory-test/audio/animals/hen_31.wav": { url: "/media/auditory-test/audio/animals/hen_31.92db3269.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_32.mp3": { url: "/media/auditory-test/audio/animals/hen_32.8b8960cf.mp3", size: 41655, duration: 5.94 },
+    "/auditory-test/audio/animals/hen_32.wav": { url: "/media/auditory-test/audio/animals/hen_32.6af30d6e.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_33.mp3": { url: "/media/auditory-test/audio/animals/hen_33.4da30943.mp3", size: 61527, duration: 8.78 },
+    "/auditory-test/audio/animals/hen_33.wav": { url: "/media/auditory-test/audio/animals/hen_33.e0ef3282.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_34.mp3": { url: "/media/auditory-test/audio/animals/hen_34.41692ea2.mp3", size: 65458, duration: 9.34 },
+    "/auditory-test/audio/animals/hen_34.wav": { url: "/media/auditory-test/audio/animals/hen_34.1f849e38.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_35.mp3": { url: "/media/auditory-test/audio/animals/hen_35.5c37a460.mp3", size: 64470, duration: 9.2 },
+    "/auditory-test/audio/animals/hen_35.wav": { url: "/media/auditory-test/audio/animals/hen_35.823eb42a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_36.mp3": { url: "/media/auditory-test/audio/animals/hen_36.bf7322b3.mp3", size: 60743, duration: 8.67 },
+    "/auditory-test/audio/animals/hen_36.wav": { url: "/media/auditory-test/audio/animals/hen_36.26692289.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_37.mp3": { url: "/media/auditory-test/audio/animals/hen_37.9546650d.mp3", size: 61678, duration: 8.8 },
+    "/auditory-test/audio/animals/hen_37.wav": { url: "/media/auditory-test/audio/animals/hen_37.7e35dc1a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_38.mp3": { url: "/media/auditory-test/audio/animals/hen_38.ac8b3697.mp3", size: 66814, duration: 9.54 },
+    "/auditory-test/audio/animals/hen_38.wav": { url: "/media/auditory-test/audio/animals/hen_38.e9861a41.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_39.mp3": { url: "/media/auditory-test/audio/animals/hen_39.db31913f.mp3", size: 61549, duration: 8.79 },
+    "/auditory-test/audio/animals/hen_39.wav": { url: "/media/auditory-test/audio/animals/hen_39.17b93306.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_4.mp3": { url: "/media/auditory-test/audio/animals/hen_4.646fcb32.mp3", size: 59337, duration: 8.47 },
+    "/auditory-test/audio/animals/hen_4.wav": { url: "/media/auditory-test/audio/animals/hen_4.2cdb1b3a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_40.mp3": { url: "/media/auditory-test/audio/animals/hen_40.ba781b07.mp3", size: 60872, duration: 8.69 },
+    "/auditory-test/audio/animals/hen_40.wav": { url: "/media/auditory-test/audio/animals/hen_40.d244c4d6.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_5.mp3": { url: "/media/auditory-test/audio/animals/hen_5.dd4b5e12.mp3", size: 61731, duration: 8.81 },
+    "/auditory-test/audio/animals/hen_5.wav": { url: "/media/auditory-test/audio/animals/hen_5.f6ef2901.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_6.mp3": { url: "/media/auditory-test/audio/animals/hen_6.6f88a4b7.mp3", size: 58793, duration: 8.39 },
+    "/auditory-test/audio/animals/hen_6.wav": { url: "/media/auditory-test/audio/animals/hen_6.4ab392d7.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_7.mp3": { url: "/media/auditory-test/audio/animals/hen_7.a6dcc1b9.mp3", size: 59441, duration: 8.49 },
+    "/auditory-test/audio/animals/hen_7.wav": { url: "/media/auditory-test/audio/animals/hen_7.d6d876c2.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_8.mp3": { url: "/media/auditory-test/audio/animals/hen_8.89aad411.mp3", size: 61263, duration: 8.75 },
+    "/auditory-test/audio/animals/hen_8.wav": { url: "/media/auditory-test/audio/animals/hen_8.5e34754f.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/hen_9.mp3": { url: "/media/auditory-test/audio/animals/hen_9.07dec73e.mp3", size: 53522, duration: 7.64 },
+    "/auditory-test/audio/animals/hen_9.wav": { url: "/media/auditory-test/audio/animals/hen_9.b077480a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/horse.mp3": { url: "/media/auditory-test/audio/animals/horse.c79c5e25.mp3", size: 154677, duration: 3.87 },
+    "/auditory-test/audio/animals/insects_1.mp3": { url: "/media/auditory-test/audio/animals/insects_1.d1b529e5.mp3", size: 61184, duration: 8.73 },
+    "/auditory-test/audio/animals/insects_1.wav": { url: "/media/auditory-test/audio/animals/insects_1.beb564e1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_10.mp3": { url: "/media/auditory-test/audio/animals/insects_10.76bac4cc.mp3", size: 59156, duration: 8.44 },
+    "/auditory-test/audio/animals/insects_10.wav": { url: "/media/auditory-test/audio/animals/insects_10.424e1ada.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_11.mp3": { url: "/media/auditory-test/audio/animals/insects_11.3ebadcbf.mp3", size: 58557, duration: 8.36 },
+    "/auditory-test/audio/animals/insects_11.wav": { url: "/media/auditory-test/audio/animals/insects_11.62ea1a42.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_12.mp3": { url: "/media/auditory-test/audio/animals/insects_12.3fc2bd6c.mp3", size: 59311, duration: 8.47 },
+    "/auditory-test/audio/animals/insects_12.wav": { url: "/media/auditory-test/audio/animals/insects_12.ea94a99a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_13.mp3": { url: "/media/auditory-test/audio/animals/insects_13.ae143f37.mp3", size: 53717, duration: 7.67 },
+    "/auditory-test/audio/animals/insects_13.wav": { url: "/media/auditory-test/audio/animals/insects_13.916f2e34.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_14.mp3": { url: "/media/auditory-test/audio/animals/insects_14.1a793946.mp3", size: 61187, duration: 8.73 },
+    "/auditory-test/audio/animals/insects_14.wav": { url: "/media/auditory-test/audio/animals/insects_14.f2e4ede4.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_15.mp3": { url: "/media/auditory-test/audio/animals/insects_15.3e631eef.mp3", size: 61836, duration: 8.83 },
+    "/auditory-test/audio/animals/insects_15.wav": { url: "/media/auditory-test/audio/animals/insects_15.07eb4085.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_16.mp3": { url: "/media/auditory-test/audio/animals/insects_16.67f8acab.mp3", size: 62906, duration: 8.98 },
+    "/auditory-test/audio/animals/insects_16.wav": { url: "/media/auditory-test/audio/animals/insects_16.36efed27.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_17.mp3": { url: "/media/auditory-test/audio/animals/insects_17.2114b0a5.mp3", size: 67915, duration: 9.7 },
+    "/auditory-test/audio/animals/insects_17.wav": { url: "/media/auditory-test/audio/animals/insects_17.a035a812.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_18.mp3": { url: "/media/auditory-test/audio/animals/insects_18.e2831a99.mp3", size: 61266, duration: 8.75 },
+    "/auditory-test/audio/animals/insects_18.wav": { url: "/media/auditory-test/audio/animals/insects_18.b1305165.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_19.mp3": { url: "/media/auditory-test/audio/animals/insects_19.573d7975.mp3", size: 60170, duration: 8.59 },
+    "/auditory-test/audio/animals/insects_19.wav": { url: "/media/auditory-test/audio/animals/insects_19.188bf662.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_2.mp3": { url: "/media/auditory-test/audio/animals/insects_2.cc0cddfe.mp3", size: 32109, duration: 4.58 },
+    "/auditory-test/audio/animals/insects_2.wav": { url: "/media/auditory-test/audio/animals/insects_2.d10dfa62.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_20.mp3": { url: "/media/auditory-test/audio/animals/insects_20.6b6eec0c.mp3", size: 58739, duration: 8.38 },
+    "/auditory-test/audio/animals/insects_20.wav": { url: "/media/auditory-test/audio/animals/insects_20.dad8e9e5.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_21.mp3": { url: "/media/auditory-test/audio/animals/insects_21.7dd6095d.mp3", size: 58896, duration: 8.41 },
+    "/auditory-test/audio/animals/insects_21.wav": { url: "/media/auditory-test/audio/animals/insects_21.1d807fd9.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_22.mp3": { url: "/media/auditory-test/audio/animals/insects_22.27e92d21.mp3", size: 57699, duration: 8.24 },
+    "/auditory-test/audio/animals/insects_22.wav": { url: "/media/auditory-test/audio/animals/insects_22.7b1d051e.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_23.mp3": { url: "/media/auditory-test/audio/animals/insects_23.b3eed9cc.mp3", size: 59104, duration: 8.44 },
+    "/auditory-test/audio/animals/insects_23.wav": { url: "/media/auditory-test/audio/animals/insects_23.8d6e7220.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_24.mp3": { url: "/media/auditory-test/audio/animals/insects_24.775dab2c.mp3", size: 59259, duration: 8.46 },
+    "/auditory-test/audio/animals/insects_24.wav": { url: "/media/auditory-test/audio/animals/insects_24.9bacabbb.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_25.mp3": { url: "/media/auditory-test/audio/animals/insects_25.b78ded8b.mp3", size: 50848, duration: 7.26 },
+    "/auditory-test/audio/animals/insects_25.wav": { url: "/media/auditory-test/audio/animals/insects_25.12c07996.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_26.mp3": { url: "/media/auditory-test/audio/animals/insects_26.89f172f7.mp3", size: 31634, duration: 4.51 },
+    "/auditory-test/audio/animals/insects_26.wav": { url: "/media/auditory-test/audio/animals/insects_26.e1d8ea89.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_27.mp3": { url: "/media/auditory-test/audio/animals/insects_27.74737b4e.mp3", size: 62551, duration: 8.93 },
+    "/auditory-test/audio/animals/insects_27.wav": { url: "/media/auditory-test/audio/animals/insects_27.60f56e65.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_28.mp3": { url: "/media/auditory-test/audio/animals/insects_28.af703c4f.mp3", size: 58742, duration: 8.39 },
+    "/auditory-test/audio/animals/insects_28.wav": { url: "/media/auditory-test/audio/animals/insects_28.d49b3d79.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_29.mp3": { url: "/media/auditory-test/audio/animals/insects_29.7be93910.mp3", size: 58167, duration: 8.3 },
+    "/auditory-test/audio/animals/insects_29.wav": { url: "/media/auditory-test/audio/animals/insects_29.cfb0d81b.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_3.mp3": { url: "/media/auditory-test/audio/animals/insects_3.acf80162.mp3", size: 55593, duration: 7.94 },
+    "/auditory-test/audio/animals/insects_3.wav": { url: "/media/auditory-test/audio/animals/insects_3.d97f844f.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_30.mp3": { url: "/media/auditory-test/audio/animals/insects_30.2ca4ff95.mp3", size: 57518, duration: 8.21 },
+    "/auditory-test/audio/animals/insects_30.wav": { url: "/media/auditory-test/audio/animals/insects_30.ffdb86b9.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_31.mp3": { url: "/media/auditory-test/audio/animals/insects_31.fb37aae6.mp3", size: 67154, duration: 9.59 },
+    "/auditory-test/audio/animals/insects_31.wav": { url: "/media/auditory-test/audio/animals/insects_31.18442565.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_32.mp3": { url: "/media/auditory-test/audio/animals/insects_32.38309f08.mp3", size: 66014, duration: 9.42 },
+    "/auditory-test/audio/animals/insects_32.wav": { url: "/media/auditory-test/audio/animals/insects_32.9f7734cc.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_33.mp3": { url: "/media/auditory-test/audio/animals/insects_33.6a17e049.mp3", size: 61763, duration: 8.82 },
+    "/auditory-test/audio/animals/insects_33.wav": { url: "/media/auditory-test/audio/animals/insects_33.1068b661.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_34.mp3": { url: "/media/auditory-test/audio/animals/insects_34.50c4acf0.mp3", size: 61551, duration: 8.79 },
+    "/auditory-test/audio/animals/insects_34.wav": { url: "/media/auditory-test/audio/animals/insects_34.5bc17ca8.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_35.mp3": { url: "/media/auditory-test/audio/animals/insects_35.0be2e2a9.mp3", size: 64575, duration: 9.22 },
+    "/auditory-test/audio/animals/insects_35.wav": { url: "/media/auditory-test/audio/animals/insects_35.d826d4ce.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_36.mp3": { url: "/media/auditory-test/audio/animals/insects_36.8c5cf181.mp3", size: 59783, duration: 8.53 },
+    "/auditory-test/audio/animals/insects_36.wav": { url: "/media/auditory-test/audio/animals/insects_36.b85e8363.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_37.mp3": { url: "/media/auditory-test/audio/animals/insects_37.d686dee9.mp3", size: 58350, duration: 8.33 },
+    "/auditory-test/audio/animals/insects_37.wav": { url: "/media/auditory-test/audio/animals/insects_37.d4a264ca.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_38.mp3": { url: "/media/auditory-test/audio/animals/insects_38.82efb6d1.mp3", size: 57699, duration: 8.24 },
+    "/auditory-test/audio/animals/insects_38.wav": { url: "/media/auditory-test/audio/animals/insects_38.1ea680df.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_39.mp3": { url: "/media/auditory-test/audio/animals/insects_39.2dec22dc.mp3", size: 58089, duration: 8.29 },
+    "/auditory-test/audio/animals/insects_39.wav": { url: "/media/auditory-test/audio/animals/insects_39.d75eefbb.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_4.mp3": { url: "/media/auditory-test/audio/animals/insects_4.400f9cac.mp3", size: 55515, duration: 7.92 },
+    "/auditory-test/audio/animals/insects_4.wav": { url: "/media/auditory-test/audio/animals/insects_4.53e23b70.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_40.mp3": { url: "/media/auditory-test/audio/animals/insects_40.ad914f94.mp3", size: 62224, duration: 8.88 },
+    "/auditory-test/audio/animals/insects_40.wav": { url: "/media/auditory-test/audio/animals/insects_40.a7bc8f99.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_5.mp3": { url: "/media/auditory-test/audio/animals/insects_5.f5417d85.mp3", size: 59493, duration: 8.49 },
+    "/auditory-test/audio/animals/insects_5.wav": { url: "/media/auditory-test/audio/animals/insects_5.167d606a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_6.mp3": { url: "/media/auditory-test/audio/animals/insects_6.c6e362ac.mp3", size: 63575, duration: 9.08 },
+    "/auditory-test/audio/animals/insects_6.wav": { url: "/media/auditory-test/audio/animals/insects_6.626f938e.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_7.mp3": { url: "/media/auditory-test/audio/animals/insects_7.859eb64e.mp3", size: 65251, duration: 9.32 },
+    "/auditory-test/audio/animals/insects_7.wav": { url: "/media/auditory-test/audio/animals/insects_7.889f613a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_8.mp3": { url: "/media/auditory-test/audio/animals/insects_8.27d2c162.mp3", size: 56581, duration: 8.08 },
+    "/auditory-test/audio/animals/insects_8.wav": { url: "/media/auditory-test/audio/animals/insects_8.c150869a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/insects_9.mp3": { url: "/media/auditory-test/audio/animals/insects_9.dd321246.mp3", size: 59602, duration: 8.51 },
+    "/auditory-test/audio/animals/insects_9.wav": { url: "/media/auditory-test/audio/animals/insects_9.e5b29a67.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/lion.mp3": { url: "/media/auditory-test/audio/animals/lion.c3df78f4.mp3", size: 68858, duration: 9.83 },
+    "/auditory-test/audio/animals/lion.wav": { url: "/media/auditory-test/audio/animals/lion.f726b1f7.wav", size: 397228, duration: 4.5 },
+    "/auditory-test/audio/animals/lion_2.mp3": { url: "/media/auditory-test/audio/animals/lion_2.eb629e49.mp3", size: 5770, duration: 1.43 },
+    "/auditory-test/audio/animals/lion_2.wav": { url: "/media/auditory-test/audio/animals/lion_2.66ced1af.wav", size: 51640, duration: 1.17 },
+    "/auditory-test/audio/animals/lion_3.mp3": { url: "/media/auditory-test/audio/animals/lion_3.0206a699.mp3", size: 4729, duration: 1.17 },
+    "/auditory-test/audio/animals/lion_3.wav": { url: "/media/auditory-test/audio/animals/lion_3.33c96993.wav", size: 11564, duration: 1.04 },
+    "/auditory-test/audio/animals/lion_4.mp3": { url: "/media/auditory-test/audio/animals/lion_4.695b55af.mp3", size: 47538, duration: 11.87 },
+    "/auditory-test/audio/animals/lion_4.wav": { url: "/media/auditory-test/audio/animals/lion_4.a24b6d5b.wav", size: 217146, duration: 9.85 },
+    "/auditory-test/audio/animals/lizard.mp3": { url: "/media/auditory-test/audio/animals/lizard.6a8c80ca.mp3", size: 219009, duration: 13.69 },
+    "/auditory-test/audio/animals/monkey.mp3": { url: "/media/auditory-test/audio/animals/monkey.4c63bde6.mp3", size: 9797, duration: 2.42 },
+    "/auditory-test/audio/animals/monkey.wav": { url: "/media/auditory-test/audio/animals/monkey.c7ca0661.wav", size: 24368, duration: 2.01 },
+    "/auditory-test/audio/animals/monkey_2.mp3": { url: "/media/auditory-test/audio/animals/monkey_2.d2322256.mp3", size: 5733, duration: 1.9 },
+    "/auditory-test/audio/animals/monkey_2.wav": { url: "/media/auditory-test/audio/animals/monkey_2.66ef6972.wav", size: 13626, duration: 1.7 },
+    "/auditory-test/audio/animals/monkey_3.mp3": { url: "/media/auditory-test/audio/animals/monkey_3.28cf86a0.mp3", size: 57451, duration: 7.18 },
+    "/auditory-test/audio/animals/monkey_3.wav": { url: "/media/auditory-test/audio/animals/monkey_3.1c81ef01.wav", size: 476020, duration: 2.7 },
+    "/auditory-test/audio/animals/monkey_4.mp3": { url: "/media/auditory-test/audio/animals/monkey_4.365027d8.mp3", size: 16665, duration: 2.37 },
+    "/auditory-test/audio/animals/monkey_4.wav": { url: "/media/auditory-test/audio/animals/monkey_4.a92ba213.wav", size: 71220, duration: 1.78 },
+    "/auditory-test/audio/animals/mosquito.mp3": { url: "/media/auditory-test/audio/animals/mosquito.7082eb4e.mp3", size: 182229, duration: 11.39 },
+    "/auditory-test/audio/animals/mouse.mp3": { url: "/media/auditory-test/audio/animals/mouse.779b1db6.mp3", size: 16299, duration: 1.02 },
+    "/auditory-test/audio/animals/owl.mp3": { url: "/media/auditory-test/audio/animals/owl.54683b8e.mp3", size: 147956, duration: 9.25 },
+    "/auditory-test/audio/animals/peacock.mp3": { url: "/media/auditory-test/audio/animals/peacock.b52440ea.mp3", size: 103234, duration: 6.45 },
+    "/auditory-test/audio/animals/pig.mp3": { url: "/media/auditory-test/audio/animals/pig.b506bb11.mp3", size: 28838, duration: 1.8 },
+    "/auditory-test/audio/animals/pig_1.mp3": { url: "/media/auditory-test/audio/animals/pig_1.8a67e169.mp3", size: 61782, duration: 8.82 },
+    "/auditory-test/audio/animals/pig_1.wav": { url: "/media/auditory-test/audio/animals/pig_1.866245ac.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_10.mp3": { url: "/media/auditory-test/audio/animals/pig_10.bcc1af6c.mp3", size: 66006, duration: 9.42 },
+    "/auditory-test/audio/animals/pig_10.wav": { url: "/media/auditory-test/audio/animals/pig_10.8ab130e0.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_11.mp3": { url: "/media/auditory-test/audio/animals/pig_11.d57348e6.mp3", size: 62021, duration: 8.85 },
+    "/auditory-test/audio/animals/pig_11.wav": { url: "/media/auditory-test/audio/animals/pig_11.70afaa57.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_12.mp3": { url: "/media/auditory-test/audio/animals/pig_12.218ebca1.mp3", size: 63584, duration: 9.08 },
+    "/auditory-test/audio/animals/pig_12.wav": { url: "/media/auditory-test/audio/animals/pig_12.fbdc5d04.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_13.mp3": { url: "/media/auditory-test/audio/animals/pig_13.075290ce.mp3", size: 64967, duration: 9.27 },
+    "/auditory-test/audio/animals/pig_13.wav": { url: "/media/auditory-test/audio/animals/pig_13.22b884eb.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_14.mp3": { url: "/media/auditory-test/audio/animals/pig_14.2dc563c8.mp3", size: 63143, duration: 9.01 },
+    "/auditory-test/audio/animals/pig_14.wav": { url: "/media/auditory-test/audio/animals/pig_14.4222b9e3.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_15.mp3": { url: "/media/auditory-test/audio/animals/pig_15.48257561.mp3", size: 61944, duration: 8.84 },
+    "/auditory-test/audio/animals/pig_15.wav": { url: "/media/auditory-test/audio/animals/pig_15.e9b0017b.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_16.mp3": { url: "/media/auditory-test/audio/animals/pig_16.aad9fa10.mp3", size: 62042, duration: 8.86 },
+    "/auditory-test/audio/animals/pig_16.wav": { url: "/media/auditory-test/audio/animals/pig_16.3ec937d3.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_17.mp3": { url: "/media/auditory-test/audio/animals/pig_17.69659b80.mp3", size: 39151, duration: 5.59 },
+    "/auditory-test/audio/animals/pig_17.wav": { url: "/media/auditory-test/audio/animals/pig_17.bce22c0b.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_18.mp3": { url: "/media/auditory-test/audio/animals/pig_18.e70a55b6.mp3", size: 61993, duration: 8.85 },
+    "/auditory-test/audio/animals/pig_18.wav": { url: "/media/auditory-test/audio/animals/pig_18.8ed9b723.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_19.mp3": { url: "/media/auditory-test/audio/animals/pig_19.ed416fbf.mp3", size: 66325, duration: 9.47 },
+    "/auditory-test/audio/animals/pig_19.wav": { url: "/media/auditory-test/audio/animals/pig_19.0513f5f2.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_2.mp3": { url: "/media/auditory-test/audio/animals/pig_2.c975d231.mp3", size: 60639, duration: 8.66 },
+    "/auditory-test/audio/animals/pig_2.wav": { url: "/media/auditory-test/audio/animals/pig_2.2d041c16.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_20.mp3": { url: "/media/auditory-test/audio/animals/pig_20.b563b2df.mp3", size: 68700, duration: 9.81 },
+    "/auditory-test/audio/animals/pig_20.wav": { url: "/media/auditory-test/audio/animals/pig_20.1b37ac40.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_21.mp3": { url: "/media/auditory-test/audio/animals/pig_21.e683aca6.mp3", size: 72385, duration: 10.33 },
+    "/auditory-test/audio/animals/pig_21.wav": { url: "/media/auditory-test/audio/animals/pig_21.1fb83a06.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_22.mp3": { url: "/media/auditory-test/audio/animals/pig_22.260c938d.mp3", size: 63247, duration: 9.03 },
+    "/auditory-test/audio/animals/pig_22.wav": { url: "/media/auditory-test/audio/animals/pig_22.a8758acd.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_23.mp3": { url: "/media/auditory-test/audio/animals/pig_23.8de7b172.mp3", size: 67789, duration: 9.68 },
+    "/auditory-test/audio/animals/pig_23.wav": { url: "/media/auditory-test/audio/animals/pig_23.5d2bc9d1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_24.mp3": { url: "/media/auditory-test/audio/animals/pig_24.6a46672c.mp3", size: 61370, duration: 8.76 },
+    "/auditory-test/audio/animals/pig_24.wav": { url: "/media/auditory-test/audio/animals/pig_24.5d8ae655.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_25.mp3": { url: "/media/auditory-test/audio/animals/pig_25.d0be4157.mp3", size: 61219, duration: 8.74 },
+    "/auditory-test/audio/animals/pig_25.wav": { url: "/media/auditory-test/audio/animals/pig_25.a1a29bac.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_26.mp3": { url: "/media/auditory-test/audio/animals/pig_26.8f96e463.mp3", size: 60823, duration: 8.68 },
+    "/auditory-test/audio/animals/pig_26.wav": { url: "/media/auditory-test/audio/animals/pig_26.92f93d98.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_27.mp3": { url: "/media/auditory-test/audio/animals/pig_27.8e8e6588.mp3", size: 62363, duration: 8.9 },
+    "/auditory-test/audio/animals/pig_27.wav": { url: "/media/auditory-test/audio/animals/pig_27.e37e3876.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_28.mp3": { url: "/media/auditory-test/audio/animals/pig_28.90129a51.mp3", size: 61113, duration: 8.72 },
+    "/auditory-test/audio/animals/pig_28.wav": { url: "/media/auditory-test/audio/animals/pig_28.35123a48.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_29.mp3": { url: "/media/auditory-test/audio/animals/pig_29.a0964050.mp3", size: 78634, duration: 11.23 },
+    "/auditory-test/audio/animals/pig_29.wav": { url: "/media/auditory-test/audio/animals/pig_29.f7ec7993.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_3.mp3": { url: "/media/auditory-test/audio/animals/pig_3.a59e96ef.mp3", size: 61656, duration: 8.8 },
+    "/auditory-test/audio/animals/pig_3.wav": { url: "/media/auditory-test/audio/animals/pig_3.060daa95.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_30.mp3": { url: "/media/auditory-test/audio/animals/pig_30.d9ad790b.mp3", size: 62519, duration: 8.92 },
+    "/auditory-test/audio/animals/pig_30.wav": { url: "/media/auditory-test/audio/animals/pig_30.fb80ab27.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_31.mp3": { url: "/media/auditory-test/audio/animals/pig_31.054324eb.mp3", size: 66918, duration: 9.55 },
+    "/auditory-test/audio/animals/pig_31.wav": { url: "/media/auditory-test/audio/animals/pig_31.2fcd8c5c.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_32.mp3": { url: "/media/auditory-test/audio/animals/pig_32.822fe638.mp3", size: 69549, duration: 9.93 },
+    "/auditory-test/audio/animals/pig_32.wav": { url: "/media/auditory-test/audio/animals/pig_32.a5d240fa.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_33.mp3": { url: "/media/auditory-test/audio/animals/pig_33.13352e0e.mp3", size: 60637, duration: 8.66 },
+    "/auditory-test/audio/animals/pig_33.wav": { url: "/media/auditory-test/audio/animals/pig_33.5922660f.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_34.mp3": { url: "/media/auditory-test/audio/animals/pig_34.31c3f3af.mp3", size: 34817, duration: 4.97 },
+    "/auditory-test/audio/animals/pig_34.wav": { url: "/media/auditory-test/audio/animals/pig_34.5c6603bf.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_35.mp3": { url: "/media/auditory-test/audio/animals/pig_35.14930271.mp3", size: 38955, duration: 5.56 },
+    "/auditory-test/audio/animals/pig_35.wav": { url: "/media/auditory-test/audio/animals/pig_35.f18b537a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_36.mp3": { url: "/media/auditory-test/audio/animals/pig_36.d0cb54ce.mp3", size: 28106, duration: 4.01 },
+    "/auditory-test/audio/animals/pig_36.wav": { url: "/media/auditory-test/audio/animals/pig_36.e62aa6dd.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_37.mp3": { url: "/media/auditory-test/audio/animals/pig_37.63ff73b5.mp3", size: 60438, duration: 8.63 },
+    "/auditory-test/audio/animals/pig_37.wav": { url: "/media/auditory-test/audio/animals/pig_37.738fdd92.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_38.mp3": { url: "/media/auditory-test/audio/animals/pig_38.d49eadd2.mp3", size: 24582, duration: 3.51 },
+    "/auditory-test/audio/animals/pig_38.wav": { url: "/media/auditory-test/audio/animals/pig_38.4c82ac9c.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_39.mp3": { url: "/media/auditory-test/audio/animals/pig_39.b59e56ea.mp3", size: 28625, duration: 4.08 },
+    "/auditory-test/audio/animals/pig_39.wav": { url: "/media/auditory-test/audio/animals/pig_39.9da61a42.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_4.mp3": { url: "/media/auditory-test/audio/animals/pig_4.16dc94ba.mp3", size: 64731, duration: 9.24 },
+    "/auditory-test/audio/animals/pig_4.wav": { url: "/media/auditory-test/audio/animals/pig_4.776ae2c1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_40.mp3": { url: "/media/auditory-test/audio/animals/pig_40.72d94b7a.mp3", size: 70386, duration: 10.05 },
+    "/auditory-test/audio/animals/pig_40.wav": { url: "/media/auditory-test/audio/animals/pig_40.afb2e2ad.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_5.mp3": { url: "/media/auditory-test/audio/animals/pig_5.268e9ca1.mp3", size: 64546, duration: 9.21 },
+    "/auditory-test/audio/animals/pig_5.wav": { url: "/media/auditory-test/audio/animals/pig_5.2085c6ff.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_6.mp3": { url: "/media/auditory-test/audio/animals/pig_6.548a6b7d.mp3", size: 67838, duration: 9.68 },
+    "/auditory-test/audio/animals/pig_6.wav": { url: "/media/auditory-test/audio/animals/pig_6.e624cb74.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_7.mp3": { url: "/media/auditory-test/audio/animals/pig_7.96ce087d.mp3", size: 70419, duration: 10.05 },
+    "/auditory-test/audio/animals/pig_7.wav": { url: "/media/auditory-test/audio/animals/pig_7.3c310e4f.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_8.mp3": { url: "/media/auditory-test/audio/animals/pig_8.65884326.mp3", size: 72513, duration: 10.35 },
+    "/auditory-test/audio/animals/pig_8.wav": { url: "/media/auditory-test/audio/animals/pig_8.3c7e3feb.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/pig_9.mp3": { url: "/media/auditory-test/audio/animals/pig_9.1ee4e473.mp3", size: 65639, duration: 9.37 },
+    "/auditory-test/audio/animals/pig_9.wav": { url: "/media/auditory-test/audio/animals/pig_9.a49f779f.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rabbit.mp3": { url: "/media/auditory-test/audio/animals/rabbit.cd7f5176.mp3", size: 68126, duration: 4.26 },
+    "/auditory-test/audio/animals/rooster.mp3": { url: "/media/auditory-test/audio/animals/rooster.e9a757bd.mp3", size: 35761, duration: 5.1 },
+    "/auditory-test/audio/animals/rooster_1.mp3": { url: "/media/auditory-test/audio/animals/rooster_1.e9a757bd.mp3", size: 35761, duration: 5.1 },
+    "/auditory-test/audio/animals/rooster_1.wav": { url: "/media/auditory-test/audio/animals/rooster_1.9021db2a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_10.mp3": { url: "/media/auditory-test/audio/animals/rooster_10.2d1cfbac.mp3", size: 35975, duration: 5.13 },
+    "/auditory-test/audio/animals/rooster_10.wav": { url: "/media/auditory-test/audio/animals/rooster_10.665283ba.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_11.mp3": { url: "/media/auditory-test/audio/animals/rooster_11.8773840a.mp3", size: 59181, duration: 8.45 },
+    "/auditory-test/audio/animals/rooster_11.wav": { url: "/media/auditory-test/audio/animals/rooster_11.0e66be15.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_12.mp3": { url: "/media/auditory-test/audio/animals/rooster_12.475b17fe.mp3", size: 60431, duration: 8.63 },
+    "/auditory-test/audio/animals/rooster_12.wav": { url: "/media/auditory-test/audio/animals/rooster_12.ffbbe318.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_13.mp3": { url: "/media/auditory-test/audio/animals/rooster_13.33fe97ca.mp3", size: 38078, duration: 5.43 },
+    "/auditory-test/audio/animals/rooster_13.wav": { url: "/media/auditory-test/audio/animals/rooster_13.21fae7e7.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_14.mp3": { url: "/media/auditory-test/audio/animals/rooster_14.134a109a.mp3", size: 45409, duration: 6.48 },
+    "/auditory-test/audio/animals/rooster_14.wav": { url: "/media/auditory-test/audio/animals/rooster_14.d28ca7b6.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_15.mp3": { url: "/media/auditory-test/audio/animals/rooster_15.2b2634bf.mp3", size: 53274, duration: 7.6 },
+    "/auditory-test/audio/animals/rooster_15.wav": { url: "/media/auditory-test/audio/animals/rooster_15.f3d02c68.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_16.mp3": { url: "/media/auditory-test/audio/animals/rooster_16.71952ea2.mp3", size: 35533, duration: 5.07 },
+    "/auditory-test/audio/animals/rooster_16.wav": { url: "/media/auditory-test/audio/animals/rooster_16.21a1734a.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_17.mp3": { url: "/media/auditory-test/audio/animals/rooster_17.b0d864c2.mp3", size: 35338, duration: 5.04 },
+    "/auditory-test/audio/animals/rooster_17.wav": { url: "/media/auditory-test/audio/animals/rooster_17.18c72ca3.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_18.mp3": { url: "/media/auditory-test/audio/animals/rooster_18.18f78398.mp3", size: 52803, duration: 7.54 },
+    "/auditory-test/audio/animals/rooster_18.wav": { url: "/media/auditory-test/audio/animals/rooster_18.04154679.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_19.mp3": { url: "/media/auditory-test/audio/animals/rooster_19.d6d5e493.mp3", size: 46276, duration: 6.6 },
+    "/auditory-test/audio/animals/rooster_19.wav": { url: "/media/auditory-test/audio/animals/rooster_19.2ccd8659.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_2.mp3": { url: "/media/auditory-test/audio/animals/rooster_2.ef61612d.mp3", size: 37020, duration: 5.28 },
+    "/auditory-test/audio/animals/rooster_2.wav": { url: "/media/auditory-test/audio/animals/rooster_2.3bb615f7.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_20.mp3": { url: "/media/auditory-test/audio/animals/rooster_20.69fb466a.mp3", size: 40150, duration: 5.73 },
+    "/auditory-test/audio/animals/rooster_20.wav": { url: "/media/auditory-test/audio/animals/rooster_20.55944b46.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_21.mp3": { url: "/media/auditory-test/audio/animals/rooster_21.806bd45a.mp3", size: 39790, duration: 5.68 },
+    "/auditory-test/audio/animals/rooster_21.wav": { url: "/media/auditory-test/audio/animals/rooster_21.20a3a8bb.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_22.mp3": { url: "/media/auditory-test/audio/animals/rooster_22.92136f9d.mp3", size: 34561, duration: 4.93 },
+    "/auditory-test/audio/animals/rooster_22.wav": { url: "/media/auditory-test/audio/animals/rooster_22.0ab04272.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_23.mp3": { url: "/media/auditory-test/audio/animals/rooster_23.7394f43a.mp3", size: 53835, duration: 7.68 },
+    "/auditory-test/audio/animals/rooster_23.wav": { url: "/media/auditory-test/audio/animals/rooster_23.6ffb2cb8.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_24.mp3": { url: "/media/auditory-test/audio/animals/rooster_24.593dd9a1.mp3", size: 38269, duration: 5.46 },
+    "/auditory-test/audio/animals/rooster_24.wav": { url: "/media/auditory-test/audio/animals/rooster_24.941201c0.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_25.mp3": { url: "/media/auditory-test/audio/animals/rooster_25.356c3aed.mp3", size: 53240, duration: 7.6 },
+    "/auditory-test/audio/animals/rooster_25.wav": { url: "/media/auditory-test/audio/animals/rooster_25.95b7f782.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_26.mp3": { url: "/media/auditory-test/audio/animals/rooster_26.c2d5c33e.mp3", size: 38817, duration: 5.54 },
+    "/auditory-test/audio/animals/rooster_26.wav": { url: "/media/auditory-test/audio/animals/rooster_26.08b35648.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_27.mp3": { url: "/media/auditory-test/audio/animals/rooster_27.11473015.mp3", size: 41077, duration: 5.86 },
+    "/auditory-test/audio/animals/rooster_27.wav": { url: "/media/auditory-test/audio/animals/rooster_27.60ddaf0f.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_28.mp3": { url: "/media/auditory-test/audio/animals/rooster_28.d2225b9e.mp3", size: 41707, duration: 5.95 },
+    "/auditory-test/audio/animals/rooster_28.wav": { url: "/media/auditory-test/audio/animals/rooster_28.34e4f9b7.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_29.mp3": { url: "/media/auditory-test/audio/animals/rooster_29.d80e1994.mp3", size: 43607, duration: 6.22 },
+    "/auditory-test/audio/animals/rooster_29.wav": { url: "/media/auditory-test/audio/animals/rooster_29.96f91f5d.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_3.mp3": { url: "/media/auditory-test/audio/animals/rooster_3.5dc38d7d.mp3", size: 31736, duration: 4.53 },
+    "/auditory-test/audio/animals/rooster_3.wav": { url: "/media/auditory-test/audio/animals/rooster_3.4085bfea.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_30.mp3": { url: "/media/auditory-test/audio/animals/rooster_30.6bf166b1.mp3", size: 39523, duration: 5.64 },
+    "/auditory-test/audio/animals/rooster_30.wav": { url: "/media/auditory-test/audio/animals/rooster_30.54247657.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_31.mp3": { url: "/media/auditory-test/audio/animals/rooster_31.03ffd68b.mp3", size: 47753, duration: 6.82 },
+    "/auditory-test/audio/animals/rooster_31.wav": { url: "/media/auditory-test/audio/animals/rooster_31.0cb40e86.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_32.mp3": { url: "/media/auditory-test/audio/animals/rooster_32.e6dc722a.mp3", size: 39917, duration: 5.7 },
+    "/auditory-test/audio/animals/rooster_32.wav": { url: "/media/auditory-test/audio/animals/rooster_32.b3daaeac.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_33.mp3": { url: "/media/auditory-test/audio/animals/rooster_33.90d0614b.mp3", size: 58475, duration: 8.35 },
+    "/auditory-test/audio/animals/rooster_33.wav": { url: "/media/auditory-test/audio/animals/rooster_33.78561579.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_34.mp3": { url: "/media/auditory-test/audio/animals/rooster_34.d69fda68.mp3", size: 61312, duration: 8.75 },
+    "/auditory-test/audio/animals/rooster_34.wav": { url: "/media/auditory-test/audio/animals/rooster_34.b263df73.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_35.mp3": { url: "/media/auditory-test/audio/animals/rooster_35.b60ec501.mp3", size: 48300, duration: 6.89 },
+    "/auditory-test/audio/animals/rooster_35.wav": { url: "/media/auditory-test/audio/animals/rooster_35.6c5e64aa.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_36.mp3": { url: "/media/auditory-test/audio/animals/rooster_36.1e2a43f1.mp3", size: 48827, duration: 6.97 },
+    "/auditory-test/audio/animals/rooster_36.wav": { url: "/media/auditory-test/audio/animals/rooster_36.e98e4171.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_37.mp3": { url: "/media/auditory-test/audio/animals/rooster_37.04e1493a.mp3", size: 50812, duration: 7.25 },
+    "/auditory-test/audio/animals/rooster_37.wav": { url: "/media/auditory-test/audio/animals/rooster_37.a29c86e2.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_38.mp3": { url: "/media/auditory-test/audio/animals/rooster_38.f6b7a82d.mp3", size: 41876, duration: 5.98 },
+    "/auditory-test/audio/animals/rooster_38.wav": { url: "/media/auditory-test/audio/animals/rooster_38.efa062fe.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_39.mp3": { url: "/media/auditory-test/audio/animals/rooster_39.bada35a0.mp3", size: 42028, duration: 6.0 },
+    "/auditory-test/audio/animals/rooster_39.wav": { url: "/media/auditory-test/audio/animals/rooster_39.89cfcee1.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_4.mp3": { url: "/media/auditory-test/audio/animals/rooster_4.18e36768.mp3", size: 32727, duration: 4.67 },
+    "/auditory-test/audio/animals/rooster_4.wav": { url: "/media/auditory-test/audio/animals/rooster_4.55c3e6b3.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_40.mp3": { url: "/media/auditory-test/audio/animals/rooster_40.e028d65a.mp3", size: 41612, duration: 5.94 },
+    "/auditory-test/audio/animals/rooster_40.wav": { url: "/media/auditory-test/audio/animals/rooster_40.8f0a677c.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_5.mp3": { url: "/media/auditory-test/audio/animals/rooster_5.7982a33e.mp3", size: 41611, duration: 5.94 },
+    "/auditory-test/audio/animals/rooster_5.wav": { url: "/media/auditory-test/audio/animals/rooster_5.62379ace.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_6.mp3": { url: "/media/auditory-test/audio/animals/rooster_6.f9614172.mp3", size: 42368, duration: 6.05 },
+    "/auditory-test/audio/animals/rooster_6.wav": { url: "/media/auditory-test/audio/animals/rooster_6.5b6f2f37.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_7.mp3": { url: "/media/auditory-test/audio/animals/rooster_7.0ac22b94.mp3", size: 45272, duration: 6.46 },
+    "/auditory-test/audio/animals/rooster_7.wav": { url: "/media/auditory-test/audio/animals/rooster_7.95fff216.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_8.mp3": { url: "/media/auditory-test/audio/animals/rooster_8.48390e74.mp3", size: 36598, duration: 5.22 },
+    "/auditory-test/audio/animals/rooster_8.wav": { url: "/media/auditory-test/audio/animals/rooster_8.f8958a10.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/rooster_9.mp3": { url: "/media/auditory-test/audio/animals/rooster_9.e2792c64.mp3", size: 45563, duration: 6.5 },
+    "/auditory-test/audio/animals/rooster_9.wav": { url: "/media/auditory-test/audio/animals/rooster_9.53704d16.wav", size: 441044, duration: 5.0 },
+    "/auditory-test/audio/animals/sheep.mp3": { url: "/media/auditory-test/audio/animals/sheep.59d6c90d.mp3", size: 5457, duration: 1.35 },
+    "/auditory-test/audio/animals/sheep.wav": { url: "/media/auditory-test/audio/animals/sheep.c263668f.wav", size: 12564, duration: 1.14 },
+    "/auditory-test/audio/animals/sheep_2.mp3": { url: "/media/auditory-test/audio/animals/sheep_2.05d0e810.mp3", size: 4127, duration: 1.34 },
+    "/auditory-test/audio/animals/sheep_2.wav": { url: "/media/auditory-test/audio/animals/sheep_2.ee804bf7.wav", size: 8256, duration: 1.02 },
+    "/auditory-test/audio/animals/sheep_3.mp3": { url: "/media/auditory-test/audio/animals/sheep_3.2426ac9f.mp3", size: 44086, duration: 5.51 },
+    "/auditory-test/audio/animals/sheep_3.wav": { url: "/media/auditory-test/audio/animals/sheep_3.10ce9fe7.wav", size: 345884, duration: 1.96 },
+    "/auditory-test/audio/animals/sheep_4.mp3": { url: "/media/auditory-test/audio/animals/sheep_4.710e702f.mp3", size: 7173, duration: 2.38 },
+    "/auditory-test/audio/animals/sheep_4.wav": { url: "/media/auditory-test/audio/animals/sheep_4.dc91972a.wav", size: 17559, duration: 2.19 },
+    "/auditory-test/audio/animals/snake.mp3": { url: "/media/auditory-test/audio/animals/snake.e0a8612e.mp3", size: 175541, duration: 10.97 },
+    "/auditory-test/audio/animals/squirrel.mp3": { url: "/media/auditory-test/audio/animals/squirrel.38d2ad5b.mp3", size: 16340, duration: 1.02 },
+    "/auditory-test/audio/animals/tiger.mp3": { url: "/media/auditory-test/audio/animals/tiger.9c1e79dd.mp3", size: 29674, duration: 1.85 },
+    "/auditory-test/audio/animals/turkey.mp3": { url: "/media/auditory-test/audio/animals/turkey.b29d6b50.mp3", size: 31346, duration: 1.96 },
+    "/auditory-test/audio/animals/whale.mp3": { url: "/media/auditory-test/audio/animals/whale.aa81237a.mp3", size: 244087, duration: 15.26 },
+    "/auditory-test/audio/animals/wolf.mp3": { url: "/media/auditory-test/audio/animals/wolf.8c3eb1b5.mp3", size: 78993, duration: 4.94 },
+    "/auditory-test/audio/animals/zebra.mp3": { url: "/media/auditory-test/audio/animals/zebra.1340e258.mp3", size: 164674, duration: 10.29 },
+    "/auditory-test/audio/apple.mp3": { url: "/media/auditory-test/audio/apple.df52b731.mp3", size: 9408, duration: 1.18 },
+    "/auditory-test/audio/backpack.mp3": { url: "/media/auditory-test/audio/backpack.0c2f43cc.mp3", size: 9024, duration: 1.13 },
+    "/auditory-test/audio/bag.mp3": { url: "/media/auditory-test/audio/bag.fd5d2fef.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/ball.mp3": { url: "/media/auditory-test/audio/ball.e1f23b5f.mp3", size: 6912, duration: 0.86 },
+    "/auditory-test/audio/banana.mp3": { url: "/media/auditory-test/audio/banana.287a0c6b.mp3", size: 8064, duration: 1.01 },
+    "/auditory-test/audio/bear.mp3": { url: "/media/auditory-test/audio/bear.a517d10e.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/bed.mp3": { url: "/media/auditory-test/audio/bed.76ef827d.mp3", size: 9024, duration: 1.13 },
+    "/auditory-test/audio/bee.mp3": { url: "/media/auditory-test/audio/bee.58ca5908.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/bicycle.mp3": { url: "/media/auditory-test/audio/bicycle.002789ae.mp3", size: 10368, duration: 1.3 },
+    "/auditory-test/audio/bird.mp3": { url: "/media/auditory-test/audio/bird.fa13a232.mp3", size: 8256, duration: 1.03 },
+    "/auditory-test/audio/book.mp3": { url: "/media/auditory-test/audio/book.f981ddbb.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/boots.mp3": { url: "/media/auditory-test/audio/boots.a9988e13.mp3", size: 9024, duration: 1.13 },
+    "/auditory-test/audio/bread.mp3": { url: "/media/auditory-test/audio/bread.20fff467.mp3", size: 7104, duration: 0.89 },
+    "/auditory-test/audio/bucket.mp3": { url: "/media/auditory-test/audio/bucket.47cd807c.mp3", size: 7488, duration: 0.94 },
+    "/auditory-test/audio/burger.mp3": { url: "/media/auditory-test/audio/burger.c83a3f0c.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/bus.mp3": { url: "/media/auditory-test/audio/bus.496ff2ae.mp3", size: 9984, duration: 1.25 },
+    "/auditory-test/audio/butterfly.mp3": { url: "/media/auditory-test/audio/butterfly.18d3fe2d.mp3", size: 9408, duration: 1.18 },
+    "/auditory-test/audio/cake.mp3": { url: "/media/auditory-test/audio/cake.14701838.mp3", size: 6912, duration: 0.86 },
+    "/auditory-test/audio/car.mp3": { url: "/media/auditory-test/audio/car.ab3d6ba9.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/carrot.mp3": { url: "/media/auditory-test/audio/carrot.7ade786d.mp3", size: 9408, duration: 1.18 },
+    "/auditory-test/audio/cat.mp3": { url: "/media/auditory-test/audio/cat.b18023ae.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/chair.mp3": { url: "/media/auditory-test/audio/chair.074b184a.mp3", size: 7680, duration: 0.96 },
+    "/auditory-test/audio/cheese.mp3": { url: "/media/auditory-test/audio/cheese.f1fcaf29.mp3", size: 6720, duration: 0.84 },
+    "/auditory-test/audio/chicken.mp3": { url: "/media/auditory-test/audio/chicken.2a1eabef.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/clock.mp3": { url: "/media/auditory-test/audio/clock.80e7a183.mp3", size: 7488, duration: 0.94 },
+    "/auditory-test/audio/cloud.mp3": { url: "/media/auditory-test/audio/cloud.14db9c32.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/computer.mp3": { url: "/media/auditory-test/audio/computer.475591bb.mp3", size: 9216, duration: 1.15 },
+    "/auditory-test/audio/cow.mp3": { url: "/media/auditory-test/audio/cow.560a1a3f.mp3", size: 8064, duration: 1.01 },
+    "/auditory-test/audio/cucumber.mp3": { url: "/media/auditory-test/audio/cucumber.2f72895b.mp3", size: 9024, duration: 1.13 },
+    "/auditory-test/audio/cup.mp3": { url: "/media/auditory-test/audio/cup.d58d1388.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/dog.mp3": { url: "/media/auditory-test/audio/dog.244fdb64.mp3", size: 9024, duration: 1.13 },
+    "/auditory-test/audio/door.mp3": { url: "/media/auditory-test/audio/door.35a00991.mp3", size: 6528, duration: 0.82 },
+    "/auditory-test/audio/dress.mp3": { url: "/media/auditory-test/audio/dress.9e42e89e.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/duck.mp3": { url: "/media/auditory-test/audio/duck.fe3e816a.mp3", size: 7488, duration: 0.94 },
+    "/auditory-test/audio/egg.mp3": { url: "/media/auditory-test/audio/egg.092dfdce.mp3", size: 7680, duration: 0.96 },
+    "/auditory-test/audio/elephant.mp3": { url: "/media/auditory-test/audio/elephant.c2ef1dcb.mp3", size: 8256, duration: 1.03 },
+    "/auditory-test/audio/fish.mp3": { url: "/media/auditory-test/audio/fish.78aaef9e.mp3", size: 6912, duration: 0.86 },
+    "/auditory-test/audio/flower.mp3": { url: "/media/auditory-test/audio/flower.df741a98.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/fork.mp3": { url: "/media/auditory-test/audio/fork.3b6757f8.mp3", size: 8256, duration: 1.03 },
+    "/auditory-test/audio/frog.mp3": { url: "/media/auditory-test/audio/frog.850de1ec.mp3", size: 9216, duration: 1.15 },
+    "/auditory-test/audio/giraffe.mp3": { url: "/media/auditory-test/audio/giraffe.88a92a35.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/glasses.mp3": { url: "/media/auditory-test/audio/glasses.81cd8f13.mp3", size: 7104, duration: 0.89 },
+    "/auditory-test/audio/gloves.mp3": { url: "/media/auditory-test/audio/gloves.fcc8eeb1.mp3", size: 10368, duration: 1.3 },
+    "/auditory-test/audio/grapes.mp3": { url: "/media/auditory-test/audio/grapes.16056ffa.mp3", size: 9600, duration: 1.2 },
+    "/auditory-test/audio/hat.mp3": { url: "/media/auditory-test/audio/hat.a38a5599.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/horse.mp3": { url: "/media/auditory-test/audio/horse.940a050a.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/house.mp3": { url: "/media/auditory-test/audio/house.bbfe84d6.mp3", size: 6912, duration: 0.86 },
+    "/auditory-test/audio/ice_cream.mp3": { url: "/media/auditory-test/audio/ice_cream.a544ead6.mp3", size: 10176, duration: 1.27 },
+    "/auditory-test/audio/jacket.mp3": { url: "/media/auditory-test/audio/jacket.afae3c2a.mp3", size: 8256, duration: 1.03 },
+    "/auditory-test/audio/juice.mp3": { url: "/media/auditory-test/audio/juice.5860fce3.mp3", size: 7680, duration: 0.96 },
+    "/auditory-test/audio/key.mp3": { url: "/media/auditory-test/audio/key.6d001205.mp3", size: 7488, duration: 0.94 },
+    "/auditory-test/audio/kite.mp3": { url: "/media/auditory-test/audio/kite.ecb1b533.mp3", size: 12672, duration: 1.58 },
+    "/auditory-test/audio/lamp.mp3": { url: "/media/auditory-test/audio/lamp.66fa8a36.mp3", size: 8064, duration: 1.01 },
+    "/auditory-test/audio/lemon.mp3": { url: "/media/auditory-test/audio/lemon.7d88d3ca.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/lion.mp3": { url: "/media/auditory-test/audio/lion.89240636.mp3", size: 7104, duration: 0.89 },
+    "/auditory-test/audio/lock.mp3": { url: "/media/auditory-test/audio/lock.326d41de.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/milk.mp3": { url: "/media/auditory-test/audio/milk.90ab2483.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/monkey.mp3": { url: "/media/auditory-test/audio/monkey.79b76bd1.mp3", size: 9792, duration: 1.22 },
+    "/auditory-test/audio/moon.mp3": { url: "/media/auditory-test/audio/moon.c0f9f261.mp3", size: 7296, duration: 0.91 },
+    "/auditory-test/audio/mountain.mp3": { url: "/media/auditory-test/audio/mountain.88253992.mp3", size: 6720, duration: 0.84 },
+    "/auditory-test/audio/mushroom.mp3": { url: "/media/auditory-test/audio/mushroom.604d7945.mp3", size: 7104, duration: 0.89 },
+    "/auditory-test/audio/orange.mp3": { url: "/media/auditory-test/audio/orange.d6657838.mp3", size: 9600, duration: 1.2 },
+    "/auditory-test/audio/owl.mp3": { url: "/media/auditory-test/audio/owl.1813cfd7.mp3", size: 7488, duration: 0.94 },
+    "/auditory-test/audio/pants.mp3": { url: "/media/auditory-test/audio/pants.fb2cf164.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/pear.mp3": { url: "/media/auditory-test/audio/pear.54fde792.mp3", size: 8256, duration: 1.03 },
+    "/auditory-test/audio/pencil.mp3": { url: "/media/auditory-test/audio/pencil.c40c2757.mp3", size: 10176, duration: 1.27 },
+    "/auditory-test/audio/penguin.mp3": { url: "/media/auditory-test/audio/penguin.2318d971.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/phone.mp3": { url: "/media/auditory-test/audio/phone.4fb35174.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/pig.mp3": { url: "/media/auditory-test/audio/pig.7801f0fa.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/pillow.mp3": { url: "/media/auditory-test/audio/pillow.0dda37e3.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/pizza.mp3": { url: "/media/auditory-test/audio/pizza.f3fc0457.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/plate.mp3": { url: "/media/auditory-test/audio/plate.0439cda2.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/potato.mp3": { url: "/media/auditory-test/audio/potato.db5a3d26.mp3", size: 9408, duration: 1.18 },
+    "/auditory-test/audio/rabbit.mp3": { url: "/media/auditory-test/audio/rabbit.15808bde.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/rain.mp3": { url: "/media/auditory-test/audio/rain.1d862230.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/scarf.mp3": { url: "/media/auditory-test/audio/scarf.6a888d30.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/sheep.mp3": { url: "/media/auditory-test/audio/sheep.cbf530e9.mp3", size: 7680, duration: 0.96 },
+    "/auditory-test/audio/ship.mp3": { url: "/media/auditory-test/audio/ship.a48a3baf.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/shirt.mp3": { url: "/media/auditory-test/audio/shirt.f4c30489.mp3", size: 9024, duration: 1.13 },
+    "/auditory-test/audio/shorts.mp3": { url: "/media/auditory-test/audio/shorts.3b3b6db9.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/shovel.mp3": { url: "/media/auditory-test/audio/shovel.a19e2aa0.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/skirt.mp3": { url: "/media/auditory-test/audio/skirt.64bc9d4e.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/snake.mp3": { url: "/media/auditory-test/audio/snake.3846fb6b.mp3", size: 8064, duration: 1.01 },
+    "/auditory-test/audio/snowman.mp3": { url: "/media/auditory-test/audio/snowman.9c73f260.mp3", size: 9792, duration: 1.22 },
+    "/auditory-test/audio/sofa.mp3": { url: "/media/auditory-test/audio/sofa.a1a445ba.mp3", size: 8064, duration: 1.01 },
+    "/auditory-test/audio/spider.mp3": { url: "/media/auditory-test/audio/spider.b1e2cb2e.mp3", size: 8064, duration: 1.01 },
+    "/auditory-test/audio/spoon.mp3": { url: "/media/auditory-test/audio/spoon.c5ec6a63.mp3", size: 8256, duration: 1.03 },
+    "/auditory-test/audio/star.mp3": { url: "/media/auditory-test/audio/star.5f894440.mp3", size: 8256, duration: 1.03 },
+    "/auditory-test/audio/strawberry.mp3": { url: "/media/auditory-test/audio/strawberry.e7b9056a.mp3", size: 9408, duration: 1.18 },
+    "/auditory-test/audio/sun.mp3": { url: "/media/auditory-test/audio/sun.5dd84db9.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/table.mp3": { url: "/media/auditory-test/audio/table.0c41be5c.mp3", size: 7488, duration: 0.94 },
+    "/auditory-test/audio/television.mp3": { url: "/media/auditory-test/audio/television.961593a0.mp3", size: 9600, duration: 1.2 },
+    "/auditory-test/audio/tiger.mp3": { url: "/media/auditory-test/audio/tiger.18cdea47.mp3", size: 6912, duration: 0.86 },
+    "/auditory-test/audio/tomato.mp3": { url: "/media/auditory-test/audio/tomato.e9c06212.mp3", size: 7872, duration: 0.98 },
+    "/auditory-test/audio/train.mp3": { url: "/media/auditory-test/audio/train.c2f9db44.mp3", size: 8064, duration: 1.01 },
+    "/auditory-test/audio/tree.mp3": { url: "/media/auditory-test/audio/tree.bcb19829.mp3", size: 8448, duration: 1.06 },
+    "/auditory-test/audio/tshirt.mp3": { url: "/media/auditory-test/audio/tshirt.99486368.mp3", size: 9600, duration: 1.2 },
+    "/auditory-test/audio/turtle.mp3": { url: "/media/auditory-test/audio/turtle.aeb705c8.mp3", size: 10176, duration: 1.27 },
+    "/auditory-test/audio/umbrella.mp3": { url: "/media/auditory-test/audio/umbrella.87dd17ad.mp3", size: 8832, duration: 1.1 },
+    "/auditory-test/audio/watermelon.mp3": { url: "/media/auditory-test/audio/watermelon.5ed76794.mp3", size: 8640, duration: 1.08 },
+    "/auditory-test/audio/window.mp3": { url: "/media/auditory-test/audio/window.9de58428.mp3", size: 7104, duration: 0.89 },
+    "/auditory-test/audio/zebra.mp3": { url: "/media/auditory-test/audio/zebra.61730de3.mp3", size: 8448, duration: 1.06 },
+};
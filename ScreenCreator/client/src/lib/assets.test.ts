@@ -0,0 +1,32 @@
+import { describe, it, expect } from 'vitest';
+import { assetUrl, assetInfo } from './assets';
+
+const manifest = {
+    '/auditory-test/audio/cat.mp3': { url: '/media/auditory-test/audio/cat.1a2b3c4d.mp3', size: 1024, duration: 1.2 },
+};
+
+describe('assetUrl', () => {
+    it('should return the hashed url in production', () => {
+        expect(assetUrl('/auditory-test/audio/cat.mp3', manifest, false))
+            .toBe('/media/auditory-test/audio/cat.1a2b3c4d.mp3');
+    });
+
+    it('should fall back to the original path for unpublished files', () => {
+        expect(assetUrl('/auditory-test/audio/dog.mp3', manifest, false)).toBe('/auditory-test/audio/dog.mp3');
+    });
+
+    it('should keep the original path in development', () => {
+        expect(assetUrl('/auditory-test/audio/cat.mp3', manifest, true)).toBe('/auditory-test/audio/cat.mp3');
+    });
+});
+
+describe('assetInfo', () => {
+    it('should expose size and duration', () => {
+        expect(assetInfo('/auditory-test/audio/cat.mp3', manifest)).toEqual({
+            url: '/media/auditory-test/audio/cat.1a2b3c4d.mp3',
+            size: 1024,
+            duration: 1.2,
+        });
+        expect(assetInfo('/missing.mp3', manifest)).toBeUndefined();
+    });
+});
@@ -0,0 +1,23 @@
+import { assetManifest, type AssetEntry } from "./asset-manifest";
+
+/**
+ * Resolve a public media path (e.g. "/auditory-test/audio/cat.mp3") to its
+ * content-hashed URL from scripts/publish_assets.py. In development, or for
+ * files that were not published, the original path is returned.
+ */
+export function assetUrl(
+    path: string,
+    manifest: Record<string, AssetEntry> = assetManifest,
+    dev: boolean = import.meta.env.DEV,
+): string {
+    if (dev) return path;
+    return manifest[path]?.url ?? path;
+}
+
+/** Size and duration recorded for a published file, if any. */
+export function assetInfo(
+    path: string,
+    manifest: Record<string, AssetEntry> = assetManifest,
+): AssetEntry | undefined {
+    return manifest[path];
+}
@@ -0,0 +1,39 @@
+import { describe, it, expect, vi } from 'vitest';
+import { prefetchTraining } from './prefetch';
+
+const assets = {
+    'fly-test': { bytes: 3000, files: ['/audio/directions/up.mp3', '/audio/directions/down.mp3', '/missing.mp3'] },
+    'memory-cards': { bytes: 100 * 1024 * 1024, files: ['/word-images/gus.png'] },
+};
+
+const okFetch = vi.fn(async (url: RequestInfo | URL) => {
+    const ok = !String(url).includes('missing');
+    return { ok, blob: async () => new Blob() } as Response;
+});
+
+describe('prefetchTraining', () => {
+    it('should fetch every file of the training', async () => {
+        okFetch.mockClear();
+        const result = await prefetchTraining('fly-test', { assets, fetcher: okFetch, concurrency: 2 });
+        expect(okFetch).toHaveBeenCalledTimes(3);
+        expect(result).toEqual({ loaded: 2, failed: 1, skipped: false });
+    });
+
+    it('should skip trainings over the byte limit', async () => {
+        okFetch.mockClear();
+        const result = await prefetchTraining('memory-cards', { assets, fetcher: okFetch });
+        expect(okFetch).not.toHaveBeenCalled();
+        expect(result.skipped).toBe(true);
+    });
+
+    it('should skip unknown trainings', async () => {
+        const result = await prefetchTraining('unknown', { assets, fetcher: okFetch });
+        expect(result.skipped).toBe(true);
+    });
+
+    it('should count network errors as failures', async () => {
+        const failing = vi.fn(async () => { throw new Error('offline'); });
+        const result = await prefetchTraining('fly-test', { assets, fetcher: failing as unknown as typeof fetch });
+        expect(result).toEqual({ loaded: 0, failed: 3, skipped: false });
+    });
+});
@@ -0,0 +1,62 @@
+import { trainingAssets, type TrainingAssets } from "./training-assets";
+
+export interface PrefetchOptions {
+    /** Parallel requests */
+    concurrency?: number;
+    /** Trainings heavier than this are left to load on demand */
+    maxBytes?: number;
+    signal?: AbortSignal;
+    assets?: Record<string, TrainingAssets>;
+    fetcher?: typeof fetch;
+}
+
+export interface PrefetchResult {
+    loaded: number;
+    failed: number;
+    skipped: boolean;
+}
+
+export const PREFETCH_MAX_BYTES = 20 * 1024 * 1024;
+const PREFETCH_CONCURRENCY = 4;
+
+/**
+ * Warm the HTTP cache with one training's media (from
+ * scripts/bundle_trainings.py), so the first trial does not stall on a
+ * network request. Failures are counted, never thrown.
+ */
+export async function prefetchTraining(trainingId: string, options: PrefetchOptions = {}): Promise<PrefetchResult> {
+    const {
+        concurrency = PREFETCH_CONCURRENCY,
+        maxBytes = PREFETCH_MAX_BYTES,
+        signal,
+        assets = trainingAssets,
+        fetcher = fetch,
+    } = options;
+
+    const entry = assets[trainingId];
+    if (!entry || entry.bytes > maxBytes) {
+        return { loaded: 0, failed: 0, skipped: true };
+    }
+
+    const queue = [...entry.files];
+    let loaded = 0;
+    let failed = 0;
+
+    const worker = async () => {
+        while (queue.length > 0 && !signal?.aborted) {
+            const url = queue.shift()!;
+            try {
+                const response = await fetcher(url, { signal });
+                // Read the body so the whole file lands in the cache
+                await response.blob();
+                if (response.ok) loaded++;
+                else failed++;
+            } catch {
+                failed++;
+            }
+        }
+    };
+
+    await Promise.all(Array.from({ length: Math.min(concurrency, queue.length) }, worker));
+    return { loaded, failed, skipped: false };
+}
@@ -0,0 +1,1571 @@
+// Generated by scripts/bundle_trainings.py, do not edit by hand.
+
+export interface TrainingAssets {
+    bytes: number;
+    files: string[];
+}
+
+export const trainingAssets: Record<string, TrainingAssets> = {
+    "admin": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "alphabet-game": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "anagram-picture-test": {
+        bytes: 117968368,
+        files: [
+            "/word-images/akula.png",
+            "/word-images/apelsin.png",
+            "/word-images/arbuz.png",
+            "/word-images/avtobus.png",
+            "/word-images/baba.png",
+            "/word-images/babochka.png",
+            "/word-images/babushka.png",
+            "/word-images/banan.png",
+            "/word-images/baraban.png",
+            "/word-images/baran.png",
+            "/word-images/belka.png",
+            "/word-images/botinki.png",
+            "/word-images/bryuki.png",
+            "/word-images/butylka.png",
+            "/word-images/chashka.png",
+            "/word-images/chasy.png",
+            "/word-images/cherepaha.png",
+            "/word-images/chereshnya.png",
+            "/word-images/cvetok.png",
+            "/word-images/cyplyonok.png",
+            "/word-images/dedushka.png",
+            "/word-images/delfin.png",
+            "/word-images/derevo.png",
+            "/word-images/devochka.png",
+            "/word-images/doma.png",
+            "/word-images/domik.png",
+            "/word-images/dver.png",
+            "/word-images/dyadya.png",
+            "/word-images/dynya.png",
+            "/word-images/futbolka.png",
+            "/word-images/garmoshka.png",
+            "/word-images/gitara.png",
+            "/word-images/gnezdo.png",
+            "/word-images/gora.png",
+            "/word-images/grib.png",
+            "/word-images/grusha.png",
+            "/word-images/gruzovik.png",
+            "/word-images/gus.png",
+            "/word-images/igrushka.png",
+            "/word-images/izbushka.png",
+            "/word-images/kacheli.png",
+            "/word-images/kamen.png",
+            "/word-images/kapusta.png",
+            "/word-images/karandash.png",
+            "/word-images/kartina.png",
+            "/word-images/kartoshka.png",
+            "/word-images/karusel.png",
+            "/word-images/kasha.png",
+            "/word-images/kastryulya.png",
+            "/word-images/kino.png",
+            "/word-images/kit.png",
+            "/word-images/klubnika.png",
+            "/word-images/klyuch.png",
+            "/word-images/kniga.png",
+            "/word-images/kolco.png",
+            "/word-images/kolobok.png",
+            "/word-images/konfeta.png",
+            "/word-images/korabl.png",
+            "/word-images/korobka.png",
+            "/word-images/korova.png",
+            "/word-images/koshka.png",
+            "/word-images/kotik.png",
+            "/word-images/kotyonok.png",
+            "/word-images/koza.png",
+            "/word-images/kozlyonok.png",
+            "/word-images/kozyol.png",
+            "/word-images/krokodil.png",
+            "/word-images/krovat.png",
+            "/word-images/kubik.png",
+            "/word-images/kukla.png",
+            "/word-images/kukuruza.png",
+            "/word-images/kurica.png",
+            "/word-images/kuznechik.png",
+            "/word-images/lampa.png",
+            "/word-images/lapa.png",
+            "/word-images/lastochka.png",
+            "/word-images/leto.png",
+            "/word-images/lev.png",
+            "/word-images/leyka.png",
+            "/word-images/limon.png",
+            "/word-images/lisa.png",
+            "/word-images/lisyonok.png",
+            "/word-images/lodka.png",
+            "/word-images/lopata.png",
+            "/word-images/lopatka.png",
+            "/word-images/loshad.png",
+            "/word-images/lozhka.png",
+            "/word-images/luna.png",
+            "/word-images/luzha.png",
+            "/word-images/lyagushka.png",
+            "/word-images/malina.png",
+            "/word-images/mama.png",
+            "/word-images/mashina.png",
+            "/word-images/mashinka.png",
+            "/word-images/matryoshka.png",
+            "/word-images/medved.png",
+            "/word-images/metla.png",
+            "/word-images/miska.png",
+            "/word-images/more.png",
+            "/word-images/morkovka.png",
+            "/word-images/muha.png",
+            "/word-images/muravey.png",
+            "/word-images/myach.png",
+            "/word-images/mylo.png",
+            "/word-images/myshka.png",
+            "/word-images/nebo.png",
+            "/word-images/noga.png",
+            "/word-images/noski.png",
+            "/word-images/obezyana.png",
+            "/word-images/oblako.png",
+            "/word-images/ochki.png",
+            "/word-images/ogurets.png",
+            "/word-images/okno.png",
+            "/word-images/osen.png",
+            "/word-images/oslik.png",
+            "/word-images/ovca.png",
+            "/word-images/palka.png",
+            "/word-images/panda.png",
+            "/word-images/papa.png",
+            "/word-images/parovoz.png",
+            "/word-images/parus.png",
+            "/word-images/pchela.png",
+            "/word-images/perec.png",
+            "/word-images/pero.png",
+            "/word-images/pesok.png",
+            "/word-images/petuh.png",
+            "/word-images/pila.png",
+            "/word-images/pirozhok.png",
+            "/word-images/pizhama.png",
+            "/word-images/platye.png",
+            "/word-images/podsolnuh.png",
+            "/word-images/poezd.png",
+            "/word-images/polka.png",
+            "/word-images/pomidor.png",
+            "/word-images/poni.png",
+            "/word-images/popugay.png",
+            "/word-images/ptica.png",
+            "/word-images/raduga.png",
+            "/word-images/raketa.png",
+            "/word-images/rebyonok.png",
+            "/word-images/repa.png",
+            "/word-images/roza.png",
+            "/word-images/rubashka.png",
+            "/word-images/ruka.png",
+            "/word-images/ryba.png",
+            "/word-images/samolet.png",
+            "/word-images/sani.png",
+            "/word-images/sapogi.png",
+            "/word-images/schenok.png",
+            "/word-images/shapka.png",
+            "/word-images/shishka.png",
+            "/word-images/shkola.png",
+            "/word-images/sinica.png",
+            "/word-images/sliva.png",
+            "/word-images/slon.png",
+            "/word-images/slonyonok.png",
+            "/word-images/snegurka.png",
+            "/word-images/snezhinka.png",
+            "/word-images/sobaka.png",
+            "/word-images/soldatik.png",
+            "/word-images/solnce.png",
+            "/word-images/solovey.png",
+            "/word-images/sova.png",
+            "/word-images/stol.png",
+            "/word-images/strekoza.png",
+            "/word-images/stul.png",
+            "/word-images/sumka.png",
+            "/word-images/svecha.png",
+            "/word-images/svetofor.png",
+            "/word-images/svinya.png",
+            "/word-images/tapki.png",
+            "/word-images/tarelka.png",
+            "/word-images/telefon.png",
+            "/word-images/telyonok.png",
+            "/word-images/teremok.png",
+            "/word-images/tigr.png",
+            "/word-images/tigryonok.png",
+            "/word-images/tort.png",
+            "/word-images/trava.png",
+            "/word-images/tufli.png",
+            "/word-images/tykva.png",
+            "/word-images/tyotya.png",
+            "/word-images/ulitka.png",
+            "/word-images/utka.png",
+            "/word-images/utyonok.png",
+            "/word-images/vatrushka.png",
+            "/word-images/vaza.png",
+            "/word-images/vedro.png",
+            "/word-images/vedyorko.png",
+            "/word-images/velosiped.png",
+            "/word-images/veslo.png",
+            "/word-images/vesna.png",
+            "/word-images/vetka.png",
+            "/word-images/vilka.png",
+            "/word-images/vinograd.png",
+            "/word-images/vishnya.png",
+            "/word-images/voda.png",
+            "/word-images/volk.png",
+            "/word-images/vorobey.png",
+            "/word-images/vorona.png",
+            "/word-images/yabloko.png",
+            "/word-images/yakor.png",
+            "/word-images/yozhik.png",
+            "/word-images/zamok.png",
+            "/word-images/zayac.png",
+            "/word-images/zebra.png",
+            "/word-images/zhiraf.png",
+            "/word-images/zhuk.png",
+            "/word-images/zima.png",
+            "/word-images/zont.png",
+            "/word-images/zvezda.png",
+        ],
+    },
+    "animal-sound-test": {
+        bytes: 12598956,
+        files: [
+            "/media/auditory-test/audio/animals/bear.0fdce000.mp3",
+            "/media/auditory-test/audio/animals/bee.086a7d9d.mp3",
+            "/media/auditory-test/audio/animals/bird.35f0dfe8.mp3",
+            "/media/auditory-test/audio/animals/butterfly.bae46770.mp3",
+            "/media/auditory-test/audio/animals/cat.aacca9db.mp3",
+            "/media/auditory-test/audio/animals/chicken.c92cc07c.mp3",
+            "/media/auditory-test/audio/animals/cow.f039baa7.mp3",
+            "/media/auditory-test/audio/animals/crow.171fae7d.mp3",
+            "/media/auditory-test/audio/animals/dog.9d5e9f10.mp3",
+            "/media/auditory-test/audio/animals/dolphin.dd2d167d.mp3",
+            "/media/auditory-test/audio/animals/duck.cd486c69.mp3",
+            "/media/auditory-test/audio/animals/eagle.6d700de9.mp3",
+            "/media/auditory-test/audio/animals/elephant.c40f5149.mp3",
+            "/media/auditory-test/audio/animals/fox.e6c8ecfc.mp3",
+            "/media/auditory-test/audio/animals/frog.a423f948.mp3",
+            "/media/auditory-test/audio/animals/goat.d6d7ab86.mp3",
+            "/media/auditory-test/audio/animals/horse.c79c5e25.mp3",
+            "/media/auditory-test/audio/animals/lion.c3df78f4.mp3",
+            "/media/auditory-test/audio/animals/monkey.4c63bde6.mp3",
+            "/media/auditory-test/audio/animals/mouse.779b1db6.mp3",
+            "/media/auditory-test/audio/animals/owl.54683b8e.mp3",
+            "/media/auditory-test/audio/animals/pig.b506bb11.mp3",
+            "/media/auditory-test/audio/animals/rooster.e9a757bd.mp3",
+            "/media/auditory-test/audio/animals/sheep.59d6c90d.mp3",
+            "/media/auditory-test/audio/animals/snake.e0a8612e.mp3",
+            "/media/auditory-test/audio/animals/tiger.9c1e79dd.mp3",
+            "/media/auditory-test/audio/animals/whale.aa81237a.mp3",
+            "/media/auditory-test/audio/animals/wolf.8c3eb1b5.mp3",
+            "/media/auditory-test/audio/animals/zebra.1340e258.mp3",
+            "/media/auditory-test/audio/cat.b18023ae.mp3",
+            "/vocabulary/bear.png",
+            "/vocabulary/bee.png",
+            "/vocabulary/bird.png",
+            "/vocabulary/butterfly.png",
+            "/vocabulary/cat.png",
+            "/vocabulary/chicken.png",
+            "/vocabulary/cow.png",
+            "/vocabulary/crow.png",
+            "/vocabulary/dog.png",
+            "/vocabulary/dolphin.png",
+            "/vocabulary/duck.png",
+            "/vocabulary/eagle.png",
+            "/vocabulary/elephant.png",
+            "/vocabulary/fox.png",
+            "/vocabulary/frog.png",
+            "/vocabulary/goat.png",
+            "/vocabulary/horse.png",
+            "/vocabulary/lion.png",
+            "/vocabulary/monkey.png",
+            "/vocabulary/mouse.png",
+            "/vocabulary/owl.png",
+            "/vocabulary/pig.png",
+            "/vocabulary/rooster.png",
+            "/vocabulary/sheep.png",
+            "/vocabulary/snake.png",
+            "/vocabulary/tiger.png",
+            "/vocabulary/whale.png",
+            "/vocabulary/wolf.png",
+            "/vocabulary/zebra.png",
+        ],
+    },
+    "attention-test": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "auditory-test": {
+        bytes: 36024223,
+        files: [
+            "/media/auditory-test/audio/airplane.affc7899.mp3",
+            "/media/auditory-test/audio/apple.df52b731.mp3",
+            "/media/auditory-test/audio/backpack.0c2f43cc.mp3",
+            "/media/auditory-test/audio/bag.fd5d2fef.mp3",
+            "/media/auditory-test/audio/ball.e1f23b5f.mp3",
+            "/media/auditory-test/audio/banana.287a0c6b.mp3",
+            "/media/auditory-test/audio/bear.a517d10e.mp3",
+            "/media/auditory-test/audio/bed.76ef827d.mp3",
+            "/media/auditory-test/audio/bee.58ca5908.mp3",
+            "/media/auditory-test/audio/bicycle.002789ae.mp3",
+            "/media/auditory-test/audio/bird.fa13a232.mp3",
+            "/media/auditory-test/audio/book.f981ddbb.mp3",
+            "/media/auditory-test/audio/boots.a9988e13.mp3",
+            "/media/auditory-test/audio/bread.20fff467.mp3",
+            "/media/auditory-test/audio/bucket.47cd807c.mp3",
+            "/media/auditory-test/audio/burger.c83a3f0c.mp3",
+            "/media/auditory-test/audio/bus.496ff2ae.mp3",
+            "/media/auditory-test/audio/butterfly.18d3fe2d.mp3",
+            "/media/auditory-test/audio/cake.14701838.mp3",
+            "/media/auditory-test/audio/car.ab3d6ba9.mp3",
+            "/media/auditory-test/audio/carrot.7ade786d.mp3",
+            "/media/auditory-test/audio/cat.b18023ae.mp3",
+            "/media/auditory-test/audio/chair.074b184a.mp3",
+            "/media/auditory-test/audio/cheese.f1fcaf29.mp3",
+            "/media/auditory-test/audio/chicken.2a1eabef.mp3",
+            "/media/auditory-test/audio/clock.80e7a183.mp3",
+            "/media/auditory-test/audio/cloud.14db9c32.mp3",
+            "/media/auditory-test/audio/computer.475591bb.mp3",
+            "/media/auditory-test/audio/cow.560a1a3f.mp3",
+            "/media/auditory-test/audio/cucumber.2f72895b.mp3",
+            "/media/auditory-test/audio/cup.d58d1388.mp3",
+            "/media/auditory-test/audio/dog.244fdb64.mp3",
+            "/media/auditory-test/audio/door.35a00991.mp3",
+            "/media/auditory-test/audio/dress.9e42e89e.mp3",
+            "/media/auditory-test/audio/duck.fe3e816a.mp3",
+            "/media/auditory-test/audio/egg.092dfdce.mp3",
+            "/media/auditory-test/audio/elephant.c2ef1dcb.mp3",
+            "/media/auditory-test/audio/fish.78aaef9e.mp3",
+            "/media/auditory-test/audio/flower.df741a98.mp3",
+            "/media/auditory-test/audio/fork.3b6757f8.mp3",
+            "/media/auditory-test/audio/frog.850de1ec.mp3",
+            "/media/auditory-test/audio/giraffe.88a92a35.mp3",
+            "/media/auditory-test/audio/glasses.81cd8f13.mp3",
+            "/media/auditory-test/audio/gloves.fcc8eeb1.mp3",
+            "/media/auditory-test/audio/grapes.16056ffa.mp3",
+            "/media/auditory-test/audio/hat.a38a5599.mp3",
+            "/media/auditory-test/audio/horse.940a050a.mp3",
+            "/media/auditory-test/audio/house.bbfe84d6.mp3",
+            "/media/auditory-test/audio/ice_cream.a544ead6.mp3",
+            "/media/auditory-test/audio/jacket.afae3c2a.mp3",
+            "/media/auditory-test/audio/juice.5860fce3.mp3",
+            "/media/auditory-test/audio/key.6d001205.mp3",
+            "/media/auditory-test/audio/kite.ecb1b533.mp3",
+            "/media/auditory-test/audio/lamp.66fa8a36.mp3",
+            "/media/auditory-test/audio/lemon.7d88d3ca.mp3",
+            "/media/auditory-test/audio/lion.89240636.mp3",
+            "/media/auditory-test/audio/lock.326d41de.mp3",
+            "/media/auditory-test/audio/milk.90ab2483.mp3",
+            "/media/auditory-test/audio/monkey.79b76bd1.mp3",
+            "/media/auditory-test/audio/moon.c0f9f261.mp3",
+            "/media/auditory-test/audio/mountain.88253992.mp3",
+            "/media/auditory-test/audio/mushroom.604d7945.mp3",
+            "/media/auditory-test/audio/orange.d6657838.mp3",
+            "/media/auditory-test/audio/owl.1813cfd7.mp3",
+            "/media/auditory-test/audio/pants.fb2cf164.mp3",
+            "/media/auditory-test/audio/pear.54fde792.mp3",
+            "/media/auditory-test/audio/pencil.c40c2757.mp3",
+            "/media/auditory-test/audio/penguin.2318d971.mp3",
+            "/media/auditory-test/audio/phone.4fb35174.mp3",
+            "/media/auditory-test/audio/pig.7801f0fa.mp3",
+            "/media/auditory-test/audio/pillow.0dda37e3.mp3",
+            "/media/auditory-test/audio/pizza.f3fc0457.mp3",
+            "/media/auditory-test/audio/plate.0439cda2.mp3",
+            "/media/auditory-test/audio/potato.db5a3d26.mp3",
+            "/media/auditory-test/audio/rabbit.15808bde.mp3",
+            "/media/auditory-test/audio/rain.1d862230.mp3",
+            "/media/auditory-test/audio/scarf.6a888d30.mp3",
+            "/media/auditory-test/audio/sheep.cbf530e9.mp3",
+            "/media/auditory-test/audio/ship.a48a3baf.mp3",
+            "/media/auditory-test/audio/shirt.f4c30489.mp3",
+            "/media/auditory-test/audio/shorts.3b3b6db9.mp3",
+            "/media/auditory-test/audio/shovel.a19e2aa0.mp3",
+            "/media/auditory-test/audio/skirt.64bc9d4e.mp3",
+            "/media/auditory-test/audio/snake.3846fb6b.mp3",
+            "/media/auditory-test/audio/snowman.9c73f260.mp3",
+            "/media/auditory-test/audio/sofa.a1a445ba.mp3",
+            "/media/auditory-test/audio/spider.b1e2cb2e.mp3",
+            "/media/auditory-test/audio/spoon.c5ec6a63.mp3",
+            "/media/auditory-test/audio/star.5f894440.mp3",
+            "/media/auditory-test/audio/strawberry.e7b9056a.mp3",
+            "/media/auditory-test/audio/sun.5dd84db9.mp3",
+            "/media/auditory-test/audio/table.0c41be5c.mp3",
+            "/media/auditory-test/audio/television.961593a0.mp3",
+            "/media/auditory-test/audio/tiger.18cdea47.mp3",
+            "/media/auditory-test/audio/tomato.e9c06212.mp3",
+            "/media/auditory-test/audio/train.c2f9db44.mp3",
+            "/media/auditory-test/audio/tree.bcb19829.mp3",
+            "/media/auditory-test/audio/tshirt.99486368.mp3",
+            "/media/auditory-test/audio/turtle.aeb705c8.mp3",
+            "/media/auditory-test/audio/umbrella.87dd17ad.mp3",
+            "/media/auditory-test/audio/watermelon.5ed76794.mp3",
+            "/media/auditory-test/audio/window.9de58428.mp3",
+            "/media/auditory-test/audio/zebra.61730de3.mp3",
+            "/vocabulary/airplane.png",
+            "/vocabulary/apple.png",
+            "/vocabulary/backpack.png",
+            "/vocabulary/bag.png",
+            "/vocabulary/ball.png",
+            "/vocabulary/banana.png",
+            "/vocabulary/bear.png",
+            "/vocabulary/bed.png",
+            "/vocabulary/bee.png",
+            "/vocabulary/bicycle.png",
+            "/vocabulary/bird.png",
+            "/vocabulary/book.png",
+            "/vocabulary/boots.png",
+            "/vocabulary/bread.png",
+            "/vocabulary/bucket.png",
+            "/vocabulary/burger.png",
+            "/vocabulary/bus.png",
+            "/vocabulary/butterfly.png",
+            "/vocabulary/cake.png",
+            "/vocabulary/car.png",
+            "/vocabulary/carrot.png",
+            "/vocabulary/cat.png",
+            "/vocabulary/chair.png",
+            "/vocabulary/cheese.png",
+            "/vocabulary/chicken.png",
+            "/vocabulary/clock.png",
+            "/vocabulary/cloud.png",
+            "/vocabulary/computer.png",
+            "/vocabulary/cow.png",
+            "/vocabulary/cucumber.png",
+            "/vocabulary/cup.png",
+            "/vocabulary/dog.png",
+            "/vocabulary/door.png",
+            "/vocabulary/dress.png",
+            "/vocabulary/duck.png",
+            "/vocabulary/egg.png",
+            "/vocabulary/elephant.png",
+            "/vocabulary/fish.png",
+            "/vocabulary/flower.png",
+            "/vocabulary/fork.png",
+            "/vocabulary/frog.png",
+            "/vocabulary/giraffe.png",
+            "/vocabulary/glasses.png",
+            "/vocabulary/gloves.png",
+            "/vocabulary/grapes.png",
+            "/vocabulary/hat.png",
+            "/vocabulary/horse.png",
+            "/vocabulary/house.png",
+            "/vocabulary/ice_cream.png",
+            "/vocabulary/jacket.png",
+            "/vocabulary/juice.png",
+            "/vocabulary/key.png",
+            "/vocabulary/kite.png",
+            "/vocabulary/lamp.png",
+            "/vocabulary/lemon.png",
+            "/vocabulary/lion.png",
+            "/vocabulary/lock.png",
+            "/vocabulary/milk.png",
+            "/vocabulary/monkey.png",
+            "/vocabulary/moon.png",
+            "/vocabulary/mountain.png",
+            "/vocabulary/mushroom.png",
+            "/vocabulary/orange.png",
+            "/vocabulary/owl.png",
+            "/vocabulary/pants.png",
+            "/vocabulary/pear.png",
+            "/vocabulary/pencil.png",
+            "/vocabulary/penguin.png",
+            "/vocabulary/phone.png",
+            "/vocabulary/pig.png",
+            "/vocabulary/pillow.png",
+            "/vocabulary/pizza.png",
+            "/vocabulary/plate.png",
+            "/vocabulary/potato.png",
+            "/vocabulary/rabbit.png",
+            "/vocabulary/rain.png",
+            "/vocabulary/scarf.png",
+            "/vocabulary/sheep.png",
+            "/vocabulary/ship.png",
+            "/vocabulary/shirt.png",
+            "/vocabulary/shorts.png",
+            "/vocabulary/shovel.png",
+            "/vocabulary/skirt.png",
+            "/vocabulary/snake.png",
+            "/vocabulary/snowman.png",
+            "/vocabulary/sofa.png",
+            "/vocabulary/spider.png",
+            "/vocabulary/spoon.png",
+            "/vocabulary/star.png",
+            "/vocabulary/strawberry.png",
+            "/vocabulary/sun.png",
+            "/vocabulary/table.png",
+            "/vocabulary/television.png",
+            "/vocabulary/tiger.png",
+            "/vocabulary/tomato.png",
+            "/vocabulary/train.png",
+            "/vocabulary/tree.png",
+            "/vocabulary/tshirt.png",
+            "/vocabulary/turtle.png",
+            "/vocabulary/umbrella.png",
+            "/vocabulary/watermelon.png",
+            "/vocabulary/window.png",
+            "/vocabulary/zebra.png",
+        ],
+    },
+    "correction-test": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "create-profile": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "fast-numbers": {
+        bytes: 90720,
+        files: [
+            "/audio/numbers/1.mp3",
+            "/audio/numbers/2.mp3",
+            "/audio/numbers/3.mp3",
+            "/audio/numbers/4.mp3",
+            "/audio/numbers/5.mp3",
+            "/audio/numbers/6.mp3",
+            "/audio/numbers/7.mp3",
+            "/audio/numbers/8.mp3",
+            "/audio/numbers/9.mp3",
+        ],
+    },
+    "fast-syllables": {
+        bytes: 865584,
+        files: [
+            "/syllables/ба.mp3",
+            "/syllables/бе.mp3",
+            "/syllables/би.mp3",
+            "/syllables/бо.mp3",
+            "/syllables/бы.mp3",
+            "/syllables/ва.mp3",
+            "/syllables/ве.mp3",
+            "/syllables/ви.mp3",
+            "/syllables/ву.mp3",
+            "/syllables/вы.mp3",
+            "/syllables/га.mp3",
+            "/syllables/ге.mp3",
+            "/syllables/ги.mp3",
+            "/syllables/го.mp3",
+            "/syllables/да.mp3",
+            "/syllables/де.mp3",
+            "/syllables/ди.mp3",
+            "/syllables/до.mp3",
+            "/syllables/ду.mp3",
+            "/syllables/ды.mp3",
+            "/syllables/жа.mp3",
+            "/syllables/же.mp3",
+            "/syllables/жи.mp3",
+            "/syllables/жо.mp3",
+            "/syllables/жу.mp3",
+            "/syllables/за.mp3",
+            "/syllables/зе.mp3",
+            "/syllables/зи.mp3",
+            "/syllables/зо.mp3",
+            "/syllables/зу.mp3",
+            "/syllables/зы.mp3",
+            "/syllables/ка.mp3",
+            "/syllables/ке.mp3",
+            "/syllables/ки.mp3",
+            "/syllables/ко.mp3",
+            "/syllables/ку.mp3",
+            "/syllables/ле.mp3",
+            "/syllables/ли.mp3",
+            "/syllables/ло.mp3",
+            "/syllables/лу.mp3",
+            "/syllables/лы.mp3",
+            "/syllables/ма.mp3",
+            "/syllables/ме.mp3",
+            "/syllables/ми.mp3",
+            "/syllables/мо.mp3",
+            "/syllables/му.mp3",
+            "/syllables/мы.mp3",
+            "/syllables/на.mp3",
+            "/syllables/но.mp3",
+            "/syllables/ну.mp3",
+            "/syllables/ны.mp3",
+            "/syllables/па.mp3",
+            "/syllables/пе.mp3",
+            "/syllables/пи.mp3",
+            "/syllables/по.mp3",
+            "/syllables/пу.mp3",
+            "/syllables/пы.mp3",
+            "/syllables/ре.mp3",
+            "/syllables/ри.mp3",
+            "/syllables/ру.mp3",
+            "/syllables/ры.mp3",
+            "/syllables/са.mp3",
+            "/syllables/се.mp3",
+            "/syllables/си.mp3",
+            "/syllables/су.mp3",
+            "/syllables/сы.mp3",
+            "/syllables/та.mp3",
+            "/syllables/те.mp3",
+            "/syllables/то.mp3",
+            "/syllables/ту.mp3",
+            "/syllables/ты.mp3",
+            "/syllables/фа.mp3",
+            "/syllables/фе.mp3",
+            "/syllables/фи.mp3",
+            "/syllables/фо.mp3",
+            "/syllables/фу.mp3",
+            "/syllables/ха.mp3",
+            "/syllables/хе.mp3",
+            "/syllables/хи.mp3",
+            "/syllables/хо.mp3",
+            "/syllables/ху.mp3",
+            "/syllables/ша.mp3",
+            "/syllables/ше.mp3",
+            "/syllables/ши.mp3",
+            "/syllables/шо.mp3",
+            "/syllables/шу.mp3",
+        ],
+    },
+    "flexibility-test": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "fly-test": {
+        bytes: 42912,
+        files: [
+            "/audio/directions/down.mp3",
+            "/audio/directions/left.mp3",
+            "/audio/directions/right.mp3",
+            "/audio/directions/up.mp3",
+        ],
+    },
+    "magic-forest": {
+        bytes: 9059055,
+        files: [
+            "/animals/badger.png",
+            "/animals/bear.png",
+            "/animals/boar.png",
+            "/animals/fox.png",
+            "/animals/grouse.png",
+            "/animals/hare.png",
+            "/animals/hedgehog.png",
+            "/animals/lynx.png",
+            "/animals/moose.png",
+            "/animals/owl.png",
+            "/animals/squirrel.png",
+            "/animals/wolf.png",
+        ],
+    },
+    "memory-cards": {
+        bytes: 117968368,
+        files: [
+            "/word-images/akula.png",
+            "/word-images/apelsin.png",
+            "/word-images/arbuz.png",
+            "/word-images/avtobus.png",
+            "/word-images/baba.png",
+            "/word-images/babochka.png",
+            "/word-images/babushka.png",
+            "/word-images/banan.png",
+            "/word-images/baraban.png",
+            "/word-images/baran.png",
+            "/word-images/belka.png",
+            "/word-images/botinki.png",
+            "/word-images/bryuki.png",
+            "/word-images/butylka.png",
+            "/word-images/chashka.png",
+            "/word-images/chasy.png",
+            "/word-images/cherepaha.png",
+            "/word-images/chereshnya.png",
+            "/word-images/cvetok.png",
+            "/word-images/cyplyonok.png",
+            "/word-images/dedushka.png",
+            "/word-images/delfin.png",
+            "/word-images/derevo.png",
+            "/word-images/devochka.png",
+            "/word-images/doma.png",
+            "/word-images/domik.png",
+            "/word-images/dver.png",
+            "/word-images/dyadya.png",
+            "/word-images/dynya.png",
+            "/word-images/futbolka.png",
+            "/word-images/garmoshka.png",
+            "/word-images/gitara.png",
+            "/word-images/gnezdo.png",
+            "/word-images/gora.png",
+            "/word-images/grib.png",
+            "/word-images/grusha.png",
+            "/word-images/gruzovik.png",
+            "/word-images/gus.png",
+            "/word-images/igrushka.png",
+            "/word-images/izbushka.png",
+            "/word-images/kacheli.png",
+            "/word-images/kamen.png",
+            "/word-images/kapusta.png",
+            "/word-images/karandash.png",
+            "/word-images/kartina.png",
+            "/word-images/kartoshka.png",
+            "/word-images/karusel.png",
+            "/word-images/kasha.png",
+            "/word-images/kastryulya.png",
+            "/word-images/kino.png",
+            "/word-images/kit.png",
+            "/word-images/klubnika.png",
+            "/word-images/klyuch.png",
+            "/word-images/kniga.png",
+            "/word-images/kolco.png",
+            "/word-images/kolobok.png",
+            "/word-images/konfeta.png",
+            "/word-images/korabl.png",
+            "/word-images/korobka.png",
+            "/word-images/korova.png",
+            "/word-images/koshka.png",
+            "/word-images/kotik.png",
+            "/word-images/kotyonok.png",
+            "/word-images/koza.png",
+            "/word-images/kozlyonok.png",
+            "/word-images/kozyol.png",
+            "/word-images/krokodil.png",
+            "/word-images/krovat.png",
+            "/word-images/kubik.png",
+            "/word-images/kukla.png",
+            "/word-images/kukuruza.png",
+            "/word-images/kurica.png",
+            "/word-images/kuznechik.png",
+            "/word-images/lampa.png",
+            "/word-images/lapa.png",
+            "/word-images/lastochka.png",
+            "/word-images/leto.png",
+            "/word-images/lev.png",
+            "/word-images/leyka.png",
+            "/word-images/limon.png",
+            "/word-images/lisa.png",
+            "/word-images/lisyonok.png",
+            "/word-images/lodka.png",
+            "/word-images/lopata.png",
+            "/word-images/lopatka.png",
+            "/word-images/loshad.png",
+            "/word-images/lozhka.png",
+            "/word-images/luna.png",
+            "/word-images/luzha.png",
+            "/word-images/lyagushka.png",
+            "/word-images/malina.png",
+            "/word-images/mama.png",
+            "/word-images/mashina.png",
+            "/word-images/mashinka.png",
+            "/word-images/matryoshka.png",
+            "/word-images/medved.png",
+            "/word-images/metla.png",
+            "/word-images/miska.png",
+            "/word-images/more.png",
+            "/word-images/morkovka.png",
+            "/word-images/muha.png",
+            "/word-images/muravey.png",
+            "/word-images/myach.png",
+            "/word-images/mylo.png",
+            "/word-images/myshka.png",
+            "/word-images/nebo.png",
+            "/word-images/noga.png",
+            "/word-images/noski.png",
+            "/word-images/obezyana.png",
+            "/word-images/oblako.png",
+            "/word-images/ochki.png",
+            "/word-images/ogurets.png",
+            "/word-images/okno.png",
+            "/word-images/osen.png",
+            "/word-images/oslik.png",
+            "/word-images/ovca.png",
+            "/word-images/palka.png",
+            "/word-images/panda.png",
+            "/word-images/papa.png",
+            "/word-images/parovoz.png",
+            "/word-images/parus.png",
+            "/word-images/pchela.png",
+            "/word-images/perec.png",
+            "/word-images/pero.png",
+            "/word-images/pesok.png",
+            "/word-images/petuh.png",
+            "/word-images/pila.png",
+            "/word-images/pirozhok.png",
+            "/word-images/pizhama.png",
+            "/word-images/platye.png",
+            "/word-images/podsolnuh.png",
+            "/word-images/poezd.png",
+            "/word-images/polka.png",
+            "/word-images/pomidor.png",
+            "/word-images/poni.png",
+            "/word-images/popugay.png",
+            "/word-images/ptica.png",
+            "/word-images/raduga.png",
+            "/word-images/raketa.png",
+            "/word-images/rebyonok.png",
+            "/word-images/repa.png",
+            "/word-images/roza.png",
+            "/word-images/rubashka.png",
+            "/word-images/ruka.png",
+            "/word-images/ryba.png",
+            "/word-images/samolet.png",
+            "/word-images/sani.png",
+            "/word-images/sapogi.png",
+            "/word-images/schenok.png",
+            "/word-images/shapka.png",
+            "/word-images/shishka.png",
+            "/word-images/shkola.png",
+            "/word-images/sinica.png",
+            "/word-images/sliva.png",
+            "/word-images/slon.png",
+            "/word-images/slonyonok.png",
+            "/word-images/snegurka.png",
+            "/word-images/snezhinka.png",
+            "/word-images/sobaka.png",
+            "/word-images/soldatik.png",
+            "/word-images/solnce.png",
+            "/word-images/solovey.png",
+            "/word-images/sova.png",
+            "/word-images/stol.png",
+            "/word-images/strekoza.png",
+            "/word-images/stul.png",
+            "/word-images/sumka.png",
+            "/word-images/svecha.png",
+            "/word-images/svetofor.png",
+            "/word-images/svinya.png",
+            "/word-images/tapki.png",
+            "/word-images/tarelka.png",
+            "/word-images/telefon.png",
+            "/word-images/telyonok.png",
+            "/word-images/teremok.png",
+            "/word-images/tigr.png",
+            "/word-images/tigryonok.png",
+            "/word-images/tort.png",
+            "/word-images/trava.png",
+            "/word-images/tufli.png",
+            "/word-images/tykva.png",
+            "/word-images/tyotya.png",
+            "/word-images/ulitka.png",
+            "/word-images/utka.png",
+            "/word-images/utyonok.png",
+            "/word-images/vatrushka.png",
+            "/word-images/vaza.png",
+            "/word-images/vedro.png",
+            "/word-images/vedyorko.png",
+            "/word-images/velosiped.png",
+            "/word-images/veslo.png",
+            "/word-images/vesna.png",
+            "/word-images/vetka.png",
+            "/word-images/vilka.png",
+            "/word-images/vinograd.png",
+            "/word-images/vishnya.png",
+            "/word-images/voda.png",
+            "/word-images/volk.png",
+            "/word-images/vorobey.png",
+            "/word-images/vorona.png",
+            "/word-images/yabloko.png",
+            "/word-images/yakor.png",
+            "/word-images/yozhik.png",
+            "/word-images/zamok.png",
+            "/word-images/zayac.png",
+            "/word-images/zebra.png",
+            "/word-images/zhiraf.png",
+            "/word-images/zhuk.png",
+            "/word-images/zima.png",
+            "/word-images/zont.png",
+            "/word-images/zvezda.png",
+        ],
+    },
+    "munsterberg-test": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "n-back": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "n-back-picture": {
+        bytes: 191232,
+        files: [
+            "/audio/letters/a.mp3",
+            "/audio/letters/b.mp3",
+            "/audio/letters/d.mp3",
+            "/audio/letters/e.mp3",
+            "/audio/letters/f.mp3",
+            "/audio/letters/g.mp3",
+            "/audio/letters/h.mp3",
+            "/audio/letters/i.mp3",
+            "/audio/letters/k.mp3",
+            "/audio/letters/l.mp3",
+            "/audio/letters/m.mp3",
+            "/audio/letters/n.mp3",
+            "/audio/letters/o.mp3",
+            "/audio/letters/p.mp3",
+            "/audio/letters/r.mp3",
+            "/audio/letters/s.mp3",
+            "/audio/letters/t.mp3",
+            "/audio/letters/ts.mp3",
+            "/audio/letters/u.mp3",
+            "/audio/letters/v.mp3",
+            "/audio/letters/z.mp3",
+            "/audio/letters/zh.mp3",
+        ],
+    },
+    "pairs-test": {
+        bytes: 36039990,
+        files: [
+            "/vocabulary/airplane.png",
+            "/vocabulary/apple.png",
+            "/vocabulary/backpack.png",
+            "/vocabulary/bag.png",
+            "/vocabulary/ball.png",
+            "/vocabulary/banana.png",
+            "/vocabulary/bathtub.png",
+            "/vocabulary/bear.png",
+            "/vocabulary/bed.png",
+            "/vocabulary/bee.png",
+            "/vocabulary/bicycle.png",
+            "/vocabulary/bird.png",
+            "/vocabulary/blanket.png",
+            "/vocabulary/book.png",
+            "/vocabulary/boots.png",
+            "/vocabulary/bread.png",
+            "/vocabulary/bucket.png",
+            "/vocabulary/burger.png",
+            "/vocabulary/bus.png",
+            "/vocabulary/butterfly.png",
+            "/vocabulary/cake.png",
+            "/vocabulary/car.png",
+            "/vocabulary/carrot.png",
+            "/vocabulary/cat.png",
+            "/vocabulary/chair.png",
+            "/vocabulary/cheese.png",
+            "/vocabulary/chicken.png",
+            "/vocabulary/clock.png",
+            "/vocabulary/cloud.png",
+            "/vocabulary/computer.png",
+            "/vocabulary/cow.png",
+            "/vocabulary/cucumber.png",
+            "/vocabulary/cup.png",
+            "/vocabulary/dog.png",
+            "/vocabulary/door.png",
+            "/vocabulary/dress.png",
+            "/vocabulary/duck.png",
+            "/vocabulary/egg.png",
+            "/vocabulary/elephant.png",
+            "/vocabulary/fish.png",
+            "/vocabulary/flower.png",
+            "/vocabulary/fork.png",
+            "/vocabulary/frog.png",
+            "/vocabulary/giraffe.png",
+            "/vocabulary/glasses.png",
+            "/vocabulary/gloves.png",
+            "/vocabulary/grapes.png",
+            "/vocabulary/hat.png",
+            "/vocabulary/horse.png",
+            "/vocabulary/house.png",
+            "/vocabulary/ice_cream.png",
+            "/vocabulary/jacket.png",
+            "/vocabulary/juice.png",
+            "/vocabulary/key.png",
+            "/vocabulary/kite.png",
+            "/vocabulary/lamp.png",
+            "/vocabulary/lemon.png",
+            "/vocabulary/lion.png",
+            "/vocabulary/lock.png",
+            "/vocabulary/milk.png",
+            "/vocabulary/monkey.png",
+            "/vocabulary/moon.png",
+            "/vocabulary/mountain.png",
+            "/vocabulary/mushroom.png",
+            "/vocabulary/orange.png",
+            "/vocabulary/pants.png",
+            "/vocabulary/pear.png",
+            "/vocabulary/pencil.png",
+            "/vocabulary/phone.png",
+            "/vocabulary/pig.png",
+            "/vocabulary/pillow.png",
+            "/vocabulary/pizza.png",
+            "/vocabulary/plate.png",
+            "/vocabulary/potato.png",
+            "/vocabulary/rabbit.png",
+            "/vocabulary/rain.png",
+            "/vocabulary/scarf.png",
+            "/vocabulary/sheep.png",
+            "/vocabulary/ship.png",
+            "/vocabulary/shirt.png",
+            "/vocabulary/shorts.png",
+            "/vocabulary/shovel.png",
+            "/vocabulary/sink.png",
+            "/vocabulary/skirt.png",
+            "/vocabulary/snake.png",
+            "/vocabulary/snowman.png",
+            "/vocabulary/sofa.png",
+            "/vocabulary/spider.png",
+            "/vocabulary/spoon.png",
+            "/vocabulary/star.png",
+            "/vocabulary/stone.png",
+            "/vocabulary/strawberry.png",
+            "/vocabulary/sun.png",
+            "/vocabulary/table.png",
+            "/vocabulary/television.png",
+            "/vocabulary/tiger.png",
+            "/vocabulary/toilet.png",
+            "/vocabulary/tomato.png",
+            "/vocabulary/train.png",
+            "/vocabulary/tree.png",
+            "/vocabulary/tshirt.png",
+            "/vocabulary/turtle.png",
+            "/vocabulary/umbrella.png",
+            "/vocabulary/watermelon.png",
+            "/vocabulary/window.png",
+            "/vocabulary/zebra.png",
+        ],
+    },
+    "reaction-test": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "schulte-table": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "sequence-test": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "speed-reading": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "stroop-test": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "syllable-picture-game": {
+        bytes: 118550128,
+        files: [
+            "/syllables/ба.mp3",
+            "/syllables/бо.mp3",
+            "/syllables/ва.mp3",
+            "/syllables/ве.mp3",
+            "/syllables/ви.mp3",
+            "/syllables/га.mp3",
+            "/syllables/ги.mp3",
+            "/syllables/го.mp3",
+            "/syllables/да.mp3",
+            "/syllables/де.mp3",
+            "/syllables/до.mp3",
+            "/syllables/ду.mp3",
+            "/syllables/ды.mp3",
+            "/syllables/жа.mp3",
+            "/syllables/жи.mp3",
+            "/syllables/за.mp3",
+            "/syllables/зи.mp3",
+            "/syllables/зо.mp3",
+            "/syllables/ка.mp3",
+            "/syllables/ке.mp3",
+            "/syllables/ки.mp3",
+            "/syllables/ко.mp3",
+            "/syllables/ку.mp3",
+            "/syllables/ле.mp3",
+            "/syllables/ли.mp3",
+            "/syllables/ло.mp3",
+            "/syllables/лу.mp3",
+            "/syllables/ма.mp3",
+            "/syllables/ми.mp3",
+            "/syllables/мо.mp3",
+            "/syllables/му.mp3",
+            "/syllables/мы.mp3",
+            "/syllables/на.mp3",
+            "/syllables/но.mp3",
+            "/syllables/па.mp3",
+            "/syllables/пе.mp3",
+            "/syllables/пи.mp3",
+            "/syllables/по.mp3",
+            "/syllables/пу.mp3",
+            "/syllables/ре.mp3",
+            "/syllables/ри.mp3",
+            "/syllables/ру.mp3",
+            "/syllables/ры.mp3",
+            "/syllables/са.mp3",
+            "/syllables/си.mp3",
+            "/syllables/сы.mp3",
+            "/syllables/та.mp3",
+            "/syllables/те.mp3",
+            "/syllables/то.mp3",
+            "/syllables/фе.mp3",
+            "/syllables/ха.mp3",
+            "/syllables/ца.mp3",
+            "/syllables/це.mp3",
+            "/syllables/цо.mp3",
+            "/syllables/ча.mp3",
+            "/syllables/ша.mp3",
+            "/syllables/ши.mp3",
+            "/syllables/ще.mp3",
+            "/word-images/akula.png",
+            "/word-images/apelsin.png",
+            "/word-images/arbuz.png",
+            "/word-images/avtobus.png",
+            "/word-images/baba.png",
+            "/word-images/babochka.png",
+            "/word-images/babushka.png",
+            "/word-images/banan.png",
+            "/word-images/baraban.png",
+            "/word-images/baran.png",
+            "/word-images/belka.png",
+            "/word-images/botinki.png",
+            "/word-images/bryuki.png",
+            "/word-images/butylka.png",
+            "/word-images/chashka.png",
+            "/word-images/chasy.png",
+            "/word-images/cherepaha.png",
+            "/word-images/chereshnya.png",
+            "/word-images/cvetok.png",
+            "/word-images/cyplyonok.png",
+            "/word-images/dedushka.png",
+            "/word-images/delfin.png",
+            "/word-images/derevo.png",
+            "/word-images/devochka.png",
+            "/word-images/doma.png",
+            "/word-images/domik.png",
+            "/word-images/dver.png",
+            "/word-images/dyadya.png",
+            "/word-images/dynya.png",
+            "/word-images/futbolka.png",
+            "/word-images/garmoshka.png",
+            "/word-images/gitara.png",
+            "/word-images/gnezdo.png",
+            "/word-images/gora.png",
+            "/word-images/grib.png",
+            "/word-images/grusha.png",
+            "/word-images/gruzovik.png",
+            "/word-images/gus.png",
+            "/word-images/igrushka.png",
+            "/word-images/izbushka.png",
+            "/word-images/kacheli.png",
+            "/word-images/kamen.png",
+            "/word-images/kapusta.png",
+            "/word-images/karandash.png",
+            "/word-images/kartina.png",
+            "/word-images/kartoshka.png",
+            "/word-images/karusel.png",
+            "/word-images/kasha.png",
+            "/word-images/kastryulya.png",
+            "/word-images/kino.png",
+            "/word-images/kit.png",
+            "/word-images/klubnika.png",
+            "/word-images/klyuch.png",
+            "/word-images/kniga.png",
+            "/word-images/kolco.png",
+            "/word-images/kolobok.png",
+            "/word-images/konfeta.png",
+            "/word-images/korabl.png",
+            "/word-images/korobka.png",
+            "/word-images/korova.png",
+            "/word-images/koshka.png",
+            "/word-images/kotik.png",
+            "/word-images/kotyonok.png",
+            "/word-images/koza.png",
+            "/word-images/kozlyonok.png",
+            "/word-images/kozyol.png",
+            "/word-images/krokodil.png",
+            "/word-images/krovat.png",
+            "/word-images/kubik.png",
+            "/word-images/kukla.png",
+            "/word-images/kukuruza.png",
+            "/word-images/kurica.png",
+            "/word-images/kuznechik.png",
+            "/word-images/lampa.png",
+            "/word-images/lapa.png",
+            "/word-images/lastochka.png",
+            "/word-images/leto.png",
+            "/word-images/lev.png",
+            "/word-images/leyka.png",
+            "/word-images/limon.png",
+            "/word-images/lisa.png",
+            "/word-images/lisyonok.png",
+            "/word-images/lodka.png",
+            "/word-images/lopata.png",
+            "/word-images/lopatka.png",
+            "/word-images/loshad.png",
+            "/word-images/lozhka.png",
+            "/word-images/luna.png",
+            "/word-images/luzha.png",
+            "/word-images/lyagushka.png",
+            "/word-images/malina.png",
+            "/word-images/mama.png",
+            "/word-images/mashina.png",
+            "/word-images/mashinka.png",
+            "/word-images/matryoshka.png",
+            "/word-images/medved.png",
+            "/word-images/metla.png",
+            "/word-images/miska.png",
+            "/word-images/more.png",
+            "/word-images/morkovka.png",
+            "/word-images/muha.png",
+            "/word-images/muravey.png",
+            "/word-images/myach.png",
+            "/word-images/mylo.png",
+            "/word-images/myshka.png",
+            "/word-images/nebo.png",
+            "/word-images/noga.png",
+            "/word-images/noski.png",
+            "/word-images/obezyana.png",
+            "/word-images/oblako.png",
+            "/word-images/ochki.png",
+            "/word-images/ogurets.png",
+            "/word-images/okno.png",
+            "/word-images/osen.png",
+            "/word-images/oslik.png",
+            "/word-images/ovca.png",
+            "/word-images/palka.png",
+            "/word-images/panda.png",
+            "/word-images/papa.png",
+            "/word-images/parovoz.png",
+            "/word-images/parus.png",
+            "/word-images/pchela.png",
+            "/word-images/perec.png",
+            "/word-images/pero.png",
+            "/word-images/pesok.png",
+            "/word-images/petuh.png",
+            "/word-images/pila.png",
+            "/word-images/pirozhok.png",
+            "/word-images/pizhama.png",
+            "/word-images/platye.png",
+            "/word-images/podsolnuh.png",
+            "/word-images/poezd.png",
+            "/word-images/polka.png",
+            "/word-images/pomidor.png",
+            "/word-images/poni.png",
+            "/word-images/popugay.png",
+            "/word-images/ptica.png",
+            "/word-images/raduga.png",
+            "/word-images/raketa.png",
+            "/word-images/rebyonok.png",
+            "/word-images/repa.png",
+            "/word-images/roza.png",
+            "/word-images/rubashka.png",
+            "/word-images/ruka.png",
+            "/word-images/ryba.png",
+            "/word-images/samolet.png",
+            "/word-images/sani.png",
+            "/word-images/sapogi.png",
+            "/word-images/schenok.png",
+            "/word-images/shapka.png",
+            "/word-images/shishka.png",
+            "/word-images/shkola.png",
+            "/word-images/sinica.png",
+            "/word-images/sliva.png",
+            "/word-images/slon.png",
+            "/word-images/slonyonok.png",
+            "/word-images/snegurka.png",
+            "/word-images/snezhinka.png",
+            "/word-images/sobaka.png",
+            "/word-images/soldatik.png",
+            "/word-images/solnce.png",
+            "/word-images/solovey.png",
+            "/word-images/sova.png",
+            "/word-images/stol.png",
+            "/word-images/strekoza.png",
+            "/word-images/stul.png",
+            "/word-images/sumka.png",
+            "/word-images/svecha.png",
+            "/word-images/svetofor.png",
+            "/word-images/svinya.png",
+            "/word-images/tapki.png",
+            "/word-images/tarelka.png",
+            "/word-images/telefon.png",
+            "/word-images/telyonok.png",
+            "/word-images/teremok.png",
+            "/word-images/tigr.png",
+            "/word-images/tigryonok.png",
+            "/word-images/tort.png",
+            "/word-images/trava.png",
+            "/word-images/tufli.png",
+            "/word-images/tykva.png",
+            "/word-images/tyotya.png",
+            "/word-images/ulitka.png",
+            "/word-images/utka.png",
+            "/word-images/utyonok.png",
+            "/word-images/vatrushka.png",
+            "/word-images/vaza.png",
+            "/word-images/vedro.png",
+            "/word-images/vedyorko.png",
+            "/word-images/velosiped.png",
+            "/word-images/veslo.png",
+            "/word-images/vesna.png",
+            "/word-images/vetka.png",
+            "/word-images/vilka.png",
+            "/word-images/vinograd.png",
+            "/word-images/vishnya.png",
+            "/word-images/voda.png",
+            "/word-images/volk.png",
+            "/word-images/vorobey.png",
+            "/word-images/vorona.png",
+            "/word-images/yabloko.png",
+            "/word-images/yakor.png",
+            "/word-images/yozhik.png",
+            "/word-images/zamok.png",
+            "/word-images/zayac.png",
+            "/word-images/zebra.png",
+            "/word-images/zhiraf.png",
+            "/word-images/zhuk.png",
+            "/word-images/zima.png",
+            "/word-images/zont.png",
+            "/word-images/zvezda.png",
+        ],
+    },
+    "tower-of-hanoi": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+    "visual-memory-test": {
+        bytes: 36039990,
+        files: [
+            "/vocabulary/airplane.png",
+            "/vocabulary/apple.png",
+            "/vocabulary/backpack.png",
+            "/vocabulary/bag.png",
+            "/vocabulary/ball.png",
+            "/vocabulary/banana.png",
+            "/vocabulary/bathtub.png",
+            "/vocabulary/bear.png",
+            "/vocabulary/bed.png",
+            "/vocabulary/bee.png",
+            "/vocabulary/bicycle.png",
+            "/vocabulary/bird.png",
+            "/vocabulary/blanket.png",
+            "/vocabulary/book.png",
+            "/vocabulary/boots.png",
+            "/vocabulary/bread.png",
+            "/vocabulary/bucket.png",
+            "/vocabulary/burger.png",
+            "/vocabulary/bus.png",
+            "/vocabulary/butterfly.png",
+            "/vocabulary/cake.png",
+            "/vocabulary/car.png",
+            "/vocabulary/carrot.png",
+            "/vocabulary/cat.png",
+            "/vocabulary/chair.png",
+            "/vocabulary/cheese.png",
+            "/vocabulary/chicken.png",
+            "/vocabulary/clock.png",
+            "/vocabulary/cloud.png",
+            "/vocabulary/computer.png",
+            "/vocabulary/cow.png",
+            "/vocabulary/cucumber.png",
+            "/vocabulary/cup.png",
+            "/vocabulary/dog.png",
+            "/vocabulary/door.png",
+            "/vocabulary/dress.png",
+            "/vocabulary/duck.png",
+            "/vocabulary/egg.png",
+            "/vocabulary/elephant.png",
+            "/vocabulary/fish.png",
+            "/vocabulary/flower.png",
+            "/vocabulary/fork.png",
+            "/vocabulary/frog.png",
+            "/vocabulary/giraffe.png",
+            "/vocabulary/glasses.png",
+            "/vocabulary/gloves.png",
+            "/vocabulary/grapes.png",
+            "/vocabulary/hat.png",
+            "/vocabulary/horse.png",
+            "/vocabulary/house.png",
+            "/vocabulary/ice_cream.png",
+            "/vocabulary/jacket.png",
+            "/vocabulary/juice.png",
+            "/vocabulary/key.png",
+            "/vocabulary/kite.png",
+            "/vocabulary/lamp.png",
+            "/vocabulary/lemon.png",
+            "/vocabulary/lion.png",
+            "/vocabulary/lock.png",
+            "/vocabulary/milk.png",
+            "/vocabulary/monkey.png",
+            "/vocabulary/moon.png",
+            "/vocabulary/mountain.png",
+            "/vocabulary/mushroom.png",
+            "/vocabulary/orange.png",
+            "/vocabulary/pants.png",
+            "/vocabulary/pear.png",
+            "/vocabulary/pencil.png",
+            "/vocabulary/phone.png",
+            "/vocabulary/pig.png",
+            "/vocabulary/pillow.png",
+            "/vocabulary/pizza.png",
+            "/vocabulary/plate.png",
+            "/vocabulary/potato.png",
+            "/vocabulary/rabbit.png",
+            "/vocabulary/rain.png",
+            "/vocabulary/scarf.png",
+            "/vocabulary/sheep.png",
+            "/vocabulary/ship.png",
+            "/vocabulary/shirt.png",
+            "/vocabulary/shorts.png",
+            "/vocabulary/shovel.png",
+            "/vocabulary/sink.png",
+            "/vocabulary/skirt.png",
+            "/vocabulary/snake.png",
+            "/vocabulary/snowman.png",
+            "/vocabulary/sofa.png",
+            "/vocabulary/spider.png",
+            "/vocabulary/spoon.png",
+            "/vocabulary/star.png",
+            "/vocabulary/stone.png",
+            "/vocabulary/strawberry.png",
+            "/vocabulary/sun.png",
+            "/vocabulary/table.png",
+            "/vocabulary/television.png",
+            "/vocabulary/tiger.png",
+            "/vocabulary/toilet.png",
+            "/vocabulary/tomato.png",
+            "/vocabulary/train.png",
+            "/vocabulary/tree.png",
+            "/vocabulary/tshirt.png",
+            "/vocabulary/turtle.png",
+            "/vocabulary/umbrella.png",
+            "/vocabulary/watermelon.png",
+            "/vocabulary/window.png",
+            "/vocabulary/zebra.png",
+        ],
+    },
+    "vocabulary-test": {
+        bytes: 36039990,
+        files: [
+            "/vocabulary/airplane.png",
+            "/vocabulary/apple.png",
+            "/vocabulary/backpack.png",
+            "/vocabulary/bag.png",
+            "/vocabulary/ball.png",
+            "/vocabulary/banana.png",
+            "/vocabulary/bathtub.png",
+            "/vocabulary/bear.png",
+            "/vocabulary/bed.png",
+            "/vocabulary/bee.png",
+            "/vocabulary/bicycle.png",
+            "/vocabulary/bird.png",
+            "/vocabulary/blanket.png",
+            "/vocabulary/book.png",
+            "/vocabulary/boots.png",
+            "/vocabulary/bread.png",
+            "/vocabulary/bucket.png",
+            "/vocabulary/burger.png",
+            "/vocabulary/bus.png",
+            "/vocabulary/butterfly.png",
+            "/vocabulary/cake.png",
+            "/vocabulary/car.png",
+            "/vocabulary/carrot.png",
+            "/vocabulary/cat.png",
+            "/vocabulary/chair.png",
+            "/vocabulary/cheese.png",
+            "/vocabulary/chicken.png",
+            "/vocabulary/clock.png",
+            "/vocabulary/cloud.png",
+            "/vocabulary/computer.png",
+            "/vocabulary/cow.png",
+            "/vocabulary/cucumber.png",
+            "/vocabulary/cup.png",
+            "/vocabulary/dog.png",
+            "/vocabulary/door.png",
+            "/vocabulary/dress.png",
+            "/vocabulary/duck.png",
+            "/vocabulary/egg.png",
+            "/vocabulary/elephant.png",
+            "/vocabulary/fish.png",
+            "/vocabulary/flower.png",
+            "/vocabulary/fork.png",
+            "/vocabulary/frog.png",
+            "/vocabulary/giraffe.png",
+            "/vocabulary/glasses.png",
+            "/vocabulary/gloves.png",
+            "/vocabulary/grapes.png",
+            "/vocabulary/hat.png",
+            "/vocabulary/horse.png",
+            "/vocabulary/house.png",
+            "/vocabulary/ice_cream.png",
+            "/vocabulary/jacket.png",
+            "/vocabulary/juice.png",
+            "/vocabulary/key.png",
+            "/vocabulary/kite.png",
+            "/vocabulary/lamp.png",
+            "/vocabulary/lemon.png",
+            "/vocabulary/lion.png",
+            "/vocabulary/lock.png",
+            "/vocabulary/milk.png",
+            "/vocabulary/monkey.png",
+            "/vocabulary/moon.png",
+            "/vocabulary/mountain.png",
+            "/vocabulary/mushroom.png",
+            "/vocabulary/orange.png",
+            "/vocabulary/pants.png",
+            "/vocabulary/pear.png",
+            "/vocabulary/pencil.png",
+            "/vocabulary/phone.png",
+            "/vocabulary/pig.png",
+            "/vocabulary/pillow.png",
+            "/vocabulary/pizza.png",
+            "/vocabulary/plate.png",
+            "/vocabulary/potato.png",
+            "/vocabulary/rabbit.png",
+            "/vocabulary/rain.png",
+            "/vocabulary/scarf.png",
+            "/vocabulary/sheep.png",
+            "/vocabulary/ship.png",
+            "/vocabulary/shirt.png",
+            "/vocabulary/shorts.png",
+            "/vocabulary/shovel.png",
+            "/vocabulary/sink.png",
+            "/vocabulary/skirt.png",
+            "/vocabulary/snake.png",
+            "/vocabulary/snowman.png",
+            "/vocabulary/sofa.png",
+            "/vocabulary/spider.png",
+            "/vocabulary/spoon.png",
+            "/vocabulary/star.png",
+            "/vocabulary/stone.png",
+            "/vocabulary/strawberry.png",
+            "/vocabulary/sun.png",
+            "/vocabulary/table.png",
+            "/vocabulary/television.png",
+            "/vocabulary/tiger.png",
+            "/vocabulary/toilet.png",
+            "/vocabulary/tomato.png",
+            "/vocabulary/train.png",
+            "/vocabulary/tree.png",
+            "/vocabulary/tshirt.png",
+            "/vocabulary/turtle.png",
+            "/vocabulary/umbrella.png",
+            "/vocabulary/watermelon.png",
+            "/vocabulary/window.png",
+            "/vocabulary/zebra.png",
+        ],
+    },
+    "welcome": {
+        bytes: 78550,
+        files: [
+            "/logo.png",
+        ],
+    },
+};
@@ -35,6 +35,11 @@ function StatsSection() {
           </CardHeader>
           <CardContent>
             <div className="text-xl font-bold text-gray-800">{stat.count}</div>
+            {stat.p50Ms != null && (
+              <p className="text-xs text-gray-500 mt-1">
+                Загрузка: p50 {stat.p50Ms} мс · p95 {stat.p95Ms} мс
+              </p>
+            )}
           </CardContent>
         </Card>
       ))}
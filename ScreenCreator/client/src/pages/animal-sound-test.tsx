@@ -5,8 +5,10 @@ import { Link, useLocation } from "wouter";
 import { Button } from "@/components/ui/button";
 import { Card } from "@/components/ui/card";
 import { cn } from "@/lib/utils";
+import { assetUrl } from "@/lib/assets";
 import { useToast } from "@/hooks/use-toast";
 import { useLockedParams } from "@/hooks/useLockedParams";
+import { usePrefetchTraining } from "@/hooks/usePrefetchTraining";
 import {
     Dialog,
     DialogContent,
@@ -58,6 +60,7 @@ const animals: AnimalItem[] = [
 export default function AnimalSoundTest() {
     const [, setLocation] = useLocation();
     const { isLocked, lockedParameters, requiredResult, backPath, completeExercise, getNextPath } = useLockedParams('animal-sound-test');
+    usePrefetchTraining('animal-sound-test');
 
     const [isPlaying, setIsPlaying] = useState(false);
     const [currentRound, setCurrentRound] = useState<{ target: AnimalItem; options: AnimalItem[] } | null>(null);
@@ -136,7 +139,7 @@ export default function AnimalSoundTest() {
     };
 
     const playAnimalSound = (animalId: string) => {
-        const baseAudio = `/auditory-test/audio/animals/${animalId}.mp3`;
+        const baseAudio = assetUrl(`/auditory-test/audio/animals/${animalId}.mp3`);
         console.log(`[AudioDebug] Attempting to play: ${baseAudio}`);
 
         if (!audioRef.current) {
@@ -3,6 +3,7 @@ import { Link } from "wouter";
 import { ArrowLeft, Play, Volume2, HelpCircle, X, CheckCircle, Clock, Square, ArrowRight } from "lucide-react";
 import { useLockedParams, formatRequiredResult } from "@/hooks/useLockedParams";
 import { RequiredResultBanner } from "@/components/RequiredResultBanner";
+import { assetUrl } from "@/lib/assets";
 
 interface AuditoryItem {
     word: string;
@@ -133,7 +134,7 @@ const categories = [
     { id: "clothes", name: "Одежда" },
 ];
 
-const getAudioPath = (file: string) => `/auditory-test/audio/${file}`;
+const getAudioPath = (file: string) => assetUrl(`/auditory-test/audio/${file}`);
 const getImagePath = (file: string) => `/vocabulary/${file}`;
 
 interface TrialResult {
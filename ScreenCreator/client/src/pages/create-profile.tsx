@@ -201,7 +201,7 @@ export default function CreateProfile() {
     if (!reportGenerating || !successProfileId) return;
 
     let attempts = 0;
-    const maxAttempts = 30; // 60 seconds (2s interval * 30)
+    const maxAttempts = 90; // 3 minutes (2s interval * 90): queued analyses can wait for a worker and retry
 
     const checkStatus = async () => {
       try {
@@ -298,8 +298,15 @@ ${checkedItemsText.map(text => `- ${text}`).join("\n")}
         reportPrompt = `${systemPrompt}\n\n${reportPrompt}`;
       }
 
-      await startAnalysis(profileId, reportPrompt);
-      setReportGenerating(true);
+      const started = await startAnalysis(profileId, reportPrompt);
+      if (started.status === "completed" && started.analysis) {
+        // Served from the server's response cache, no need to poll
+        setReportContent(started.analysis);
+        setReportCreated(true);
+        setShowAIReportDialog(true);
+      } else {
+        setReportGenerating(true);
+      }
 
     } catch (error: any) {
       setErrorMessage(error.message || "Ошибка при создании профиля");
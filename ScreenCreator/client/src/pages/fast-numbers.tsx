@@ -2,6 +2,7 @@ import { useState, useEffect, useRef } from "react";
 import { Link } from "wouter";
 import { ArrowLeft, Play, HelpCircle, X, Square, Settings, ArrowRight, RotateCcw, Trophy } from "lucide-react";
 import { useLockedParams } from "@/hooks/useLockedParams";
+import { usePrefetchTraining } from "@/hooks/usePrefetchTraining";
 
 type Phase = 'idle' | 'playing' | 'finished';
 
@@ -23,6 +24,7 @@ interface GameRecord {
 
 export default function FastNumbers() {
     const { isLocked, requiredResult, lockedParameters, backPath, completeExercise: lockedCompleteExercise, hasNextExercise, getNextPath } = useLockedParams('fast-numbers');
+    usePrefetchTraining('fast-numbers');
 
     // Settings
     const [rounds, setRounds] = useState(3);
@@ -2,6 +2,7 @@ import { useState, useEffect, useRef } from "react";
 import { Link } from "wouter";
 import { ArrowLeft, Play, HelpCircle, X, Square, Settings, ArrowRight, RotateCcw, Trophy } from "lucide-react";
 import { useLockedParams } from "@/hooks/useLockedParams";
+import { usePrefetchTraining } from "@/hooks/usePrefetchTraining";
 
 type Phase = 'idle' | 'playing' | 'finished';
 
@@ -45,6 +46,7 @@ const SYLLABLES = [
 
 export default function FastSyllables() {
     const { isLocked, requiredResult, lockedParameters, backPath, completeExercise: lockedCompleteExercise, hasNextExercise, getNextPath } = useLockedParams('fast-syllables');
+    usePrefetchTraining('fast-syllables');
 
     // Settings
     const [rounds, setRounds] = useState(3);
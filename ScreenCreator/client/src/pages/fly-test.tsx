@@ -2,6 +2,7 @@ import { useState, useEffect, useRef } from "react";
 import { Link } from "wouter";
 import { ArrowLeft, Play, HelpCircle, X, CheckCircle, RotateCcw, Clock, Square, Settings, ArrowRight } from "lucide-react";
 import { useLockedParams, formatRequiredResult } from "@/hooks/useLockedParams";
+import { usePrefetchTraining } from "@/hooks/usePrefetchTraining";
 
 type Phase = 'idle' | 'playing' | 'answering' | 'result' | 'final';
 type Direction = 'up' | 'down' | 'left' | 'right';
@@ -24,6 +25,7 @@ const DIRECTION_NAMES: Record<Direction, string> = {
 
 export default function FlyTest() {
     const { isLocked, requiredResult, lockedParameters, backPath, completeExercise: lockedCompleteExercise, hasNextExercise, getNextPath } = useLockedParams('fly-test');
+    usePrefetchTraining('fly-test');
 
     // Game State
     const [phase, setPhase] = useState<Phase>('idle');
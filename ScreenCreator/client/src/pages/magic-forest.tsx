@@ -2,6 +2,7 @@ import { useState, useEffect } from "react";
 import { Link } from "wouter";
 import { ArrowLeft, ArrowRight } from "lucide-react";
 import { useLockedParams, formatRequiredResult } from "@/hooks/useLockedParams";
+import { usePrefetchTraining } from "@/hooks/usePrefetchTraining";
 
 type GameState = 'intro' | 'preview' | 'input' | 'result';
 
@@ -33,6 +34,7 @@ const ANIMALS = [
 
 export default function MagicForest() {
     const { isLocked, requiredResult, lockedParameters, backPath, completeExercise: lockedCompleteExercise, hasNextExercise, getNextPath } = useLockedParams('magic-forest');
+    usePrefetchTraining('magic-forest');
 
     const [level, setLevel] = useState(1);
     const [gameState, setGameState] = useState<GameState>('intro');
@@ -5,6 +5,7 @@ import {
     Timer, ArrowRight, Eye
 } from "lucide-react";
 import { useLockedParams } from "@/hooks/useLockedParams";
+import { usePrefetchTraining } from "@/hooks/usePrefetchTraining";
 
 type Phase = 'idle' | 'playing' | 'result';
 
@@ -85,6 +86,7 @@ const LETTERS: { letter: string; file: string }[] = [
 
 export default function NBackPicture() {
     const { isLocked, requiredResult, lockedParameters, backPath, completeExercise: lockedCompleteExercise, hasNextExercise, getNextPath } = useLockedParams('n-back-picture');
+    usePrefetchTraining('n-back-picture');
 
     // Settings
     const [n, setN] = useState(2);
@@ -1,8 +1,9 @@
-import { useState, useMemo } from "react";
+import { useState, useMemo, useEffect } from "react";
 import { Link, useLocation } from "wouter";
 import { Search, ArrowLeft, X } from "lucide-react";
 import { cn } from "@/lib/utils";
-import { useQuery, useQueryClient } from "@tanstack/react-query";
+import { useInfiniteQuery, useQueryClient } from "@tanstack/react-query";
+import { listProfiles } from "@/lib/api";
 
 type ProfileType = "child" | "adult" | null;
 
@@ -14,33 +15,30 @@ export default function SelectProfile() {
 
   const [deletedProfileIds, setDeletedProfileIds] = useState<Set<string>>(new Set());
 
-  const { data: profiles = [], isLoading } = useQuery({
-    queryKey: ["profiles"],
-    queryFn: async () => {
-      const res = await fetch("/api/profiles");
-      if (!res.ok) throw new Error("Failed to fetch profiles");
-      return res.json();
-    },
+  // Debounced, so typing does not fire a search per keystroke
+  const [debouncedSearch, setDebouncedSearch] = useState("");
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchQuery.trim()), 250);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
+  // Filtering, search and paging happen on the server; only the listed columns come back
+  const { data, isLoading, hasNextPage, fetchNextPage, isFetchingNextPage } = useInfiniteQuery({
+    queryKey: ["profiles", profileType, debouncedSearch],
+    queryFn: ({ pageParam }) => listProfiles({
+      profileType,
+      q: debouncedSearch,
+      fields: ["id", "name", "surname", "profileType"],
+      cursor: pageParam,
+    }),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
   });
 
-  const filteredProfiles = useMemo(() => {
-    let filtered: typeof profiles = profiles;
-
-    // Filter out locally deleted profiles
-    filtered = filtered.filter((p: any) => !deletedProfileIds.has(p.id));
-
-    if (profileType) {
-      filtered = filtered.filter((p: any) => p.profileType === profileType);
-    }
-
-    if (searchQuery) {
-      filtered = filtered.filter((p: any) =>
-        p.name.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-
-    return filtered;
-  }, [profiles, profileType, searchQuery, deletedProfileIds]);
+  const filteredProfiles = useMemo(
+    () => (data?.pages.flatMap((page) => page.items) ?? []).filter((p: any) => !deletedProfileIds.has(p.id)),
+    [data, deletedProfileIds],
+  );
 
   const handleSelectProfile = (profileId: string) => {
     setLocation(`/profile/${profileId}`);
@@ -154,6 +152,15 @@ export default function SelectProfile() {
               </div>
             ))
           )}
+          {hasNextPage && (
+            <button
+              onClick={() => fetchNextPage()}
+              disabled={isFetchingNextPage}
+              className="w-full py-3 text-blue-600 text-sm font-medium hover:underline disabled:text-gray-400"
+            >
+              {isFetchingNextPage ? "Загрузка..." : "Показать ещё"}
+            </button>
+          )}
         </div>
 
         {/* Action Buttons */}
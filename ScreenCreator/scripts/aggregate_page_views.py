@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Fold the nginx access log into page_views.
+
+Runs on the server from cron (see setup_page_views_cron.py). nginx answers
+the client's `POST /api/view?path=...` beacon itself and writes it to the
+access log in the `portal_timed` format from setup_nginx_domain.py, so page
+loads no longer cause a row write in Node.
+
+Each run memory-maps the log, parses it in chunks from the offset stored in
+access_log_offsets, and in a single transaction bulk-upserts per-path view
+counts plus p50/p95 latency of full page loads, and the new offset. A crash
+before commit simply re-reads the same bytes next time. When logrotate has
+moved the file, the remainder of the rotated copy (<log>.1) is read first.
+
+Requires psycopg2 (apt install python3-psycopg2).
+"""
+
+import argparse
+import mmap
+import os
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+DEFAULT_LOG = Path("/var/log/nginx/neurotrainer.access.log")
+ENV_FILE = Path("/var/www/portal/current/.env")
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# portal_timed: $remote_addr [$time_local] "$request" $status $body_bytes_sent $request_time "$upstream_response_time" "$http_user_agent"
+LINE_RE = re.compile(
+    rb'^\S+ \[[^\]]+\] "(?P<method>[A-Z]+) (?P<target>\S+) [^"]*" (?P<status>\d{3}) \d+ (?P<request_time>[\d.]+) '
+)
+# SPA routes only: keeps junk paths sent to the beacon out of the table
+PAGE_PATH_RE = re.compile(r"^/[\w\-/]{0,127}$")
+STATIC_PREFIXES = ("/api/", "/assets/", "/media/")
+
+UPSERT_SQL = """
+    INSERT INTO page_views (path, count, p50_ms, p95_ms, latency_samples, updated_at)
+    VALUES %s
+    ON CONFLICT (path) DO UPDATE SET
+        count = page_views.count + EXCLUDED.count,
+        p50_ms = COALESCE(EXCLUDED.p50_ms, page_views.p50_ms),
+        p95_ms = COALESCE(EXCLUDED.p95_ms, page_views.p95_ms),
+        latency_samples = COALESCE(EXCLUDED.latency_samples, page_views.latency_samples),
+        updated_at = now()
+"""
+
+
+def database_url(cli_value):
+    if cli_value:
+        return cli_value
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if ENV_FILE.exists():
+        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"')
+    raise SystemExit("DATABASE_URL is not set")
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class Aggregate:
+    def __init__(self):
+        self.views = defaultdict(int)
+        self.latency_ms = defaultdict(list)
+        self.lines = 0
+
+    def add_line(self, line):
+        m = LINE_RE.match(line)
+        if not m:
+            return
+        self.lines += 1
+        method = m.group("method").decode("ascii")
+        status = int(m.group("status"))
+        target = m.group("target").decode("utf-8", errors="replace")
+        url = urlsplit(target)
+
+        if url.path == "/api/view" and method == "POST" and status < 400:
+            path = parse_qs(url.query).get("path", ["/"])[0]
+            if PAGE_PATH_RE.match(path):
+                self.views[path] += 1
+        elif method == "GET" and status == 200 and PAGE_PATH_RE.match(url.path) \
+                and not url.path.startswith(STATIC_PREFIXES):
+            # Document request for an SPA route (served by @app)
+            self.latency_ms[url.path].append(float(m.group("request_time")) * 1000)
+
+    def rows(self):
+        rows = []
+        for path in sorted(set(self.views) | set(self.latency_ms)):
+            samples = self.latency_ms.get(path)
+            if samples:
+                rows.append((path, self.views.get(path, 0), round(percentile(samples, 50)),
+                             round(percentile(samples, 95)), len(samples)))
+            else:
+                rows.append((path, self.views.get(path, 0), None, None, None))
+        return rows
+
+
+def read_from(path, offset, aggregate):
+    """Parse complete lines of `path` from `offset`; return the new offset."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= offset:
+            return offset
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            position = offset
+            while position < size:
+                end = min(position + CHUNK_SIZE, size)
+                chunk = mm[position:end]
+                last_newline = chunk.rfind(b"\n")
+                if last_newline < 0:
+                    if end == size:
+                        break  # trailing partial line, picked up next run
+                    # A single line longer than the chunk: extend to its end
+                    next_newline = mm.find(b"\n", end)
+                    if next_newline < 0:
+                        break
+                    chunk = mm[position:next_newline + 1]
+                    last_newline = len(chunk) - 1
+                for line in chunk[:last_newline].split(b"\n"):
+                    aggregate.add_line(line)
+                position += last_newline + 1
+    return position
+
+
+def run(log_path, dsn, dry_run):
+    conn = psycopg2.connect(dsn)
+    try:
+        with conn:
+            with conn.cursor() as cur:
+                # Overlapping cron runs must not read the same bytes twice
+                cur.execute("SELECT pg_advisory_xact_lock(hashtext('aggregate_page_views'))")
+                cur.execute(
+                    'SELECT inode, "offset" FROM access_log_offsets WHERE log_path = %s',
+                    (str(log_path),),
+                )
+                saved = cur.fetchone()
+                aggregate = Aggregate()
+
+                inode = os.stat(log_path).st_ino
+                offset = 0
+                if saved:
+                    saved_inode, saved_offset = saved
+                    if saved_inode == inode:
+                        offset = saved_offset
+                        if os.stat(log_path).st_size < offset:
+                            offset = 0  # truncated (copytruncate)
+                    else:
+                        rotated = log_path.with_name(log_path.name + ".1")
+                        if rotated.exists() and os.stat(rotated).st_ino == saved_inode:
+                            read_from(rotated, saved_offset, aggregate)
+
+                new_offset = read_from(log_path, offset, aggregate)
+                rows = aggregate.rows()
+                print(f"{aggregate.lines} lines, {new_offset - offset} bytes, "
+                      f"{sum(aggregate.views.values())} views on {len(rows)} paths")
+
+                if dry_run:
+                    for row in rows:
+                        print("  ", row)
+                    conn.rollback()
+                    return
+
+                if rows:
+                    execute_values(cur, UPSERT_SQL, rows, template="(%s, %s, %s, %s, %s, now())")
+                cur.execute(
+                    """
+                    INSERT INTO access_log_offsets (log_path, inode, "offset", updated_at)
+                    VALUES (%s, %s, %s, now())
+                    ON CONFLICT (log_path) DO UPDATE SET
+                        inode = EXCLUDED.inode, "offset" = EXCLUDED."offset", updated_at = now()
+                    """,
+                    (str(log_path), inode, new_offset),
+                )
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate nginx access log into page_views")
+    parser.add_argument("--log", type=Path, default=DEFAULT_LOG, help="access log in the portal_timed format")
+    parser.add_argument("--database-url", help="defaults to $DATABASE_URL or the release .env")
+    parser.add_argument("--dry-run", action="store_true", help="parse and print, do not write")
+    args = parser.parse_args()
+
+    if not args.log.exists():
+        print(f"No access log at {args.log}")
+        return 0
+    run(args.log, database_url(args.database_url), args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Move old chat_logs and chat_messages rows into compressed JSONL archives.
+
+Runs on the server from cron (see setup_chat_archive_cron.py). Rows created
+before the cutoff (--older-than-days) are read through a server-side cursor
+in created_at order, --batch rows at a time, so memory stays flat however
+large the backlog. Each batch is appended to a monthly gzip file
+(<out-dir>/<table>/<table>-YYYY-MM-<run>.jsonl.gz, one JSON object per
+line). The file is fsynced, and then the batch is deleted from the live
+table and committed. A crash between the fsync and the commit leaves the
+batch in both places. The next run archives it again, and `restore` skips
+rows whose id is already present.
+
+chat_messages rows are only archived once the profile's rolling summary
+(chat_summaries) covers them. The AI chat keeps its context that way; the
+messages just no longer show in the chat history view.
+
+    python3 archive_chat_logs.py --older-than-days 180
+    python3 archive_chat_logs.py restore /var/www/portal/archives/chat/chat_logs/chat_logs-2025-01-*.jsonl.gz
+
+Requires psycopg2 (apt install python3-psycopg2).
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import psycopg2
+from psycopg2.extras import RealDictCursor, execute_values
+
+ENV_FILE = Path("/var/www/portal/current/.env")
+DEFAULT_OUT_DIR = Path("/var/www/portal/archives/chat")
+
+# Rows each table may archive; %(cutoff)s is the age limit
+ARCHIVABLE = {
+    "chat_logs": "SELECT * FROM chat_logs WHERE created_at < %(cutoff)s ORDER BY created_at, id",
+    "chat_messages": """
+        SELECT m.* FROM chat_messages m
+        JOIN chat_summaries s ON s.profile_id = m.profile_id
+        WHERE m.created_at < %(cutoff)s
+          AND (m.created_at, m.id) <= (s.summarized_until, s.summarized_until_id)
+        ORDER BY m.created_at, m.id
+    """,
+}
+
+
+def database_url(cli_value):
+    if cli_value:
+        return cli_value
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if ENV_FILE.exists():
+        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"')
+    raise SystemExit("DATABASE_URL is not set")
+
+
+def to_json(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot archive {type(value).__name__}")
+
+
+class MonthlyArchive:
+    """Appends rows to one gzip file per table and month of created_at."""
+
+    def __init__(self, out_dir, table, run_id):
+        self.dir = out_dir / table
+        self.table = table
+        self.run_id = run_id
+        self.month = None
+        self.raw = None
+        self.gz = None
+        self.files = []
+
+    def _open(self, month):
+        self.close()
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / f"{self.table}-{month}-{self.run_id}.jsonl.gz"
+        self.raw = open(path, "ab")
+        self.gz = gzip.GzipFile(fileobj=self.raw, mode="ab", compresslevel=6)
+        self.month = month
+        self.files.append(path)
+        # The new directory entry has to survive a crash as well as the data
+        fd = os.open(self.dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def write(self, row):
+        month = row["created_at"].strftime("%Y-%m")
+        if month != self.month:
+            self._open(month)
+        self.gz.write(json.dumps(row, ensure_ascii=False, default=to_json).encode("utf-8") + b"\n")
+
+    def sync(self):
+        """Make everything written so far durable before it is deleted."""
+        if self.gz:
+            self.gz.flush()
+            self.raw.flush()
+            os.fsync(self.raw.fileno())
+
+    def close(self):
+        # Also runs when a batch crosses into the next month, before the
+        # batch is deleted, so the finished file is made durable here
+        if self.gz:
+            self.gz.close()
+            self.raw.flush()
+            os.fsync(self.raw.fileno())
+            self.raw.close()
+            self.gz = self.raw = None
+
+
+def table_size(cur, table):
+    cur.execute("SELECT pg_size_pretty(pg_total_relation_size(%s::regclass))", (table,))
+    return cur.fetchone()[0]
+
+
+def archive_table(dsn, table, cutoff, out_dir, run_id, batch, dry_run):
+    # The reader holds one snapshot for the whole pass; the writer commits per batch
+    reader = psycopg2.connect(dsn)
+    writer = psycopg2.connect(dsn)
+    archive = MonthlyArchive(out_dir, table, run_id)
+    moved = 0
+    try:
+        reader.set_session(readonly=True, isolation_level="REPEATABLE READ")
+        with writer.cursor() as cur:
+            size_before = table_size(cur, table)
+        writer.commit()
+
+        with reader.cursor(name=f"archive_{table}", cursor_factory=RealDictCursor) as rows:
+            rows.itersize = batch
+            rows.execute(ARCHIVABLE[table], {"cutoff": cutoff})
+            while True:
+                chunk = rows.fetchmany(batch)
+                if not chunk:
+                    break
+                if dry_run:
+                    moved += len(chunk)
+                    continue
+                for row in chunk:
+                    archive.write(row)
+                archive.sync()
+                with writer.cursor() as cur:
+                    cur.execute(f"DELETE FROM {table} WHERE id = ANY(%s)", ([row["id"] for row in chunk],))
+                writer.commit()
+                moved += len(chunk)
+        reader.rollback()
+        archive.close()
+
+        verb = "would move" if dry_run else "moved"
+        print(f"{table}: {verb} {moved} rows older than {cutoff:%Y-%m-%d}, {size_before} before")
+        for path in archive.files:
+            print(f"  {path} ({path.stat().st_size / 1024:.0f} KB)")
+        return moved
+    finally:
+        archive.close()
+        reader.close()
+        writer.close()
+
+
+def run_archive(args):
+    dsn = database_url(args.database_url)
+    cutoff = datetime.now() - timedelta(days=args.older_than_days)
+    run_id = time.strftime("%Y%m%dT%H%M%S")
+
+    lock = psycopg2.connect(dsn)
+    lock.autocommit = True
+    try:
+        with lock.cursor() as cur:
+            # Overlapping cron runs would archive the same rows twice
+            cur.execute("SELECT pg_try_advisory_lock(hashtext('archive_chat_logs'))")
+            if not cur.fetchone()[0]:
+                print("Another archive run is in progress")
+                return 0
+            started = time.time()
+            moved = {table: archive_table(dsn, table, cutoff, args.out_dir, run_id, args.batch, args.dry_run)
+                     for table in args.tables}
+            if not args.dry_run and any(moved.values()):
+                for table in args.tables:
+                    # Makes the freed pages reusable so the files stop growing
+                    cur.execute(f"VACUUM (ANALYZE) {table}")
+                    print(f"{table}: {table_size(cur, table)} after vacuum")
+            print(f"Done in {time.time() - started:.1f}s")
+    finally:
+        lock.close()
+    return 0
+
+
+def run_restore(args):
+    dsn = database_url(args.database_url)
+    conn = psycopg2.connect(dsn)
+    try:
+        for path in args.files:
+            table = Path(path).name.split("-", 1)[0]
+            if table not in ARCHIVABLE:
+                raise SystemExit(f"Cannot tell the table from {path}")
+            restored = 0
+            with gzip.open(path, "rt", encoding="utf-8") as f, conn.cursor() as cur:
+                columns = None
+                pending = []
+                for line in f:
+                    row = json.loads(line)
+                    columns = columns or list(row)
+                    pending.append([row[c] for c in columns])
+                    if len(pending) >= args.batch:
+                        restored += insert_rows(cur, table, columns, pending)
+                        pending = []
+                if pending:
+                    restored += insert_rows(cur, table, columns, pending)
+            conn.commit()
+            print(f"{path}: {restored} rows restored into {table}")
+    finally:
+        conn.close()
+    return 0
+
+
+def insert_rows(cur, table, columns, rows):
+    execute_values(
+        cur,
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s ON CONFLICT (id) DO NOTHING",
+        rows,
+        page_size=len(rows),
+    )
+    return cur.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive old chat rows to compressed JSONL")
+    parser.add_argument("--database-url", help="defaults to $DATABASE_URL or the release .env")
+    parser.add_argument("--batch", type=int, default=5000, help="rows per archive write and commit")
+    parser.add_argument("--older-than-days", type=int, default=180, help="archive rows older than this")
+    parser.add_argument("--tables", nargs="+", choices=sorted(ARCHIVABLE), default=sorted(ARCHIVABLE))
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    parser.add_argument("--dry-run", action="store_true", help="count what would move, change nothing")
+    sub = parser.add_subparsers(dest="command")
+    p_restore = sub.add_parser("restore", help="insert archived rows back into their table")
+    p_restore.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "restore":
+        return run_restore(args)
+    return run_archive(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
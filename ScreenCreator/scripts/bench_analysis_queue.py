@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the AI analysis job queue, offline.
+
+Starts scripts/fake_gemini.py in-process, creates --profiles throwaway
+profiles and posts one analysis per profile to POST /api/analyze, each one
+--duplicates times (as double clicks and retrying clients do). It then polls
+GET /api/analyze/jobs/:id until every job has finished and reports:
+
+  - jobs per second and queue-to-finish latency (p50/p95/max)
+  - how many submissions were deduplicated into an existing job
+  - attempts per job, and the 429/500 answers that caused them
+  - the fake model's peak concurrency, which must stay at or below
+    ANALYSIS_MAX_RUNNING however many pm2 instances are running
+  - with --repeat, the latency of re-running the same analyses, which the
+    response cache answers without a model call
+
+The server has to send its model calls to the fake:
+
+    AI_INTEGRATIONS_GEMINI_API_KEY=fake \\
+    AI_INTEGRATIONS_GEMINI_BASE_URL=http://127.0.0.1:8089 npm run dev
+    python scripts/bench_analysis_queue.py --profiles 100 --latency-ms 1500 --rpm 120
+
+The profiles and their jobs are deleted afterwards.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.request import urlopen
+
+from bench_result_writes import Client, percentile
+from fake_gemini import FakeGemini
+
+FINISHED = ("completed", "failed")
+
+
+def parse_ts(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def fake_stats(port):
+    with urlopen(f"http://127.0.0.1:{port}/stats", timeout=10) as response:
+        return json.loads(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis job queue against a fake model")
+    parser.add_argument("--url", default="http://localhost:5001", help="server base URL")
+    parser.add_argument("--profiles", type=int, default=50, help="distinct analyses to run")
+    parser.add_argument("--duplicates", type=int, default=3, help="submissions of each analysis")
+    parser.add_argument("--submitters", type=int, default=16, help="concurrent submitting clients")
+    parser.add_argument("--fake-port", type=int, default=8089)
+    parser.add_argument("--no-fake", action="store_true", help="use a fake_gemini.py that is already running")
+    parser.add_argument("--latency-ms", type=float, default=1500.0, help="fake model median latency")
+    parser.add_argument("--rpm", type=int, default=0, help="fake model quota per minute (0: unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of fake model calls failing with 500")
+    parser.add_argument("--timeout", type=float, default=900.0, help="seconds to wait for the queue to drain")
+    parser.add_argument("--repeat", action="store_true", help="submit every analysis again to measure cache hits")
+    args = parser.parse_args()
+
+    server = None
+    if not args.no_fake:
+        fake = FakeGemini(args.latency_ms, rpm=args.rpm, fail_rate=args.fail_rate)
+        server = fake.serve(port=args.fake_port)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"\n>>> Fake model on :{args.fake_port}, median {args.latency_ms:.0f} ms, "
+              f"rpm {args.rpm or 'unlimited'}, fail rate {args.fail_rate:.0%}")
+
+    setup = Client(args.url)
+    tag = uuid.uuid4().hex[:8]
+    profiles = []
+    try:
+        print(f">>> Creating {args.profiles} profiles...")
+        for i in range(args.profiles):
+            profile = setup.request("POST", "/api/profiles", {
+                "profileType": "child", "gender": "male", "name": f"bench-queue-{tag}-{i}", "surname": "Bench",
+            })
+            profiles.append(profile["id"])
+
+        submissions = [(profile_id, f"Проанализируй профиль {profile_id} ({tag}).")
+                       for _ in range(args.duplicates) for profile_id in profiles]
+        local = threading.local()
+
+        def submit(item):
+            profile_id, prompt = item
+            if not hasattr(local, "client"):
+                local.client = Client(args.url)
+            return local.client.request("POST", "/api/analyze", {"profileId": profile_id, "prompt": prompt})
+
+        print(f">>> Submitting {len(submissions)} analyses ({args.duplicates}x each) "
+              f"from {args.submitters} clients...")
+        started = time.time()
+        with ThreadPoolExecutor(args.submitters) as pool:
+            answers = list(pool.map(submit, submissions))
+        submit_s = time.time() - started
+        job_ids = sorted({a["jobId"] for a in answers})
+        deduplicated = sum(1 for a in answers if a.get("deduplicated"))
+        print(f"    {len(answers)} accepted in {submit_s:.2f}s -> {len(job_ids)} jobs, {deduplicated} deduplicated")
+
+        print(">>> Waiting for the queue to drain...")
+        jobs = {}
+        deadline = time.time() + args.timeout
+        while time.time() < deadline:
+            for job_id in job_ids:
+                if jobs.get(job_id, {}).get("status") not in FINISHED:
+                    jobs[job_id] = setup.request("GET", f"/api/analyze/jobs/{job_id}")
+            pending = sum(1 for j in jobs.values() if j["status"] not in FINISHED)
+            done = len(jobs) - pending
+            print(f"\r    {done}/{len(jobs)} finished", end="", flush=True)
+            if not pending:
+                break
+            time.sleep(1)
+        print()
+
+        finished = [j for j in jobs.values() if j["status"] in FINISHED and j.get("finishedAt")]
+        statuses = Counter(j["status"] for j in jobs.values())
+        attempts = Counter(j["attempts"] for j in finished)
+        latencies = [parse_ts(j["finishedAt"]) - parse_ts(j["createdAt"]) for j in finished]
+        print(f"\nJobs: {dict(statuses)}")
+        if latencies:
+            first = min(parse_ts(j["createdAt"]) for j in finished)
+            last = max(parse_ts(j["finishedAt"]) for j in finished)
+            span = max(last - first, 1e-6)
+            print(f"Throughput: {len(finished) / span:.2f} jobs/s over {span:.1f}s")
+            print(f"Queue to finish: p50 {percentile(latencies, 0.50):.1f}s, "
+                  f"p95 {percentile(latencies, 0.95):.1f}s, max {max(latencies):.1f}s")
+            print(f"Attempts per job: {dict(sorted(attempts.items()))}")
+        for j in jobs.values():
+            if j["status"] == "failed":
+                print(f"  first failure: job {j['id']}: {j['lastError']}")
+                break
+
+        model = fake_stats(args.fake_port)
+        print(f"\nModel calls: {model['total']} {model['calls']}, peak concurrency {model['peak_in_flight']}")
+        print(f"Prompts: {model['unique_prompts']} unique, {model['repeated_prompts']} repeated "
+              f"(retries only; duplicate submissions never reach the model)")
+
+        if args.repeat:
+            # Same prompts on unchanged profiles: the response cache answers them
+            print(f"\n>>> Repeating the {len(profiles)} analyses...")
+            calls_before = model["total"]
+            timings, cached = [], 0
+            for profile_id in profiles:
+                started = time.perf_counter()
+                answer = setup.request("POST", "/api/analyze", {
+                    "profileId": profile_id, "prompt": f"Проанализируй профиль {profile_id} ({tag}).",
+                })
+                timings.append((time.perf_counter() - started) * 1000)
+                cached += bool(answer.get("cached"))
+            model = fake_stats(args.fake_port)
+            print(f"    {cached}/{len(profiles)} from cache, p50 {percentile(timings, 0.50):.1f} ms, "
+                  f"p95 {percentile(timings, 0.95):.1f} ms, {model['total'] - calls_before} model calls")
+            print(f"    cache: {json.dumps(setup.request('GET', '/api/analyze/cache'))}")
+        return 0 if statuses.get("completed", 0) == len(job_ids) else 1
+    finally:
+        for profile_id in profiles:
+            setup.request("DELETE", f"/api/profiles/{profile_id}")
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for GET /api/profiles at 100k profiles.
+
+Seeds --profiles rows with realistic Russian names (ё included) straight
+into the database, then times the endpoint over HTTP:
+
+  - the first page, and the last of --pages pages walked with the cursor
+    (keyset pagination keeps both the same)
+  - the first page filtered by profile type
+  - name searches: exact, with a typo, ё typed as е, a substring, and a
+    first name plus surname
+
+For comparison it also times reading the whole table, which is what the
+endpoint used to send on every list view. Run the migration first:
+
+    npx tsx --env-file=.env scripts/migrate-profile-search.ts
+    npm run dev
+    python scripts/bench_profiles.py --profiles 100000
+
+Seeded rows are tagged parent_name = 'bench-profiles' and deleted afterwards
+unless --keep. Only local databases are seeded unless --force.
+
+Requires psycopg2 (pip install psycopg2-binary).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote, urlparse
+
+import psycopg2
+
+from bench_result_writes import Client, percentile
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+ENV_FILE = PROJECT_ROOT / ".env"
+
+LOCAL_HOSTS = {None, "", "localhost", "127.0.0.1", "::1"}
+TAG = "bench-profiles"
+LIST_FIELDS = "id,name,surname,profileType"
+
+FIRST_NAMES_M = ["Александр", "Артём", "Иван", "Михаил", "Дмитрий", "Максим", "Пётр", "Фёдор", "Семён",
+                 "Никита", "Егор", "Кирилл", "Андрей", "Матвей", "Тимофей", "Лев", "Роман", "Глеб"]
+FIRST_NAMES_F = ["Анна", "Алёна", "Мария", "София", "Виктория", "Полина", "Дарья", "Ксения", "Ольга",
+                 "Елизавета", "Варвара", "Алиса", "Екатерина", "Наталья", "Татьяна", "Юлия", "Вера", "Фёкла"]
+SURNAMES = ["Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов",
+            "Новиков", "Фёдоров", "Морозов", "Волков", "Алексеев", "Лебедев", "Семёнов", "Егоров",
+            "Павлов", "Козлов", "Степанов", "Николаев", "Орлов", "Андреев", "Макаров", "Никитин",
+            "Захаров", "Зайцев", "Соловьёв", "Борисов", "Яковлев", "Григорьев", "Романов", "Воробьёв"]
+
+SEED_SQL = """
+    INSERT INTO profiles (profile_type, gender, name, surname, parent_name, date_of_birth, created_at, updated_at)
+    SELECT CASE WHEN g %% 4 = 0 THEN 'adult' ELSE 'child' END,
+           CASE WHEN g %% 2 = 0 THEN 'male' ELSE 'female' END,
+           CASE WHEN g %% 2 = 0
+                THEN (%(first_m)s::text[])[1 + (hashint4(g) & 1023) %% %(n_first_m)s]
+                ELSE (%(first_f)s::text[])[1 + (hashint4(g) & 1023) %% %(n_first_f)s] END,
+           (%(surnames)s::text[])[1 + (hashint4(g * 31) & 1023) %% %(n_surnames)s]
+               || CASE WHEN g %% 2 = 0 THEN '' ELSE 'а' END,
+           %(tag)s,
+           to_char(date '2005-01-01' + (hashint4(g * 7) & 4095), 'YYYY-MM-DD'),
+           created, created
+    FROM generate_series(1, %(profiles)s) g,
+         LATERAL (SELECT now() - (g::float / %(profiles)s) * interval '3 years' AS created) c
+"""
+
+SEARCHES = [
+    ("exact surname", "Иванова"),
+    ("typo", "Иваноф"),
+    ("е for ё", "Алена"),
+    ("substring", "ков"),
+    ("first + last", "Пётр Соколов"),
+]
+
+
+def database_url(cli_value):
+    if cli_value:
+        return cli_value
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if ENV_FILE.exists():
+        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"')
+    raise SystemExit("DATABASE_URL is not set (use --database-url)")
+
+
+def timed(fn, runs):
+    """Median and p95 in ms over `runs` calls, plus the last result."""
+    samples, result = [], None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return percentile(samples, 0.50), percentile(samples, 0.95), result
+
+
+def report(label, p50, p95, payload, rows):
+    size = len(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
+    print(f"  {label:<34} {p50:9.1f} {p95:9.1f} {rows:>8} {size / 1024:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark profile listing and search")
+    parser.add_argument("--url", default="http://localhost:5001", help="server base URL")
+    parser.add_argument("--database-url", help="defaults to $DATABASE_URL or .env")
+    parser.add_argument("--profiles", type=int, default=100_000, help="profiles to seed")
+    parser.add_argument("--pages", type=int, default=200, help="pages to walk with the cursor")
+    parser.add_argument("--runs", type=int, default=20, help="timed calls per measurement")
+    parser.add_argument("--no-seed", action="store_true", help="measure the rows already there")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded profiles")
+    parser.add_argument("--force", action="store_true", help="allow seeding a non-local database")
+    args = parser.parse_args()
+
+    dsn = database_url(args.database_url)
+    if not args.force and not args.no_seed and urlparse(dsn).hostname not in LOCAL_HOSTS:
+        raise SystemExit(f"Refusing to seed {urlparse(dsn).hostname}; use --force for a non-local database")
+
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    cur = conn.cursor()
+    client = Client(args.url)
+    try:
+        if not args.no_seed:
+            print(f"\n>>> Seeding {args.profiles} profiles...")
+            started = time.time()
+            cur.execute(SEED_SQL, {
+                "profiles": args.profiles, "tag": TAG,
+                "first_m": FIRST_NAMES_M, "n_first_m": len(FIRST_NAMES_M),
+                "first_f": FIRST_NAMES_F, "n_first_f": len(FIRST_NAMES_F),
+                "surnames": SURNAMES, "n_surnames": len(SURNAMES),
+            })
+            seeded = cur.rowcount
+            cur.execute("ANALYZE profiles")
+            print(f"  {seeded} rows in {time.time() - started:.1f}s")
+        cur.execute("SELECT count(*) FROM profiles")
+        total = cur.fetchone()[0]
+
+        print(f"\n>>> {total} profiles, {args.runs} runs each")
+        print(f"  {'':<34} {'p50 ms':>9} {'p95 ms':>9} {'rows':>8} {'payload KB':>10}")
+
+        def whole_table():
+            cur.execute("SELECT * FROM profiles")
+            return cur.fetchall()
+        p50, p95, rows = timed(whole_table, max(1, args.runs // 5))
+        report("whole table, DB read only (old)", p50, p95, rows, len(rows))
+
+        def page(query):
+            return lambda: client.request("GET", f"/api/profiles?fields={LIST_FIELDS}&limit=50{query}")
+
+        p50, p95, first = timed(page(""), args.runs)
+        report("first page", p50, p95, first, len(first["items"]))
+
+        # Walk the cursor; keyset pages should cost the same however deep they are
+        cursor, walked, deep = first["nextCursor"], 1, []
+        while cursor and walked < args.pages:
+            started = time.perf_counter()
+            result = client.request("GET", f"/api/profiles?fields={LIST_FIELDS}&limit=50&cursor={cursor}")
+            deep.append((time.perf_counter() - started) * 1000)
+            cursor, walked = result["nextCursor"], walked + 1
+        if deep:
+            tail = deep[-min(len(deep), args.runs):]
+            report(f"page {walked} via cursor", percentile(tail, 0.50), percentile(tail, 0.95), result,
+                   len(result["items"]))
+
+        p50, p95, result = timed(page("&profileType=adult"), args.runs)
+        report("first page, adults", p50, p95, result, len(result["items"]))
+
+        for label, term in SEARCHES:
+            p50, p95, result = timed(page(f"&q={quote(term)}"), args.runs)
+            top = ", ".join(f"{p['name']} {p['surname']}" for p in result["items"][:3])
+            report(f"search {label}: {term}", p50, p95, result, len(result["items"]))
+            print(f"  {'':<34} top: {top}")
+        return 0
+    finally:
+        if not args.no_seed and not args.keep:
+            cur.execute("DELETE FROM profiles WHERE parent_name = %s", (TAG,))
+            print(f"\n>>> Deleted {cur.rowcount} seeded profiles")
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Query benchmark for the indexes added by scripts/migrate-add-indexes.ts.
+
+Seeds a local database with realistic volumes (schools, students,
+assignments, exercise results, profiles and their chat history), then
+replays the queries behind /students/:id/progress, /schools/:id/statistics,
+/assignments/:id/results and getChatMessages under EXPLAIN ANALYZE. It runs
+them twice: once with the migration's indexes dropped, and once after
+creating them from the statements in the migration file. It prints median
+execution time and the plan's scan type for both runs.
+
+Only meant for a scratch database, since it drops and creates indexes:
+
+    createdb neurotrainer_bench
+    DATABASE_URL=postgresql://localhost/neurotrainer_bench npm run db:push
+    python scripts/bench_queries.py --database-url postgresql://localhost/neurotrainer_bench
+
+Requires psycopg2 (pip install psycopg2-binary).
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import psycopg2
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+ENV_FILE = PROJECT_ROOT / ".env"
+MIGRATION = SCRIPT_DIR / "migrate-add-indexes.ts"
+
+LOCAL_HOSTS = {None, "", "localhost", "127.0.0.1", "::1"}
+TRAININGS = ["stroop-test", "schulte-table", "n-back", "reaction-test", "correction-test",
+             "alphabet-game", "fly-test", "fast-numbers"]
+
+SEED_SQL = [
+    ("schools", """
+        INSERT INTO schools (title, login, password, allowed_trainings)
+        SELECT 'Bench school ' || g, 'bench-school-' || g, 'bench', '[]'::json
+        FROM generate_series(1, %(schools)s) g
+    """),
+    ("students", """
+        INSERT INTO students (school_id, first_name, last_name, login, password, allowed_games)
+        SELECT s.id, 'Student', g::text, 'bench-' || s.id || '-' || g, 'bench', '[]'::json
+        FROM schools s, generate_series(1, %(students)s) g
+        WHERE s.login LIKE 'bench-school-%%'
+    """),
+    ("assignments", """
+        INSERT INTO assignments (school_id, student_id, title, scheduled_date, exercises, status)
+        SELECT st.school_id, st.id, 'Day ' || g,
+               to_char(date '2025-01-01' + g, 'YYYY-MM-DD'),
+               json_build_array(
+                   json_build_object('trainingId', (%(trainings)s::text[])[1 + (st.id + g) %% %(n_trainings)s],
+                                     'parameters', '{}'::json, 'requiredResult', json_build_object('type', 'score')),
+                   json_build_object('trainingId', (%(trainings)s::text[])[1 + (st.id * 7 + g) %% %(n_trainings)s],
+                                     'parameters', '{}'::json, 'requiredResult', json_build_object('type', 'score')),
+                   json_build_object('trainingId', (%(trainings)s::text[])[1 + (st.id * 13 + g) %% %(n_trainings)s],
+                                     'parameters', '{}'::json, 'requiredResult', json_build_object('type', 'score'))),
+               (ARRAY['pending', 'in_progress', 'completed'])[1 + (random() * 2)::int]
+        FROM students st, generate_series(1, %(assignments)s) g
+        WHERE st.login LIKE 'bench-%%'
+    """),
+    ("exercise_results", """
+        INSERT INTO exercise_results (assignment_id, exercise_index, student_id, result, passed, completed_at)
+        SELECT a.id, g %% 3, a.student_id,
+               json_build_object('score', (random() * 100)::int, 'time', (random() * 120)::int),
+               (random() < 0.6)::int,
+               now() - random() * interval '180 days'
+        FROM assignments a
+        JOIN students st ON st.id = a.student_id AND st.login LIKE 'bench-%%'
+        CROSS JOIN generate_series(1, %(results)s) g
+    """),
+    ("profiles", """
+        INSERT INTO profiles (profile_type, gender, name, surname)
+        SELECT CASE WHEN g %% 3 = 0 THEN 'adult' ELSE 'child' END,
+               CASE WHEN g %% 2 = 0 THEN 'male' ELSE 'female' END,
+               'bench', g::text
+        FROM generate_series(1, %(profiles)s) g
+    """),
+    ("chat_messages", """
+        INSERT INTO chat_messages (profile_id, role, content, created_at)
+        SELECT p.id, CASE WHEN g %% 2 = 0 THEN 'assistant' ELSE 'user' END,
+               repeat('message ', 30), now() - (g || ' minutes')::interval
+        FROM profiles p, generate_series(1, %(messages)s) g
+        WHERE p.name = 'bench'
+    """),
+    ("chat_logs", """
+        INSERT INTO chat_logs (profile_id, profile_name, message_type, sender, content, created_at)
+        SELECT p.id, 'bench ' || p.surname, CASE WHEN g %% 2 = 0 THEN 'assistant' ELSE 'user' END,
+               'user', repeat('log ', 40), now() - (g || ' minutes')::interval
+        FROM profiles p, generate_series(1, %(messages)s) g
+        WHERE p.name = 'bench'
+    """),
+]
+
+# (name, parameter kind, statement); %(id)s is filled with a sampled id
+QUERIES = [
+    ("progress: assignments", "student",
+     "SELECT * FROM assignments WHERE student_id = %(id)s"),
+    ("progress: results", "student",
+     "SELECT * FROM exercise_results WHERE student_id = %(id)s"),
+    ("assignment results", "assignment",
+     "SELECT * FROM exercise_results WHERE assignment_id = %(id)s"),
+    ("statistics: totals", "school", """
+        SELECT (SELECT count(*) FROM students WHERE school_id = %(id)s),
+               count(*) FILTER (WHERE status = 'completed'),
+               count(*) FILTER (WHERE status = 'in_progress'),
+               count(*) FILTER (WHERE status = 'pending')
+        FROM assignments WHERE school_id = %(id)s
+     """),
+    ("statistics: trainings", "school", """
+        SELECT e->>'trainingId', count(*)
+        FROM assignments a, json_array_elements(a.exercises) e
+        WHERE a.school_id = %(id)s
+        GROUP BY 1 ORDER BY 2 DESC LIMIT 5
+     """),
+    ("statistics: activity", "school", """
+        SELECT s.id, COALESCE(st.exercises_passed, 0), COALESCE(a.total, 0)
+        FROM students s
+        LEFT JOIN student_stats st ON st.student_id = s.id
+        LEFT JOIN (SELECT student_id, count(*) AS total FROM assignments
+                   WHERE school_id = %(id)s GROUP BY student_id) a ON a.student_id = s.id
+        WHERE s.school_id = %(id)s
+     """),
+    ("forgetResults by student", "student", """
+        SELECT student_id, count(*), count(*) FILTER (WHERE passed = 1)
+        FROM exercise_results WHERE student_id = %(id)s GROUP BY student_id
+     """),
+    ("getChatMessages", "profile",
+     "SELECT * FROM chat_messages WHERE profile_id = %(id)s ORDER BY created_at"),
+    ("deleteProfile: chat_logs", "profile",
+     "SELECT count(*) FROM chat_logs WHERE profile_id = %(id)s"),
+]
+
+SAMPLE_SQL = {
+    "school": "SELECT id FROM schools ORDER BY random() LIMIT %(n)s",
+    "student": "SELECT id FROM students ORDER BY random() LIMIT %(n)s",
+    "assignment": "SELECT id FROM assignments ORDER BY random() LIMIT %(n)s",
+    "profile": "SELECT id FROM profiles ORDER BY random() LIMIT %(n)s",
+}
+
+
+def database_url(cli_value):
+    if cli_value:
+        return cli_value
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if ENV_FILE.exists():
+        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"')
+    raise SystemExit("DATABASE_URL is not set (use --database-url)")
+
+
+def migration_indexes():
+    """(name, CREATE statement) pairs taken from the migration file."""
+    text = MIGRATION.read_text(encoding="utf-8")
+    statements = re.findall(r"sql`(CREATE INDEX[^`]+)`", text)
+    return [(re.search(r"IF NOT EXISTS (\w+)", s).group(1), s) for s in statements]
+
+
+def seed(cur, scale):
+    volumes = {
+        "schools": max(1, int(100 * scale)),
+        "students": 30,
+        "assignments": 20,
+        "results": 8,
+        "profiles": max(1, int(5000 * scale)),
+        "messages": 40,
+        "trainings": TRAININGS,
+        "n_trainings": len(TRAININGS),
+    }
+    for table, statement in SEED_SQL:
+        started = time.time()
+        cur.execute(statement, volumes)
+        print(f"  {table:<18} {cur.rowcount:>9} rows {time.time() - started:7.2f}s")
+    cur.execute("""
+        INSERT INTO student_stats (student_id, school_id, exercises_total, exercises_passed, last_result_at)
+        SELECT s.id, s.school_id, count(*), count(*) FILTER (WHERE r.passed = 1), max(r.completed_at)
+        FROM students s JOIN exercise_results r ON r.student_id = s.id
+        WHERE s.login LIKE 'bench-%'
+        GROUP BY s.id, s.school_id
+        ON CONFLICT (student_id) DO NOTHING
+    """)
+
+
+def cleanup(cur):
+    cur.execute("DELETE FROM schools WHERE login LIKE 'bench-school-%'")
+    cur.execute("DELETE FROM chat_messages WHERE profile_id IN (SELECT id FROM profiles WHERE name = 'bench')")
+    cur.execute("DELETE FROM chat_logs WHERE profile_id IN (SELECT id FROM profiles WHERE name = 'bench')")
+    cur.execute("DELETE FROM profiles WHERE name = 'bench'")
+
+
+def table_sizes(cur):
+    cur.execute("""
+        SELECT relname, n_live_tup FROM pg_stat_user_tables
+        WHERE relname IN ('schools', 'students', 'assignments', 'exercise_results', 'chat_messages', 'chat_logs')
+        ORDER BY n_live_tup DESC
+    """)
+    return cur.fetchall()
+
+
+def plan_nodes(plan):
+    """Scan node types of a JSON plan, outermost first."""
+    nodes = []
+    stack = [plan]
+    while stack:
+        node = stack.pop(0)
+        if "Scan" in node["Node Type"]:
+            nodes.append(f"{node['Node Type']} on {node.get('Relation Name', '?')}")
+        stack.extend(node.get("Plans", []))
+    return nodes
+
+
+def measure(cur, samples, repeat):
+    results = {}
+    for name, kind, statement in QUERIES:
+        times, scans = [], []
+        for _ in range(repeat):
+            for value in samples[kind]:
+                cur.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", {"id": value})
+                explained = cur.fetchone()[0]
+                if isinstance(explained, str):
+                    explained = json.loads(explained)
+                times.append(explained[0]["Execution Time"])
+                scans = plan_nodes(explained[0]["Plan"])
+        results[name] = (statistics.median(times), max(times), scans)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN ANALYZE the hot queries with and without the indexes")
+    parser.add_argument("--database-url", help="defaults to $DATABASE_URL or ScreenCreator/.env")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="1.0 = 100 schools, 3000 students, 60k assignments, 480k results, 200k chat messages")
+    parser.add_argument("--no-seed", action="store_true", help="benchmark the rows already in the database")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded rows afterwards")
+    parser.add_argument("--samples", type=int, default=20, help="ids sampled per parameter kind")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the sampled ids")
+    parser.add_argument("--force", action="store_true", help="allow a non-local database")
+    args = parser.parse_args()
+
+    dsn = database_url(args.database_url)
+    host = urlparse(dsn).hostname
+    if host not in LOCAL_HOSTS and not args.force:
+        raise SystemExit(f"{host} is not local; this drops indexes, pass --force if you mean it")
+
+    indexes = migration_indexes()
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            if not args.no_seed:
+                print(f"\n>>> Seeding (scale {args.scale})")
+                cleanup(cur)
+                seed(cur, args.scale)
+            cur.execute("VACUUM ANALYZE")
+            for table, rows in table_sizes(cur):
+                print(f"  {table:<18} {rows:>9} rows")
+
+            samples = {}
+            for kind, statement in SAMPLE_SQL.items():
+                cur.execute(statement, {"n": args.samples})
+                samples[kind] = [row[0] for row in cur.fetchall()]
+
+            print(f"\n>>> Without indexes ({len(indexes)} from {MIGRATION.name} dropped)")
+            for name, _ in indexes:
+                cur.execute(f"DROP INDEX IF EXISTS {name}")
+            cur.execute("ANALYZE")
+            before = measure(cur, samples, args.repeat)
+
+            print(">>> With indexes")
+            for name, statement in indexes:
+                started = time.time()
+                cur.execute(statement)
+                print(f"  {name:<36} {time.time() - started:6.2f}s")
+            cur.execute("ANALYZE")
+            after = measure(cur, samples, args.repeat)
+
+            print(f"\n{'query':<28} {'before ms':>10} {'after ms':>10} {'speedup':>8}  plan")
+            for name, _, _ in QUERIES:
+                b, a = before[name], after[name]
+                speedup = b[0] / a[0] if a[0] else float("inf")
+                print(f"{name:<28} {b[0]:10.3f} {a[0]:10.3f} {speedup:7.1f}x  {', '.join(a[2][:2])}")
+                if b[2][:2] != a[2][:2]:
+                    print(f"{'':<60}  was: {', '.join(b[2][:2])}")
+
+            if not args.no_seed and not args.keep:
+                cleanup(cur)
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
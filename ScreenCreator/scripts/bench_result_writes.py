@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for POST /api/assignments/:id/results.
+
+Creates a throwaway school, one student and assignment per worker, then has
+every worker post results to its own assignment as fast as the server
+answers. Latencies are bucketed by how many results the assignment already
+had, so a write path that re-reads earlier attempts shows up as p50/p95
+climbing bucket over bucket. With the passed_mask counter it should stay
+flat. The school (and everything under it) is deleted afterwards.
+
+    npm run dev   # or point --url at a staging server
+    python scripts/bench_result_writes.py --attempts 2000 --workers 4
+"""
+
+import argparse
+import http.client
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+import uuid
+from urllib.parse import urlparse
+
+EXERCISES = 10
+
+
+class Client:
+    """Keep-alive JSON client, one per thread."""
+
+    def __init__(self, url):
+        parsed = urlparse(url)
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.https = parsed.scheme == "https"
+        self.conn = None
+
+    def request(self, method, path, body=None):
+        if self.conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            self.conn = cls(self.host, self.port, timeout=30)
+        payload = None if body is None else json.dumps(body)
+        headers = {"Content-Type": "application/json"} if payload else {}
+        try:
+            self.conn.request(method, path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            self.conn.close()
+            self.conn = None
+            raise
+        if response.status >= 400:
+            raise RuntimeError(f"{method} {path} -> {response.status}: {data[:200]!r}")
+        return json.loads(data) if data else None
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def worker(url, assignment, student_id, attempts, bucket_size, buckets, lock, errors):
+    client = Client(url)
+    path = f"/api/assignments/{assignment}/results"
+    local = {}
+    for attempt in range(attempts):
+        body = {
+            "exerciseIndex": random.randrange(EXERCISES),
+            "studentId": student_id,
+            "result": {"score": random.randint(0, 100), "time": random.randint(5, 120)},
+            "passed": random.random() < 0.3,
+        }
+        started = time.perf_counter()
+        try:
+            client.request("POST", path, body)
+        except Exception as e:
+            with lock:
+                errors.append(str(e))
+            continue
+        local.setdefault(attempt // bucket_size, []).append((time.perf_counter() - started) * 1000)
+    with lock:
+        for bucket, samples in local.items():
+            buckets.setdefault(bucket, []).extend(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the exercise result write path")
+    parser.add_argument("--url", default="http://localhost:5001", help="server base URL")
+    parser.add_argument("--attempts", type=int, default=2000, help="results posted per assignment")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent assignments")
+    parser.add_argument("--bucket", type=int, default=250, help="attempts per report row")
+    args = parser.parse_args()
+
+    setup = Client(args.url)
+    tag = uuid.uuid4().hex[:8]
+    school = setup.request("POST", "/api/schools", {
+        "title": f"bench {tag}", "login": f"bench-{tag}", "password": tag,
+    })
+    print(f"\n>>> School {school['id']} with {args.workers} assignments x {args.attempts} results")
+
+    buckets, errors, lock = {}, [], threading.Lock()
+    threads = []
+    try:
+        for i in range(args.workers):
+            student = setup.request("POST", "/api/students", {
+                "school_id": school["id"], "first_name": "Bench", "last_name": str(i),
+                "login": f"bench-{tag}-{i}", "password": tag,
+            })
+            assignment = setup.request("POST", "/api/assignments", {
+                "schoolId": school["id"], "studentId": student["id"], "title": "bench",
+                "scheduledDate": time.strftime("%Y-%m-%d"),
+                "exercises": [{"trainingId": "schulte-table"} for _ in range(EXERCISES)],
+            })
+            threads.append(threading.Thread(target=worker, args=(
+                args.url, assignment["id"], student["id"], args.attempts, args.bucket, buckets, lock, errors,
+            )))
+
+        started = time.time()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.time() - started
+    finally:
+        setup.request("DELETE", f"/api/schools/{school['id']}")
+
+    total = sum(len(v) for v in buckets.values())
+    print(f"\n{'attempts':>13} {'n':>6} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8}")
+    rows = []
+    for bucket in sorted(buckets):
+        samples = buckets[bucket]
+        low, high = bucket * args.bucket, (bucket + 1) * args.bucket - 1
+        p50 = percentile(samples, 0.50)
+        rows.append(p50)
+        print(f"{low:>6}-{high:<6} {len(samples):>6} {p50:8.2f} {percentile(samples, 0.95):8.2f} "
+              f"{statistics.mean(samples):8.2f}")
+    print(f"\n{total} writes in {elapsed:.1f}s ({total / elapsed:.0f}/s), {len(errors)} errors")
+    if errors:
+        print(f"  first error: {errors[0]}")
+    if len(rows) > 1:
+        print(f"p50 last/first bucket: {rows[-1] / rows[0]:.2f}x")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Per-training asset lists and byte budgets.
+
+Statically scans every page in client/src/pages, plus the local modules it
+imports, for references to files in client/public:
+
+    '/animals/fox.png'                     -> that file
+    `/syllables/${s.toLowerCase()}.mp3`    -> glob /syllables/*.mp3
+
+Globs are narrowed to the file names that appear as string literals in the
+same module closure ('gus.png' in lib/word-dictionary.ts), so a data table
+plus a template path resolves to the files that can actually be played.
+References through lib/assets.ts are resolved to the content-hashed URLs.
+
+The result is written to client/src/lib/training-assets.ts, which the
+client uses to prefetch one training's media during its intro screen.
+Trainings heavier than their budget make the script exit with status 1,
+unless listed in KNOWN_OVERAGES and no heavier than recorded there;
+--check only verifies budgets and that the generated file is current.
+"""
+
+import argparse
+import fnmatch
+import json
+import re
+import sys
+from pathlib import Path
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+SRC_DIR = PROJECT_ROOT / "client" / "src"
+PAGES_DIR = SRC_DIR / "pages"
+PUBLIC_DIR = PROJECT_ROOT / "client" / "public"
+OUTPUT_TS = SRC_DIR / "lib" / "training-assets.ts"
+ASSET_MANIFEST_TS = SRC_DIR / "lib" / "asset-manifest.ts"
+
+MB = 1024 * 1024
+DEFAULT_BUDGET = 20 * MB
+# Trainings built around a large picture/sound dictionary
+BUDGETS = {
+    "memory-cards": 40 * MB,
+    "syllable-picture-game": 40 * MB,
+    "anagram-picture-test": 40 * MB,
+    "pairs-test": 40 * MB,
+    "visual-memory-test": 40 * MB,
+    "vocabulary-test": 40 * MB,
+    "auditory-test": 40 * MB,
+}
+
+# Over budget today and known: reported on every run, and fail only if they
+# grow past the size recorded here. All three load the whole /word-images
+# dictionary (~530 KB PNG per word, 112 MB); remove an entry once its
+# pictures are recompressed or loaded per level.
+KNOWN_OVERAGES = {
+    "memory-cards": 113 * MB,
+    "syllable-picture-game": 114 * MB,
+    "anagram-picture-test": 113 * MB,
+}
+
+IMPORT_RE = re.compile(r"""(?:import|export)\s[^;]*?from\s+["']([^"']+)["']""")
+LITERAL_RE = re.compile(r"""(["'`])((?:(?!\1)[^\\\n]|\\.)*)\1""")
+INTERPOLATION_RE = re.compile(r"\$\{[^}]*\}")
+SOURCE_EXTENSIONS = (".ts", ".tsx", "/index.ts", "/index.tsx")
+# Generated tables list every file, scanning them would match everything
+GENERATED = {OUTPUT_TS.resolve(), ASSET_MANIFEST_TS.resolve()}
+
+
+def resolve_import(spec: str, importer: Path) -> Path | None:
+    if spec.startswith("@/"):
+        base = SRC_DIR / spec[2:]
+    elif spec.startswith("."):
+        base = (importer.parent / spec).resolve()
+    else:
+        return None
+    for suffix in ("",) + SOURCE_EXTENSIONS:
+        candidate = Path(str(base) + suffix)
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def module_closure(entry: Path) -> list[Path]:
+    seen, stack = set(), [entry]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for spec in IMPORT_RE.findall(path.read_text(encoding="utf-8")):
+            target = resolve_import(spec, path)
+            # UI components never reference media, skip the shadcn tree
+            if target and target.resolve() not in GENERATED and "components/ui" not in target.as_posix():
+                stack.append(target)
+    return sorted(seen)
+
+
+def public_files() -> dict[str, int]:
+    files = {}
+    for path in PUBLIC_DIR.rglob("*"):
+        rel = path.relative_to(PUBLIC_DIR).as_posix()
+        if path.is_file() and not rel.startswith("media/"):
+            files["/" + rel] = path.stat().st_size
+    return files
+
+
+def to_pattern(literal: str) -> str | None:
+    """Public path or glob for a string literal, or None if it is not one."""
+    if not literal.startswith("/") or " " in literal:
+        return None
+    pattern = INTERPOLATION_RE.sub("*", literal)
+    # Require a literal directory (or a full file name) before any wildcard
+    head = pattern.split("*", 1)[0]
+    if "*" in pattern and head.count("/") < 2:
+        return None
+    return pattern
+
+
+def glob_match(pattern: str, path: str) -> bool:
+    # '*' must not cross directory boundaries
+    return path.count("/") == pattern.count("/") and fnmatch.fnmatchcase(path, pattern)
+
+
+def scan_training(entry: Path, files: dict[str, int]) -> list[str]:
+    literals = []
+    for path in module_closure(entry):
+        literals.extend(m.group(2) for m in LITERAL_RE.finditer(path.read_text(encoding="utf-8")))
+    names = {lit.lower() for lit in literals if lit and "/" not in lit and len(lit) < 64}
+
+    matched = set()
+    for literal in literals:
+        pattern = to_pattern(literal)
+        if pattern is None:
+            continue
+        if "*" not in pattern:
+            if pattern in files:
+                matched.add(pattern)
+            continue
+        candidates = [f for f in files if glob_match(pattern, f)]
+        narrowed = [
+            f for f in candidates
+            if f.rsplit("/", 1)[1].lower() in names or f.rsplit("/", 1)[1].rsplit(".", 1)[0].lower() in names
+        ]
+        matched.update(narrowed or candidates)
+    return sorted(matched)
+
+
+def hashed_urls() -> dict[str, str]:
+    """Original path -> hashed URL from the publish_assets.py manifest."""
+    if not ASSET_MANIFEST_TS.exists():
+        return {}
+    text = ASSET_MANIFEST_TS.read_text(encoding="utf-8")
+    entries = re.findall(r'^\s+("[^"]+"): \{ url: ("[^"]+")', text, re.M)
+    return {json.loads(key): json.loads(url) for key, url in entries}
+
+
+def render(trainings: dict[str, dict]) -> str:
+    lines = [
+        "// Generated by scripts/bundle_trainings.py, do not edit by hand.",
+        "",
+        "export interface TrainingAssets {",
+        "    bytes: number;",
+        "    files: string[];",
+        "}",
+        "",
+        "export const trainingAssets: Record<string, TrainingAssets> = {",
+    ]
+    for name in sorted(trainings):
+        t = trainings[name]
+        lines.append(f"    {json.dumps(name)}: {{")
+        lines.append(f"        bytes: {t['bytes']},")
+        lines.append("        files: [")
+        lines.extend(f"            {json.dumps(f, ensure_ascii=False)}," for f in t["files"])
+        lines.append("        ],")
+        lines.append("    },")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-training asset lists with byte budgets")
+    parser.add_argument("--check", action="store_true", help="do not write, fail if the generated file is stale")
+    args = parser.parse_args()
+
+    files = public_files()
+    hashed = hashed_urls()
+    trainings = {}
+    for page in sorted(PAGES_DIR.glob("*.tsx")):
+        matched = scan_training(page, files)
+        if matched:
+            trainings[page.stem] = {
+                # Prefetch what the page will request: hashed URL when published
+                "files": sorted(hashed.get(f, f) for f in matched),
+                "bytes": sum(files[f] for f in matched),
+            }
+
+    print(f"{'training':<28} {'files':>6} {'size':>10} {'budget':>10}")
+    over, known = [], []
+    for name, t in sorted(trainings.items(), key=lambda kv: kv[1]["bytes"], reverse=True):
+        budget = BUDGETS.get(name, DEFAULT_BUDGET)
+        flag = ""
+        if t["bytes"] > budget:
+            if t["bytes"] <= KNOWN_OVERAGES.get(name, 0):
+                flag = "  OVER (known)"
+                known.append(name)
+            else:
+                flag = "  OVER"
+                over.append(name)
+        print(f"{name:<28} {len(t['files']):>6} {t['bytes'] / MB:>8.1f}MB {budget / MB:>8.0f}MB{flag}")
+
+    content = render(trainings)
+    stale = not OUTPUT_TS.exists() or OUTPUT_TS.read_text(encoding="utf-8") != content
+    if args.check:
+        if stale:
+            print(f"\n{OUTPUT_TS.relative_to(PROJECT_ROOT)} is out of date, run scripts/bundle_trainings.py")
+    elif stale:
+        OUTPUT_TS.write_text(content, encoding="utf-8")
+        print(f"\nWrote {OUTPUT_TS.relative_to(PROJECT_ROOT)}")
+
+    if known:
+        print(f"\nKnown over budget (see KNOWN_OVERAGES): {', '.join(known)}")
+    if over:
+        print(f"\nOver budget: {', '.join(over)}")
+        return 1
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the Gemini generateContent endpoint, for offline benchmarks.
+
+Answers POST /v1beta/models/<model>:generateContent in the API's response
+shape after a log-normal delay around --latency-ms. It can also enforce a
+requests-per-minute quota (429, like the real one) and fail a share of calls
+with 500. GET /stats returns what the server saw: calls by status, peak
+concurrency and repeated prompts. POST /stats/reset clears them.
+
+Point the app at it through the base URL it already reads:
+
+    python scripts/fake_gemini.py --port 8089 --latency-ms 3000 --rpm 60
+    AI_INTEGRATIONS_GEMINI_API_KEY=fake \\
+    AI_INTEGRATIONS_GEMINI_BASE_URL=http://127.0.0.1:8089 npm run dev
+
+scripts/bench_analysis_queue.py starts one in-process.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GENERATE_RE = re.compile(r"^/v1(?:beta)?/models/([^/:]+):generateContent$")
+
+
+class FakeGemini:
+    def __init__(self, latency_ms=2000.0, jitter=0.4, rpm=0, fail_rate=0.0, response_chars=3000):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.rpm = rpm
+        self.fail_rate = fail_rate
+        self.response_chars = response_chars
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.calls = Counter()
+            self.prompts = Counter()
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self.window = deque()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "calls": dict(self.calls),
+                "total": sum(self.calls.values()),
+                "peak_in_flight": self.peak_in_flight,
+                "in_flight": self.in_flight,
+                "unique_prompts": len(self.prompts),
+                "repeated_prompts": sum(n - 1 for n in self.prompts.values()),
+            }
+
+    def _admit(self, prompt_hash):
+        """Count the call; returns the error status to answer with, if any."""
+        now = time.monotonic()
+        with self.lock:
+            self.prompts[prompt_hash] += 1
+            if self.rpm:
+                while self.window and now - self.window[0] > 60:
+                    self.window.popleft()
+                if len(self.window) >= self.rpm:
+                    self.calls[429] += 1
+                    return 429
+                self.window.append(now)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return None
+
+    def generate(self, body):
+        """(status, payload) for one generateContent request."""
+        prompt = "".join(part.get("text", "")
+                         for content in body.get("contents", [])
+                         for part in content.get("parts", []))
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        status = self._admit(prompt_hash)
+        if status == 429:
+            return 429, {"error": {"code": 429, "status": "RESOURCE_EXHAUSTED",
+                                   "message": "Quota exceeded (fake_gemini --rpm)"}}
+        try:
+            median = self.latency_ms / 1000
+            time.sleep(median * math.exp(random.gauss(0, self.jitter)) if self.jitter else median)
+            if random.random() < self.fail_rate:
+                with self.lock:
+                    self.calls[500] += 1
+                return 500, {"error": {"code": 500, "status": "INTERNAL", "message": "Injected failure"}}
+            text = f"Тестовый анализ для запроса {prompt_hash[:8]}.\n\n"
+            text += ("Показатели внимания в пределах нормы. " * (self.response_chars // 38 + 1))[:self.response_chars]
+            with self.lock:
+                self.calls[200] += 1
+            return 200, {
+                "candidates": [{
+                    "content": {"role": "model", "parts": [{"text": text}]},
+                    "finishReason": "STOP",
+                    "index": 0,
+                }],
+                "usageMetadata": {
+                    "promptTokenCount": len(prompt) // 3,
+                    "candidatesTokenCount": len(text) // 3,
+                    "totalTokenCount": (len(prompt) + len(text)) // 3,
+                },
+            }
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def serve(self, host="127.0.0.1", port=8089):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, status, payload):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path == "/stats":
+                    self._send(200, fake.stats())
+                else:
+                    self._send(404, {"error": {"code": 404, "message": "Not found"}})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                if self.path == "/stats/reset":
+                    fake.reset()
+                    self._send(200, {"ok": True})
+                    return
+                if not GENERATE_RE.match(self.path.split("?")[0]):
+                    self._send(404, {"error": {"code": 404, "message": f"Unknown path {self.path}"}})
+                    return
+                try:
+                    body = json.loads(raw or b"{}")
+                except ValueError:
+                    self._send(400, {"error": {"code": 400, "message": "Invalid JSON"}})
+                    return
+                self._send(*fake.generate(body))
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Gemini generateContent endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=2000.0, help="median response time")
+    parser.add_argument("--jitter", type=float, default=0.4, help="log-normal sigma of the response time")
+    parser.add_argument("--rpm", type=int, default=0, help="requests per minute before 429 (0: unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of calls answered with 500")
+    parser.add_argument("--response-chars", type=int, default=3000)
+    args = parser.parse_args()
+
+    fake = FakeGemini(args.latency_ms, args.jitter, args.rpm, args.fail_rate, args.response_chars)
+    server = fake.serve(args.host, args.port)
+    print(f"Fake Gemini on http://{args.host}:{args.port} (median {args.latency_ms:.0f} ms, "
+          f"rpm {args.rpm or 'unlimited'}, fail rate {args.fail_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(fake.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Synthetic schools, students, assignments and exercise results for scale tests.
+
+Rows are generated with numpy, a whole batch at a time: ids, foreign keys,
+dates, pass/fail and the per-training `result` JSON are built as arrays and
+joined into COPY text. No Python loop runs per row. Students are split into
+ranges, and a process pool loads each range over its own connection. Each
+worker COPYs its students first. In a second phase it COPYs their
+assignments and results in one transaction. passed_mask, passed_count and
+status of every assignment are derived from its generated results, the
+same way the API maintains them.
+
+Ids continue after the highest existing id and the sequences are moved past
+them at the end, so fixtures can be added to a database that already has
+data. Logins start with "fx-", and --drop removes everything generated.
+
+    createdb neurotrainer_scale
+    DATABASE_URL=postgresql://localhost/neurotrainer_scale npm run db:push
+    python scripts/generate_fixtures.py --database-url postgresql://localhost/neurotrainer_scale \\
+        --schools 2000 --students 150 --assignments 10 --results 8 --workers 8
+    python scripts/rebuild_stats.py --database-url postgresql://localhost/neurotrainer_scale
+
+Requires numpy and psycopg2 (pip install numpy psycopg2-binary).
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+import numpy as np
+import psycopg2
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+ENV_FILE = PROJECT_ROOT / ".env"
+
+# Students per task; results for one task are built in memory at once
+TASK_STUDENTS = 2000
+EPOCH = np.datetime64("2025-09-01T00:00:00")
+DAYS = 270
+
+FIRST_NAMES = ["Анна", "Иван", "Мария", "Дмитрий", "Софья", "Артём", "Алиса", "Максим", "Ева", "Лев"]
+LAST_NAMES = ["Иванов", "Смирнова", "Кузнецов", "Попова", "Соколов", "Лебедева", "Козлов", "Новикова"]
+
+# Shape of the `result` JSON each training posts: field -> (low, high) or a constant
+RESULT_SHAPES = {
+    "correction-test": {"timeElapsed": (60, 600), "foundCount": (20, 80), "totalTargets": 80},
+    "stroop-test": {"time": (30, 240)},
+    "n-back": {"accuracy": (40, 100)},
+    "n-back-picture": {"accuracy": (40, 100)},
+    "auditory-test": {"accuracy": (30, 100), "totalCorrect": (10, 40), "totalTrials": 40},
+    "animal-sound-test": {"correct": (3, 10), "total": 10},
+    "start-test": {"accuracy": (40, 100), "avgReactionTime": (250, 900), "stepsCompleted": (1, 10)},
+    "vocabulary-test": {"accuracy": (30, 100), "questionsCompleted": (5, 20)},
+    "speed-reading": {"wordsShown": (50, 400), "wordsPerMinute": (80, 400)},
+    "schulte-table": {"time": (20, 180), "errors": (0, 6)},
+    "reaction-test": {"reactionTime": (180, 600), "accuracy": (50, 100)},
+    "munsterberg-test": {"foundCount": (5, 25), "timeElapsed": (60, 300)},
+    "calcudoku": {"time": (60, 900), "size": (4, 6)},
+    "tower-of-hanoi": {"moves": (7, 60), "time": (30, 600)},
+    "fly-test": {"score": (0, 100), "level": (1, 10)},
+    "math-test": {"accuracy": (40, 100), "timeElapsed": (60, 300)},
+}
+TRAININGS = sorted(RESULT_SHAPES)
+PASS_RATE = 0.6
+
+
+def database_url(cli_value):
+    if cli_value:
+        return cli_value
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if ENV_FILE.exists():
+        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"')
+    raise SystemExit("DATABASE_URL is not set (use --database-url)")
+
+
+def text(values):
+    return np.asarray(values).astype(str).astype(object)
+
+
+def rows(*columns):
+    """COPY text for equally long columns (values must not contain tabs or backslashes)."""
+    line = columns[0]
+    for column in columns[1:]:
+        line = line + "\t" + column
+    return ("\n".join(line) + "\n").encode("utf-8") if len(line) else b""
+
+
+def timestamps(rng, n, start_day=0, days=DAYS):
+    offsets = rng.integers(start_day * 86400, days * 86400, n)
+    return text(EPOCH + offsets.astype("timedelta64[s]"))
+
+
+def result_json(rng, trainings, passed):
+    """Per-training result objects for a batch of results."""
+    out = np.empty(len(trainings), dtype=object)
+    for t, name in enumerate(TRAININGS):
+        idx = np.flatnonzero(trainings == t)
+        if not len(idx):
+            continue
+        parts = None
+        for field, spec in RESULT_SHAPES[name].items():
+            if isinstance(spec, tuple):
+                low, high = spec
+                values = rng.integers(low, high + 1, len(idx))
+                # Passed attempts skew toward the good end of the range
+                values = np.where(passed[idx], np.maximum(values, (low + high) // 2), values)
+                value = text(values)
+            else:
+                value = np.full(len(idx), str(spec), dtype=object)
+            piece = f'"{field}": ' + value
+            parts = piece if parts is None else parts + ", " + piece
+        out[idx] = "{" + parts + "}"
+    return out
+
+
+def exercise_lists(rng, count):
+    """Pool of assignment exercise lists: (training index matrix, lengths, JSON)."""
+    lengths = rng.integers(3, 7, count)
+    matrix = np.full((count, 6), -1)
+    json_values = []
+    for i, n in enumerate(lengths):
+        picked = rng.choice(len(TRAININGS), n, replace=False)
+        matrix[i, :n] = picked
+        items = ", ".join(
+            f'{{"trainingId": "{TRAININGS[t]}", "parameters": {{}}, "requiredResult": {{"type": "completion"}}}}'
+            for t in picked
+        )
+        json_values.append(f"[{items}]")
+    return matrix, lengths, np.array(json_values, dtype=object)
+
+
+_conn = None
+
+
+def init_worker(dsn):
+    global _conn
+    _conn = psycopg2.connect(dsn)
+
+
+def load_students(task):
+    first, last, plan = task
+    rng = np.random.default_rng([plan["seed"], 1, first])
+    index = np.arange(first, last)
+    ids = plan["student_base"] + 1 + index
+    school_ids = plan["school_base"] + 1 + index // plan["students"]
+    data = rows(
+        text(ids), text(school_ids),
+        np.array(FIRST_NAMES, dtype=object)[rng.integers(0, len(FIRST_NAMES), len(index))],
+        np.array(LAST_NAMES, dtype=object)[rng.integers(0, len(LAST_NAMES), len(index))],
+        "fx-" + text(ids), np.full(len(index), "fixture", dtype=object),
+        np.full(len(index), "[]", dtype=object), timestamps(rng, len(index), days=30),
+    )
+    with _conn.cursor() as cur:
+        cur.copy_expert(
+            "COPY students (id, school_id, first_name, last_name, login, password, allowed_games, created_at) "
+            "FROM STDIN", io.BytesIO(data))
+    _conn.commit()
+    return len(index), 0, 0
+
+
+def load_assignments(task):
+    first, last, plan = task
+    rng = np.random.default_rng([plan["seed"], 2, first])
+    pool_matrix, pool_lengths, pool_json = plan["exercise_pool"]
+    n_students = last - first
+    per_student = plan["assignments"]
+    n = n_students * per_student
+
+    # Assignments: ids are contiguous per student range
+    student_index = np.repeat(np.arange(first, last), per_student)
+    ids = plan["assignment_base"] + 1 + np.arange(first * per_student, last * per_student)
+    student_ids = plan["student_base"] + 1 + student_index
+    school_ids = plan["school_base"] + 1 + student_index // plan["students"]
+    pool_pick = rng.integers(0, len(pool_lengths), n)
+    lengths = pool_lengths[pool_pick]
+    ordinal = np.tile(np.arange(per_student), n_students)
+    day = ordinal * (DAYS // max(per_student, 1))
+    scheduled = text((EPOCH + day.astype("timedelta64[D]")).astype("datetime64[D]"))
+
+    # Results: Poisson attempts per assignment, exercise chosen within its list
+    counts = rng.poisson(plan["results"], n)
+    owner = np.repeat(np.arange(n), counts)
+    exercise_index = (rng.random(len(owner)) * lengths[owner]).astype(np.int64)
+    trainings = pool_matrix[pool_pick[owner], exercise_index]
+    passed = rng.random(len(owner)) < PASS_RATE
+    result_day = day[owner] + rng.integers(0, 7, len(owner))
+    completed = text(EPOCH + (result_day * 86400 + rng.integers(8 * 3600, 20 * 3600, len(owner)))
+                     .astype("timedelta64[s]"))
+
+    # Status and passed bitmap exactly as services/results.ts would leave them
+    pairs = np.unique(owner[passed] * 64 + exercise_index[passed])
+    passed_count = np.bincount(pairs // 64, minlength=n)
+    passed_mask = np.zeros(n, dtype=np.int64)
+    np.bitwise_or.at(passed_mask, pairs // 64, np.left_shift(1, pairs % 64).astype(np.int64))
+    status = np.where(passed_count >= lengths, "completed", np.where(counts > 0, "in_progress", "pending"))
+
+    assignment_rows = rows(
+        text(ids), text(school_ids), text(student_ids), "Занятие " + text(ordinal + 1),
+        scheduled, pool_json[pool_pick], status.astype(object),
+        text(passed_mask), text(passed_count), timestamps(rng, n, days=1),
+    )
+    result_rows = rows(
+        text(ids[owner]), text(exercise_index), text(student_ids[owner]),
+        result_json(rng, trainings, passed), text(passed.astype(np.int8)), completed,
+    )
+    with _conn.cursor() as cur:
+        cur.copy_expert(
+            "COPY assignments (id, school_id, student_id, title, scheduled_date, exercises, status, "
+            "passed_mask, passed_count, created_at) FROM STDIN", io.BytesIO(assignment_rows))
+        cur.copy_expert(
+            "COPY exercise_results (assignment_id, exercise_index, student_id, result, passed, completed_at) "
+            "FROM STDIN", io.BytesIO(result_rows))
+    _conn.commit()
+    return n_students, n, len(owner)
+
+
+def run_phase(pool, func, plan, total_students, label):
+    started = time.time()
+    tasks = [(first, min(first + TASK_STUDENTS, total_students), plan)
+             for first in range(0, total_students, TASK_STUDENTS)]
+    done = assignments = results = 0
+    for students, a, r in pool.imap_unordered(func, tasks):
+        done += students
+        assignments += a
+        results += r
+        elapsed = time.time() - started
+        print(f"\r  {label}: {done}/{total_students} students, {assignments} assignments, "
+              f"{results} results ({results / max(elapsed, 1e-9):,.0f} results/s)", end="", flush=True)
+    print(f"\n  {label} done in {time.time() - started:.1f}s")
+
+
+def drop(dsn):
+    conn = psycopg2.connect(dsn)
+    with conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM schools WHERE login LIKE 'fx-school-%'")
+        print(f"Deleted {cur.rowcount} fixture schools with their students, assignments and results")
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic schools, students and results")
+    parser.add_argument("--database-url", help="defaults to $DATABASE_URL or ScreenCreator/.env")
+    parser.add_argument("--schools", type=int, default=200)
+    parser.add_argument("--students", type=int, default=150, help="students per school")
+    parser.add_argument("--assignments", type=int, default=10, help="assignments per student")
+    parser.add_argument("--results", type=float, default=8.0, help="mean results per assignment")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="parallel COPY streams")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--drop", action="store_true", help="delete previously generated fixtures and exit")
+    args = parser.parse_args()
+
+    dsn = database_url(args.database_url)
+    if args.drop:
+        drop(dsn)
+        return 0
+
+    conn = psycopg2.connect(dsn)
+    with conn.cursor() as cur:
+        bases = {}
+        for table in ("schools", "students", "assignments"):
+            cur.execute(f"SELECT COALESCE(max(id), 0) FROM {table}")
+            bases[table] = cur.fetchone()[0]
+
+        started = time.time()
+        school_ids = bases["schools"] + 1 + np.arange(args.schools)
+        rng = np.random.default_rng([args.seed, 0])
+        cur.copy_expert(
+            "COPY schools (id, title, login, password, allowed_trainings, created_at) FROM STDIN",
+            io.BytesIO(rows(
+                text(school_ids), "Школа №" + text(school_ids), "fx-school-" + text(school_ids),
+                np.full(args.schools, "fixture", dtype=object), np.full(args.schools, "[]", dtype=object),
+                timestamps(rng, args.schools, days=30),
+            )))
+        conn.commit()
+        print(f"  schools: {args.schools} in {time.time() - started:.1f}s")
+
+    plan = {
+        "seed": args.seed,
+        "students": args.students,
+        "assignments": args.assignments,
+        "results": args.results,
+        "school_base": bases["schools"],
+        "student_base": bases["students"],
+        "assignment_base": bases["assignments"],
+        "exercise_pool": exercise_lists(np.random.default_rng([args.seed, 3]), 512),
+    }
+    total_students = args.schools * args.students
+    with Pool(args.workers, initializer=init_worker, initargs=(dsn,)) as pool:
+        run_phase(pool, load_students, plan, total_students, "students")
+        run_phase(pool, load_assignments, plan, total_students, "assignments")
+
+    with conn.cursor() as cur:
+        for table in ("schools", "students", "assignments", "exercise_results"):
+            cur.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"GREATEST((SELECT COALESCE(max(id), 0) FROM {table}), 1))")
+        conn.commit()
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute("ANALYZE schools, students, assignments, exercise_results")
+    conn.close()
+    print("Run scripts/rebuild_stats.py to refresh the statistics rollups")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Bulk import of the JSON-file-era data/*.json into PostgreSQL.
+
+Each file is stream-parsed (ijson when installed, otherwise incremental
+json.raw_decode, so a large export never has to fit in memory) and loaded
+with COPY into a temporary staging table shaped like its target. From there
+one INSERT per table moves the rows into schools, students,
+course_templates, templates, assignments and exercise_results.
+
+Legacy rows get new ids from the table's sequence, because the live tables
+issue the same low ids themselves. The legacy -> new id pairs are kept in
+legacy_id_map, and foreign keys are translated through it. A legacy row
+that is already mapped is left alone, so re-running the import is a no-op
+and never overwrites later edits. Rows whose parent is missing are skipped
+and reported, and so are schools and students whose login is already taken
+(in the database or earlier in the same file). The existing account is
+kept, and the logins are listed for manual merging. Everything runs in one
+transaction.
+
+Try it against a local database first:
+
+    createdb neurotrainer_import
+    DATABASE_URL=postgresql://localhost/neurotrainer_import npm run db:push
+    python scripts/import_legacy_json.py --database-url postgresql://localhost/neurotrainer_import
+
+Requires psycopg2 (pip install psycopg2-binary); ijson is optional.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import psycopg2
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+DATA_DIR = PROJECT_ROOT / "data"
+ENV_FILE = PROJECT_ROOT / ".env"
+
+READ_SIZE = 1024 * 1024
+NULL = "\\N"
+# Column defaults applied when a legacy record lacks the field
+FALLBACKS = {
+    "created_at": "now()",
+    "completed_at": "now()",
+    "status": "'pending'",
+}
+# Same as scripts/migrate-passed-mask.ts; the API sets the bits on insert
+ID_MAP_SQL = """
+    CREATE TABLE IF NOT EXISTS legacy_id_map (
+        table_name TEXT NOT NULL,
+        legacy_id INTEGER NOT NULL,
+        id INTEGER NOT NULL,
+        PRIMARY KEY (table_name, legacy_id)
+    )
+"""
+PASSED_MASK_SQL = """
+    UPDATE assignments a
+    SET passed_mask = COALESCE(m.mask, 0), passed_count = COALESCE(m.cnt, 0)
+    FROM assignments x
+    LEFT JOIN (
+        SELECT assignment_id,
+               bit_or(1::bigint << exercise_index) AS mask,
+               count(DISTINCT exercise_index)::int AS cnt
+        FROM exercise_results
+        WHERE passed = 1 AND exercise_index BETWEEN 0 AND 52
+        GROUP BY assignment_id
+    ) m ON m.assignment_id = x.id
+    WHERE a.id = x.id
+"""
+
+
+def as_json(value):
+    return None if value is None else json.dumps(value, ensure_ascii=False)
+
+
+def as_flag(value):
+    return 1 if value else 0
+
+
+# Load order follows the foreign keys. Each column: (column, json key, converter).
+# "parents" maps foreign key columns to the table their legacy ids belong to,
+# "unique" lists columns with a unique constraint besides id.
+TABLES = [
+    {
+        "table": "schools", "file": "schools.json", "parents": {}, "unique": ["login"],
+        "columns": [("id", "id", None), ("title", "title", None), ("login", "login", None),
+                    ("password", "password", None), ("allowed_trainings", "allowedTrainings", as_json),
+                    ("created_at", "createdAt", None)],
+    },
+    {
+        "table": "students", "file": "students.json", "parents": {"school_id": "schools"}, "unique": ["login"],
+        "columns": [("id", "id", None), ("school_id", "schoolId", None), ("first_name", "firstName", None),
+                    ("last_name", "lastName", None), ("login", "login", None), ("password", "password", None),
+                    ("allowed_games", "allowedGames", as_json), ("created_at", "createdAt", None)],
+    },
+    {
+        "table": "course_templates", "file": "courses.json", "parents": {"school_id": "schools"},
+        "columns": [("id", "id", None), ("school_id", "schoolId", None), ("name", "name", None),
+                    ("days", "days", as_json), ("created_at", "createdAt", None)],
+    },
+    {
+        "table": "templates", "file": "templates.json", "parents": {"school_id": "schools"},
+        "columns": [("id", "id", None), ("school_id", "schoolId", None), ("name", "name", None),
+                    ("exercises", "exercises", as_json), ("created_at", "createdAt", None)],
+    },
+    {
+        "table": "assignments", "file": "assignments.json",
+        "parents": {"school_id": "schools", "student_id": "students"},
+        "columns": [("id", "id", None), ("school_id", "schoolId", None), ("student_id", "studentId", None),
+                    ("title", "title", None), ("scheduled_date", "scheduledDate", None),
+                    ("exercises", "exercises", as_json), ("status", "status", None),
+                    ("created_at", "createdAt", None)],
+    },
+    {
+        "table": "exercise_results", "file": "results.json",
+        "parents": {"assignment_id": "assignments", "student_id": "students"},
+        "columns": [("id", "id", None), ("assignment_id", "assignmentId", None),
+                    ("exercise_index", "exerciseIndex", None), ("student_id", "studentId", None),
+                    ("result", "result", as_json), ("passed", "passed", as_flag),
+                    ("completed_at", "completedAt", None)],
+    },
+]
+
+
+def iter_array(path: Path):
+    """Yield the elements of a top-level JSON array without loading the file."""
+    with open(path, "rb") as f:
+        if ijson is not None:
+            yield from ijson.items(f, "item", use_float=True)
+            return
+
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = f.read(READ_SIZE).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{path.name} is not a JSON array")
+        buffer = buffer[1:]
+        eof = False
+        while True:
+            buffer = buffer.lstrip().lstrip(",").lstrip()
+            if buffer.startswith("]"):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(READ_SIZE)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield item
+            buffer = buffer[end:]
+
+
+class CsvStream(io.TextIOBase):
+    """File-like CSV view of a row iterator, read lazily by COPY."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.pending = ""
+        self.count = 0
+
+    def read(self, size=-1):
+        while size < 0 or len(self.pending) < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            self.writer.writerow([NULL if v is None else v for v in row])
+            self.count += 1
+            self.pending += self.buffer.getvalue()
+            self.buffer.seek(0)
+            self.buffer.truncate()
+        if size < 0:
+            size = len(self.pending)
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+    def readline(self, size=-1):
+        return self.read(size)
+
+
+def table_rows(spec, path):
+    for record in iter_array(path):
+        yield tuple(
+            convert(record.get(key)) if convert else record.get(key)
+            for _, key, convert in spec["columns"]
+        )
+
+
+def import_table(cur, spec, data_dir):
+    path = data_dir / spec["file"]
+    if not path.exists():
+        print(f"  {spec['table']:<18} {spec['file']} not found, skipped")
+        return
+    table = spec["table"]
+    stage = f"stage_{table}"
+    columns = [c for c, _, _ in spec["columns"]]
+    column_list = ", ".join(columns)
+
+    started = time.time()
+    # Same columns as the target but without constraints, checked on insert
+    cur.execute(f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT * FROM {table} WITH NO DATA")
+    stream = CsvStream(table_rows(spec, path))
+    cur.copy_expert(f"COPY {stage} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{NULL}')", stream)
+    cur.execute(f"CREATE INDEX ON {stage} (id)")
+
+    # Imported by an earlier run (or repeated in the file): nothing to do
+    imported = (
+        f"(EXISTS (SELECT 1 FROM legacy_id_map m WHERE m.table_name = '{table}' AND m.legacy_id = s.id) "
+        f"OR EXISTS (SELECT 1 FROM {stage} d WHERE d.id = s.id AND d.ctid < s.ctid))"
+    )
+    # Parents are looked up by their legacy id; the rest would violate the foreign keys
+    parents_found = " AND ".join(
+        f"EXISTS (SELECT 1 FROM legacy_id_map m JOIN {parent} p ON p.id = m.id "
+        f"WHERE m.table_name = '{parent}' AND m.legacy_id = s.{column})"
+        for column, parent in spec["parents"].items()
+    ) or "TRUE"
+    # A unique value that is already taken would abort the whole transaction.
+    # The existing row wins; inside the file the lowest id does.
+    unique = spec.get("unique", [])
+    for column in unique:
+        cur.execute(f"CREATE INDEX ON {stage} ({column}, id)")
+    conflict = " OR ".join(
+        f"EXISTS (SELECT 1 FROM {table} t WHERE t.{c} = s.{c}) "
+        f"OR EXISTS (SELECT 1 FROM {stage} d WHERE d.{c} = s.{c} AND d.id < s.id)"
+        for c in unique
+    ) or "FALSE"
+
+    cur.execute(f"SELECT count(*) FROM {stage} s WHERE {imported}")
+    already = cur.fetchone()[0]
+    conflicts = []
+    if unique:
+        cur.execute(
+            f"SELECT s.id, {', '.join(f's.{c}' for c in unique)} FROM {stage} s "
+            f"WHERE NOT {imported} AND ({parents_found}) AND ({conflict}) ORDER BY s.id"
+        )
+        conflicts = cur.fetchall()
+
+    joins = " ".join(
+        f"JOIN legacy_id_map map_{column} ON map_{column}.table_name = '{parent}' "
+        f"AND map_{column}.legacy_id = s.{column}"
+        for column, parent in spec["parents"].items()
+    )
+    select_list = ", ".join(
+        "n.id" if c == "id"
+        else f"map_{c}.id" if c in spec["parents"]
+        else f"COALESCE(s.{c}, {FALLBACKS[c]})" if c in FALLBACKS
+        else f"s.{c}"
+        for c in columns
+    )
+    cur.execute(
+        f"WITH new_ids AS ("
+        f" INSERT INTO legacy_id_map (table_name, legacy_id, id)"
+        f" SELECT '{table}', s.id, nextval(pg_get_serial_sequence('{table}', 'id')) FROM {stage} s"
+        f" WHERE NOT {imported} AND ({parents_found}) AND NOT ({conflict})"
+        f" ON CONFLICT DO NOTHING RETURNING legacy_id, id"
+        f") "
+        f"INSERT INTO {table} ({column_list}) "
+        f"SELECT {select_list} FROM {stage} s JOIN new_ids n ON n.legacy_id = s.id {joins} "
+        f"WHERE NOT EXISTS (SELECT 1 FROM {stage} d WHERE d.id = s.id AND d.ctid < s.ctid)"
+    )
+    inserted = cur.rowcount
+    orphaned = stream.count - already - inserted - len(conflicts)
+    print(f"  {table:<18} {stream.count:>7} read {inserted:>7} inserted {already:>7} already there "
+          f"{orphaned:>5} orphaned {len(conflicts):>5} conflicting {time.time() - started:6.2f}s")
+    for row in conflicts[:20]:
+        print(f"    legacy id {row[0]}: {', '.join(f'{c} {v!r}' for c, v in zip(unique, row[1:]))} is already taken")
+    if len(conflicts) > 20:
+        print(f"    ... and {len(conflicts) - 20} more")
+
+
+def refresh_passed_masks(cur):
+    """Recompute assignments.passed_mask / passed_count from exercise_results."""
+    cur.execute(PASSED_MASK_SQL)
+    print(f"  {'passed_mask':<18} {cur.rowcount:>7} assignments refreshed")
+
+
+def database_url(cli_value):
+    if cli_value:
+        return cli_value
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if ENV_FILE.exists():
+        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"')
+    raise SystemExit("DATABASE_URL is not set (use --database-url)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import legacy data/*.json into PostgreSQL")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="directory with the JSON files")
+    parser.add_argument("--database-url", help="defaults to $DATABASE_URL or ScreenCreator/.env")
+    parser.add_argument("--only", nargs="*", help="subset of tables to import")
+    parser.add_argument("--dry-run", action="store_true", help="roll back instead of committing")
+    args = parser.parse_args()
+
+    if ijson is None:
+        print("ijson is not installed, using the built-in incremental parser")
+
+    specs = [s for s in TABLES if not args.only or s["table"] in args.only]
+    conn = psycopg2.connect(database_url(args.database_url))
+    started = time.time()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(ID_MAP_SQL)
+            for spec in specs:
+                import_table(cur, spec, args.data_dir)
+            if any(s["table"] in ("assignments", "exercise_results") for s in specs):
+                refresh_passed_masks(cur)
+        if args.dry_run:
+            conn.rollback()
+            print(f"Dry run, rolled back ({time.time() - started:.2f}s)")
+        else:
+            conn.commit()
+            print(f"Committed in {time.time() - started:.2f}s")
+            print("Run scripts/rebuild_stats.py to refresh the statistics rollups")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Open-loop load generator for the school/student API.
+
+Student sessions arrive as a Poisson process at --rate per second, whether
+or not earlier sessions have finished, so a slow server builds up a queue
+the way a real classroom would. Each session logs in (POST
+/api/auth/student), lists its assignments, posts a few exercise results
+with think time in between, and finally loads its progress. School
+dashboards (GET /api/schools/:id/statistics) arrive as a separate stream
+at --dashboard-rate.
+
+Requests share one keep-alive aiohttp connection pool. Latencies go into
+log-linear histograms, HDR-style with ~2% precision, so p99 and p99.9 are
+exact enough without keeping every sample. The report has per-endpoint
+p50/p90/p99/p99.9/max and errors.
+
+A throwaway population (schools, students, assignments) is created
+through the API first and deleted afterwards:
+
+    npm run dev
+    python scripts/load_test.py --rate 20 --duration 60
+
+Requires aiohttp (pip install aiohttp).
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+
+import aiohttp
+
+EXERCISES = 5
+TRAININGS = ["stroop-test", "schulte-table", "n-back", "reaction-test", "correction-test"]
+
+
+class Histogram:
+    """Log-linear latency histogram: 64 linear sub-buckets per power of two (µs)."""
+
+    SUB_BITS = 6
+
+    def __init__(self):
+        self.counts = Counter()
+        self.total = 0
+        self.max = 0
+
+    def _index(self, value):
+        exponent = max(0, value.bit_length() - self.SUB_BITS)
+        return exponent, value >> exponent
+
+    def record(self, seconds):
+        value = max(1, int(seconds * 1_000_000))
+        self.counts[self._index(value)] += 1
+        self.total += 1
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct):
+        """Upper edge of the bucket holding the pct-th value, in ms."""
+        if not self.total:
+            return 0.0
+        rank = max(1, int(self.total * pct / 100 + 0.5))
+        seen = 0
+        for exponent, sub in sorted(self.counts):
+            seen += self.counts[(exponent, sub)]
+            if seen >= rank:
+                return min(((sub + 1) << exponent) - 1, self.max) / 1000
+        return self.max / 1000
+
+
+class Stats:
+    def __init__(self):
+        self.latency = {}
+        self.errors = Counter()
+        self.sessions_started = 0
+        self.sessions_done = 0
+        self.sessions_dropped = 0
+
+    def record(self, endpoint, seconds, error=None):
+        self.latency.setdefault(endpoint, Histogram()).record(seconds)
+        if error:
+            self.errors[(endpoint, error)] += 1
+
+
+async def call(session, stats, method, url, endpoint, json=None):
+    started = time.perf_counter()
+    try:
+        async with session.request(method, url, json=json) as response:
+            body = await response.json(content_type=None)
+            error = None if response.status < 400 else f"HTTP {response.status}"
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        body, error = None, type(e).__name__
+    stats.record(endpoint, time.perf_counter() - started, error)
+    return body if error is None else None
+
+
+async def student_session(http, base, stats, student, args):
+    stats.sessions_started += 1
+    login = await call(http, stats, "POST", f"{base}/api/auth/student", "POST /auth/student",
+                       {"login": student["login"], "password": student["password"]})
+    if not login or not login.get("success"):
+        return
+    student_id = login["student"]["id"]
+    assignments = await call(http, stats, "GET", f"{base}/api/assignments?studentId={student_id}", "GET /assignments")
+    if assignments:
+        assignment = random.choice(assignments)
+        for _ in range(max(1, int(random.expovariate(1 / args.results_per_session)))):
+            await asyncio.sleep(random.expovariate(1 / args.think))
+            await call(http, stats, "POST", f"{base}/api/assignments/{assignment['id']}/results",
+                       "POST /assignments/:id/results", {
+                           "exerciseIndex": random.randrange(EXERCISES),
+                           "studentId": student_id,
+                           "result": {"score": random.randint(0, 100), "timeElapsed": random.randint(20, 300)},
+                           "passed": random.random() < 0.5,
+                       })
+    await call(http, stats, "GET", f"{base}/api/students/{student_id}/progress", "GET /students/:id/progress")
+    stats.sessions_done += 1
+
+
+async def dashboard(http, base, stats, school_id):
+    await call(http, stats, "GET", f"{base}/api/schools/{school_id}/statistics", "GET /schools/:id/statistics")
+
+
+async def arrivals(rate, duration, spawn, limit, stats, tasks):
+    """Start spawn() at Poisson arrival times for `duration` seconds."""
+    if rate <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+    next_at = loop.time()
+    while True:
+        next_at += random.expovariate(rate)
+        if next_at >= deadline:
+            return
+        await asyncio.sleep(max(0.0, next_at - loop.time()))
+        if len(tasks) >= limit:
+            stats.sessions_dropped += 1
+            continue
+        task = asyncio.create_task(spawn())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+
+async def create_population(http, base, args):
+    tag = uuid.uuid4().hex[:8]
+    schools, students = [], []
+    for s in range(args.schools):
+        async with http.post(f"{base}/api/schools", json={
+            "title": f"load {tag} {s}", "login": f"load-{tag}-{s}", "password": tag,
+        }) as r:
+            r.raise_for_status()
+            school = await r.json()
+        schools.append(school["id"])
+        for i in range(args.students):
+            login = f"load-{tag}-{s}-{i}"
+            async with http.post(f"{base}/api/students", json={
+                "school_id": school["id"], "first_name": "Load", "last_name": str(i),
+                "login": login, "password": tag,
+            }) as r:
+                r.raise_for_status()
+                student = await r.json()
+            students.append({"login": login, "password": tag})
+            for day in range(2):
+                async with http.post(f"{base}/api/assignments", json={
+                    "schoolId": school["id"], "studentId": student["id"], "title": f"Day {day + 1}",
+                    "scheduledDate": time.strftime("%Y-%m-%d"),
+                    "exercises": [{"trainingId": random.choice(TRAININGS), "parameters": {},
+                                   "requiredResult": {"type": "score"}} for _ in range(EXERCISES)],
+                }) as r:
+                    r.raise_for_status()
+    return schools, students
+
+
+def print_report(stats, elapsed, args):
+    print(f"\n{stats.sessions_started} sessions started ({stats.sessions_started / elapsed:.1f}/s, "
+          f"target {args.rate}/s), {stats.sessions_done} completed, {stats.sessions_dropped} dropped "
+          f"at the --max-sessions limit")
+    print(f"\n{'endpoint':<32} {'count':>7} {'rps':>7} {'p50':>8} {'p90':>8} {'p99':>8} {'p99.9':>8} "
+          f"{'max':>8} {'errors':>7}")
+    overall = Histogram()
+    for endpoint in sorted(stats.latency):
+        h = stats.latency[endpoint]
+        overall.merge(h)
+        errors = sum(n for (e, _), n in stats.errors.items() if e == endpoint)
+        print(f"{endpoint:<32} {h.total:>7} {h.total / elapsed:>7.1f} {h.percentile(50):>8.1f} "
+              f"{h.percentile(90):>8.1f} {h.percentile(99):>8.1f} {h.percentile(99.9):>8.1f} "
+              f"{h.max / 1000:>8.1f} {errors:>7}")
+    total_errors = sum(stats.errors.values())
+    print(f"{'all':<32} {overall.total:>7} {overall.total / elapsed:>7.1f} {overall.percentile(50):>8.1f} "
+          f"{overall.percentile(90):>8.1f} {overall.percentile(99):>8.1f} {overall.percentile(99.9):>8.1f} "
+          f"{overall.max / 1000:>8.1f} {total_errors:>7}")
+    print("(latencies in ms)")
+    for (endpoint, error), n in stats.errors.most_common(10):
+        print(f"  {n:>6} x {error} on {endpoint}")
+    return total_errors
+
+
+async def run(args):
+    base = args.url.rstrip("/")
+    connector = aiohttp.TCPConnector(limit=args.connections, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+        print(f"\n>>> Creating {args.schools} schools x {args.students} students...")
+        schools, students = await create_population(http, base, args)
+        stats = Stats()
+        tasks = set()
+        try:
+            print(f">>> Running {args.duration}s: {args.rate} sessions/s, {args.dashboard_rate} dashboards/s")
+            started = time.perf_counter()
+            await asyncio.gather(
+                arrivals(args.rate, args.duration,
+                         lambda: student_session(http, base, stats, random.choice(students), args),
+                         args.max_sessions, stats, tasks),
+                arrivals(args.dashboard_rate, args.duration,
+                         lambda: dashboard(http, base, stats, random.choice(schools)),
+                         args.max_sessions, stats, tasks),
+            )
+            if tasks:
+                print(f">>> Waiting for {len(tasks)} sessions in flight...")
+                await asyncio.gather(*list(tasks), return_exceptions=True)
+            elapsed = time.perf_counter() - started
+        finally:
+            if not args.keep:
+                for school_id in schools:
+                    async with http.delete(f"{base}/api/schools/{school_id}"):
+                        pass
+        return print_report(stats, elapsed, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop load test of the school/student API")
+    parser.add_argument("--url", default="http://localhost:5001", help="server base URL")
+    parser.add_argument("--rate", type=float, default=10.0, help="student sessions started per second")
+    parser.add_argument("--dashboard-rate", type=float, default=0.5, help="school dashboard loads per second")
+    parser.add_argument("--duration", type=int, default=60, help="seconds of arrivals")
+    parser.add_argument("--think", type=float, default=2.0, help="mean seconds between results in a session")
+    parser.add_argument("--results-per-session", type=float, default=6.0, help="mean results posted per session")
+    parser.add_argument("--schools", type=int, default=5)
+    parser.add_argument("--students", type=int, default=20, help="students per school")
+    parser.add_argument("--connections", type=int, default=64, help="HTTP connection pool size")
+    parser.add_argument("--max-sessions", type=int, default=2000, help="cap on concurrent sessions")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--keep", action="store_true", help="keep the generated schools afterwards")
+    args = parser.parse_args()
+    errors = asyncio.run(run(args))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
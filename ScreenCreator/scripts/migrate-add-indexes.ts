@@ -0,0 +1,36 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+// Kept in sync with the index definitions in shared/schema.ts.
+// scripts/bench_queries.py reads this list to measure before/after plans.
+const INDEXES = [
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS students_school_id_idx ON students (school_id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS assignments_school_status_idx ON assignments (school_id, status)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS assignments_student_id_idx ON assignments (student_id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS exercise_results_assignment_idx ON exercise_results (assignment_id, exercise_index)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS exercise_results_student_idx ON exercise_results (student_id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS student_stats_school_id_idx ON student_stats (school_id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS templates_school_id_idx ON templates (school_id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS course_templates_school_id_idx ON course_templates (school_id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS chat_messages_profile_created_idx ON chat_messages (profile_id, created_at)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS chat_logs_profile_id_idx ON chat_logs (profile_id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS chat_logs_created_at_idx ON chat_logs (created_at)`,
+];
+
+async function main() {
+    console.log("Running migration to add foreign key and lookup indexes...");
+    try {
+        // CONCURRENTLY so the live tables stay writable; each runs outside a transaction
+        for (const statement of INDEXES) {
+            await db.execute(statement);
+        }
+        await db.execute(sql`ANALYZE students, assignments, exercise_results, chat_messages, chat_logs`);
+        console.log("Migration completed successfully");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
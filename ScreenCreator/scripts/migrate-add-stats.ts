@@ -0,0 +1,34 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+async function main() {
+    console.log("Running migration to add student_stats and school_stats...");
+    try {
+        await db.execute(sql`
+      CREATE TABLE IF NOT EXISTS student_stats (
+        student_id INTEGER PRIMARY KEY REFERENCES students(id) ON DELETE CASCADE,
+        school_id INTEGER NOT NULL REFERENCES schools(id) ON DELETE CASCADE,
+        exercises_total INTEGER NOT NULL DEFAULT 0,
+        exercises_passed INTEGER NOT NULL DEFAULT 0,
+        last_result_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT now()
+      );
+    `);
+        await db.execute(sql`
+      CREATE TABLE IF NOT EXISTS school_stats (
+        school_id INTEGER PRIMARY KEY REFERENCES schools(id) ON DELETE CASCADE,
+        exercises_total INTEGER NOT NULL DEFAULT 0,
+        exercises_passed INTEGER NOT NULL DEFAULT 0,
+        last_result_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT now()
+      );
+    `);
+        console.log("Migration completed successfully. Run scripts/rebuild_stats.py to backfill.");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
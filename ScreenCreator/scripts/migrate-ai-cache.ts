@@ -0,0 +1,31 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+async function main() {
+    console.log("Running migration to add ai_response_cache...");
+    try {
+        await db.execute(sql`
+      CREATE TABLE IF NOT EXISTS ai_response_cache (
+        key TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        profile_id VARCHAR,
+        response TEXT NOT NULL,
+        bytes INTEGER NOT NULL,
+        elapsed_ms INTEGER NOT NULL DEFAULT 0,
+        hits INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT now(),
+        expires_at TIMESTAMP NOT NULL,
+        last_hit_at TIMESTAMP DEFAULT now()
+      );
+    `);
+        await db.execute(sql`CREATE INDEX IF NOT EXISTS ai_response_cache_expires_idx ON ai_response_cache (expires_at);`);
+        await db.execute(sql`CREATE INDEX IF NOT EXISTS ai_response_cache_last_hit_idx ON ai_response_cache (last_hit_at);`);
+        console.log("Migration completed successfully");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
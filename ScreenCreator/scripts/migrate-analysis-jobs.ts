@@ -0,0 +1,39 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+async function main() {
+    console.log("Running migration to add analysis_jobs...");
+    try {
+        await db.execute(sql`
+      CREATE TABLE IF NOT EXISTS analysis_jobs (
+        id SERIAL PRIMARY KEY,
+        profile_id VARCHAR NOT NULL,
+        prompt TEXT NOT NULL,
+        prompt_hash TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'queued',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        max_attempts INTEGER NOT NULL DEFAULT 4,
+        run_at TIMESTAMP NOT NULL DEFAULT now(),
+        locked_until TIMESTAMP,
+        last_error TEXT,
+        created_at TIMESTAMP DEFAULT now(),
+        finished_at TIMESTAMP
+      );
+    `);
+        await db.execute(sql`CREATE INDEX IF NOT EXISTS analysis_jobs_queued_idx ON analysis_jobs (run_at) WHERE status = 'queued';`);
+        await db.execute(sql`CREATE INDEX IF NOT EXISTS analysis_jobs_running_idx ON analysis_jobs (locked_until) WHERE status = 'running';`);
+        await db.execute(sql`
+      CREATE UNIQUE INDEX IF NOT EXISTS analysis_jobs_active_uniq
+        ON analysis_jobs (profile_id, prompt_hash) WHERE status IN ('queued', 'running');
+    `);
+        // Analyses interrupted by the restart that deployed the queue never finished
+        await db.execute(sql`UPDATE profiles SET analysis_status = 'failed' WHERE analysis_status = 'pending';`);
+        console.log("Migration completed successfully");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
@@ -0,0 +1,43 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+async function main() {
+    console.log("Running migration to add chat_summaries and pin summary boundaries...");
+    try {
+        await db.execute(sql`
+      CREATE TABLE IF NOT EXISTS chat_summaries (
+        profile_id VARCHAR PRIMARY KEY,
+        summary TEXT NOT NULL,
+        summarized_until TIMESTAMP NOT NULL,
+        summarized_until_id VARCHAR,
+        message_count INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT now()
+      );
+    `);
+        // Summaries written before the boundary kept its message id stored a
+        // millisecond-truncated time; pin them to the message they ended at
+        await db.execute(sql`
+      ALTER TABLE chat_summaries ADD COLUMN IF NOT EXISTS summarized_until_id VARCHAR;
+    `);
+        const backfilled = await db.execute(sql`
+      UPDATE chat_summaries s SET (summarized_until, summarized_until_id) = (
+        SELECT m.created_at, m.id FROM chat_messages m
+        WHERE m.profile_id = s.profile_id AND m.created_at < s.summarized_until + interval '1 millisecond'
+        ORDER BY m.created_at DESC, m.id DESC LIMIT 1
+      )
+      WHERE s.summarized_until_id IS NULL AND EXISTS (
+        SELECT 1 FROM chat_messages m
+        WHERE m.profile_id = s.profile_id AND m.created_at < s.summarized_until + interval '1 millisecond'
+      )
+      RETURNING s.profile_id
+    `);
+        console.log(`Pinned ${backfilled.length} existing summaries to their last message`);
+        console.log("Migration completed successfully");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
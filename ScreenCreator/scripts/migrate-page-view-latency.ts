@@ -0,0 +1,29 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+async function main() {
+    console.log("Running migration to add page view latency columns and access_log_offsets...");
+    try {
+        await db.execute(sql`
+      ALTER TABLE page_views
+      ADD COLUMN IF NOT EXISTS p50_ms INTEGER,
+      ADD COLUMN IF NOT EXISTS p95_ms INTEGER,
+      ADD COLUMN IF NOT EXISTS latency_samples INTEGER;
+    `);
+        await db.execute(sql`
+      CREATE TABLE IF NOT EXISTS access_log_offsets (
+        log_path TEXT PRIMARY KEY,
+        inode BIGINT NOT NULL,
+        "offset" BIGINT NOT NULL,
+        updated_at TIMESTAMP DEFAULT now()
+      );
+    `);
+        console.log("Migration completed successfully.");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
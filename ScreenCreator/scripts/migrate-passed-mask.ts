@@ -0,0 +1,33 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+async function main() {
+    console.log("Running migration to add assignments.passed_mask and passed_count...");
+    try {
+        await db.execute(sql`
+      ALTER TABLE assignments
+        ADD COLUMN IF NOT EXISTS passed_mask BIGINT NOT NULL DEFAULT 0,
+        ADD COLUMN IF NOT EXISTS passed_count INTEGER NOT NULL DEFAULT 0;
+    `);
+        // Backfill from the results already stored
+        await db.execute(sql`
+      UPDATE assignments a SET passed_mask = m.mask, passed_count = m.cnt
+      FROM (
+        SELECT assignment_id,
+               bit_or(1::bigint << exercise_index) AS mask,
+               count(DISTINCT exercise_index)::int AS cnt
+        FROM exercise_results
+        WHERE passed = 1 AND exercise_index BETWEEN 0 AND 52
+        GROUP BY assignment_id
+      ) m
+      WHERE a.id = m.assignment_id;
+    `);
+        console.log("Migration completed successfully");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
@@ -0,0 +1,38 @@
+
+import { db } from "../server/db";
+import { sql } from "drizzle-orm";
+
+// Kept in sync with the profiles indexes in shared/schema.ts
+const INDEXES = [
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_created_id_idx ON profiles (created_at, id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_type_created_id_idx ON profiles (profile_type, created_at, id)`,
+    sql`CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_name_trgm_idx ON profiles
+        USING gin (translate(lower(coalesce(name, '') || ' ' || coalesce(surname, '')), 'ё', 'е') gin_trgm_ops)`,
+];
+
+async function main() {
+    console.log("Running migration to add profile pagination and trigram search indexes...");
+    try {
+        await db.execute(sql`CREATE EXTENSION IF NOT EXISTS pg_trgm`);
+        // pg_trgm and lower() follow the database's LC_CTYPE; under "C" Cyrillic
+        // letters are not word characters and produce no trigrams at all
+        const check = await db.execute<{ trigrams: number }>(sql`SELECT cardinality(show_trgm('Иван')) AS trigrams`);
+        if (Number(check[0].trigrams) === 0) {
+            console.warn("WARNING: pg_trgm finds no trigrams in Cyrillic text; the database needs a UTF-8 LC_CTYPE for name search");
+        }
+        // Keyset pagination needs a created_at on every row
+        await db.execute(sql`UPDATE profiles SET created_at = coalesce(updated_at, now()) WHERE created_at IS NULL`);
+        await db.execute(sql`ALTER TABLE profiles ALTER COLUMN created_at SET NOT NULL`);
+        // CONCURRENTLY so the table stays writable; each runs outside a transaction
+        for (const statement of INDEXES) {
+            await db.execute(statement);
+        }
+        await db.execute(sql`ANALYZE profiles`);
+        console.log("Migration completed successfully");
+    } catch (error) {
+        console.error("Migration failed:", error);
+    }
+    process.exit(0);
+}
+
+main();
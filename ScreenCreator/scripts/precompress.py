@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Precompress the build output for nginx gzip_static / brotli_static.
+
+Walks dist/public (or the given directories) and writes .gz and .br sidecars
+next to every compressible file, at gzip level 9 and Brotli quality 11, on a
+process pool. Compressed outputs are kept in a content-addressed cache, so a
+fresh build only pays for files whose contents actually changed (Vite keeps
+the same hashed names and bytes for untouched chunks).
+
+Brotli needs the `brotli` package (pip install brotli); without it only .gz
+sidecars are produced.
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+DEFAULT_ROOT = PROJECT_ROOT / "dist" / "public"
+CACHE_DIR = Path.home() / ".cache" / "portal-precompress"
+
+COMPRESSIBLE = {'.js', '.mjs', '.css', '.html', '.json', '.svg', '.txt', '.xml', '.map', '.webmanifest', '.ico', '.wasm'}
+MIN_SIZE = 1024
+# Sidecars that save less than this are not worth a second file
+MIN_RATIO = 0.95
+CACHE_MAX_AGE_DAYS = 30
+
+
+def find_files(roots, exclude):
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            if Path(dirpath) == root:
+                dirnames[:] = [d for d in dirnames if d not in exclude]
+            for name in filenames:
+                path = Path(dirpath) / name
+                if path.suffix.lower() in COMPRESSIBLE and path.stat().st_size >= MIN_SIZE:
+                    yield path
+
+
+def compress_file(path, cache_dir):
+    """Write sidecars for one file; return (path, original, gz, br, cached)."""
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    cached = True
+    sizes = {}
+
+    for ext, compress in (('.gz', lambda d: gzip.compress(d, compresslevel=9, mtime=0)),
+                          ('.br', lambda d: brotli.compress(d, quality=11) if brotli else None)):
+        entry = cache_dir / digest[:2] / f"{digest}{ext}"
+        if entry.exists():
+            blob = entry.read_bytes()
+            os.utime(entry)
+        else:
+            blob = compress(data)
+            if blob is None:
+                continue
+            cached = False
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_suffix(f"{ext}.{os.getpid()}.tmp")
+            tmp.write_bytes(blob)
+            tmp.replace(entry)
+
+        sidecar = path.with_name(path.name + ext)
+        if len(blob) > len(data) * MIN_RATIO:
+            sidecar.unlink(missing_ok=True)
+            continue
+        sidecar.write_bytes(blob)
+        # Same mtime as the original, so Last-Modified matches either variant
+        stat = path.stat()
+        os.utime(sidecar, (stat.st_atime, stat.st_mtime))
+        sizes[ext] = len(blob)
+
+    return path, len(data), sizes.get('.gz', len(data)), sizes.get('.br', sizes.get('.gz', len(data))), cached
+
+
+def prune_cache(cache_dir):
+    cutoff = time.time() - CACHE_MAX_AGE_DAYS * 86400
+    removed = 0
+    for entry in cache_dir.glob('*/*'):
+        if entry.stat().st_mtime < cutoff:
+            entry.unlink()
+            removed += 1
+    return removed
+
+
+def human(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .gz/.br sidecars for the build output")
+    parser.add_argument('roots', nargs='*', type=Path, default=[DEFAULT_ROOT], help="directories to walk (default: dist/public)")
+    parser.add_argument('--exclude', nargs='*', default=[], help="top-level directory names to skip")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="process pool size")
+    parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR, help="content-addressed cache of compressed outputs")
+    parser.add_argument('--top', type=int, default=10, help="largest files to list in the report")
+    args = parser.parse_args()
+
+    roots = [root.resolve() for root in args.roots]
+    for root in roots:
+        if not root.is_dir():
+            print(f"Not a directory: {root}")
+            return 1
+
+    if brotli is None:
+        print("brotli is not installed (pip install brotli), writing .gz sidecars only")
+
+    files = sorted(find_files(roots, set(args.exclude)))
+    print(f"Compressing {len(files)} files with {args.workers} workers...")
+    started = time.time()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(compress_file, files, [args.cache_dir] * len(files), chunksize=8))
+    elapsed = time.time() - started
+
+    original = sum(r[1] for r in results)
+    gz_total = sum(r[2] for r in results)
+    br_total = sum(r[3] for r in results)
+    reused = sum(1 for r in results if r[4])
+
+    print(f"\n{'file':<56} {'size':>10} {'gzip':>10} {'brotli':>10}")
+    for path, size, gz, br, _ in sorted(results, key=lambda r: r[1], reverse=True)[:args.top]:
+        name = str(path.relative_to(next(root for root in roots if root in path.parents)))
+        print(f"{name[-56:]:<56} {human(size):>10} {human(gz):>10} {human(br):>10}")
+
+    if original:
+        print(f"\nTotal {human(original)} -> gzip {human(gz_total)} ({1 - gz_total / original:.0%} saved)"
+              + (f", brotli {human(br_total)} ({1 - br_total / original:.0%} saved)" if brotli else ""))
+    print(f"{len(results) - reused} compressed, {reused} reused from cache, {elapsed:.1f}s")
+
+    removed = prune_cache(args.cache_dir) if args.cache_dir.exists() else 0
+    if removed:
+        print(f"Pruned {removed} cache entries older than {CACHE_MAX_AGE_DAYS} days")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
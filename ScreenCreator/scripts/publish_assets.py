@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Publish media under content-hashed names and generate the client manifest.
+
+Every file in PUBLISH_DIRS (client/public/auditory-test/...) is copied to
+client/public/media/<same path>/<name>.<hash>.<ext>, and
+client/src/lib/asset-manifest.ts is regenerated with one entry per file:
+
+    "/auditory-test/audio/cat.mp3": { url: "/media/auditory-test/audio/cat.1a2b3c4d.mp3", size: 10450, duration: 1.31 }
+
+The client resolves paths through assetUrl() in lib/assets.ts, so the hashed
+files can be cached as immutable and a changed sound gets a new URL.
+Superseded hashed files are left in place: pages already loaded, and older
+releases, still request them. sync_assets.py keeps them on the server while
+a kept asset release lists them. The media directory is not committed;
+sync_assets.py runs this script before uploading.
+
+--check writes nothing and exits 1 when the committed manifest points at
+other URLs than the media would get, so a build never ships stale hashes.
+
+Durations come from mutagen when installed, otherwise from the WAV header or
+an MP3 frame-header bitrate estimate.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import struct
+import sys
+import wave
+from pathlib import Path
+
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+PUBLIC_DIR = PROJECT_ROOT / "client" / "public"
+MEDIA_DIR = PUBLIC_DIR / "media"
+MANIFEST_TS = PROJECT_ROOT / "client" / "src" / "lib" / "asset-manifest.ts"
+
+PUBLISH_DIRS = ["auditory-test"]
+HASH_LENGTH = 8
+AUDIO_EXTENSIONS = {".mp3", ".wav"}
+
+# Layer III bitrates (kbps) and sample rates by the header's version bits
+# (3: MPEG-1, 2: MPEG-2, 0: MPEG-2.5; 1 is reserved)
+MP3_BITRATES = {
+    3: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0],
+    0: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0],
+}
+MP3_SAMPLE_RATES = {
+    3: [44100, 48000, 32000, 0],
+    2: [22050, 24000, 16000, 0],
+    0: [11025, 12000, 8000, 0],
+}
+
+
+def content_hash(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:HASH_LENGTH]
+
+
+def mp3_duration(path: Path) -> float | None:
+    """Estimate from the first frame header, assuming constant bitrate."""
+    start = 0
+    with open(path, "rb") as f:
+        data = f.read(64 * 1024)
+        if data[:3] == b"ID3":
+            # Syncsafe tag size after the 10-byte header
+            start = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+            f.seek(start)
+            data = f.read(64 * 1024)
+    offset = 0
+    while offset + 4 <= len(data):
+        if data[offset] == 0xFF and (data[offset + 1] & 0xE0) == 0xE0:
+            header = struct.unpack(">I", data[offset:offset + 4])[0]
+            version = (header >> 19) & 0x3
+            layer = (header >> 17) & 0x3
+            if version in MP3_BITRATES and layer == 1:
+                bitrate = MP3_BITRATES[version][(header >> 12) & 0xF]
+                sample_rate = MP3_SAMPLE_RATES[version][(header >> 10) & 0x3]
+                if bitrate and sample_rate:
+                    audio_bytes = path.stat().st_size - (start + offset)
+                    return audio_bytes * 8 / (bitrate * 1000)
+        offset += 1
+    return None
+
+
+def audio_duration(path: Path) -> float | None:
+    if path.suffix.lower() not in AUDIO_EXTENSIONS:
+        return None
+    try:
+        if mutagen is not None:
+            info = mutagen.File(path)
+            if info is not None and info.info is not None:
+                return info.info.length
+        if path.suffix.lower() == ".wav":
+            with wave.open(str(path), "rb") as w:
+                return w.getnframes() / w.getframerate()
+        return mp3_duration(path)
+    except Exception as e:
+        print(f"  ! could not read duration of {path.name}: {e}")
+        return None
+
+
+def publish_file(path: Path, write: bool = True) -> tuple[str, dict]:
+    rel = path.relative_to(PUBLIC_DIR)
+    digest = content_hash(path)
+    target = MEDIA_DIR / rel.parent / f"{path.stem}.{digest}{path.suffix}"
+    if write and not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, target)
+        except OSError:
+            shutil.copy2(path, target)
+
+    entry = {
+        "url": "/" + target.relative_to(PUBLIC_DIR).as_posix(),
+        "size": path.stat().st_size,
+    }
+    duration = audio_duration(path)
+    if duration is not None:
+        entry["duration"] = round(duration, 2)
+    return "/" + rel.as_posix(), entry
+
+
+def render_manifest(entries: dict[str, dict]) -> str:
+    lines = [
+        "// Generated by scripts/publish_assets.py, do not edit by hand.",
+        "",
+        "export interface AssetEntry {",
+        "    url: string;",
+        "    size: number;",
+        "    duration?: number;",
+        "}",
+        "",
+        "export const assetManifest: Record<string, AssetEntry> = {",
+    ]
+    for key in sorted(entries):
+        e = entries[key]
+        fields = [f"url: {json.dumps(e['url'], ensure_ascii=False)}", f"size: {e['size']}"]
+        if "duration" in e:
+            fields.append(f"duration: {e['duration']}")
+        lines.append(f"    {json.dumps(key, ensure_ascii=False)}: {{ {', '.join(fields)} }},")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def manifest_urls(text: str) -> dict[str, tuple[str, int]]:
+    """Original path -> (hashed URL, size) from a rendered manifest."""
+    entries = re.findall(r'^\s+("[^"]+"): \{ url: ("[^"]+"), size: (\d+)', text, re.M)
+    return {json.loads(key): (json.loads(url), int(size)) for key, url, size in entries}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish content-hashed media and regenerate the manifest")
+    parser.add_argument("--check", action="store_true", help="write nothing, fail if the committed manifest is stale")
+    args = parser.parse_args()
+
+    if mutagen is None:
+        print("mutagen is not installed, estimating durations from file headers")
+
+    entries = {}
+    for top in PUBLISH_DIRS:
+        root = PUBLIC_DIR / top
+        if not root.exists():
+            print(f"Skipping missing {root}")
+            continue
+        for path in sorted(root.rglob("*")):
+            if path.is_file():
+                key, entry = publish_file(path, write=not args.check)
+                entries[key] = entry
+
+    content = render_manifest(entries)
+    committed = MANIFEST_TS.read_text(encoding="utf-8") if MANIFEST_TS.exists() else ""
+    if args.check:
+        # Durations depend on whether mutagen is installed; only URLs can 404
+        expected, actual = manifest_urls(content), manifest_urls(committed)
+        stale = sorted(key for key in expected.keys() | actual.keys() if expected.get(key) != actual.get(key))
+        for key in stale[:20]:
+            print(f"  {key}: manifest has {actual.get(key, ('missing',))[0]}, "
+                  f"media gives {expected.get(key, ('missing',))[0]}")
+        if stale:
+            print(f"{MANIFEST_TS.relative_to(PROJECT_ROOT)} is out of date for {len(stale)} files, "
+                  f"run scripts/publish_assets.py and commit it")
+            return 1
+        if content != committed:
+            print(f"{MANIFEST_TS.relative_to(PROJECT_ROOT)} URLs are current (durations differ)")
+        else:
+            print(f"{MANIFEST_TS.relative_to(PROJECT_ROOT)} is current")
+        return 0
+
+    changed = content != committed
+    if changed:
+        MANIFEST_TS.write_text(content, encoding="utf-8")
+
+    total = sum(e["size"] for e in entries.values())
+    print(f"Published {len(entries)} files ({total / 1024 / 1024:.1f} MB)")
+    print(f"{MANIFEST_TS.relative_to(PROJECT_ROOT)} {'updated, rebuild the client' if changed else 'unchanged'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
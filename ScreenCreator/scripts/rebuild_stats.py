@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Backfill or rebuild the student_stats / school_stats rollups.
+
+The server keeps the rollups up to date incrementally when a result is
+posted (server/services/results.ts). This tool recomputes them from
+exercise_results in bulk: one GROUP BY per table inside a transaction that
+locks the rollups against concurrent incremental updates, then replaces the
+rows of the affected schools. --check only reports drift.
+
+Requires psycopg2 (pip install psycopg2-binary).
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import psycopg2
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+ENV_FILE = PROJECT_ROOT / ".env"
+
+STUDENT_ROLLUP_SQL = """
+    SELECT s.id AS student_id, s.school_id,
+           count(r.id)::int AS exercises_total,
+           (count(r.id) FILTER (WHERE r.passed = 1))::int AS exercises_passed,
+           max(r.completed_at) AS last_result_at
+    FROM students s
+    JOIN exercise_results r ON r.student_id = s.id
+    WHERE %(school_id)s IS NULL OR s.school_id = %(school_id)s
+    GROUP BY s.id, s.school_id
+"""
+
+SCHOOL_ROLLUP_SQL = """
+    SELECT school_id, sum(exercises_total)::int, sum(exercises_passed)::int, max(last_result_at)
+    FROM fresh_student_stats
+    GROUP BY school_id
+"""
+
+
+def database_url(cli_value):
+    if cli_value:
+        return cli_value
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+    if ENV_FILE.exists():
+        for line in ENV_FILE.read_text(encoding="utf-8").splitlines():
+            if line.startswith("DATABASE_URL="):
+                return line.split("=", 1)[1].strip().strip('"')
+    raise SystemExit("DATABASE_URL is not set (use --database-url)")
+
+
+def report_drift(cur, school_id):
+    cur.execute(
+        """
+        SELECT f.student_id, COALESCE(st.exercises_total, 0), f.exercises_total,
+               COALESCE(st.exercises_passed, 0), f.exercises_passed
+        FROM fresh_student_stats f
+        LEFT JOIN student_stats st ON st.student_id = f.student_id
+        WHERE st.student_id IS NULL
+           OR st.exercises_total <> f.exercises_total
+           OR st.exercises_passed <> f.exercises_passed
+        UNION ALL
+        SELECT st.student_id, st.exercises_total, 0, st.exercises_passed, 0
+        FROM student_stats st
+        WHERE NOT EXISTS (SELECT 1 FROM fresh_student_stats f WHERE f.student_id = st.student_id)
+          AND (%(school_id)s IS NULL OR st.school_id = %(school_id)s)
+          AND (st.exercises_total <> 0 OR st.exercises_passed <> 0)
+        ORDER BY 1
+        """,
+        {"school_id": school_id},
+    )
+    drift = cur.fetchall()
+    for student_id, old_total, new_total, old_passed, new_passed in drift[:50]:
+        print(f"  student {student_id}: total {old_total} -> {new_total}, passed {old_passed} -> {new_passed}")
+    if len(drift) > 50:
+        print(f"  ... and {len(drift) - 50} more")
+    return len(drift)
+
+
+def rebuild(dsn, school_id, check):
+    conn = psycopg2.connect(dsn)
+    started = time.time()
+    try:
+        with conn.cursor() as cur:
+            # Incremental updates from the API wait until the swap is committed
+            cur.execute("LOCK TABLE student_stats, school_stats IN SHARE ROW EXCLUSIVE MODE")
+            cur.execute(
+                f"CREATE TEMP TABLE fresh_student_stats ON COMMIT DROP AS {STUDENT_ROLLUP_SQL}",
+                {"school_id": school_id},
+            )
+            cur.execute("SELECT count(*) FROM fresh_student_stats")
+            students = cur.fetchone()[0]
+
+            drift = report_drift(cur, school_id)
+            print(f"{students} students with results, {drift} rollup rows differ")
+            if check:
+                conn.rollback()
+                return 1 if drift else 0
+
+            scope = "" if school_id is None else "WHERE school_id = %(school_id)s"
+            cur.execute(f"DELETE FROM student_stats {scope}", {"school_id": school_id})
+            cur.execute(
+                """
+                INSERT INTO student_stats (student_id, school_id, exercises_total, exercises_passed, last_result_at, updated_at)
+                SELECT student_id, school_id, exercises_total, exercises_passed, last_result_at, now()
+                FROM fresh_student_stats
+                """
+            )
+            cur.execute(f"DELETE FROM school_stats {scope}", {"school_id": school_id})
+            cur.execute(
+                f"""
+                INSERT INTO school_stats (school_id, exercises_total, exercises_passed, last_result_at, updated_at)
+                SELECT *, now() FROM ({SCHOOL_ROLLUP_SQL}) rollup
+                """
+            )
+            schools = cur.rowcount
+        conn.commit()
+        print(f"Rebuilt rollups for {students} students and {schools} schools in {time.time() - started:.2f}s")
+        return 0
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild student_stats and school_stats from exercise_results")
+    parser.add_argument("--school", type=int, help="only rebuild one school")
+    parser.add_argument("--check", action="store_true", help="report drift without writing")
+    parser.add_argument("--database-url", help="defaults to $DATABASE_URL or ScreenCreator/.env")
+    args = parser.parse_args()
+    return rebuild(database_url(args.database_url), args.school, args.check)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
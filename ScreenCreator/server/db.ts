@@ -6,5 +6,9 @@ if (!connectionString) {
   throw new Error("DATABASE_URL environment variable is not set");
 }
 
-const client = postgres(connectionString);
+// PgBouncer in transaction mode hands each transaction to any server
+// connection, so named prepared statements cannot be reused across them.
+const client = postgres(connectionString, {
+  prepare: !process.env.PGBOUNCER,
+});
 export const db = drizzle(client);
@@ -2,6 +2,7 @@ import express, { type Request, Response, NextFunction } from "express";
 import { registerRoutes } from "./routes";
 import { serveStatic } from "./static";
 import { createServer } from "http";
+import { startAnalysisWorkers, stopAnalysisWorkers } from "./services/analysis-queue";
 
 const app = express();
 const httpServer = createServer(app);
@@ -95,6 +96,19 @@ app.use((req, res, next) => {
     },
     () => {
       log(`serving on port ${port}`);
+      // pm2 cluster mode (wait_ready) only routes traffic after this
+      process.send?.("ready");
+      startAnalysisWorkers();
     },
   );
+
+  // pm2 sends SIGINT on reload: stop accepting connections and let
+  // in-flight requests finish before exiting (kill_timeout is 10s)
+  process.on("SIGINT", () => {
+    log("shutting down");
+    // Hand running analyses back to the queue for the other instances
+    const released = stopAnalysisWorkers();
+    httpServer.close(() => released.finally(() => process.exit(0)));
+    setTimeout(() => process.exit(0), 8000).unref();
+  });
 })();
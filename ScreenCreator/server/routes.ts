@@ -18,14 +18,10 @@ export async function registerRoutes(
   app.use("/api/chat", chatRoutes);
   app.use("/api", authRoutes); // Auth, Schools, Students, Courses
 
-  app.post("/api/view", async (req, res) => {
-    try {
-      const { path } = req.body;
-      await storage.incrementPageView(path || "/");
-      res.json({ success: true });
-    } catch (e) {
-      res.status(500).json({ error: "Failed to record view" });
-    }
+  // Page-view beacon. In production nginx answers it and logs the path;
+  // scripts/aggregate_page_views.py folds the access log into page_views.
+  app.post("/api/view", (_req, res) => {
+    res.status(204).end();
   });
 
   app.get("/api/stats", async (_req, res) => {
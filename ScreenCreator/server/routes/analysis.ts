@@ -1,6 +1,8 @@
 import { Router } from "express";
 import { storage } from "../storage";
-import { analyzeWithGoogleAI, getGenAI } from "../services/ai";
+import { analyzeWithGoogleAI, getCachedAnalysis, getGenAI } from "../services/ai";
+import { getCacheStats } from "../services/ai-cache";
+import { enqueueAnalysis, getAnalysisJob } from "../services/analysis-queue";
 
 const router = Router();
 
@@ -18,42 +20,19 @@ router.post("/", async (req, res) => {
         }
 
         if (profileId) {
-            // Background processing mode
-            console.log(`Starting background AI analysis for profile ${profileId}...`);
+            // Same prompt on an unchanged profile: answer from the cache right away
+            const profile = await storage.getProfile(profileId);
+            const cached = profile ? await getCachedAnalysis(profile, prompt) : undefined;
+            if (cached !== undefined) {
+                await storage.updateProfile(profileId, { aiAnalysis: cached, analysisStatus: "completed" });
+                return res.json({ status: "completed", analysis: cached, cached: true });
+            }
 
-            // Respond immediately to client
-            res.json({ status: "processing", message: "Analysis started in background" });
-
-            // Process in background
-            (async () => {
-                try {
-                    // Set status to pending
-                    await storage.updateProfile(profileId, { analysisStatus: "pending" });
-
-                    // Create a timeout promise
-                    const timeoutPromise = new Promise((_, reject) => {
-                        setTimeout(() => reject(new Error("AI Analysis timed out after 60s")), 60000);
-                    });
-
-                    // Race between analysis and timeout
-                    const analysis = await Promise.race([
-                        analyzeWithGoogleAI({}, prompt),
-                        timeoutPromise
-                    ]) as string;
-
-                    console.log(`Background analysis completed for profile ${profileId}`);
-
-                    // Save directly to database with completed status
-                    await storage.updateProfile(profileId, {
-                        aiAnalysis: analysis,
-                        analysisStatus: "completed"
-                    });
-                } catch (error) {
-                    console.error(`Background analysis failed for profile ${profileId}:`, error);
-                    // Set status to failed
-                    await storage.updateProfile(profileId, { analysisStatus: "failed" });
-                }
-            })();
+            // Queued mode: a worker from services/analysis-queue.ts runs it and
+            // stores the result on the profile
+            const job = await enqueueAnalysis(profileId, prompt);
+            console.log(`Analysis job ${job.id} for profile ${profileId}${job.deduplicated ? " (already queued)" : ""}`);
+            res.json({ status: "processing", message: "Analysis queued", jobId: job.id, deduplicated: job.deduplicated });
         } else {
             // Synchronous mode (legacy behavior)
             console.log("Starting synchronous AI analysis...");
@@ -67,4 +46,27 @@ router.post("/", async (req, res) => {
     }
 });
 
+router.get("/cache", async (_req, res) => {
+    try {
+        res.json(await getCacheStats());
+    } catch (error) {
+        console.error("Error fetching AI cache stats:", error);
+        res.status(500).json({ error: "Failed to fetch cache stats" });
+    }
+});
+
+router.get("/jobs/:id", async (req, res) => {
+    try {
+        const id = Number(req.params.id);
+        const job = Number.isInteger(id) ? await getAnalysisJob(id) : undefined;
+        if (!job) {
+            return res.status(404).json({ error: "Job not found" });
+        }
+        res.json(job);
+    } catch (error) {
+        console.error("Error fetching analysis job:", error);
+        res.status(500).json({ error: "Failed to fetch analysis job" });
+    }
+});
+
 export default router;
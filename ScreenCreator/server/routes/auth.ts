@@ -2,9 +2,11 @@ import { Router, Request, Response } from "express";
 import { db } from "../db";
 import {
     schools, students, assignments, exerciseResults, templates, courseTemplates, adminSettings,
-    type School, type Student, type Assignment, type ExerciseResult, type Template, type CourseTemplate
+    type School, type Student, type Assignment, type Template, type CourseTemplate
 } from "@shared/schema";
-import { eq, and, desc, sql } from "drizzle-orm";
+import { eq, and, desc } from "drizzle-orm";
+import { forgetResults, getSchoolStatistics } from "../services/school-stats";
+import { postExerciseResult, MAX_TRACKED_EXERCISES } from "../services/results";
 
 const router = Router();
 
@@ -210,72 +212,30 @@ router.get("/schools/:id/statistics", async (req: Request, res: Response) => {
         return;
     }
 
-    const schoolStudents = await db.select().from(students).where(eq(students.schoolId, schoolId));
-    const schoolAssignments = await db.select().from(assignments).where(eq(assignments.schoolId, schoolId));
-    const studentIds = schoolStudents.map(s => s.id);
+    // Result counts come from the student_stats / school_stats rollups
+    const stats = await getSchoolStatistics(schoolId);
+    const exercisesFailed = stats.exercisesTotal - stats.exercisesPassed;
+    const successRate = stats.exercisesTotal > 0 ? Math.round((stats.exercisesPassed / stats.exercisesTotal) * 100) : 0;
 
-    let results: ExerciseResult[] = [];
-    if (studentIds.length > 0) {
-        results = await db.select().from(exerciseResults).where(
-            sql`${exerciseResults.studentId} IN (${sql.join(studentIds.map(id => sql`${id}`), sql`, `)})`
-        );
-    }
-
-    const assignmentsCompleted = schoolAssignments.filter(a => a.status === 'completed').length;
-    const assignmentsInProgress = schoolAssignments.filter(a => a.status === 'in_progress').length;
-    const assignmentsPending = schoolAssignments.filter(a => a.status === 'pending').length;
-
-    const exercisesPassed = results.filter(r => r.passed === 1).length;
-    const exercisesFailed = results.filter(r => r.passed === 0).length;
-    const exercisesTotal = results.length;
-    const successRate = exercisesTotal > 0 ? Math.round((exercisesPassed / exercisesTotal) * 100) : 0;
-
-    const lastResult = results.length > 0
-        ? results.reduce((latest, r) => (r.completedAt && latest.completedAt && new Date(r.completedAt) > new Date(latest.completedAt)) ? r : latest)
-        : null;
-
-    const trainingCounts: Record<string, number> = {};
-    schoolAssignments.forEach(a => {
-        const exercises = a.exercises as Array<{ trainingId: string }>;
-        exercises?.forEach(e => {
-            trainingCounts[e.trainingId] = (trainingCounts[e.trainingId] || 0) + 1;
-        });
+    const topTrainings = stats.trainingCounts.map(({ id, count }) => {
+        const training = TRAININGS.find(t => t.id === id);
+        return { id, name: training?.name || id, count };
     });
 
-    const topTrainings = Object.entries(trainingCounts)
-        .map(([id, count]) => {
-            const training = TRAININGS.find(t => t.id === id);
-            return { id, name: training?.name || id, count };
-        })
-        .sort((a, b) => b.count - a.count)
-        .slice(0, 5);
-
-    const studentActivity = schoolStudents.map(s => {
-        const studentResults = results.filter(r => r.studentId === s.id);
-        const studentAssignments = schoolAssignments.filter(a => a.studentId === s.id);
-        return {
-            id: s.id,
-            name: `${s.firstName} ${s.lastName}`,
-            completedExercises: studentResults.filter(r => r.passed === 1).length,
-            totalAssignments: studentAssignments.length,
-            completedAssignments: studentAssignments.filter(a => a.status === 'completed').length
-        };
-    }).sort((a, b) => b.completedExercises - a.completedExercises);
-
     res.json({
-        studentsCount: schoolStudents.length,
-        assignmentsTotal: schoolAssignments.length,
-        assignmentsCompleted,
-        assignmentsInProgress,
-        assignmentsPending,
-        exercisesTotal,
-        exercisesPassed,
+        studentsCount: stats.studentsCount,
+        assignmentsTotal: stats.assignmentsTotal,
+        assignmentsCompleted: stats.assignmentsCompleted,
+        assignmentsInProgress: stats.assignmentsInProgress,
+        assignmentsPending: stats.assignmentsPending,
+        exercisesTotal: stats.exercisesTotal,
+        exercisesPassed: stats.exercisesPassed,
         exercisesFailed,
         successRate,
-        lastActivity: lastResult?.completedAt || school.createdAt,
+        lastActivity: stats.lastResultAt || school.createdAt,
         createdAt: school.createdAt,
         topTrainings,
-        studentActivity
+        studentActivity: stats.studentActivity
     });
 });
 
@@ -369,7 +329,10 @@ router.put("/students/:id", async (req: Request, res: Response) => {
 
 router.delete("/students/:id", async (req: Request, res: Response) => {
     const id = parseInt(req.params.id);
-    await db.delete(students).where(eq(students.id, id));
+    await db.transaction(async (tx) => {
+        await forgetResults(tx, { studentId: id });
+        await tx.delete(students).where(eq(students.id, id));
+    });
     res.json({ success: true });
 });
 
@@ -437,7 +400,10 @@ router.put("/assignments/:id", async (req: Request, res: Response) => {
 
 router.delete("/assignments/:id", async (req: Request, res: Response) => {
     const id = parseInt(req.params.id);
-    await db.delete(assignments).where(eq(assignments.id, id));
+    await db.transaction(async (tx) => {
+        await forgetResults(tx, { assignmentId: id });
+        await tx.delete(assignments).where(eq(assignments.id, id));
+    });
     res.json({ success: true });
 });
 
@@ -452,34 +418,18 @@ router.post("/assignments/:assignmentId/results", async (req: Request, res: Resp
     const assignmentId = parseInt(req.params.assignmentId);
     const { exerciseIndex, studentId, result, passed } = req.body;
 
-    const [newResult] = await db.insert(exerciseResults).values({
+    if (!Number.isInteger(exerciseIndex) || exerciseIndex < 0 || exerciseIndex >= MAX_TRACKED_EXERCISES) {
+        return res.status(400).json({ error: "Invalid exerciseIndex" });
+    }
+
+    // Insert, passed-bitmap/status update and rollups in a single statement
+    const newResult = await postExerciseResult({
         assignmentId,
         exerciseIndex,
         studentId,
         result: result || {},
-        passed: passed ? 1 : 0
-    }).returning();
-
-    // Update assignment status
-    const [assignment] = await db.select().from(assignments).where(eq(assignments.id, assignmentId));
-    if (assignment) {
-        const assignmentResults = await db.select().from(exerciseResults).where(eq(exerciseResults.assignmentId, assignmentId));
-        const passedExerciseIndices = new Set(
-            assignmentResults.filter(r => r.passed === 1).map(r => r.exerciseIndex)
-        );
-        const exercisesArray = assignment.exercises as Array<unknown>;
-
-        let newStatus = assignment.status;
-        if (passedExerciseIndices.size >= exercisesArray.length) {
-            newStatus = "completed";
-        } else if (assignmentResults.length > 0) {
-            newStatus = "in_progress";
-        }
-
-        if (newStatus !== assignment.status) {
-            await db.update(assignments).set({ status: newStatus }).where(eq(assignments.id, assignmentId));
-        }
-    }
+        passed: !!passed
+    });
 
     res.json(newResult);
 });
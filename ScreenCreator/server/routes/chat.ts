@@ -1,12 +1,25 @@
 import { Router } from "express";
 import { storage } from "../storage";
-import { getGenAI } from "../services/ai";
+import { getGenAI, getModel } from "../services/ai";
+import { buildChatContext, summarizeOverflow, CHAT_MODEL } from "../services/chat-context";
 
 const router = Router();
 
+const LOGS_PAGE_SIZE = 100;
+const MAX_LOGS_PAGE_SIZE = 500;
+
+// GET /api/chat/logs?limit=100&cursor=...&profileId=... -> { items, nextCursor }
 router.get("/logs", async (req, res) => {
     try {
-        const logs = await storage.getAllChatLogs();
+        const limit = req.query.limit === undefined ? LOGS_PAGE_SIZE : Number(req.query.limit);
+        if (!Number.isInteger(limit) || limit < 1 || limit > MAX_LOGS_PAGE_SIZE) {
+            return res.status(400).json({ error: `limit must be an integer from 1 to ${MAX_LOGS_PAGE_SIZE}` });
+        }
+        const logs = await storage.getChatLogsPage({
+            limit,
+            cursor: req.query.cursor as string | undefined,
+            profileId: req.query.profileId as string | undefined,
+        });
         res.json(logs);
     } catch (error) {
         console.error("Error fetching chat logs:", error);
@@ -43,18 +56,19 @@ router.post("/", async (req, res) => {
             return res.status(400).json({ error: "profileId and message are required" });
         }
 
-        const genAI = getGenAI();
-        if (!genAI) {
+        if (!getGenAI()) {
             return res.status(503).json({ error: "AI service unavailable" });
         }
 
-        // Get profile and chat history
+        // Get profile
         const profile = await storage.getProfile(profileId);
         if (!profile) {
             return res.status(404).json({ error: "Profile not found" });
         }
 
-        const chatHistory = await storage.getChatMessages(profileId);
+        // Build the windowed context before saving, so the new message is not part of the history
+        const contextData = currentFormData || profile;
+        const context = await buildChatContext(profileId, contextData, chatSystemPrompt, message);
 
         // Save user message FIRST so it appears immediately
         const savedUserMessage = await storage.addChatMessage({
@@ -62,51 +76,17 @@ router.post("/", async (req, res) => {
             role: "user",
             content: message,
         });
+        const newMessages = [savedUserMessage];
 
         try {
-            // Use currentFormData if available (for unsaved changes), otherwise use DB profile
-            const contextData = currentFormData || profile;
-
-
-            // Build system context with profile info
-            let systemContext = `ВАЖНО: Ответь ТОЛЬКО на русском языке. Не используй английский язык.
-
-Ты ассистент для анализа и помощи с информацией о профиле. Вот информация о профиле:
-
-Тип: ${contextData.profileType === "child" ? "Ребенок" : "Взрослый"}
-Имя: ${contextData.name} ${contextData.surname || ""}
-Пол: ${contextData.gender}
-Дата рождения: ${contextData.dateOfBirth || "Не указана"}
-${contextData.parentName ? `Родитель/Опекун: ${contextData.parentName}` : ""}
-Телефон: ${contextData.phone || "Не указан"}
-Telegram: ${contextData.telegramId || "Не указан"}
-Жалоба: ${contextData.complaint || "не указана"}
-Дополнительные заметки: ${contextData.additionalNotes || "нет"}
-${contextData.aiAnalysis ? `\nПредыдущий анализ ИИ:\n${contextData.aiAnalysis}` : ""}
-
-Помогай пользователю на основе этой информации. Будь вежливым, профессиональным и полезным помощником.`;
-
-            // Add custom chat prompt if provided
-            if (chatSystemPrompt) {
-                systemContext = `${systemContext}\n\nДополнительные инструкции:\n${chatSystemPrompt}`;
-            }
-
-            // Build conversation history for API - include the user message we just saved
-            const allMessages = [...chatHistory, savedUserMessage];
-            const conversationHistory = allMessages
-                .map((msg) => ({
-                    role: msg.role === "user" ? "user" : "model",
-                    parts: [{ text: msg.content }],
-                }));
-
-            const model = genAI.getGenerativeModel({
-                model: "gemini-2.5-flash",
-                systemInstruction: systemContext
+            const model = getModel({
+                model: CHAT_MODEL,
+                systemInstruction: context.systemInstruction,
             });
 
-            // Start chat session with history
+            // Start chat session with the recent history only
             const chat = model.startChat({
-                history: conversationHistory,
+                history: context.history,
             });
 
             // Send the user's message
@@ -114,19 +94,21 @@ ${contextData.aiAnalysis ? `\nПредыдущий анализ ИИ:\n${context
             const assistantMessage = result.response.text();
 
             // Save assistant message
-            await storage.addChatMessage({
+            newMessages.push(await storage.addChatMessage({
                 profileId,
                 role: "assistant",
                 content: assistantMessage,
-            });
+            }));
         } catch (aiError) {
             console.error("AI processing error:", aiError);
             // Return messages with user message even if AI fails
         }
 
-        // Return updated messages (but filter out the system context message from response)
-        const updatedMessages = await storage.getChatMessages(profileId);
-        res.json({ messages: updatedMessages });
+        // Only the messages of this turn; the client already has the rest
+        res.json({ messages: newMessages });
+
+        // Older turns that fell out of the window go into the rolling summary
+        void summarizeOverflow(profileId, context.overflow);
     } catch (error) {
         console.error("Error in chat endpoint:", error);
         res.status(500).json({ error: "Ошибка при общении с ИИ" });
@@ -1,6 +1,7 @@
 import { Router } from "express";
-import { storage } from "../storage";
+import { storage, PROFILE_FIELDS, type ProfileField } from "../storage";
 import { insertProfileSchema } from "@shared/schema";
+import { invalidateChatContext } from "../services/chat-context";
 
 const router = Router();
 
@@ -44,6 +45,7 @@ router.patch("/:id", async (req, res) => {
         }
 
         const updated = await storage.updateProfile(req.params.id, req.body);
+        invalidateChatContext(req.params.id);
         res.json(updated);
     } catch (error) {
         console.error("Error updating profile:", error);
@@ -54,6 +56,7 @@ router.patch("/:id", async (req, res) => {
 router.delete("/:id", async (req, res) => {
     try {
         await storage.deleteProfile(req.params.id);
+        invalidateChatContext(req.params.id);
         res.sendStatus(204);
     } catch (error) {
         console.error("Error deleting profile:", error);
@@ -73,17 +76,36 @@ router.get("/:id", async (req, res) => {
     }
 });
 
+const DEFAULT_PAGE_SIZE = 50;
+const MAX_PAGE_SIZE = 200;
+
+// GET /api/profiles?profileType=child&q=иван&fields=id,name,surname&limit=50&cursor=...
+// Returns { items, nextCursor }; pass nextCursor back for the following page.
 router.get("/", async (req, res) => {
     try {
         const profileType = req.query.profileType as string | undefined;
-        let profiles = await storage.getAllProfiles();
+        const search = (req.query.q as string | undefined)?.trim() || undefined;
+        const cursor = req.query.cursor as string | undefined;
+
+        const limit = req.query.limit === undefined ? DEFAULT_PAGE_SIZE : Number(req.query.limit);
+        if (!Number.isInteger(limit) || limit < 1 || limit > MAX_PAGE_SIZE) {
+            return res.status(400).json({ error: `limit must be an integer from 1 to ${MAX_PAGE_SIZE}` });
+        }
 
-        if (profileType) {
-            profiles = profiles.filter(p => p.profileType === profileType);
+        let fields: ProfileField[] | undefined;
+        if (req.query.fields) {
+            const requested = String(req.query.fields).split(",").map((f) => f.trim()).filter(Boolean);
+            const unknown = requested.filter((f) => !PROFILE_FIELDS.includes(f as ProfileField));
+            if (unknown.length) {
+                return res.status(400).json({ error: `Unknown fields: ${unknown.join(", ")}` });
+            }
+            fields = requested as ProfileField[];
         }
 
-        res.json(profiles);
+        const page = await storage.listProfiles({ profileType, search, fields, limit, cursor });
+        res.json(page);
     } catch (error) {
+        console.error("Error listing profiles:", error);
         res.status(500).json({ error: "Ошибка при получении профилей" });
     }
 });
@@ -0,0 +1,146 @@
+import { createHash } from "crypto";
+import { db } from "../db";
+import { sql } from "drizzle-orm";
+
+const TTL_HOURS = parseFloat(process.env.AI_CACHE_TTL_HOURS || "168");
+const MAX_BYTES = parseFloat(process.env.AI_CACHE_MAX_MB || "64") * 1024 * 1024;
+const EVICT_EVERY_MS = 60_000;
+
+// Written by the analysis itself, so they must not change the version
+const VOLATILE_PROFILE_FIELDS = new Set(["aiAnalysis", "analysisStatus", "createdAt", "updatedAt"]);
+
+// Since process start; the table keeps per-entry hit counts
+const counters = { hits: 0, misses: 0, stores: 0, evictions: 0, savedMs: 0 };
+
+/**
+ * Prompt text that differs only in line endings, Unicode composition or
+ * runs of blanks is the same prompt to the model.
+ */
+export function normalizePrompt(prompt: string): string {
+    return prompt
+        .normalize("NFC")
+        .replace(/\r\n?/g, "\n")
+        .replace(/[ \t]+/g, " ")
+        .replace(/ ?\n ?/g, "\n")
+        .replace(/\n{3,}/g, "\n\n")
+        .trim();
+}
+
+/**
+ * Content hash of the profile fields an analysis can depend on. Unlike
+ * updatedAt it does not move when the analysis result is saved back.
+ */
+export function profileVersion(profile?: Record<string, any> | null): string {
+    if (!profile || !profile.id) return "";
+    const fields = Object.keys(profile)
+        .filter((key) => !VOLATILE_PROFILE_FIELDS.has(key))
+        .sort()
+        .map((key) => [key, profile[key] ?? null]);
+    return createHash("sha256").update(JSON.stringify(fields)).digest("hex");
+}
+
+export function cacheKey(model: string, prompt: string, profile?: Record<string, any> | null): string {
+    return createHash("sha256")
+        .update(JSON.stringify([model, normalizePrompt(prompt), profileVersion(profile)]))
+        .digest("hex");
+}
+
+export async function getCachedResponse(key: string): Promise<string | undefined> {
+    const rows = await db.execute<{ response: string; elapsed_ms: number }>(sql`
+        UPDATE ai_response_cache SET hits = hits + 1, last_hit_at = now()
+        WHERE key = ${key} AND expires_at > now()
+        RETURNING response, elapsed_ms
+    `);
+    if (rows.length > 0) {
+        counters.hits++;
+        counters.savedMs += rows[0].elapsed_ms;
+        return rows[0].response;
+    }
+    counters.misses++;
+    return undefined;
+}
+
+let lastEviction = 0;
+
+export async function putCachedResponse(key: string, model: string, profileId: string | null, response: string, elapsedMs: number) {
+    const bytes = Buffer.byteLength(response, "utf8");
+    await db.execute(sql`
+        INSERT INTO ai_response_cache (key, model, profile_id, response, bytes, expires_at, elapsed_ms)
+        VALUES (${key}, ${model}, ${profileId}, ${response}, ${bytes},
+                now() + ${TTL_HOURS}::float * interval '1 hour', ${Math.round(elapsedMs)})
+        ON CONFLICT (key) DO UPDATE SET
+            response = excluded.response, bytes = excluded.bytes, created_at = now(),
+            expires_at = excluded.expires_at, last_hit_at = now(), elapsed_ms = excluded.elapsed_ms
+    `);
+    counters.stores++;
+    if (Date.now() - lastEviction > EVICT_EVERY_MS) {
+        lastEviction = Date.now();
+        evictCachedResponses().catch((error) => console.error("AI cache eviction failed:", error));
+    }
+}
+
+/**
+ * Drop expired entries, then the least recently used ones until the table
+ * is back under AI_CACHE_MAX_MB.
+ */
+export async function evictCachedResponses(): Promise<number> {
+    const expired = await db.execute(sql`
+        DELETE FROM ai_response_cache WHERE expires_at <= now() RETURNING key
+    `);
+    const overflow = await db.execute(sql`
+        DELETE FROM ai_response_cache WHERE key IN (
+            SELECT key FROM (
+                SELECT key, sum(bytes) OVER (ORDER BY last_hit_at DESC, key) AS kept
+                FROM ai_response_cache
+            ) ranked WHERE kept > ${MAX_BYTES}
+        ) RETURNING key
+    `);
+    const evicted = expired.length + overflow.length;
+    counters.evictions += evicted;
+    return evicted;
+}
+
+/**
+ * Run `call` unless the same model, prompt and profile version already has
+ * a live cached response.
+ */
+export async function cachedGenerate(
+    model: string,
+    prompt: string,
+    profile: Record<string, any> | null | undefined,
+    call: () => Promise<string>,
+): Promise<string> {
+    const key = cacheKey(model, prompt, profile);
+    const cached = await getCachedResponse(key).catch((error) => {
+        console.error("AI cache lookup failed:", error);
+        return undefined;
+    });
+    if (cached !== undefined) return cached;
+
+    const started = Date.now();
+    const response = await call();
+    await putCachedResponse(key, model, profile?.id ?? null, response, Date.now() - started)
+        .catch((error) => console.error("AI cache store failed:", error));
+    return response;
+}
+
+export async function getCacheStats() {
+    const rows = await db.execute<{ entries: number; bytes: number; hits: number; saved_ms: number }>(sql`
+        SELECT count(*)::int AS entries, coalesce(sum(bytes), 0)::bigint AS bytes,
+               coalesce(sum(hits), 0)::bigint AS hits, coalesce(sum(hits::bigint * elapsed_ms), 0)::bigint AS saved_ms
+        FROM ai_response_cache WHERE expires_at > now()
+    `);
+    const lookups = counters.hits + counters.misses;
+    return {
+        process: { ...counters, hitRate: lookups ? counters.hits / lookups : 0 },
+        table: {
+            entries: Number(rows[0].entries),
+            bytes: Number(rows[0].bytes),
+            maxBytes: MAX_BYTES,
+            hits: Number(rows[0].hits),
+            // Model time not spent thanks to the cache
+            savedMs: Number(rows[0].saved_ms),
+            ttlHours: TTL_HOURS,
+        },
+    };
+}
@@ -1,4 +1,5 @@
-import { GoogleGenerativeAI } from "@google/generative-ai";
+import { GoogleGenerativeAI, type ModelParams, type RequestOptions } from "@google/generative-ai";
+import { cacheKey, cachedGenerate, getCachedResponse } from "./ai-cache";
 
 // Use Replit's Gemini AI integrations
 const apiKey = process.env.AI_INTEGRATIONS_GEMINI_API_KEY;
@@ -6,11 +7,7 @@ const baseUrl = process.env.AI_INTEGRATIONS_GEMINI_BASE_URL;
 
 let genAI: GoogleGenerativeAI | null = null;
 
-if (apiKey && baseUrl) {
-    genAI = new GoogleGenerativeAI(apiKey);
-    // Configure to use Replit's proxy
-    (genAI as any).baseUrl = baseUrl;
-} else if (apiKey) {
+if (apiKey) {
     genAI = new GoogleGenerativeAI(apiKey);
 }
 
@@ -18,23 +15,49 @@ export function getGenAI() {
     return genAI;
 }
 
-export async function analyzeWithGoogleAI(profileData: any, customPrompt?: string): Promise<string> {
+/**
+ * Model handle that goes through the configured proxy. The SDK only takes
+ * the base URL per model via requestOptions; setting it on the client
+ * object is silently ignored.
+ */
+export function getModel(params: ModelParams, options: RequestOptions = {}) {
+    if (!genAI) {
+        throw new Error("Gemini AI not initialized");
+    }
+    return genAI.getGenerativeModel(params, baseUrl ? { baseUrl, ...options } : options);
+}
+
+export const ANALYSIS_MODEL = "gemini-flash-latest";
+
+/**
+ * Profile analysis for a prompt. A repeat of the same prompt for an
+ * unchanged profile is answered from the response cache. Pass the profile
+ * row when there is one; without it the cache key is the prompt alone.
+ */
+export async function analyzeWithGoogleAI(profileData: any, customPrompt?: string, timeoutMs?: number): Promise<string> {
     try {
         if (!genAI) {
             return "AI analysis unavailable. Please configure Google API key.";
         }
-        console.log("Calling Gemini API with model: gemini-flash-latest");
-        const model = genAI.getGenerativeModel({ model: "gemini-flash-latest" });
-
         // Use the custom prompt that was sent from frontend
         // (frontend already handles combining systemPrompt with patient info)
-        const result = await model.generateContent(customPrompt || "Анализ недоступен");
-        const response = result.response;
-        const text = response.text();
-        console.log("Gemini API response received, length:", text.length);
-        return text;
+        const prompt = customPrompt || "Анализ недоступен";
+        return await cachedGenerate(ANALYSIS_MODEL, prompt, profileData, async () => {
+            console.log(`Calling Gemini API with model: ${ANALYSIS_MODEL}`);
+            const model = getModel({ model: ANALYSIS_MODEL }, timeoutMs ? { timeout: timeoutMs } : {});
+            const result = await model.generateContent(prompt);
+            const response = result.response;
+            const text = response.text();
+            console.log("Gemini API response received, length:", text.length);
+            return text;
+        });
     } catch (error) {
         console.error("Error calling Google AI:", error);
         throw error;
     }
 }
+
+/** Cached analysis for this profile and prompt, without calling the model. */
+export async function getCachedAnalysis(profileData: any, prompt: string): Promise<string | undefined> {
+    return getCachedResponse(cacheKey(ANALYSIS_MODEL, prompt, profileData));
+}
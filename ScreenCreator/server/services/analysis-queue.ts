@@ -0,0 +1,265 @@
+import { createHash } from "crypto";
+import { db } from "../db";
+import { sql } from "drizzle-orm";
+import { storage } from "../storage";
+import { analyzeWithGoogleAI } from "./ai";
+import { normalizePrompt } from "./ai-cache";
+
+// Jobs run at once by this process, and by all processes together: pm2
+// cluster instances share the second limit through the claim query.
+const CONCURRENCY = parseInt(process.env.ANALYSIS_CONCURRENCY || "2", 10);
+const MAX_RUNNING = parseInt(process.env.ANALYSIS_MAX_RUNNING || "4", 10);
+
+const ATTEMPT_TIMEOUT_MS = 60_000;
+// A job whose worker died is requeued once its lease runs out
+const LEASE_MS = ATTEMPT_TIMEOUT_MS + 30_000;
+const BACKOFF_BASE_MS = 5_000;
+const BACKOFF_MAX_MS = 5 * 60_000;
+// LISTEN/NOTIFY does not survive PgBouncer's transaction mode, so idle
+// workers poll; local enqueues wake them straight away
+const POLL_MS = 1_000;
+const REAP_EVERY_MS = 15_000;
+// pg_advisory_xact_lock key serializing claims across processes
+const CLAIM_LOCK_KEY = 4_700_047;
+
+interface ClaimedJob {
+    id: number;
+    profile_id: string;
+    prompt: string;
+    attempts: number;
+    max_attempts: number;
+}
+
+export function promptHash(prompt: string): string {
+    return createHash("sha256").update(prompt).digest("hex");
+}
+
+/**
+ * Queue an analysis of `prompt` for a profile. If the same prompt is already
+ * queued or running for that profile, that job is returned instead of a new
+ * one.
+ */
+export async function enqueueAnalysis(profileId: string, prompt: string): Promise<{ id: number; status: string; deduplicated: boolean }> {
+    const hash = promptHash(normalizePrompt(prompt));
+    await storage.updateProfile(profileId, { analysisStatus: "pending" });
+
+    // The active job can finish between the insert and the select; go round again then
+    for (let i = 0; i < 3; i++) {
+        const inserted = await db.execute<{ id: number; status: string }>(sql`
+            INSERT INTO analysis_jobs (profile_id, prompt, prompt_hash)
+            VALUES (${profileId}, ${prompt}, ${hash})
+            ON CONFLICT (profile_id, prompt_hash) WHERE status IN ('queued', 'running') DO NOTHING
+            RETURNING id, status
+        `);
+        if (inserted.length > 0) {
+            wake();
+            return { ...inserted[0], deduplicated: false };
+        }
+        const active = await db.execute<{ id: number; status: string }>(sql`
+            SELECT id, status FROM analysis_jobs
+            WHERE profile_id = ${profileId} AND prompt_hash = ${hash} AND status IN ('queued', 'running')
+        `);
+        if (active.length > 0) {
+            return { ...active[0], deduplicated: true };
+        }
+    }
+    throw new Error("Could not enqueue analysis job");
+}
+
+/**
+ * Claim up to `limit` due jobs without exceeding MAX_RUNNING overall. The
+ * advisory lock makes the running count exact; SKIP LOCKED keeps the claim
+ * from waiting on rows another statement is finishing.
+ */
+async function claim(limit: number): Promise<ClaimedJob[]> {
+    return db.transaction(async (tx) => {
+        await tx.execute(sql`SELECT pg_advisory_xact_lock(${CLAIM_LOCK_KEY})`);
+        const rows = await tx.execute<ClaimedJob>(sql`
+            WITH due AS (
+                SELECT id FROM analysis_jobs
+                WHERE status = 'queued' AND run_at <= now()
+                ORDER BY run_at, id
+                LIMIT greatest(0, least(${limit}::int, ${MAX_RUNNING}::int - (
+                    SELECT count(*)::int FROM analysis_jobs WHERE status = 'running'
+                )))
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE analysis_jobs j SET
+                status = 'running',
+                attempts = j.attempts + 1,
+                locked_until = now() + ${LEASE_MS}::int * interval '1 millisecond'
+            FROM due WHERE j.id = due.id
+            RETURNING j.id, j.profile_id, j.prompt, j.attempts, j.max_attempts
+        `);
+        return [...rows];
+    });
+}
+
+// Jobs whose worker vanished (crash, kill -9) go back to the queue, or fail for good
+async function reapExpired() {
+    await db.execute(sql`
+        WITH expired AS (
+            UPDATE analysis_jobs SET
+                status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,
+                finished_at = CASE WHEN attempts >= max_attempts THEN now() END,
+                run_at = now(),
+                locked_until = NULL,
+                last_error = 'lease expired'
+            WHERE status = 'running' AND locked_until < now()
+            RETURNING profile_id, status
+        )
+        UPDATE profiles p SET analysis_status = 'failed', updated_at = now()
+        FROM expired e WHERE p.id = e.profile_id AND e.status = 'failed'
+    `);
+}
+
+function isRetryable(error: unknown): boolean {
+    // Quota (429) and server errors are worth another try; a rejected request is not.
+    // Timeouts and network failures carry no status.
+    const status = (error as { status?: number })?.status;
+    return status === undefined || status === 429 || status >= 500;
+}
+
+function backoffMs(attempts: number): number {
+    const ceiling = Math.min(BACKOFF_MAX_MS, BACKOFF_BASE_MS * 2 ** (attempts - 1));
+    return Math.round(ceiling / 2 + Math.random() * ceiling / 2);
+}
+
+async function runJob(job: ClaimedJob) {
+    // Updates only apply while this attempt still owns the job
+    const owned = sql`id = ${job.id} AND status = 'running' AND attempts = ${job.attempts}`;
+    try {
+        const profile = await storage.getProfile(job.profile_id);
+        const analysis = await analyzeWithGoogleAI(profile ?? {}, job.prompt, ATTEMPT_TIMEOUT_MS);
+        const done = await db.execute(sql`
+            UPDATE analysis_jobs SET status = 'completed', locked_until = NULL, last_error = NULL, finished_at = now()
+            WHERE ${owned} RETURNING id
+        `);
+        if (done.length > 0) {
+            await storage.updateProfile(job.profile_id, { aiAnalysis: analysis, analysisStatus: "completed" });
+            console.log(`Analysis job ${job.id} completed for profile ${job.profile_id}`);
+        }
+    } catch (error) {
+        const message = error instanceof Error ? error.message : String(error);
+        if (isRetryable(error) && job.attempts < job.max_attempts) {
+            const delay = backoffMs(job.attempts);
+            console.warn(`Analysis job ${job.id} attempt ${job.attempts} failed, retrying in ${delay}ms: ${message}`);
+            await db.execute(sql`
+                UPDATE analysis_jobs SET status = 'queued', locked_until = NULL, last_error = ${message},
+                    run_at = now() + ${delay}::int * interval '1 millisecond'
+                WHERE ${owned}
+            `);
+        } else {
+            console.error(`Analysis job ${job.id} failed for profile ${job.profile_id}:`, error);
+            const failed = await db.execute(sql`
+                UPDATE analysis_jobs SET status = 'failed', locked_until = NULL, last_error = ${message}, finished_at = now()
+                WHERE ${owned} RETURNING id
+            `);
+            if (failed.length > 0) {
+                await storage.updateProfile(job.profile_id, { analysisStatus: "failed" });
+            }
+        }
+    }
+}
+
+let stopped = true;
+const active = new Map<number, ClaimedJob>();
+let wakeUp: (() => void) | null = null;
+let loopDone: Promise<void> = Promise.resolve();
+
+function wake() {
+    wakeUp?.();
+}
+
+function idle(ms: number): Promise<void> {
+    return new Promise((resolve) => {
+        const timer = setTimeout(done, ms);
+        function done() {
+            clearTimeout(timer);
+            wakeUp = null;
+            resolve();
+        }
+        wakeUp = done;
+    });
+}
+
+async function workLoop() {
+    let lastReap = 0;
+    while (!stopped) {
+        try {
+            if (Date.now() - lastReap > REAP_EVERY_MS) {
+                lastReap = Date.now();
+                await reapExpired();
+            }
+            const free = CONCURRENCY - active.size;
+            if (free > 0) {
+                for (const job of await claim(free)) {
+                    active.set(job.id, job);
+                    runJob(job).finally(() => {
+                        active.delete(job.id);
+                        wake();
+                    });
+                }
+            }
+        } catch (error) {
+            console.error("Analysis queue error:", error);
+        }
+        await idle(POLL_MS);
+    }
+}
+
+export function startAnalysisWorkers() {
+    if (!stopped || CONCURRENCY <= 0) return;
+    stopped = false;
+    loopDone = workLoop();
+    console.log(`Analysis queue: ${CONCURRENCY} workers, ${MAX_RUNNING} running at most`);
+}
+
+/**
+ * Stop claiming and hand the jobs still running here back to the queue, so
+ * another instance picks them up now instead of after the lease. The
+ * handed-back attempt does not count against max_attempts.
+ */
+export async function stopAnalysisWorkers() {
+    if (stopped) return;
+    stopped = true;
+    wake();
+    await loopDone;
+    for (const job of active.values()) {
+        await db.execute(sql`
+            UPDATE analysis_jobs SET status = 'queued', locked_until = NULL, run_at = now(),
+                max_attempts = max_attempts + 1
+            WHERE id = ${job.id} AND status = 'running' AND attempts = ${job.attempts}
+        `).catch((error) => console.error(`Could not release analysis job ${job.id}:`, error));
+    }
+}
+
+export async function getAnalysisJob(id: number) {
+    const rows = await db.execute<{
+        id: number;
+        profile_id: string;
+        status: string;
+        attempts: number;
+        max_attempts: number;
+        run_at: Date;
+        last_error: string | null;
+        created_at: Date;
+        finished_at: Date | null;
+    }>(sql`
+        SELECT id, profile_id, status, attempts, max_attempts, run_at, last_error, created_at, finished_at
+        FROM analysis_jobs WHERE id = ${id}
+    `);
+    const row = rows[0];
+    if (!row) return undefined;
+    return {
+        id: row.id,
+        profileId: row.profile_id,
+        status: row.status,
+        attempts: row.attempts,
+        maxAttempts: row.max_attempts,
+        runAt: row.run_at,
+        lastError: row.last_error,
+        createdAt: row.created_at,
+        finishedAt: row.finished_at,
+    };
+}
@@ -0,0 +1,190 @@
+import { createHash } from "crypto";
+import { storage } from "../storage";
+import { getGenAI, getModel } from "./ai";
+import type { ChatMessage, ChatSummary } from "@shared/schema";
+
+export const CHAT_MODEL = "gemini-2.5-flash";
+
+// Prompt budget for one turn: system context + summary + recent messages.
+// Estimated, not counted: Cyrillic text runs at roughly 3 characters a token.
+export const CONTEXT_TOKEN_BUDGET = 8000;
+const CHARS_PER_TOKEN = 3;
+// Always keep the last few turns verbatim, even over budget
+const MIN_RECENT_MESSAGES = 4;
+// Upper bound on unsummarized messages read per turn
+const MAX_RECENT_MESSAGES = 200;
+// Fold older messages into the summary once this many have left the window
+const SUMMARIZE_AFTER = 8;
+const SUMMARY_BATCH = 100;
+const SYSTEM_CONTEXT_CACHE_SIZE = 500;
+
+export function estimateTokens(text: string): number {
+    return Math.ceil(text.length / CHARS_PER_TOKEN);
+}
+
+interface CachedContext {
+    key: string;
+    text: string;
+    tokens: number;
+}
+
+// profileId -> last rendered system context. Map order doubles as LRU order.
+const systemContextCache = new Map<string, CachedContext>();
+
+function buildSystemContext(contextData: any, chatSystemPrompt?: string): string {
+    let systemContext = `ВАЖНО: Ответь ТОЛЬКО на русском языке. Не используй английский язык.
+
+Ты ассистент для анализа и помощи с информацией о профиле. Вот информация о профиле:
+
+Тип: ${contextData.profileType === "child" ? "Ребенок" : "Взрослый"}
+Имя: ${contextData.name} ${contextData.surname || ""}
+Пол: ${contextData.gender}
+Дата рождения: ${contextData.dateOfBirth || "Не указана"}
+${contextData.parentName ? `Родитель/Опекун: ${contextData.parentName}` : ""}
+Телефон: ${contextData.phone || "Не указан"}
+Telegram: ${contextData.telegramId || "Не указан"}
+Жалоба: ${contextData.complaint || "не указана"}
+Дополнительные заметки: ${contextData.additionalNotes || "нет"}
+${contextData.aiAnalysis ? `\nПредыдущий анализ ИИ:\n${contextData.aiAnalysis}` : ""}
+
+Помогай пользователю на основе этой информации. Будь вежливым, профессиональным и полезным помощником.`;
+
+    // Add custom chat prompt if provided
+    if (chatSystemPrompt) {
+        systemContext = `${systemContext}\n\nДополнительные инструкции:\n${chatSystemPrompt}`;
+    }
+    return systemContext;
+}
+
+/**
+ * System context for a profile, rendered once per profile version. The key
+ * covers every field the template reads, so unsaved form data and edited
+ * chat prompts still produce a fresh context; invalidateChatContext drops
+ * the entry when the profile itself is edited or deleted.
+ */
+export function getSystemContext(profileId: string, contextData: any, chatSystemPrompt?: string): CachedContext {
+    const key = createHash("sha1").update(JSON.stringify([
+        contextData.profileType, contextData.name, contextData.surname, contextData.gender,
+        contextData.dateOfBirth, contextData.parentName, contextData.phone, contextData.telegramId,
+        contextData.complaint, contextData.additionalNotes, contextData.aiAnalysis, chatSystemPrompt || "",
+    ])).digest("hex");
+
+    const cached = systemContextCache.get(profileId);
+    if (cached && cached.key === key) {
+        systemContextCache.delete(profileId);
+        systemContextCache.set(profileId, cached);
+        return cached;
+    }
+
+    const text = buildSystemContext(contextData, chatSystemPrompt);
+    const entry = { key, text, tokens: estimateTokens(text) };
+    systemContextCache.delete(profileId);
+    systemContextCache.set(profileId, entry);
+    if (systemContextCache.size > SYSTEM_CONTEXT_CACHE_SIZE) {
+        systemContextCache.delete(systemContextCache.keys().next().value!);
+    }
+    return entry;
+}
+
+export function invalidateChatContext(profileId: string) {
+    systemContextCache.delete(profileId);
+}
+
+export interface ChatContext {
+    systemInstruction: string;
+    history: { role: "user" | "model"; parts: { text: string }[] }[];
+    // Unsummarized messages that no longer fit the window
+    overflow: number;
+}
+
+/**
+ * Context for the next turn: the cached system context, the rolling summary
+ * of older turns and as many recent messages as fit the token budget. Only
+ * messages after the summary are read, so the cost of a turn stays flat as
+ * the conversation grows.
+ */
+export async function buildChatContext(
+    profileId: string,
+    contextData: any,
+    chatSystemPrompt: string | undefined,
+    message: string,
+): Promise<ChatContext> {
+    const summary = await storage.getChatSummary(profileId);
+    const recent = await storage.getUnsummarizedChatMessages(profileId, MAX_RECENT_MESSAGES, true);
+
+    const system = getSystemContext(profileId, contextData, chatSystemPrompt);
+    let systemInstruction = system.text;
+    if (summary) {
+        systemInstruction += `\n\nКраткое содержание более ранней части диалога:\n${summary.summary}`;
+    }
+
+    let remaining = CONTEXT_TOKEN_BUDGET - estimateTokens(systemInstruction) - estimateTokens(message);
+    let start = recent.length;
+    while (start > 0) {
+        const tokens = estimateTokens(recent[start - 1].content);
+        if (tokens > remaining && recent.length - start >= MIN_RECENT_MESSAGES) break;
+        remaining -= tokens;
+        start--;
+    }
+    // Gemini wants the history to open with a user turn
+    while (start < recent.length && recent[start].role !== "user") start++;
+
+    const history = recent.slice(start).map((msg) => ({
+        role: msg.role === "user" ? "user" as const : "model" as const,
+        parts: [{ text: msg.content }],
+    }));
+
+    // A full page means there are even older unsummarized messages
+    const overflow = recent.length === MAX_RECENT_MESSAGES ? Math.max(start, SUMMARY_BATCH) : start;
+    return { systemInstruction, history, overflow };
+}
+
+const summarizing = new Set<string>();
+
+function formatTranscript(messages: ChatMessage[]): string {
+    return messages
+        .map((msg) => `${msg.role === "user" ? "Пользователь" : "Ассистент"}: ${msg.content}`)
+        .join("\n\n");
+}
+
+/**
+ * Fold the oldest unsummarized messages into the profile's rolling summary.
+ * Runs after the response has been sent; a concurrent run for the same
+ * profile (here or in another pm2 instance) makes this one a no-op.
+ */
+export async function summarizeOverflow(profileId: string, overflow: number): Promise<void> {
+    if (overflow < SUMMARIZE_AFTER || summarizing.has(profileId)) return;
+    if (!getGenAI()) return;
+
+    summarizing.add(profileId);
+    try {
+        const previous: ChatSummary | undefined = await storage.getChatSummary(profileId);
+        const batch = await storage.getUnsummarizedChatMessages(profileId, Math.min(overflow, SUMMARY_BATCH));
+        if (batch.length === 0) return;
+
+        const model = getModel({
+            model: CHAT_MODEL,
+            generationConfig: { maxOutputTokens: 1024 },
+        });
+        const prompt = `Ответь ТОЛЬКО на русском языке. Составь краткое содержание диалога специалиста с ИИ-ассистентом о профиле клиента.
+Сохрани факты о клиенте, заданные вопросы, данные рекомендации и договорённости. Не более 300 слов, без вступлений.
+${previous ? `\nКраткое содержание предыдущей части:\n${previous.summary}\n` : ""}
+Новая часть диалога:
+${formatTranscript(batch)}`;
+
+        const result = await model.generateContent(prompt);
+        const text = result.response.text().trim();
+        if (!text) return;
+
+        await storage.saveChatSummary({
+            profileId,
+            summary: text,
+            lastMessageId: batch[batch.length - 1].id,
+            messageCount: (previous?.messageCount ?? 0) + batch.length,
+        }, previous);
+    } catch (error) {
+        console.error("Error summarizing chat history:", error);
+    } finally {
+        summarizing.delete(profileId);
+    }
+}
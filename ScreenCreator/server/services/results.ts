@@ -0,0 +1,86 @@
+import { db } from "../db";
+import { sql } from "drizzle-orm";
+import type { ExerciseResult } from "@shared/schema";
+
+// passed_mask is read into a JS number, so only bits that stay exact are used
+export const MAX_TRACKED_EXERCISES = 53;
+
+interface NewResult {
+    assignmentId: number;
+    exerciseIndex: number;
+    studentId: number;
+    result: Record<string, unknown>;
+    passed: boolean;
+}
+
+/**
+ * Insert an exercise result and, in the same statement, set the exercise's
+ * bit in assignments.passed_mask, derive the status from passed_count and
+ * bump the student_stats / school_stats rollups. One round trip, no matter
+ * how many attempts the assignment already has.
+ *
+ * Rollups are attributed to the student's school, as in forgetResults() and
+ * scripts/rebuild_stats.py; an assignment's own school_id may differ.
+ */
+export async function postExerciseResult({ assignmentId, exerciseIndex, studentId, result, passed }: NewResult): Promise<ExerciseResult> {
+    const passedFlag = passed ? 1 : 0;
+    const rows = await db.execute<{
+        id: number;
+        assignment_id: number;
+        exercise_index: number;
+        student_id: number;
+        result: Record<string, unknown>;
+        passed: number;
+        completed_at: Date;
+    }>(sql`
+        WITH inserted AS (
+            INSERT INTO exercise_results (assignment_id, exercise_index, student_id, result, passed)
+            VALUES (${assignmentId}, ${exerciseIndex}, ${studentId}, ${JSON.stringify(result)}::json, ${passedFlag})
+            RETURNING *
+        ), assignment AS (
+            UPDATE assignments a SET
+                passed_mask = a.passed_mask | bit.value,
+                passed_count = a.passed_count + (a.passed_mask & bit.value <> bit.value)::int,
+                status = CASE
+                    WHEN a.passed_count + (a.passed_mask & bit.value <> bit.value)::int
+                         >= COALESCE(json_array_length(a.exercises), 0) THEN 'completed'
+                    ELSE 'in_progress'
+                END
+            FROM inserted i,
+                 LATERAL (SELECT CASE WHEN i.passed = 1 THEN 1::bigint << i.exercise_index ELSE 0::bigint END AS value) bit
+            WHERE a.id = i.assignment_id
+        ), student AS (
+            SELECT s.school_id FROM students s, inserted i WHERE s.id = i.student_id
+        ), student_rollup AS (
+            INSERT INTO student_stats (student_id, school_id, exercises_total, exercises_passed, last_result_at, updated_at)
+            SELECT i.student_id, st.school_id, 1, i.passed, i.completed_at, now()
+            FROM inserted i, student st
+            ON CONFLICT (student_id) DO UPDATE SET
+                exercises_total = student_stats.exercises_total + 1,
+                exercises_passed = student_stats.exercises_passed + EXCLUDED.exercises_passed,
+                last_result_at = GREATEST(student_stats.last_result_at, EXCLUDED.last_result_at),
+                updated_at = now()
+        ), school_rollup AS (
+            INSERT INTO school_stats (school_id, exercises_total, exercises_passed, last_result_at, updated_at)
+            SELECT st.school_id, 1, i.passed, i.completed_at, now()
+            FROM inserted i, student st
+            ON CONFLICT (school_id) DO UPDATE SET
+                exercises_total = school_stats.exercises_total + 1,
+                exercises_passed = school_stats.exercises_passed + EXCLUDED.exercises_passed,
+                last_result_at = GREATEST(school_stats.last_result_at, EXCLUDED.last_result_at),
+                updated_at = now()
+        )
+        SELECT * FROM inserted
+    `);
+
+    const row = rows[0];
+    return {
+        id: row.id,
+        assignmentId: row.assignment_id,
+        exerciseIndex: row.exercise_index,
+        studentId: row.student_id,
+        result: row.result,
+        passed: row.passed,
+        completedAt: row.completed_at,
+    };
+}
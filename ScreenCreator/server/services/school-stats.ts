@@ -0,0 +1,135 @@
+import { db } from "../db";
+import { sql } from "drizzle-orm";
+
+type Transaction = Parameters<Parameters<typeof db.transaction>[0]>[0];
+type Executor = typeof db | Transaction;
+
+// Rollups are incremented by the result insert itself (services/results.ts)
+
+/**
+ * Subtract the results that are about to be removed (by cascade) with an
+ * assignment or a student. last_result_at is left as is; rebuild_stats.py
+ * recomputes it exactly.
+ */
+export async function forgetResults(tx: Executor, filter: { assignmentId: number } | { studentId: number }) {
+    const where = "assignmentId" in filter
+        ? sql`r.assignment_id = ${filter.assignmentId}`
+        : sql`r.student_id = ${filter.studentId}`;
+
+    await tx.execute(sql`
+        WITH removed AS (
+            SELECT r.student_id, s.school_id, count(*)::int AS total,
+                   count(*) FILTER (WHERE r.passed = 1)::int AS passed
+            FROM exercise_results r
+            JOIN students s ON s.id = r.student_id
+            WHERE ${where}
+            GROUP BY r.student_id, s.school_id
+        ), students_updated AS (
+            UPDATE student_stats st SET
+                exercises_total = st.exercises_total - removed.total,
+                exercises_passed = st.exercises_passed - removed.passed,
+                updated_at = now()
+            FROM removed WHERE st.student_id = removed.student_id
+        )
+        UPDATE school_stats sc SET
+            exercises_total = sc.exercises_total - totals.total,
+            exercises_passed = sc.exercises_passed - totals.passed,
+            updated_at = now()
+        FROM (SELECT school_id, sum(total)::int AS total, sum(passed)::int AS passed FROM removed GROUP BY school_id) totals
+        WHERE sc.school_id = totals.school_id
+    `);
+}
+
+export interface StudentActivity {
+    id: number;
+    name: string;
+    completedExercises: number;
+    totalAssignments: number;
+    completedAssignments: number;
+}
+
+/** Dashboard statistics for one school from rollups and SQL aggregates. */
+export async function getSchoolStatistics(schoolId: number) {
+    const [totals] = await db.execute<{
+        students_count: number;
+        assignments_total: number;
+        assignments_completed: number;
+        assignments_in_progress: number;
+        assignments_pending: number;
+        exercises_total: number | null;
+        exercises_passed: number | null;
+        last_result_at: Date | null;
+    }>(sql`
+        SELECT
+            (SELECT count(*)::int FROM students WHERE school_id = ${schoolId}) AS students_count,
+            a.total AS assignments_total,
+            a.completed AS assignments_completed,
+            a.in_progress AS assignments_in_progress,
+            a.pending AS assignments_pending,
+            ss.exercises_total,
+            ss.exercises_passed,
+            ss.last_result_at
+        FROM (
+            SELECT count(*)::int AS total,
+                   count(*) FILTER (WHERE status = 'completed')::int AS completed,
+                   count(*) FILTER (WHERE status = 'in_progress')::int AS in_progress,
+                   count(*) FILTER (WHERE status = 'pending')::int AS pending
+            FROM assignments WHERE school_id = ${schoolId}
+        ) a
+        LEFT JOIN school_stats ss ON ss.school_id = ${schoolId}
+    `);
+
+    const trainingCounts = await db.execute<{ id: string; count: number }>(sql`
+        SELECT e->>'trainingId' AS id, count(*)::int AS count
+        FROM assignments a, json_array_elements(a.exercises) e
+        WHERE a.school_id = ${schoolId}
+        GROUP BY 1
+        ORDER BY 2 DESC
+        LIMIT 5
+    `);
+
+    const activity = await db.execute<{
+        id: number;
+        first_name: string;
+        last_name: string;
+        completed_exercises: number;
+        total_assignments: number;
+        completed_assignments: number;
+    }>(sql`
+        SELECT s.id, s.first_name, s.last_name,
+               COALESCE(st.exercises_passed, 0) AS completed_exercises,
+               COALESCE(a.total, 0) AS total_assignments,
+               COALESCE(a.completed, 0) AS completed_assignments
+        FROM students s
+        LEFT JOIN student_stats st ON st.student_id = s.id
+        LEFT JOIN (
+            SELECT student_id, count(*)::int AS total,
+                   count(*) FILTER (WHERE status = 'completed')::int AS completed
+            FROM assignments WHERE school_id = ${schoolId}
+            GROUP BY student_id
+        ) a ON a.student_id = s.id
+        WHERE s.school_id = ${schoolId}
+        ORDER BY completed_exercises DESC
+    `);
+
+    const studentActivity: StudentActivity[] = activity.map(row => ({
+        id: row.id,
+        name: `${row.first_name} ${row.last_name}`,
+        completedExercises: row.completed_exercises,
+        totalAssignments: row.total_assignments,
+        completedAssignments: row.completed_assignments,
+    }));
+
+    return {
+        studentsCount: totals.students_count,
+        assignmentsTotal: totals.assignments_total,
+        assignmentsCompleted: totals.assignments_completed,
+        assignmentsInProgress: totals.assignments_in_progress,
+        assignmentsPending: totals.assignments_pending,
+        exercisesTotal: totals.exercises_total ?? 0,
+        exercisesPassed: totals.exercises_passed ?? 0,
+        lastResultAt: totals.last_result_at,
+        trainingCounts: trainingCounts.map(row => ({ id: row.id, count: row.count })),
+        studentActivity,
+    };
+}
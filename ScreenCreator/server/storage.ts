@@ -1,37 +1,72 @@
-import { profiles, chatMessages, chatLogs, pageViews } from "@shared/schema";
-import type { InsertProfile, Profile, InsertChatMessage, ChatMessage, InsertChatLog, ChatLog, PageView } from "@shared/schema";
-import { eq, desc, sql } from "drizzle-orm";
+import { profiles, chatMessages, chatLogs, chatSummaries, analysisJobs, aiResponseCache, pageViews } from "@shared/schema";
+import type { InsertProfile, Profile, InsertChatMessage, ChatMessage, InsertChatLog, ChatLog, ChatSummary, PageView } from "@shared/schema";
+import { eq, desc, asc, and, or, sql, getTableColumns, type SQL } from "drizzle-orm";
 import { db } from "./db";
 
+export type ProfileField = keyof Profile;
+
+export interface NewChatSummary {
+  profileId: string;
+  summary: string;
+  lastMessageId: string;
+  messageCount: number;
+}
+export const PROFILE_FIELDS = Object.keys(getTableColumns(profiles)) as ProfileField[];
+
+export interface ProfileListOptions {
+  profileType?: string;
+  search?: string;
+  fields?: ProfileField[];
+  limit: number;
+  cursor?: string;
+}
+
+export interface ProfileListPage {
+  items: Partial<Profile>[];
+  nextCursor: string | null;
+}
+
+// Full name as searched, lower-cased with ё folded into е. Must match the
+// profiles_name_trgm_idx expression in scripts/migrate-profile-search.ts.
+const profileSearchName = sql`translate(lower(coalesce(${profiles.name}, '') || ' ' || coalesce(${profiles.surname}, '')), 'ё', 'е')`;
+
+// Keyset cursor: the last row's created_at (as Postgres text, so microseconds
+// survive) and id
+function encodeCursor(createdAt: string, id: string): string {
+  return Buffer.from(JSON.stringify([createdAt, id])).toString("base64url");
+}
+
+function decodeCursor(cursor: string): [string, string] | undefined {
+  try {
+    const value = JSON.parse(Buffer.from(cursor, "base64url").toString("utf8"));
+    return Array.isArray(value) && value.length === 2 && value.every((v) => typeof v === "string")
+      ? [value[0], value[1]]
+      : undefined;
+  } catch {
+    return undefined;
+  }
+}
+
 export interface IStorage {
   createProfile(profile: InsertProfile): Promise<Profile>;
   getProfile(id: string): Promise<Profile | undefined>;
   getProfileByName(name: string): Promise<Profile | undefined>;
   updateProfile(id: string, profile: Partial<InsertProfile>): Promise<Profile>;
   getAllProfiles(): Promise<Profile[]>;
+  listProfiles(options: ProfileListOptions): Promise<ProfileListPage>;
   addChatMessage(message: InsertChatMessage): Promise<ChatMessage>;
   getChatMessages(profileId: string): Promise<ChatMessage[]>;
+  getUnsummarizedChatMessages(profileId: string, limit: number, newest?: boolean): Promise<ChatMessage[]>;
+  getChatSummary(profileId: string): Promise<ChatSummary | undefined>;
+  saveChatSummary(summary: NewChatSummary, previous: ChatSummary | undefined): Promise<boolean>;
   addChatLog(log: InsertChatLog): Promise<ChatLog>;
   getAllChatLogs(): Promise<ChatLog[]>;
+  getChatLogsPage(options: { limit: number; cursor?: string; profileId?: string }): Promise<{ items: ChatLog[]; nextCursor: string | null }>;
   deleteProfile(id: string): Promise<void>;
-  incrementPageView(path: string): Promise<void>;
   getPageViews(): Promise<PageView[]>;
 }
 
 export class DbStorage implements IStorage {
-  async incrementPageView(path: string): Promise<void> {
-    await db
-      .insert(pageViews)
-      .values({ path, count: 1 })
-      .onConflictDoUpdate({
-        target: pageViews.path,
-        set: { 
-          count: sql`${pageViews.count} + 1`,
-          updatedAt: new Date()
-        }
-      });
-  }
-
   async getPageViews(): Promise<PageView[]> {
     return db.select().from(pageViews);
   }
@@ -58,6 +93,9 @@ export class DbStorage implements IStorage {
     // Delete related chat messages and logs first
     await db.delete(chatMessages).where(eq(chatMessages.profileId, id));
     await db.delete(chatLogs).where(eq(chatLogs.profileId, id));
+    await db.delete(chatSummaries).where(eq(chatSummaries.profileId, id));
+    await db.delete(analysisJobs).where(eq(analysisJobs.profileId, id));
+    await db.delete(aiResponseCache).where(eq(aiResponseCache.profileId, id));
     await db.delete(profiles).where(eq(profiles.id, id));
   }
 
@@ -70,6 +108,54 @@ export class DbStorage implements IStorage {
     return db.select().from(profiles);
   }
 
+  /**
+   * One page of profiles, newest first, with only the requested columns.
+   * Without a search the page is a keyset range on (created_at, id), so
+   * every page costs the same. A search returns the best trigram matches
+   * on the full name instead and has no further pages.
+   */
+  async listProfiles({ profileType, search, fields, limit, cursor }: ProfileListOptions): Promise<ProfileListPage> {
+    const columns = getTableColumns(profiles);
+    const selection: Record<string, any> = { id: columns.id };
+    for (const field of fields ?? PROFILE_FIELDS) {
+      selection[field] = columns[field];
+    }
+    selection._cursorAt = sql<string>`${profiles.createdAt}::text`;
+
+    const conditions: SQL[] = [];
+    if (profileType) {
+      conditions.push(eq(profiles.profileType, profileType));
+    }
+
+    if (search) {
+      const term = search.trim().toLowerCase().replace(/ё/g, "е");
+      const pattern = `%${term.replace(/[\\%_]/g, "\\$&")}%`;
+      // Substring match, or a fuzzy one (typos, transliteration slips) via word_similarity
+      conditions.push(or(sql`${profileSearchName} LIKE ${pattern}`, sql`${profileSearchName} %> ${term}`)!);
+      const rows = await db.select(selection).from(profiles)
+        .where(and(...conditions))
+        .orderBy(sql`word_similarity(${term}, ${profileSearchName}) DESC`, desc(profiles.createdAt), desc(profiles.id))
+        .limit(limit);
+      return { items: rows.map(({ _cursorAt, ...row }) => row), nextCursor: null };
+    }
+
+    const after = cursor ? decodeCursor(cursor) : undefined;
+    if (after) {
+      conditions.push(sql`(${profiles.createdAt}, ${profiles.id}) < (${after[0]}::timestamp, ${after[1]})`);
+    }
+    const rows = await db.select(selection).from(profiles)
+      .where(conditions.length ? and(...conditions) : undefined)
+      .orderBy(desc(profiles.createdAt), desc(profiles.id))
+      .limit(limit + 1);
+
+    const page = rows.slice(0, limit);
+    const last = page[page.length - 1];
+    return {
+      items: page.map(({ _cursorAt, ...row }) => row),
+      nextCursor: rows.length > limit && last ? encodeCursor(last._cursorAt, last.id) : null,
+    };
+  }
+
   async addChatMessage(message: InsertChatMessage): Promise<ChatMessage> {
     const result = await db.insert(chatMessages).values(message).returning();
     return result[0];
@@ -79,6 +165,59 @@ export class DbStorage implements IStorage {
     return db.select().from(chatMessages).where(eq(chatMessages.profileId, profileId)).orderBy(chatMessages.createdAt);
   }
 
+  /**
+   * Messages the profile's rolling summary does not cover yet (all of them
+   * without a summary), in chronological order. With `newest` the limit
+   * keeps the latest messages, otherwise the oldest.
+   */
+  async getUnsummarizedChatMessages(profileId: string, limit: number, newest = false): Promise<ChatMessage[]> {
+    // Compared in SQL on (created_at, id): the boundary keeps its microseconds
+    const rows = await db.select().from(chatMessages)
+      .where(and(
+        eq(chatMessages.profileId, profileId),
+        sql`NOT EXISTS (
+          SELECT 1 FROM ${chatSummaries} s
+          WHERE s.profile_id = ${chatMessages.profileId}
+            AND (${chatMessages.createdAt}, ${chatMessages.id}) <= (s.summarized_until, s.summarized_until_id)
+        )`,
+      ))
+      .orderBy(...(newest
+        ? [desc(chatMessages.createdAt), desc(chatMessages.id)]
+        : [asc(chatMessages.createdAt), asc(chatMessages.id)]))
+      .limit(limit);
+    return newest ? rows.reverse() : rows;
+  }
+
+  async getChatSummary(profileId: string): Promise<ChatSummary | undefined> {
+    const result = await db.select().from(chatSummaries).where(eq(chatSummaries.profileId, profileId));
+    return result[0];
+  }
+
+  /**
+   * Store a new rolling summary ending at message `lastMessageId`, unless
+   * another request already advanced it past `previous`. Returns whether
+   * this write won.
+   */
+  async saveChatSummary(summary: NewChatSummary, previous: ChatSummary | undefined): Promise<boolean> {
+    // The boundary is copied from the message row, not round-tripped through JS
+    const result = await db.execute<{ profile_id: string }>(sql`
+      INSERT INTO chat_summaries (profile_id, summary, summarized_until, summarized_until_id, message_count, updated_at)
+      SELECT ${summary.profileId}, ${summary.summary}, m.created_at, m.id, ${summary.messageCount}, now()
+      FROM chat_messages m WHERE m.id = ${summary.lastMessageId}
+      ON CONFLICT (profile_id) DO UPDATE SET
+        summary = excluded.summary,
+        summarized_until = excluded.summarized_until,
+        summarized_until_id = excluded.summarized_until_id,
+        message_count = excluded.message_count,
+        updated_at = now()
+      WHERE ${previous
+        ? sql`chat_summaries.summarized_until_id IS NOT DISTINCT FROM ${previous.summarizedUntilId}`
+        : sql`false`}
+      RETURNING profile_id
+    `);
+    return result.length > 0;
+  }
+
   async addChatLog(log: InsertChatLog): Promise<ChatLog> {
     const result = await db.insert(chatLogs).values(log).returning();
     return result[0];
@@ -87,6 +226,34 @@ export class DbStorage implements IStorage {
   async getAllChatLogs(): Promise<ChatLog[]> {
     return db.select().from(chatLogs).orderBy(desc(chatLogs.createdAt));
   }
+
+  /**
+   * Newest chat logs first, one keyset page at a time. Rows older than the
+   * archive cutoff are no longer in the table (scripts/archive_chat_logs.py),
+   * so the pages only cover recent history.
+   */
+  async getChatLogsPage({ limit, cursor, profileId }: { limit: number; cursor?: string; profileId?: string }) {
+    const conditions: SQL[] = [];
+    if (profileId) {
+      conditions.push(eq(chatLogs.profileId, profileId));
+    }
+    const after = cursor ? decodeCursor(cursor) : undefined;
+    if (after) {
+      conditions.push(sql`(${chatLogs.createdAt}, ${chatLogs.id}) < (${after[0]}::timestamp, ${after[1]})`);
+    }
+    const rows = await db.select({ ...getTableColumns(chatLogs), _cursorAt: sql<string>`${chatLogs.createdAt}::text` })
+      .from(chatLogs)
+      .where(conditions.length ? and(...conditions) : undefined)
+      .orderBy(desc(chatLogs.createdAt), desc(chatLogs.id))
+      .limit(limit + 1);
+
+    const page = rows.slice(0, limit);
+    const last = page[page.length - 1];
+    return {
+      items: page.map(({ _cursorAt, ...log }) => log),
+      nextCursor: rows.length > limit && last?._cursorAt ? encodeCursor(last._cursorAt, last.id) : null,
+    };
+  }
 }
 
 export const storage = new DbStorage();
@@ -1,4 +1,4 @@
-import { pgTable, text, varchar, json, timestamp, uniqueIndex, integer, serial } from "drizzle-orm/pg-core";
+import { pgTable, text, varchar, json, timestamp, index, uniqueIndex, integer, serial, bigint, primaryKey } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
 import { z } from "zod";
 import { sql } from "drizzle-orm";
@@ -20,9 +20,15 @@ export const profiles = pgTable("profiles", {
   aiAnalysis: text("ai_analysis"),
   analysisStatus: text("analysis_status").default("none"), // "none" | "pending" | "completed" | "failed"
   completedStages: json("completed_stages").$type<{ stage1: boolean; stage2: boolean; stage3: boolean }>().default({ stage1: false, stage2: false, stage3: false }),
-  createdAt: timestamp("created_at").defaultNow(),
+  createdAt: timestamp("created_at").notNull().defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  // Keyset pagination of GET /api/profiles, newest first
+  index("profiles_created_id_idx").on(table.createdAt, table.id),
+  index("profiles_type_created_id_idx").on(table.profileType, table.createdAt, table.id),
+  // Fuzzy name search; the expression matches profileSearchName in server/storage.ts
+  index("profiles_name_trgm_idx").using("gin", sql`translate(lower(coalesce(name, '') || ' ' || coalesce(surname, '')), 'ё', 'е') gin_trgm_ops`),
+]);
 
 export const chatMessages = pgTable("chat_messages", {
   id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
@@ -30,7 +36,9 @@ export const chatMessages = pgTable("chat_messages", {
   role: text("role").notNull(), // "user" | "assistant"
   content: text("content").notNull(),
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  index("chat_messages_profile_created_idx").on(table.profileId, table.createdAt),
+]);
 
 export const chatLogs = pgTable("chat_logs", {
   id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
@@ -40,8 +48,60 @@ export const chatLogs = pgTable("chat_logs", {
   sender: text("sender").notNull(), // "user" or "specialist" for specialist chats
   content: text("content").notNull(),
   createdAt: timestamp("created_at").defaultNow(),
+}, (table) => [
+  index("chat_logs_profile_id_idx").on(table.profileId),
+  index("chat_logs_created_at_idx").on(table.createdAt),
+]);
+
+// Rolling summary of the chat turns that fell out of the context window
+export const chatSummaries = pgTable("chat_summaries", {
+  profileId: varchar("profile_id").primaryKey(),
+  summary: text("summary").notNull(),
+  // Last message folded in, as (createdAt, id): only ever set from SQL, since
+  // a JS Date would drop created_at's microseconds
+  summarizedUntil: timestamp("summarized_until").notNull(),
+  summarizedUntilId: varchar("summarized_until_id"),
+  messageCount: integer("message_count").notNull().default(0),
+  updatedAt: timestamp("updated_at").defaultNow(),
 });
 
+// Background AI analyses, claimed by server/services/analysis-queue.ts
+export const analysisJobs = pgTable("analysis_jobs", {
+  id: serial("id").primaryKey(),
+  profileId: varchar("profile_id").notNull(),
+  prompt: text("prompt").notNull(),
+  promptHash: text("prompt_hash").notNull(), // sha256 of the prompt, for deduplication
+  status: text("status").notNull().default("queued"), // "queued" | "running" | "completed" | "failed"
+  attempts: integer("attempts").notNull().default(0),
+  maxAttempts: integer("max_attempts").notNull().default(4),
+  runAt: timestamp("run_at").notNull().defaultNow(), // not claimed before this (retry backoff)
+  lockedUntil: timestamp("locked_until"), // lease of the worker running it
+  lastError: text("last_error"),
+  createdAt: timestamp("created_at").defaultNow(),
+  finishedAt: timestamp("finished_at"),
+}, (table) => [
+  index("analysis_jobs_queued_idx").on(table.runAt).where(sql`status = 'queued'`),
+  index("analysis_jobs_running_idx").on(table.lockedUntil).where(sql`status = 'running'`),
+  uniqueIndex("analysis_jobs_active_uniq").on(table.profileId, table.promptHash).where(sql`status IN ('queued', 'running')`),
+]);
+
+// Model responses keyed by model, normalized prompt and profile version (server/services/ai-cache.ts)
+export const aiResponseCache = pgTable("ai_response_cache", {
+  key: text("key").primaryKey(), // sha256 hex
+  model: text("model").notNull(),
+  profileId: varchar("profile_id"),
+  response: text("response").notNull(),
+  bytes: integer("bytes").notNull(),
+  elapsedMs: integer("elapsed_ms").notNull().default(0), // model time of the original call
+  hits: integer("hits").notNull().default(0),
+  createdAt: timestamp("created_at").defaultNow(),
+  expiresAt: timestamp("expires_at").notNull(),
+  lastHitAt: timestamp("last_hit_at").defaultNow(),
+}, (table) => [
+  index("ai_response_cache_expires_idx").on(table.expiresAt),
+  index("ai_response_cache_last_hit_idx").on(table.lastHitAt),
+]);
+
 export const insertProfileSchema = createInsertSchema(profiles).omit({
   id: true,
   createdAt: true,
@@ -64,6 +124,8 @@ export type InsertChatMessage = z.infer<typeof insertChatMessageSchema>;
 export type ChatMessage = typeof chatMessages.$inferSelect;
 export type InsertChatLog = z.infer<typeof insertChatLogSchema>;
 export type ChatLog = typeof chatLogs.$inferSelect;
+export type ChatSummary = typeof chatSummaries.$inferSelect;
+export type AnalysisJob = typeof analysisJobs.$inferSelect;
 
 export const cosmoPatrolResults = pgTable("cosmo_patrol_results", {
   id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
@@ -80,9 +142,22 @@ export const insertCosmoPatrolResultSchema = createInsertSchema(cosmoPatrolResul
   createdAt: true,
 });
 
+// Filled from the nginx access log by scripts/aggregate_page_views.py
 export const pageViews = pgTable("page_views", {
   path: text("path").primaryKey(),
   count: integer("count").notNull().default(0),
+  // Full page loads in the latest aggregated interval
+  p50Ms: integer("p50_ms"),
+  p95Ms: integer("p95_ms"),
+  latencySamples: integer("latency_samples"),
+  updatedAt: timestamp("updated_at").defaultNow(),
+});
+
+// Read position of the aggregator, committed together with the counts
+export const accessLogOffsets = pgTable("access_log_offsets", {
+  logPath: text("log_path").primaryKey(),
+  inode: bigint("inode", { mode: "number" }).notNull(),
+  offset: bigint("offset", { mode: "number" }).notNull(),
   updatedAt: timestamp("updated_at").defaultNow(),
 });
 
@@ -126,7 +201,9 @@ export const students = pgTable("students", {
   allowedGames: json("allowed_games").$type<string[]>().default([]),
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
-});
+}, (table) => [
+  index("students_school_id_idx").on(table.schoolId),
+]);
 
 export const insertStudentSchema = createInsertSchema(students).omit({
   id: true,
@@ -144,7 +221,9 @@ export const courseTemplates = pgTable("course_templates", {
   name: text("name").notNull(),
   days: json("days").default([]),
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  index("course_templates_school_id_idx").on(table.schoolId),
+]);
 
 export const insertCourseTemplateSchema = createInsertSchema(courseTemplates).omit({
   id: true,
@@ -163,11 +242,19 @@ export const assignments = pgTable("assignments", {
   scheduledDate: text("scheduled_date").notNull(),
   exercises: json("exercises").$type<Array<{ trainingId: string; parameters: Record<string, unknown>; requiredResult: { type: string; minValue?: number } }>>().default([]),
   status: text("status").notNull().default("pending"), // pending, in_progress, completed
+  // Bit i set once exercise i has a passed result; passedCount = number of set bits
+  passedMask: bigint("passed_mask", { mode: "number" }).notNull().default(0),
+  passedCount: integer("passed_count").notNull().default(0),
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  index("assignments_school_status_idx").on(table.schoolId, table.status),
+  index("assignments_student_id_idx").on(table.studentId),
+]);
 
 export const insertAssignmentSchema = createInsertSchema(assignments).omit({
   id: true,
+  passedMask: true,
+  passedCount: true,
   createdAt: true,
 });
 
@@ -183,7 +270,10 @@ export const exerciseResults = pgTable("exercise_results", {
   result: json("result").$type<Record<string, unknown>>().default({}),
   passed: integer("passed").notNull().default(0), // 0 = false, 1 = true
   completedAt: timestamp("completed_at").defaultNow(),
-});
+}, (table) => [
+  index("exercise_results_assignment_idx").on(table.assignmentId, table.exerciseIndex),
+  index("exercise_results_student_idx").on(table.studentId),
+]);
 
 export const insertExerciseResultSchema = createInsertSchema(exerciseResults).omit({
   id: true,
@@ -193,6 +283,32 @@ export const insertExerciseResultSchema = createInsertSchema(exerciseResults).om
 export type InsertExerciseResult = z.infer<typeof insertExerciseResultSchema>;
 export type ExerciseResult = typeof exerciseResults.$inferSelect;
 
+// ==================== STATISTICS ROLLUPS ====================
+// Maintained incrementally by server/services/results.ts when a result is
+// posted; scripts/rebuild_stats.py recomputes them from exercise_results.
+export const studentStats = pgTable("student_stats", {
+  studentId: integer("student_id").primaryKey().references(() => students.id, { onDelete: "cascade" }),
+  schoolId: integer("school_id").notNull().references(() => schools.id, { onDelete: "cascade" }),
+  exercisesTotal: integer("exercises_total").notNull().default(0),
+  exercisesPassed: integer("exercises_passed").notNull().default(0),
+  lastResultAt: timestamp("last_result_at"),
+  updatedAt: timestamp("updated_at").defaultNow(),
+}, (table) => [
+  index("student_stats_school_id_idx").on(table.schoolId),
+]);
+
+export type StudentStats = typeof studentStats.$inferSelect;
+
+export const schoolStats = pgTable("school_stats", {
+  schoolId: integer("school_id").primaryKey().references(() => schools.id, { onDelete: "cascade" }),
+  exercisesTotal: integer("exercises_total").notNull().default(0),
+  exercisesPassed: integer("exercises_passed").notNull().default(0),
+  lastResultAt: timestamp("last_result_at"),
+  updatedAt: timestamp("updated_at").defaultNow(),
+});
+
+export type SchoolStats = typeof schoolStats.$inferSelect;
+
 // ==================== TEMPLATES ====================
 export const templates = pgTable("templates", {
   id: serial("id").primaryKey(),
@@ -200,7 +316,9 @@ export const templates = pgTable("templates", {
   name: text("name").notNull(),
   exercises: json("exercises").$type<Array<{ trainingId: string; parameters: Record<string, unknown>; requiredResult: { type: string; minValue?: number } }>>().default([]),
   createdAt: timestamp("created_at").defaultNow(),
-});
+}, (table) => [
+  index("templates_school_id_idx").on(table.schoolId),
+]);
 
 export const insertTemplateSchema = createInsertSchema(templates).omit({
   id: true,
@@ -223,3 +341,13 @@ export const insertAdminSettingsSchema = createInsertSchema(adminSettings).omit(
 
 export type InsertAdminSettings = z.infer<typeof insertAdminSettingsSchema>;
 export type AdminSettings = typeof adminSettings.$inferSelect;
+
+// ==================== LEGACY IMPORT ====================
+// JSON-file-era ids -> database ids, written by scripts/import_legacy_json.py
+export const legacyIdMap = pgTable("legacy_id_map", {
+  tableName: text("table_name").notNull(),
+  legacyId: integer("legacy_id").notNull(),
+  id: integer("id").notNull(),
+}, (table) => [
+  primaryKey({ columns: [table.tableName, table.legacyId] }),
+]);
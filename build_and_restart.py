@@ -2,7 +2,8 @@
 import paramiko
 import sys
 import io
-import time
+
+from deploy_log import DeployLog
 
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
@@ -10,7 +11,14 @@ HOST = '109.73.199.60'
 USERNAME = 'root'
 PASSWORD = 'eaACMy*w+5L+_w'
 
+READINESS_CMD = (
+    'for i in $(seq 1 60); do '
+    'curl -sf -o /dev/null http://localhost:5001/ && exit 0; sleep 1; '
+    'done; exit 1'
+)
+
 def build_and_restart():
+    log = DeployLog('build_and_restart', HOST)
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     
@@ -20,20 +28,16 @@ def build_and_restart():
         
         # Pull latest changes
         print("\n>>> Pulling latest changes...")
-        stdin, stdout, stderr = client.exec_command('cd /var/www/portal && git pull origin master', timeout=120)
-        exit_status = stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        exit_status, output, error = log.exec(client, 'git pull', 'cd /var/www/portal && git pull origin master', timeout=120)
         print(output[-500:] if output else "Pulled")
         
         # Build client
         print("\n>>> Building client (npm run build)...")
-        stdin, stdout, stderr = client.exec_command(
+        exit_status, output, error = log.exec(
+            client, 'npm run build',
             'cd /var/www/portal/ScreenCreator && npm run build',
             timeout=300
         )
-        exit_status = stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
-        error = stderr.read().decode('utf-8', errors='replace')
         print(output[-1000:] if output else "")
         if error and 'warning' not in error.lower():
             print(f"STDERR: {error[-500:]}")
@@ -41,36 +45,31 @@ def build_and_restart():
         
         # Check if dist folder exists
         print("\n>>> Checking dist folder...")
-        stdin, stdout, stderr = client.exec_command('ls -la /var/www/portal/ScreenCreator/dist/ 2>/dev/null || echo "dist not found"', timeout=30)
-        stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        _, output, _ = log.exec(client, 'check dist', 'ls -la /var/www/portal/ScreenCreator/dist/ 2>/dev/null || echo "dist not found"', timeout=30)
         print(output[:500])
         
         # Restart app
         print("\n>>> Restarting app...")
-        stdin, stdout, stderr = client.exec_command('cd /var/www/portal/ScreenCreator && pm2 restart portal', timeout=60)
-        stdout.channel.recv_exit_status()
+        log.exec(client, 'pm2 restart', 'cd /var/www/portal/ScreenCreator && pm2 restart portal', timeout=60)
         
-        # Wait
-        print("\n>>> Waiting 10 seconds...")
-        time.sleep(10)
+        # Wait until the app answers (timed, instead of a fixed sleep)
+        print("\n>>> Waiting for the app to answer...")
+        log.exec(client, 'readiness', READINESS_CMD, timeout=90)
         
         # Check status
         print("\n>>> Checking port 5001...")
-        stdin, stdout, stderr = client.exec_command('ss -tlnp | grep 5001 || echo "Port not listening"', timeout=30)
-        stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        _, output, _ = log.exec(client, 'check port', 'ss -tlnp | grep 5001 || echo "Port not listening"', timeout=30)
         print(f"  {output}")
         
         # Test HTTP
         print("\n>>> Testing HTTP...")
-        stdin, stdout, stderr = client.exec_command('curl -s -o /dev/null -w "%{http_code}" http://localhost:5001/ 2>/dev/null', timeout=10)
-        stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        _, output, _ = log.exec(client, 'check http', 'curl -s -o /dev/null -w "%{http_code}" http://localhost:5001/ 2>/dev/null', timeout=10)
         print(f"  HTTP Response: {output}")
+        log.finish(output.strip() == '200')
         
     except Exception as e:
         print(f"Error: {e}")
+        log.finish(False)
     finally:
         client.close()
 
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""
+Deduplicated backups of the portal database over SSH.
+
+`backup` uploads this file to the server and runs pg_dump there. With the
+default format it is `pg_dump -Fc -Z0`. With --jobs N it is a parallel
+`-Fd -j N` dump, staged in /var/tmp and streamed back as tar. The dump is
+piped into this script's `agent` command. The agent splits the stream into
+content-defined chunks and sends back only the chunks the local store does
+not already have; for the rest it sends a reference. Everything comes over
+the one SSH channel. Dumps are left uncompressed so unchanged tables chunk
+identically from night to night, and new chunks travel zlib-compressed.
+Locally each chunk is verified and stored zstd-compressed under
+backups/chunks/. A backup is a JSON manifest of chunk hashes.
+
+`restore` reassembles a backup, checking every chunk hash, and runs a
+parallel pg_restore into a database you name. Point it at a scratch local
+database to check that a backup really restores:
+
+    createdb neurotrainer_restore
+    python db_backup.py restore latest --database-url postgresql://localhost/neurotrainer_restore
+
+Requires zstandard locally (pip install zstandard); the server only needs python3.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+try:
+    import paramiko
+except ImportError:  # not needed by the agent running on the server
+    paramiko = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+HOST = '109.73.199.60'
+USERNAME = 'root'
+PASSWORD = 'eaACMy*w+5L+_w'
+
+DB_NAME = 'neurotrainer'
+REMOTE_AGENT = '/var/www/portal/bin/db_backup.py'
+REMOTE_KNOWN = '/tmp/portal-backup-known.bin'
+REMOTE_STAGE = '/var/tmp/portal-backup'
+
+STORE = Path(__file__).resolve().parent / 'backups'
+TABLES_TO_COUNT = ['schools', 'students', 'assignments', 'exercise_results', 'profiles', 'chat_messages']
+
+# Content-defined chunks of ~1 MB: never below 256 KB or above 4 MB
+MIN_SIZE = 256 * 1024
+CUT_SPACING = 768 * 1024
+MAX_SIZE = 4 * 1024 * 1024
+
+READ_SIZE = 8 * 1024 * 1024
+HASH_SIZE = 32
+FRAME = struct.Struct('>cI')  # kind, payload length
+KNOWN, NEW, END = b'K', b'N', b'E'
+
+
+def cut_point(buf, n):
+    """Length of the next chunk at the start of buf[:n].
+
+    Candidate boundaries are line ends: the table data in a dump is COPY
+    text, one row per line. A line ends the chunk when its CRC falls below a
+    bound proportional to its length, so chunks average MIN_SIZE +
+    CUT_SPACING bytes whatever the row width. An inserted or deleted row
+    only changes the chunk it lands in. Regions without newlines are cut
+    at MAX_SIZE.
+    """
+    if n <= MIN_SIZE:
+        return n
+    limit = min(n, MAX_SIZE)
+    line_start = buf.rfind(b'\n', 0, MIN_SIZE) + 1
+    with memoryview(buf) as view:
+        while True:
+            end = buf.find(b'\n', max(line_start, MIN_SIZE), limit)
+            if end < 0:
+                return limit
+            if zlib.crc32(view[line_start:end]) % CUT_SPACING < end + 1 - line_start:
+                return end + 1
+            line_start = end + 1
+
+
+def iter_chunks(stream):
+    buf = bytearray()
+    eof = False
+    while True:
+        while not eof and len(buf) < MAX_SIZE:
+            data = stream.read(READ_SIZE)
+            if not data:
+                eof = True
+            buf += data
+        if not buf:
+            return
+        cut = cut_point(buf, len(buf))
+        yield bytes(buf[:cut])
+        del buf[:cut]
+
+
+def agent(known_path):
+    """Server side: chunk stdin, write frames to stdout."""
+    known = set()
+    if known_path and os.path.exists(known_path):
+        data = Path(known_path).read_bytes()
+        known = {data[i:i + HASH_SIZE] for i in range(0, len(data), HASH_SIZE)}
+    out = sys.stdout.buffer
+    total = hashlib.sha256()
+    for chunk in iter_chunks(sys.stdin.buffer):
+        total.update(chunk)
+        digest = hashlib.sha256(chunk).digest()
+        if digest in known:
+            out.write(FRAME.pack(KNOWN, HASH_SIZE + 4) + digest + struct.pack('>I', len(chunk)))
+        else:
+            payload = zlib.compress(chunk, 1)
+            out.write(FRAME.pack(NEW, HASH_SIZE + len(payload)) + digest + payload)
+            known.add(digest)
+    out.write(FRAME.pack(END, HASH_SIZE) + total.digest())
+    out.flush()
+
+
+class Store:
+    """Content-addressed zstd chunk store plus one manifest per backup."""
+
+    def __init__(self, root):
+        if zstandard is None:
+            raise SystemExit("zstandard is not installed (pip install zstandard)")
+        self.root = root
+        self.chunks = root / 'chunks'
+        self.manifests = root / 'manifests'
+        self.chunks.mkdir(parents=True, exist_ok=True)
+        self.manifests.mkdir(parents=True, exist_ok=True)
+        self.compressor = zstandard.ZstdCompressor(level=9)
+        self.decompressor = zstandard.ZstdDecompressor()
+
+    def chunk_path(self, hex_digest):
+        return self.chunks / hex_digest[:2] / f'{hex_digest}.zst'
+
+    def known_digests(self):
+        return [bytes.fromhex(p.stem) for p in self.chunks.glob('*/*.zst')]
+
+    def put(self, digest, data):
+        path = self.chunk_path(digest.hex())
+        if path.exists():
+            return 0
+        path.parent.mkdir(exist_ok=True)
+        compressed = self.compressor.compress(data)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(compressed)
+        os.replace(tmp, path)
+        return len(compressed)
+
+    def get(self, hex_digest):
+        data = self.decompressor.decompress(self.chunk_path(hex_digest).read_bytes())
+        if hashlib.sha256(data).hexdigest() != hex_digest:
+            raise ValueError(f"chunk {hex_digest} is corrupt")
+        return data
+
+    def backups(self):
+        return sorted(p.stem for p in self.manifests.glob('*.json'))
+
+    def load(self, name):
+        if name == 'latest':
+            names = self.backups()
+            if not names:
+                raise SystemExit("no backups in the store")
+            name = names[-1]
+        return json.loads((self.manifests / f'{name}.json').read_text(encoding='utf-8'))
+
+    def save(self, manifest):
+        path = self.manifests / f"{manifest['name']}.json"
+        path.write_text(json.dumps(manifest, indent=1), encoding='utf-8')
+
+
+def read_exact(stream, n):
+    data = b''
+    while len(data) < n:
+        part = stream.read(n - len(data))
+        if not part:
+            raise EOFError("backup stream ended early")
+        data += part
+    return data
+
+
+def connect():
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(HOST, username=USERNAME, password=PASSWORD, timeout=30)
+    return client
+
+
+def check_dump(stdout, stderr):
+    exit_status = stdout.channel.recv_exit_status()
+    if exit_status != 0:
+        raise RuntimeError(f"pg_dump failed: {stderr.read().decode('utf-8', errors='replace')[-500:]}")
+
+
+def backup(store_root, jobs):
+    store = Store(store_root)
+    name = time.strftime('%Y%m%d-%H%M%S')
+    client = connect()
+    started = time.time()
+    try:
+        print("\n>>> Uploading agent and known chunk list...")
+        known = store.known_digests()
+        client.exec_command(f'mkdir -p {os.path.dirname(REMOTE_AGENT)}')[1].channel.recv_exit_status()
+        sftp = client.open_sftp()
+        sftp.put(__file__, REMOTE_AGENT)
+        with sftp.open(REMOTE_KNOWN, 'wb') as f:
+            f.write(b''.join(known))
+        sftp.close()
+        print(f"  {len(known)} chunks already stored locally")
+
+        agent_cmd = f'python3 {REMOTE_AGENT} agent --known {REMOTE_KNOWN}'
+        if jobs > 1:
+            fmt = 'directory-tar'
+            dump = (f'rm -rf {REMOTE_STAGE} && '
+                    f'sudo -u postgres pg_dump -Fd -j {jobs} -Z0 -f {REMOTE_STAGE} {DB_NAME} && '
+                    f'tar -cf - -C {REMOTE_STAGE} . | {agent_cmd}; status=$?; rm -rf {REMOTE_STAGE}; exit $status')
+        else:
+            fmt = 'custom'
+            dump = f'sudo -u postgres pg_dump -Fc -Z0 {DB_NAME} | {agent_cmd}'
+        cmd = f"bash -c 'set -o pipefail; {dump}'"
+
+        print(f"\n>>> Dumping {DB_NAME} ({fmt}{f', {jobs} jobs' if jobs > 1 else ''})...")
+        stdin, stdout, stderr = client.exec_command(cmd)
+        chunks, new_chunks = [], 0
+        received = stored = logical = 0
+        total = hashlib.sha256()
+        while True:
+            try:
+                kind, length = FRAME.unpack(read_exact(stdout, FRAME.size))
+                payload = read_exact(stdout, length)
+            except EOFError:
+                # With --jobs a failed pg_dump stops the chain before the agent
+                # starts, so no END frame comes; report why instead
+                check_dump(stdout, stderr)
+                raise
+            received += FRAME.size + length
+            digest = payload[:HASH_SIZE]
+            if kind == END:
+                if digest != total.digest():
+                    raise ValueError("stream checksum mismatch")
+                break
+            if kind == NEW:
+                data = zlib.decompress(payload[HASH_SIZE:])
+                if hashlib.sha256(data).digest() != digest:
+                    raise ValueError("chunk checksum mismatch in transfer")
+                stored += store.put(digest, data)
+                new_chunks += 1
+            else:
+                data = store.get(digest.hex())
+            total.update(data)
+            logical += len(data)
+            chunks.append([digest.hex(), len(data)])
+        check_dump(stdout, stderr)
+    finally:
+        client.close()
+
+    elapsed = time.time() - started
+    store.save({
+        'name': name, 'database': DB_NAME, 'format': fmt, 'created': time.time(),
+        'bytes': logical, 'sha256': total.hexdigest(), 'chunks': chunks,
+        'received_bytes': received, 'new_chunks': new_chunks, 'stored_bytes': stored,
+        'elapsed_s': round(elapsed, 2),
+    })
+    print(f"  {logical / 1e6:.1f} MB dump in {len(chunks)} chunks, {new_chunks} new")
+    print(f"  {received / 1e6:.2f} MB transferred, {stored / 1e6:.2f} MB added to the store, {elapsed:.1f}s")
+    print(f"\n=== Backup {name} saved ===")
+
+
+def reassemble(store, manifest, target):
+    """Write the dump to target (a file, or a directory for directory-tar)."""
+    digest = hashlib.sha256()
+    with tempfile.TemporaryFile() as raw:
+        for hex_digest, _ in manifest['chunks']:
+            data = store.get(hex_digest)
+            digest.update(data)
+            raw.write(data)
+        if digest.hexdigest() != manifest['sha256']:
+            raise ValueError("reassembled dump does not match the manifest checksum")
+        raw.seek(0)
+        if manifest['format'] == 'directory-tar':
+            target.mkdir()
+            with tarfile.open(fileobj=raw, mode='r:') as tar:
+                tar.extractall(target)
+        else:
+            with open(target, 'wb') as f:
+                shutil.copyfileobj(raw, f)
+
+
+def restore(store_root, name, database_url, jobs):
+    store = Store(store_root)
+    manifest = store.load(name)
+    print(f"\n>>> Reassembling {manifest['name']} ({manifest['bytes'] / 1e6:.1f} MB, {len(manifest['chunks'])} chunks)...")
+    started = time.time()
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / 'dump'
+        reassemble(store, manifest, target)
+        print(f"  checksums verified in {time.time() - started:.1f}s")
+
+        print(f"\n>>> pg_restore -j {jobs} into {database_url}...")
+        started = time.time()
+        result = subprocess.run(['pg_restore', '-j', str(jobs), '--no-owner', '--no-privileges',
+                                 '--clean', '--if-exists', '-d', database_url, str(target)])
+        print(f"  exit status {result.returncode} after {time.time() - started:.1f}s")
+
+    counts = subprocess.run(
+        ['psql', database_url, '-At', '-c',
+         ' UNION ALL '.join(f"SELECT '{t}', count(*) FROM {t}" for t in TABLES_TO_COUNT)],
+        capture_output=True, text=True)
+    print("\n>>> Restored row counts:")
+    print(counts.stdout.replace('|', '\t') or counts.stderr)
+    return result.returncode
+
+
+def list_backups(store_root):
+    store = Store(store_root)
+    referenced = set()
+    for name in store.backups():
+        m = store.load(name)
+        referenced.update(h for h, _ in m['chunks'])
+        print(f"{name}  {m['format']:<13} {m['bytes'] / 1e6:8.1f} MB  "
+              f"{m['received_bytes'] / 1e6:7.2f} MB transferred  {m['new_chunks']:>4} new chunks")
+    on_disk = sum(p.stat().st_size for p in store.chunks.glob('*/*.zst'))
+    print(f"\n{len(referenced)} chunks referenced, {on_disk / 1e6:.1f} MB on disk")
+
+
+def prune(store_root, keep):
+    store = Store(store_root)
+    names = store.backups()
+    for name in names[:-keep] if keep else names:
+        (store.manifests / f'{name}.json').unlink()
+        print(f"  removed {name}")
+    referenced = {h for name in store.backups() for h, _ in store.load(name)['chunks']}
+    freed = 0
+    for path in store.chunks.glob('*/*.zst'):
+        if path.stem not in referenced:
+            freed += path.stat().st_size
+            path.unlink()
+    print(f"  {freed / 1e6:.1f} MB of unreferenced chunks deleted")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Deduplicated PostgreSQL backups over SSH")
+    parser.add_argument('--store', type=Path, default=STORE, help="local chunk store directory")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_backup = sub.add_parser('backup', help="dump the server database into the store")
+    p_backup.add_argument('--jobs', type=int, default=1, help="parallel -Fd dump with N jobs (staged in /var/tmp)")
+    p_restore = sub.add_parser('restore', help="restore a backup into a database")
+    p_restore.add_argument('name', nargs='?', default='latest')
+    p_restore.add_argument('--database-url', required=True, help="target database, e.g. a local scratch one")
+    p_restore.add_argument('--jobs', type=int, default=4, help="pg_restore parallelism")
+    sub.add_parser('list', help="backups and store size")
+    p_prune = sub.add_parser('prune', help="drop old backups and unreferenced chunks")
+    p_prune.add_argument('--keep', type=int, default=14)
+    p_agent = sub.add_parser('agent', help=argparse.SUPPRESS)
+    p_agent.add_argument('--known')
+    args = parser.parse_args()
+
+    if args.command == 'agent':
+        agent(args.known)
+    elif args.command == 'backup':
+        backup(args.store, args.jobs)
+    elif args.command == 'restore':
+        sys.exit(restore(args.store, args.name, args.database_url, args.jobs))
+    elif args.command == 'list':
+        list_backups(args.store)
+    else:
+        prune(args.store, args.keep)
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+Build the portal off the production box and ship it as a compressed bundle.
+
+The build runs either in the local working tree (--mode local) or in a clean
+checkout exported with `git archive` (--mode sandbox, the default). The
+resulting dist/, production node_modules and package files are packed into a
+gzipped tar stream that goes over a single SSH channel straight into
+`tar -x` on the server, so nothing is staged on disk on either side.
+
+Releases live in /var/www/portal/releases/<stamp>; /var/www/portal/current
+is switched atomically to the new one and pm2 is pointed at it. The media
+directories are not shipped: they are kept up to date by sync_assets.py and
+symlinked into dist/public of every release.
+"""
+import argparse
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+import paramiko
+
+from deploy_log import DeployLog
+from sync_assets import ASSET_DIRS, HOST, REMOTE_ASSETS_CURRENT, ssh_connect
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+REPO_ROOT = Path(__file__).resolve().parent
+PROJECT_DIR = REPO_ROOT / 'ScreenCreator'
+
+REMOTE_BASE = '/var/www/portal'
+REMOTE_APP_DIR = f'{REMOTE_BASE}/ScreenCreator'
+RELEASES_DIR = f'{REMOTE_BASE}/releases'
+CURRENT_LINK = f'{REMOTE_BASE}/current'
+KEEP_RELEASES = 5
+ECOSYSTEM_PATH = f'{REMOTE_BASE}/ecosystem.config.js'
+# How the app ran before the first bundle release (see fix_pm2_npm.py)
+LEGACY_START = f'cd {REMOTE_APP_DIR} && pm2 start npm --name portal -- run dev'
+
+NPM = 'npm.cmd' if os.name == 'nt' else 'npm'
+
+
+class ChannelWriter:
+    """Minimal file-like object that pushes tar output into an SSH channel."""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.bytes_sent = 0
+
+    def write(self, data):
+        self.channel.sendall(data)
+        self.bytes_sent += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def npm(log, step, args, cwd):
+    print(f"  $ npm {' '.join(args)}  ({cwd})")
+    with log.step(step) as info:
+        info['exit_status'] = subprocess.run([NPM, *args], cwd=cwd).returncode
+    if info['exit_status'] != 0:
+        raise subprocess.CalledProcessError(info['exit_status'], ['npm', *args])
+
+
+def check_asset_budgets(log, project):
+    """Fail early when the media manifests are stale or a training is over its byte budget."""
+    print("\n>>> Checking the hashed media manifest...")
+    script = project / 'scripts' / 'publish_assets.py'
+    with log.step('asset manifest') as info:
+        info['exit_status'] = subprocess.run([sys.executable, str(script), '--check']).returncode
+    if info['exit_status'] != 0:
+        raise RuntimeError("asset-manifest.ts is stale, see scripts/publish_assets.py")
+
+    print("\n>>> Checking per-training asset budgets...")
+    script = project / 'scripts' / 'bundle_trainings.py'
+    with log.step('asset budgets') as info:
+        info['exit_status'] = subprocess.run([sys.executable, str(script), '--check']).returncode
+    if info['exit_status'] != 0:
+        raise RuntimeError("asset budget check failed, see scripts/bundle_trainings.py")
+
+
+def precompress(log, project):
+    """Write .gz/.br sidecars into dist/public for nginx gzip_static/brotli_static."""
+    print("\n>>> Precompressing build output...")
+    script = PROJECT_DIR / 'scripts' / 'precompress.py'
+    with log.step('precompress') as info:
+        info['exit_status'] = subprocess.run(
+            [sys.executable, str(script), str(project / 'dist' / 'public'), '--exclude', *ASSET_DIRS],
+        ).returncode
+    if info['exit_status'] != 0:
+        raise RuntimeError("precompress failed")
+
+
+def export_sandbox(log, ref, workdir):
+    """Extract a clean copy of ScreenCreator at `ref` into workdir."""
+    print(f"\n>>> Exporting ScreenCreator@{ref} into sandbox {workdir}")
+    with log.step('git archive'):
+        proc = subprocess.Popen(
+            ['git', 'archive', '--format=tar', ref, 'ScreenCreator'],
+            cwd=REPO_ROOT,
+            stdout=subprocess.PIPE,
+        )
+        with tarfile.open(fileobj=proc.stdout, mode='r|') as tar:
+            tar.extractall(workdir)
+        if proc.wait() != 0:
+            raise RuntimeError(f"git archive {ref} failed")
+    return Path(workdir) / 'ScreenCreator'
+
+
+def build(log, mode, ref, workdir):
+    """Run the build and return (project_dir, node_modules_dir)."""
+    if mode == 'sandbox':
+        project = export_sandbox(log, ref, workdir)
+        check_asset_budgets(log, project)
+        print("\n>>> Installing dependencies (npm ci)...")
+        npm(log, 'npm ci', ['ci', '--no-audit', '--no-fund'], project)
+        print("\n>>> Building (npm run build)...")
+        npm(log, 'npm run build', ['run', 'build'], project)
+        precompress(log, project)
+        print("\n>>> Pruning dev dependencies...")
+        npm(log, 'npm prune', ['prune', '--omit=dev', '--no-audit', '--no-fund'], project)
+        return project, project / 'node_modules'
+
+    check_asset_budgets(log, PROJECT_DIR)
+    print("\n>>> Building in working tree (npm run build)...")
+    npm(log, 'npm run build', ['run', 'build'], PROJECT_DIR)
+    precompress(log, PROJECT_DIR)
+
+    # The working tree keeps its dev dependencies, so production modules
+    # are installed separately next to a copy of the lockfile.
+    print("\n>>> Installing production dependencies into staging...")
+    staging = Path(workdir) / 'modules'
+    staging.mkdir(parents=True)
+    for name in ('package.json', 'package-lock.json'):
+        shutil.copy2(PROJECT_DIR / name, staging / name)
+    npm(log, 'npm ci --omit=dev', ['ci', '--omit=dev', '--no-audit', '--no-fund'], staging)
+    return PROJECT_DIR, staging / 'node_modules'
+
+
+def bundle_entries(project, node_modules):
+    dist = project / 'dist'
+    if not (dist / 'index.cjs').exists() or not (dist / 'public' / 'index.html').exists():
+        raise RuntimeError(f"Build output missing in {dist}")
+    return [
+        ('dist', dist),
+        ('node_modules', node_modules),
+        ('package.json', project / 'package.json'),
+        ('package-lock.json', project / 'package-lock.json'),
+    ]
+
+
+def skip_asset_dirs(tarinfo):
+    """tarfile filter dropping the media copied by Vite into dist/public."""
+    parts = tarinfo.name.split('/')
+    if len(parts) >= 3 and parts[:2] == ['dist', 'public'] and parts[2] in ASSET_DIRS:
+        return None
+    return tarinfo
+
+
+def asset_links():
+    """Symlink members pointing dist/public/<dir> at the synced asset tree."""
+    for name in ASSET_DIRS:
+        info = tarfile.TarInfo(f'dist/public/{name}')
+        info.type = tarfile.SYMTYPE
+        info.linkname = f'{REMOTE_ASSETS_CURRENT}/{name}'
+        info.mtime = int(time.time())
+        yield info
+
+
+def stream_bundle(client, entries, release_dir):
+    """Pack entries as tar.gz directly into `tar -x` on the server."""
+    channel = client.get_transport().open_session()
+    channel.exec_command(f"mkdir -p {release_dir} && tar -xzf - -C {release_dir}")
+    writer = ChannelWriter(channel)
+    with tarfile.open(fileobj=writer, mode='w|gz', compresslevel=6) as tar:
+        for arcname, path in entries:
+            print(f"  + {arcname}")
+            tar.add(str(path), arcname=arcname, filter=skip_asset_dirs)
+        for info in asset_links():
+            tar.addfile(info)
+    channel.shutdown_write()
+    exit_status = channel.recv_exit_status()
+    error = b''
+    while channel.recv_stderr_ready():
+        error += channel.recv_stderr(65536)
+    channel.close()
+    return exit_status, writer.bytes_sent, error.decode('utf-8', errors='replace')
+
+
+def activate(log, client, release_dir):
+    """Point `current` at the release and (re)start pm2 from it.
+
+    With the cluster config written by fix_pm2.py this is a rolling
+    `pm2 reload`; otherwise a single fork-mode process is (re)started.
+    """
+    script = f"{CURRENT_LINK}/dist/index.cjs"
+    cmd = (
+        f"cp {REMOTE_APP_DIR}/.env {release_dir}/.env 2>/dev/null; "
+        f"ln -sfn {release_dir} {CURRENT_LINK}.next && mv -Tf {CURRENT_LINK}.next {CURRENT_LINK} && "
+        f"cd {CURRENT_LINK} && set -a && {{ [ ! -f .env ] || . ./.env; }} && set +a && "
+        f"if [ -f {ECOSYSTEM_PATH} ]; then "
+        f"pm2 reload {ECOSYSTEM_PATH} --update-env; "
+        f"elif pm2 describe portal 2>/dev/null | grep -q '{script}'; then "
+        f"pm2 restart portal --update-env; "
+        f"else pm2 delete portal 2>/dev/null; pm2 start {script} --name portal --cwd {CURRENT_LINK}; fi && "
+        f"pm2 save"
+    )
+    return log.exec(client, 'pm2 reload', cmd, timeout=300)
+
+
+def restore_legacy(log, client):
+    """Undo a failed first release: drop `current` and restart the pre-bundle process."""
+    cmd = (
+        f"rm -f {CURRENT_LINK} && pm2 delete portal 2>/dev/null; "
+        f"{LEGACY_START} && pm2 save"
+    )
+    return log.exec(client, 'restore legacy', cmd, timeout=120)
+
+
+def wait_ready(log, client):
+    cmd = (
+        "for i in $(seq 1 30); do "
+        "curl -sf -o /dev/null http://localhost:5001/ && exit 0; sleep 1; "
+        "done; exit 1"
+    )
+    exit_status, _, _ = log.exec(client, 'readiness', cmd, timeout=60)
+    return exit_status == 0
+
+
+def deploy_bundle(mode, ref):
+    log = DeployLog('deploy_bundle', HOST)
+    workdir = tempfile.mkdtemp(prefix='portal-build-')
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+    try:
+        started = time.time()
+        project, node_modules = build(log, mode, ref, workdir)
+        entries = bundle_entries(project, node_modules)
+        print(f"Build finished in {time.time() - started:.1f}s")
+
+        ssh_connect(client)
+        print("Connected!")
+
+        exit_status, _, _ = log.exec(client, 'check assets', f"test -d {REMOTE_ASSETS_CURRENT}/")
+        if exit_status != 0:
+            print(f"ERROR: {REMOTE_ASSETS_CURRENT} is missing, run sync_assets.py first")
+            log.finish(False)
+            return False
+
+        # readlink -f prints the path even when it does not exist, so only trust a real symlink
+        _, previous, _ = log.exec(client, 'read current',
+                                  f"[ -L {CURRENT_LINK} ] && readlink -f {CURRENT_LINK}")
+        previous = previous.strip()
+
+        release_dir = f"{RELEASES_DIR}/{time.strftime('%Y%m%d-%H%M%S')}"
+        print(f"\n>>> Streaming bundle into {release_dir}...")
+        started = time.time()
+        with log.step('stream bundle', host=HOST) as info:
+            exit_status, sent, error = stream_bundle(client, entries, release_dir)
+            info.update(exit_status=exit_status, stderr_bytes=len(error), bytes_sent=sent)
+        if exit_status != 0:
+            print(f"ERROR: remote tar failed ({exit_status}): {error[-500:]}")
+            log.exec(client, 'cleanup', f"rm -rf {release_dir}")
+            log.finish(False)
+            return False
+        print(f"  Sent {sent / 1024 / 1024:.1f} MB in {time.time() - started:.1f}s")
+
+        print("\n>>> Activating release...")
+        exit_status, output, error = activate(log, client, release_dir)
+        print(output[-800:] if output else "")
+        if exit_status != 0:
+            print(f"STDERR: {error[-500:]}")
+
+        print("\n>>> Waiting for port 5001...")
+        if not wait_ready(log, client):
+            print("ERROR: app did not come up")
+            if previous and previous != release_dir:
+                print(f">>> Rolling back to {previous}")
+                activate(log, client, previous)
+            else:
+                print(">>> No previous release, restarting the legacy process")
+                exit_status, _, error = restore_legacy(log, client)
+                if exit_status != 0:
+                    print(f"ERROR: rollback failed, nothing is serving: {error[-500:]}")
+            log.finish(False)
+            return False
+        print("  HTTP OK")
+
+        print(f"\n>>> Pruning old releases (keeping {KEEP_RELEASES})...")
+        log.exec(client, 'prune releases', f"ls -1dt {RELEASES_DIR}/*/ | tail -n +{KEEP_RELEASES + 1} | xargs -r rm -rf")
+
+        print("\n=== BUNDLE DEPLOY SUCCESS ===")
+        log.finish(True)
+        return True
+
+    except subprocess.CalledProcessError as e:
+        print(f"Build step failed: {e}")
+        log.finish(False)
+        return False
+    except Exception as e:
+        print(f"Error: {e}")
+        log.finish(False)
+        return False
+    finally:
+        client.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mode', choices=['sandbox', 'local'], default='sandbox',
+                        help="sandbox: clean git export + npm ci; local: build the working tree")
+    parser.add_argument('--ref', default='HEAD', help="git ref to export in sandbox mode")
+    args = parser.parse_args()
+    sys.exit(0 if deploy_bundle(args.mode, args.ref) else 1)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Structured timing log shared by the deploy and maintenance scripts.
+
+Every step (remote command or local build stage) appends one JSON line to
+deploy_events.jsonl with its start/end time, duration, exit status, output
+byte counts and host. deploy_report.py aggregates the file.
+"""
+import json
+import os
+import socket
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+LOG_PATH = Path(os.environ.get('DEPLOY_LOG', Path(__file__).resolve().parent / 'deploy_events.jsonl'))
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec='milliseconds')
+
+
+class DeployLog:
+    """Records the steps of one script invocation under a common run id."""
+
+    def __init__(self, script, host):
+        self.script = script
+        self.host = host
+        self.run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self.started = time.time()
+
+    def record(self, step, start, end, exit_status, stdout_bytes=0, stderr_bytes=0, host=None, **extra):
+        event = {
+            'run_id': self.run_id,
+            'script': self.script,
+            'step': step,
+            'host': host or self.host,
+            'start': _iso(start),
+            'end': _iso(end),
+            'duration_s': round(end - start, 3),
+            'exit_status': exit_status,
+            'stdout_bytes': stdout_bytes,
+            'stderr_bytes': stderr_bytes,
+            **extra,
+        }
+        with open(LOG_PATH, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event, ensure_ascii=False) + '\n')
+        return event
+
+    def exec(self, client, step, cmd, timeout=60, stdin_data=None):
+        """Run `cmd` over SSH, log it as `step`, return (status, out, err)."""
+        start = time.time()
+        stdin, stdout, stderr = client.exec_command(cmd, timeout=timeout)
+        if stdin_data is not None:
+            stdin.write(stdin_data)
+            stdin.channel.shutdown_write()
+        exit_status = stdout.channel.recv_exit_status()
+        out = stdout.read()
+        err = stderr.read()
+        self.record(step, start, time.time(), exit_status, len(out), len(err))
+        return exit_status, out.decode('utf-8', errors='replace'), err.decode('utf-8', errors='replace')
+
+    @contextmanager
+    def step(self, step, host=None):
+        """Time a block of local or custom work.
+
+        The yielded dict may be filled with exit_status / stdout_bytes /
+        stderr_bytes (any other key is stored as-is); an exception marks
+        the step as failed.
+        """
+        info = {'exit_status': 0, 'stdout_bytes': 0, 'stderr_bytes': 0}
+        start = time.time()
+        try:
+            yield info
+        except BaseException:
+            info['exit_status'] = info['exit_status'] or 1
+            raise
+        finally:
+            extra = {k: v for k, v in info.items() if k not in ('exit_status', 'stdout_bytes', 'stderr_bytes')}
+            self.record(step, start, time.time(), info['exit_status'],
+                        info['stdout_bytes'], info['stderr_bytes'], host or socket.gethostname(), **extra)
+
+    def finish(self, ok):
+        """Log the whole invocation as a pseudo-step named `total`."""
+        self.record('total', self.started, time.time(), 0 if ok else 1, host=self.host)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Per-step timing report over the last deploys recorded in deploy_events.jsonl.
+
+For every (script, step) pair it prints p50/p90/max over the selected runs
+and flags the latest run as a regression when it is markedly slower than
+the median of the runs before it.
+"""
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+from deploy_log import LOG_PATH
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+REGRESSION_FACTOR = 1.5
+REGRESSION_MIN_SECONDS = 2.0
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def load_events(path):
+    events = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return events
+
+
+def report(runs, script=None):
+    if not LOG_PATH.exists():
+        print(f"No events yet ({LOG_PATH})")
+        return
+
+    events = [e for e in load_events(LOG_PATH) if not script or e['script'] == script]
+
+    # run_id starts with a timestamp, so sorting keeps chronological order
+    run_ids = sorted({e['run_id'] for e in events})[-runs:]
+    selected = set(run_ids)
+
+    series = defaultdict(list)  # (script, step) -> [(run_id, duration, exit_status)]
+    for e in events:
+        if e['run_id'] in selected:
+            series[(e['script'], e['step'])].append((e['run_id'], e['duration_s'], e['exit_status']))
+
+    print(f"Last {len(run_ids)} runs from {LOG_PATH.name}\n")
+    header = f"{'script':<22} {'step':<24} {'n':>3} {'fail':>4} {'p50':>8} {'p90':>8} {'max':>8} {'last':>8}"
+    print(header)
+    print('-' * len(header))
+
+    regressions = []
+    for (script_name, step), samples in sorted(series.items()):
+        samples.sort()
+        durations = [d for _, d, _ in samples]
+        failures = sum(1 for _, _, status in samples if status != 0)
+        last = durations[-1]
+        print(f"{script_name:<22} {step:<24} {len(durations):>3} {failures:>4} "
+              f"{percentile(durations, 50):>7.1f}s {percentile(durations, 90):>7.1f}s "
+              f"{max(durations):>7.1f}s {last:>7.1f}s")
+
+        previous = durations[:-1]
+        if len(previous) >= 3:
+            baseline = percentile(previous, 50)
+            if last > baseline * REGRESSION_FACTOR and last - baseline > REGRESSION_MIN_SECONDS:
+                regressions.append((script_name, step, baseline, last))
+
+    if regressions:
+        print("\nRegressions (latest sample vs. median of earlier ones):")
+        for script_name, step, baseline, last in regressions:
+            print(f"  ! {script_name} / {step}: {last:.1f}s vs median {baseline:.1f}s "
+                  f"(x{last / baseline if baseline else float('inf'):.1f})")
+    else:
+        print("\nNo regressions.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Deploy step timing report")
+    parser.add_argument('--runs', type=int, default=20, help="number of most recent runs to include")
+    parser.add_argument('--script', help="only include one script (e.g. quick_deploy)")
+    args = parser.parse_args()
+    report(args.runs, args.script)
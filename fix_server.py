@@ -2,6 +2,8 @@ import paramiko
 import sys
 import io
 
+from deploy_log import DeployLog
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 def fix_server():
@@ -9,6 +11,7 @@ def fix_server():
     user = "root"
     password = "eaACMy*w+5L+_w"
     
+    log = DeployLog('fix_server', host)
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     
@@ -18,30 +21,31 @@ def fix_server():
         print("Connected!")
         
         commands = [
-            "cd /var/www/portal/ScreenCreator && npm install",  # Install ALL dependencies including devDeps
-            "pm2 restart portal",
-            "sleep 5",
-            "pm2 list",
-            "netstat -tlnp | grep 5001"
+            ("npm install", "cd /var/www/portal/ScreenCreator && npm install"),  # Install ALL dependencies including devDeps
+            ("pm2 restart", "pm2 restart portal"),
+            ("wait", "sleep 5"),
+            ("pm2 list", "pm2 list"),
+            ("check port", "netstat -tlnp | grep 5001")
         ]
         
-        for cmd in commands:
+        ok = True
+        for step, cmd in commands:
             print(f"\n>>> Executing: {cmd}")
-            _, stdout, stderr = client.exec_command(cmd, timeout=120)
-            exit_code = stdout.channel.recv_exit_status()
-            out = stdout.read().decode('utf-8', errors='replace')
-            err = stderr.read().decode('utf-8', errors='replace')
+            exit_code, out, err = log.exec(client, step, cmd, timeout=120)
             if out:
                 print(out)
             if err:
                 print(f"STDERR: {err}")
             print(f"Exit code: {exit_code}")
+            ok = ok and exit_code == 0
         
         client.close()
-        print("\n=== DONE ===")
-        return True
+        print("\n=== DONE ===" if ok else "\n=== DONE WITH ERRORS ===")
+        log.finish(ok)
+        return ok
     except Exception as e:
         print(f"Error: {e}")
+        log.finish(False)
         client.close()
         return False
 
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental follower for the pm2 logs of the portal.
+
+Instead of re-reading `tail -30`, the follower remembers the inode and
+byte offset of every /root/.pm2/logs/portal-*.log file and only fetches
+the bytes appended since the last poll, over one SSH connection with a
+persistent SFTP session. Rotated or truncated files are detected by inode,
+size or a change in their first bytes (a copytruncate rotation can grow
+back past the saved offset between polls) and re-read from the start.
+
+Request lines written by log() in server/index.ts
+("10:15:30 AM [express] GET /api/schools 200 in 12ms :: {...}") are parsed
+into method, route, status and duration; per-route latency histograms are
+kept in the state file across runs.
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+import paramiko
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+HOST = '109.73.199.60'
+USERNAME = 'root'
+PASSWORD = 'eaACMy*w+5L+_w'
+
+LOG_GLOB = '/root/.pm2/logs/portal-*.log'
+STATE_PATH = Path(__file__).resolve().parent / 'log_follower_state.json'
+
+# First time a file is seen only its tail is read, like `tail`
+INITIAL_TAIL_BYTES = 64 * 1024
+MAX_READ_BYTES = 8 * 1024 * 1024
+# Kept with the offset to recognise the same file after a copytruncate
+HEAD_BYTES = 256
+
+# Histogram upper bounds in ms; the last bucket is open-ended
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+REQUEST_RE = re.compile(
+    r'\[(?P<source>[\w-]+)\] (?P<method>GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS) '
+    r'(?P<path>\S+) (?P<status>\d{3}) in (?P<duration>\d+)ms'
+)
+ID_SEGMENT_RE = re.compile(r'^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$', re.I)
+
+
+def normalize_route(path):
+    """Collapse ids and free-text segments so routes aggregate."""
+    segments = path.split('?')[0].split('/')
+    out = []
+    for i, seg in enumerate(segments):
+        if ID_SEGMENT_RE.match(seg):
+            out.append(':id')
+        elif i > 0 and segments[i - 1] == 'search' and seg:
+            out.append(':name')
+        else:
+            out.append(seg)
+    return '/'.join(out)
+
+
+def parse_request(line):
+    m = REQUEST_RE.search(line)
+    if not m:
+        return None
+    return {
+        'method': m.group('method'),
+        'path': m.group('path'),
+        'route': normalize_route(m.group('path')),
+        'status': int(m.group('status')),
+        'duration_ms': int(m.group('duration')),
+    }
+
+
+def load_state():
+    if STATE_PATH.exists():
+        return json.loads(STATE_PATH.read_text(encoding='utf-8'))
+    return {'files': {}, 'routes': {}}
+
+
+def save_state(state):
+    tmp = STATE_PATH.with_suffix('.tmp')
+    tmp.write_text(json.dumps(state, ensure_ascii=False), encoding='utf-8')
+    tmp.replace(STATE_PATH)
+
+
+def observe(state, record):
+    key = f"{record['method']} {record['route']}"
+    route = state['routes'].setdefault(key, {'count': 0, 'sum_ms': 0, 'buckets': [0] * (len(BUCKETS_MS) + 1), 'status': {}})
+    route['count'] += 1
+    route['sum_ms'] += record['duration_ms']
+    index = next((i for i, bound in enumerate(BUCKETS_MS) if record['duration_ms'] <= bound), len(BUCKETS_MS))
+    route['buckets'][index] += 1
+    status = str(record['status'])
+    route['status'][status] = route['status'].get(status, 0) + 1
+
+
+def bucket_percentile(buckets, pct):
+    total = sum(buckets)
+    if not total:
+        return 0
+    rank = total * pct / 100
+    seen = 0
+    for i, n in enumerate(buckets):
+        seen += n
+        if seen >= rank:
+            return BUCKETS_MS[i] if i < len(BUCKETS_MS) else float('inf')
+    return float('inf')
+
+
+def stat_logs(client):
+    """{path: (inode, size)} for every portal log file on the server."""
+    stdin, stdout, stderr = client.exec_command(f"stat -c '%i %s %n' {LOG_GLOB} 2>/dev/null", timeout=30)
+    stdout.channel.recv_exit_status()
+    files = {}
+    for line in stdout.read().decode('utf-8', errors='replace').splitlines():
+        inode, size, path = line.split(' ', 2)
+        files[path] = (int(inode), int(size))
+    return files
+
+
+def poll(client, sftp, state):
+    """Fetch new bytes from every log; return (new records, new error lines)."""
+    records, errors = [], []
+    for path, (inode, size) in sorted(stat_logs(client).items()):
+        known = state['files'].get(path)
+        with sftp.open(path, 'rb') as f:
+            head = f.read(min(size, HEAD_BYTES)).hex()
+            if known is None:
+                offset = max(0, size - INITIAL_TAIL_BYTES)
+                # Skip the partial first line of the initial tail
+                skip_line = offset > 0
+            elif known['inode'] != inode or size < known['offset'] or not head.startswith(known.get('head', '')):
+                offset, skip_line = 0, False  # rotated or truncated
+            else:
+                offset, skip_line = known['offset'], known.get('skip_line', False)
+
+            chunk = ''
+            if size > offset:
+                f.seek(offset)
+                data = f.read(min(size - offset, MAX_READ_BYTES))
+                newline = data.find(b'\n')
+                if skip_line and newline < 0:
+                    # Still inside the line being skipped
+                    offset += len(data)
+                elif newline < 0 and len(data) == MAX_READ_BYTES:
+                    # A line longer than a whole read: drop it instead of re-reading it forever
+                    offset += len(data)
+                    skip_line = True
+                else:
+                    start = newline + 1 if skip_line else 0
+                    # Only consume complete lines; the rest is re-read next time
+                    end = data.rfind(b'\n') + 1
+                    chunk = data[start:end].decode('utf-8', errors='replace')
+                    offset += end
+                    skip_line = False
+
+        is_error_log = '-error' in path
+        for line in chunk.splitlines():
+            if is_error_log:
+                if line.strip():
+                    errors.append(line)
+                continue
+            record = parse_request(line)
+            if record:
+                records.append(record)
+                observe(state, record)
+
+        state['files'][path] = {'inode': inode, 'offset': offset, 'head': head, 'skip_line': skip_line}
+    return records, errors
+
+
+def print_batch(records, errors):
+    if records:
+        slow = sorted(records, key=lambda r: r['duration_ms'], reverse=True)[:5]
+        failed = [r for r in records if r['status'] >= 500]
+        print(f"{time.strftime('%H:%M:%S')} {len(records)} requests, {len(failed)} 5xx, "
+              f"slowest {slow[0]['duration_ms']}ms {slow[0]['method']} {slow[0]['path']}")
+        for r in failed[:10]:
+            print(f"  5xx {r['status']} {r['method']} {r['path']} {r['duration_ms']}ms")
+    for line in errors[-20:]:
+        print(f"  ERR {line[:300]}")
+
+
+def print_report(state, top):
+    routes = sorted(state['routes'].items(), key=lambda kv: kv[1]['sum_ms'], reverse=True)[:top]
+    if not routes:
+        print("No requests recorded yet")
+        return
+    header = f"{'route':<48} {'count':>7} {'mean':>7} {'p50':>7} {'p90':>7} {'p99':>7} {'5xx':>5}"
+    print(header)
+    print('-' * len(header))
+    for key, r in routes:
+        errors_5xx = sum(n for status, n in r['status'].items() if status.startswith('5'))
+        fmt = lambda v: f'>{BUCKETS_MS[-1]}' if v == float('inf') else f"{v}ms"
+        print(f"{key[:48]:<48} {r['count']:>7} {r['sum_ms'] / r['count']:>5.0f}ms "
+              f"{fmt(bucket_percentile(r['buckets'], 50)):>7} {fmt(bucket_percentile(r['buckets'], 90)):>7} "
+              f"{fmt(bucket_percentile(r['buckets'], 99)):>7} {errors_5xx:>5}")
+    print("\n(percentiles are histogram bucket upper bounds)")
+
+
+def follow(interval, once):
+    state = load_state()
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+    try:
+        client.connect(HOST, username=USERNAME, password=PASSWORD, timeout=30)
+        sftp = client.open_sftp()
+        print("Connected!")
+        while True:
+            records, errors = poll(client, sftp, state)
+            save_state(state)
+            print_batch(records, errors)
+            if once:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        save_state(state)
+        client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Incremental pm2 log follower with per-route latency histograms")
+    parser.add_argument('--follow', action='store_true', help="keep polling instead of a single fetch")
+    parser.add_argument('--interval', type=float, default=5.0, help="seconds between polls with --follow")
+    parser.add_argument('--report', action='store_true', help="print per-route latency histograms and exit")
+    parser.add_argument('--top', type=int, default=25, help="routes shown by --report")
+    parser.add_argument('--reset', action='store_true', help="forget offsets and histograms")
+    args = parser.parse_args()
+
+    if args.reset and STATE_PATH.exists():
+        STATE_PATH.unlink()
+    if args.report:
+        print_report(load_state(), args.top)
+    else:
+        follow(args.interval, once=not args.follow)
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""
+Periodic runtime metrics for the portal host.
+
+`sample` keeps one SSH connection open and every --interval seconds
+collects pm2 worker CPU/memory/restarts (pm2 jlist), PostgreSQL connection
+counts (pg_stat_activity) and the nginx request rate (stub_status on
+127.0.0.1:8081, see setup_nginx_domain.py). Samples are written to a
+fixed-size ring buffer file, so the history never grows. While the host
+cannot be reached the sampler keeps reconnecting with backoff and records
+gap samples (no workers, no PostgreSQL), so outages show in the history.
+
+`view` prints sparklines for the recorded window and threshold alerts.
+"""
+import argparse
+import json
+import mmap
+import struct
+import sys
+import time
+from pathlib import Path
+
+import paramiko
+
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+HOST = '109.73.199.60'
+USERNAME = 'root'
+PASSWORD = 'eaACMy*w+5L+_w'
+
+RING_PATH = Path(__file__).resolve().parent / 'metrics_ring.bin'
+RING_CAPACITY = 8640  # 24h at 10s
+
+NGINX_STATUS_URL = 'http://127.0.0.1:8081/nginx_status'
+
+SAMPLE_CMD = (
+    "echo '@@pm2'; pm2 jlist 2>/dev/null; echo; "
+    "echo '@@pg'; sudo -u postgres psql -At -F ' ' -c "
+    "\"select count(*), current_setting('max_connections') from pg_stat_activity\" 2>/dev/null; "
+    f"echo '@@nginx'; curl -s {NGINX_STATUS_URL} 2>/dev/null"
+)
+
+# Alert thresholds
+MEMORY_WARN_FRACTION = 0.8   # of pm2 max_memory_restart
+PG_CONN_WARN_FRACTION = 0.8  # of max_connections
+CPU_WARN_PCT = 90.0
+
+RECONNECT_MAX_DELAY = 300.0
+
+# ts, cpu %, total MB, max worker MB, memory limit MB, restarts,
+# workers online, workers total, pg connections, pg max, nginx req/s, nginx active
+FIELDS = ('ts', 'cpu', 'mem_total', 'mem_worker_max', 'mem_limit', 'restarts',
+          'online', 'workers', 'pg_conn', 'pg_max', 'nginx_rps', 'nginx_active')
+RECORD = struct.Struct('<dffffIHHHHfH')
+HEADER = struct.Struct('<4sHHII')  # magic, version, record size, capacity, written
+MAGIC = b'PMRB'
+VERSION = 1
+
+
+class MetricsRing:
+    """Fixed-capacity ring of RECORD structs in a memory-mapped file."""
+
+    def __init__(self, path, capacity=RING_CAPACITY):
+        size = HEADER.size + capacity * RECORD.size
+        new = not path.exists()
+        if not new:
+            with open(path, 'rb') as f:
+                magic, version, rec_size, capacity_on_disk, _ = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or rec_size != RECORD.size:
+                raise ValueError(f"{path} is not a compatible metrics ring")
+            capacity = capacity_on_disk
+            size = HEADER.size + capacity * RECORD.size
+        self.capacity = capacity
+        self.file = open(path, 'a+b')
+        if new:
+            self.file.truncate(size)
+        self.map = mmap.mmap(self.file.fileno(), size)
+        if new:
+            HEADER.pack_into(self.map, 0, MAGIC, VERSION, RECORD.size, capacity, 0)
+
+    @property
+    def written(self):
+        return HEADER.unpack_from(self.map, 0)[4]
+
+    def append(self, values):
+        written = self.written
+        RECORD.pack_into(self.map, HEADER.size + (written % self.capacity) * RECORD.size, *values)
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, RECORD.size, self.capacity, written + 1)
+        self.map.flush()
+
+    def records(self):
+        """All stored samples, oldest first, as dicts."""
+        written = self.written
+        count = min(written, self.capacity)
+        start = written - count
+        rows = []
+        for i in range(start, written):
+            values = RECORD.unpack_from(self.map, HEADER.size + (i % self.capacity) * RECORD.size)
+            rows.append(dict(zip(FIELDS, values)))
+        return rows
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+
+def parse_sections(output):
+    sections, current = {}, None
+    for line in output.splitlines():
+        if line.startswith('@@'):
+            current = line[2:].strip()
+            sections[current] = []
+        elif current:
+            sections[current].append(line)
+    return {k: '\n'.join(v).strip() for k, v in sections.items()}
+
+
+def parse_sample(output, previous_requests, previous_ts, now):
+    sections = parse_sections(output)
+
+    try:
+        procs = [p for p in json.loads(sections.get('pm2') or '[]') if p.get('name') == 'portal']
+    except ValueError:
+        procs = []
+    mems = [p.get('monit', {}).get('memory', 0) / 1024 / 1024 for p in procs]
+    limits = [p.get('pm2_env', {}).get('max_memory_restart') or 0 for p in procs]
+    cpu = sum(p.get('monit', {}).get('cpu', 0) for p in procs)
+    restarts = sum(p.get('pm2_env', {}).get('restart_time', 0) for p in procs)
+    online = sum(1 for p in procs if p.get('pm2_env', {}).get('status') == 'online')
+    mem_limit = max(limits) / 1024 / 1024 if limits else 0
+
+    pg_conn = pg_max = 0
+    if sections.get('pg'):
+        parts = sections['pg'].split()
+        if len(parts) == 2:
+            pg_conn, pg_max = int(parts[0]), int(parts[1])
+
+    # stub_status: "Active connections: N" / "server accepts handled requests" / "A H R" / ...
+    requests = None
+    nginx_active = 0
+    nginx_lines = (sections.get('nginx') or '').splitlines()
+    if len(nginx_lines) >= 3 and nginx_lines[0].startswith('Active connections'):
+        nginx_active = int(nginx_lines[0].split(':')[1])
+        requests = int(nginx_lines[2].split()[2])
+    rps = 0.0
+    if requests is not None and previous_requests is not None and now > previous_ts:
+        rps = max(0, requests - previous_requests) / (now - previous_ts)
+
+    values = (now, cpu, sum(mems), max(mems, default=0), mem_limit, restarts,
+              online, len(procs), pg_conn, pg_max, rps, nginx_active)
+    return values, requests
+
+
+def gap_values(now):
+    return (now,) + (0,) * (len(FIELDS) - 1)
+
+
+def is_gap(row):
+    return row['workers'] == 0 and row['pg_max'] == 0
+
+
+def check_alerts(rows):
+    if not rows:
+        return []
+    alerts = []
+    gaps = sum(1 for r in rows if is_gap(r))
+    if is_gap(rows[-1]):
+        alerts.append("host unreachable at the last sample")
+    elif gaps:
+        alerts.append(f"{gaps} samples missed while the host was unreachable")
+    rows = [r for r in rows if not is_gap(r)]
+    if not rows:
+        return alerts
+    last = rows[-1]
+    if last['mem_limit'] and last['mem_worker_max'] > last['mem_limit'] * MEMORY_WARN_FRACTION:
+        alerts.append(f"worker memory {last['mem_worker_max']:.0f} MB is above "
+                      f"{MEMORY_WARN_FRACTION:.0%} of the {last['mem_limit']:.0f} MB restart limit")
+    if len(rows) > 1 and last['restarts'] > rows[0]['restarts']:
+        alerts.append(f"{last['restarts'] - rows[0]['restarts']} pm2 restarts in this window")
+    if last['online'] < last['workers']:
+        alerts.append(f"only {last['online']}/{last['workers']} workers online")
+    if last['pg_max'] and last['pg_conn'] > last['pg_max'] * PG_CONN_WARN_FRACTION:
+        alerts.append(f"PostgreSQL connections {last['pg_conn']}/{last['pg_max']}")
+    recent = rows[-5:]
+    if len(recent) == 5 and sum(r['cpu'] for r in recent) / 5 > CPU_WARN_PCT * max(1, last['workers']):
+        alerts.append("sustained CPU saturation over the last 5 samples")
+    return alerts
+
+
+def connect():
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(HOST, username=USERNAME, password=PASSWORD, timeout=30)
+    return client
+
+
+def reconnect(client, ring, interval):
+    """Reconnect with backoff, recording a gap sample for every failed attempt."""
+    client.close()
+    delay = interval
+    while True:
+        ring.append(gap_values(time.time()))
+        try:
+            client = connect()
+            print("  reconnected")
+            return client
+        except (paramiko.SSHException, OSError) as e:
+            print(f"  reconnect failed ({e}), retrying in {delay:.0f}s...")
+            time.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+
+def sample(interval, count=None):
+    ring = MetricsRing(RING_PATH)
+    client = paramiko.SSHClient()
+    previous_requests, previous_ts = None, 0.0
+    taken = 0
+
+    try:
+        client = connect()
+        print(f"Connected! Sampling every {interval}s into {RING_PATH.name} (Ctrl+C to stop)")
+        while count is None or taken < count:
+            started = time.time()
+            try:
+                stdin, stdout, stderr = client.exec_command(SAMPLE_CMD, timeout=30)
+                stdout.channel.recv_exit_status()
+                output = stdout.read().decode('utf-8', errors='replace')
+            except (paramiko.SSHException, OSError) as e:
+                print(f"  sample failed ({e}), reconnecting...")
+                client = reconnect(client, ring, interval)
+                # The nginx counter delta would span the outage
+                previous_requests = None
+                taken += 1
+                continue
+
+            values, previous_requests = parse_sample(output, previous_requests, previous_ts, started)
+            previous_ts = started
+            ring.append(values)
+            taken += 1
+
+            row = dict(zip(FIELDS, values))
+            print(f"{time.strftime('%H:%M:%S')} cpu {row['cpu']:5.1f}%  mem {row['mem_total']:6.0f} MB "
+                  f"(max worker {row['mem_worker_max']:.0f}/{row['mem_limit']:.0f})  "
+                  f"restarts {row['restarts']}  pg {row['pg_conn']}/{row['pg_max']}  "
+                  f"nginx {row['nginx_rps']:.1f} req/s")
+            for alert in check_alerts(ring.records()[-60:]):
+                print(f"  ! {alert}")
+
+            time.sleep(max(0.0, interval - (time.time() - started)))
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        client.close()
+        ring.close()
+
+
+SPARKS = '▁▂▃▄▅▆▇█'
+
+
+def sparkline(values, width):
+    if not values:
+        return ''
+    # Downsample by taking the max of each bucket so spikes stay visible
+    if len(values) > width:
+        step = len(values) / width
+        values = [max(values[int(i * step):int((i + 1) * step)] or [0]) for i in range(width)]
+    lo, hi = min(values), max(values)
+    span = hi - lo or 1
+    return ''.join(SPARKS[int((v - lo) / span * (len(SPARKS) - 1))] for v in values)
+
+
+def view(last, width):
+    if not RING_PATH.exists():
+        print(f"No samples yet ({RING_PATH.name}), run: python metrics_sampler.py sample")
+        return
+    ring = MetricsRing(RING_PATH)
+    rows = ring.records()[-last:]
+    ring.close()
+    if not rows:
+        print("Ring buffer is empty")
+        return
+
+    span = rows[-1]['ts'] - rows[0]['ts']
+    print(f"{len(rows)} samples over {span / 60:.0f} min "
+          f"({time.strftime('%Y-%m-%d %H:%M', time.localtime(rows[0]['ts']))} .. "
+          f"{time.strftime('%H:%M', time.localtime(rows[-1]['ts']))})\n")
+
+    series = [
+        ('CPU %', 'cpu', '{:.0f}'),
+        ('memory MB', 'mem_total', '{:.0f}'),
+        ('max worker MB', 'mem_worker_max', '{:.0f}'),
+        ('pm2 restarts', 'restarts', '{:.0f}'),
+        ('pg connections', 'pg_conn', '{:.0f}'),
+        ('nginx req/s', 'nginx_rps', '{:.1f}'),
+        ('nginx active', 'nginx_active', '{:.0f}'),
+    ]
+    for label, key, fmt in series:
+        values = [r[key] for r in rows]
+        print(f"{label:<15} {sparkline(values, width)}  "
+              f"now {fmt.format(values[-1])}  min {fmt.format(min(values))}  max {fmt.format(max(values))}")
+
+    alerts = check_alerts(rows)
+    print()
+    if alerts:
+        for alert in alerts:
+            print(f"! {alert}")
+    else:
+        print("No alerts.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Runtime metrics sampler for pm2, PostgreSQL and nginx")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_sample = sub.add_parser('sample', help="collect samples over one SSH connection")
+    p_sample.add_argument('--interval', type=float, default=10.0, help="seconds between samples")
+    p_sample.add_argument('--count', type=int, help="stop after N samples")
+    p_view = sub.add_parser('view', help="sparklines and alerts from the ring buffer")
+    p_view.add_argument('--last', type=int, default=360, help="number of most recent samples")
+    p_view.add_argument('--width', type=int, default=60, help="sparkline width")
+    args = parser.parse_args()
+
+    if args.command == 'sample':
+        sample(args.interval, args.count)
+    else:
+        view(args.last, args.width)
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Rank the portal's SQL by database time from pg_stat_statements.
+
+`report` snapshots pg_stat_statements, waits --window seconds (or uses a
+snapshot saved earlier with `snapshot`), snapshots again and diffs the two.
+Statements are grouped by a normalized fingerprint: literals and parameters
+become ?, and IN lists collapse to (...), so one query built with a varying
+number of ids counts once. Groups are ranked by total time, mean time, rows
+or calls. For the top offenders it prints a plan: one sampled by
+auto_explain from the PostgreSQL log when there is one, otherwise
+EXPLAIN (GENERIC_PLAN) on PostgreSQL 16+.
+
+Both extensions are enabled by setup_postgres.py.
+"""
+import argparse
+import io
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+import paramiko
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+HOST = '109.73.199.60'
+USERNAME = 'root'
+PASSWORD = 'eaACMy*w+5L+_w'
+
+DB_NAME = 'neurotrainer'
+PSQL = f'sudo -u postgres psql -d {DB_NAME} -At -v ON_ERROR_STOP=1'
+
+SNAPSHOT_SQL = """
+SELECT coalesce(json_agg(row_to_json(s)), '[]')
+FROM (
+    SELECT queryid::text AS queryid, query, calls, total_exec_time, rows,
+           shared_blks_hit, shared_blks_read
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+) s
+"""
+
+# auto_explain entries: header line with the duration, JSON plan on the following lines
+PLAN_LOG_CMD = (
+    "tail -c 50000000 \"$(ls -t /var/log/postgresql/postgresql-*-main.log | head -1)\" | "
+    "awk '/duration: [0-9.]+ ms  plan:/ {p=1; print \"@@\" $0; next} "
+    "/^[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] / {p=0} p {print}'"
+)
+DURATION_RE = re.compile(r'duration: ([\d.]+) ms')
+
+SORT_KEYS = {
+    'total': lambda g: g['total_ms'],
+    'mean': lambda g: g['total_ms'] / g['calls'] if g['calls'] else 0,
+    'rows': lambda g: g['rows'],
+    'calls': lambda g: g['calls'],
+}
+
+
+def psql(client, sql, timeout=60):
+    stdin, stdout, stderr = client.exec_command(PSQL, timeout=timeout)
+    stdin.write(sql)
+    stdin.channel.shutdown_write()
+    exit_status = stdout.channel.recv_exit_status()
+    output = stdout.read().decode('utf-8', errors='replace')
+    if exit_status != 0:
+        raise RuntimeError(stderr.read().decode('utf-8', errors='replace').strip())
+    return output
+
+
+def take_snapshot(client):
+    rows = json.loads(psql(client, SNAPSHOT_SQL))
+    return {'ts': time.time(), 'statements': {r['queryid']: r for r in rows}}
+
+
+def fingerprint(query):
+    """Normalized statement text for grouping and for matching logged plans."""
+    text = query.lower()
+    text = re.sub(r"'(?:[^']|'')*'", '?', text)
+    text = re.sub(r'\$\d+', '?', text)
+    text = re.sub(r'\b\d+(?:\.\d+)?\b', '?', text)
+    text = re.sub(r'\s+', ' ', text).strip().rstrip(';')
+    text = re.sub(r'\bin \(\s*\?(?:\s*,\s*\?)*\s*\)', 'in (...)', text)
+    return text
+
+
+def diff(before, after):
+    """Per-fingerprint deltas between two snapshots."""
+    groups = {}
+    for queryid, cur in after['statements'].items():
+        prev = before['statements'].get(queryid)
+        # Missing, or pg_stat_statements was reset / evicted the entry in between
+        if prev is None or cur['calls'] < prev['calls']:
+            prev = {'calls': 0, 'total_exec_time': 0.0, 'rows': 0, 'shared_blks_hit': 0, 'shared_blks_read': 0}
+        calls = cur['calls'] - prev['calls']
+        if calls <= 0:
+            continue
+        key = fingerprint(cur['query'])
+        group = groups.setdefault(key, {
+            'fingerprint': key, 'query': cur['query'], 'variants': 0,
+            'calls': 0, 'total_ms': 0.0, 'rows': 0, 'hit': 0, 'read': 0,
+        })
+        group['variants'] += 1
+        group['calls'] += calls
+        group['total_ms'] += cur['total_exec_time'] - prev['total_exec_time']
+        group['rows'] += cur['rows'] - prev['rows']
+        group['hit'] += cur['shared_blks_hit'] - prev['shared_blks_hit']
+        group['read'] += cur['shared_blks_read'] - prev['shared_blks_read']
+    return list(groups.values())
+
+
+def print_ranking(groups, sort, top, window_s):
+    total_ms = sum(g['total_ms'] for g in groups) or 1.0
+    print(f"\n{len(groups)} statements over {window_s:.0f}s, {total_ms / 1000:.2f}s of database time, "
+          f"ranked by {sort}\n")
+    print(f"{'#':>3} {'calls':>8} {'total ms':>10} {'%':>5} {'mean ms':>9} {'rows/call':>9} {'hit %':>6}  query")
+    for i, g in enumerate(groups[:top], 1):
+        mean = g['total_ms'] / g['calls']
+        blocks = g['hit'] + g['read']
+        hit = f"{100 * g['hit'] / blocks:.0f}" if blocks else '-'
+        variants = f" [{g['variants']} variants]" if g['variants'] > 1 else ''
+        print(f"{i:>3} {g['calls']:>8} {g['total_ms']:>10.1f} {100 * g['total_ms'] / total_ms:>5.1f} "
+              f"{mean:>9.2f} {g['rows'] / g['calls']:>9.1f} {hit:>6}  {g['fingerprint'][:90]}{variants}")
+
+
+def logged_plans(client):
+    """fingerprint -> (duration ms, plan JSON) of the slowest sampled run."""
+    stdin, stdout, stderr = client.exec_command(PLAN_LOG_CMD, timeout=120)
+    stdout.channel.recv_exit_status()
+    text = stdout.read().decode('utf-8', errors='replace')
+    decoder = json.JSONDecoder()
+    plans = {}
+    for entry in text.split('@@')[1:]:
+        header, _, body = entry.partition('\n')
+        m = DURATION_RE.search(header)
+        start = body.find('{')
+        if not m or start < 0:
+            continue
+        try:
+            plan, _ = decoder.raw_decode(body[start:])
+        except ValueError:
+            continue
+        key = fingerprint(plan.get('Query Text', ''))
+        duration = float(m.group(1))
+        if key not in plans or plans[key][0] < duration:
+            plans[key] = (duration, plan)
+    return plans
+
+
+def print_plan_node(node, depth=0):
+    relation = f" on {node['Relation Name']}" if 'Relation Name' in node else ''
+    index = f" using {node['Index Name']}" if 'Index Name' in node else ''
+    actual = f" actual rows={node['Actual Rows']} loops={node.get('Actual Loops', 1)}" if 'Actual Rows' in node else ''
+    buffers = ''
+    if 'Shared Hit Blocks' in node:
+        buffers = f" hit={node['Shared Hit Blocks']} read={node.get('Shared Read Blocks', 0)}"
+    print(f"    {'  ' * depth}-> {node['Node Type']}{relation}{index} (est rows={node.get('Plan Rows')}{actual}{buffers})")
+    for child in node.get('Plans', []):
+        print_plan_node(child, depth + 1)
+
+
+def print_plans(client, groups, count):
+    plans = logged_plans(client)
+    version = int(psql(client, "SHOW server_version_num").strip())
+    for i, g in enumerate(groups[:count], 1):
+        print(f"\n>>> #{i} {g['fingerprint'][:120]}")
+        sampled = plans.get(g['fingerprint'])
+        if sampled:
+            duration, plan = sampled
+            print(f"  sampled by auto_explain, {duration:.1f} ms")
+            print_plan_node(plan['Plan'])
+        elif version >= 160000 and re.match(r'\s*(select|with|update|delete|insert)\b', g['query'], re.I):
+            try:
+                print("  no sampled plan, generic plan:")
+                output = psql(client, f"EXPLAIN (GENERIC_PLAN) {g['query']}")
+                print('\n'.join(f"    {line}" for line in output.splitlines()))
+            except RuntimeError as e:
+                print(f"  EXPLAIN failed: {e}")
+        else:
+            print("  no sampled plan (below auto_explain.log_min_duration)")
+
+
+def connect():
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(HOST, username=USERNAME, password=PASSWORD, timeout=30)
+    return client
+
+
+def report(window, since, sort, top, plans):
+    client = connect()
+    try:
+        if since:
+            before = json.loads(Path(since).read_text(encoding='utf-8'))
+            print(f"Baseline: {since} ({time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(before['ts']))})")
+        else:
+            before = take_snapshot(client)
+            print(f"Snapshot taken, waiting {window}s...")
+            time.sleep(window)
+        after = take_snapshot(client)
+        groups = diff(before, after)
+        groups.sort(key=SORT_KEYS[sort], reverse=True)
+        print_ranking(groups, sort, top, after['ts'] - before['ts'])
+        if plans:
+            print_plans(client, groups, plans)
+    finally:
+        client.close()
+
+
+def snapshot(output):
+    client = connect()
+    try:
+        snap = take_snapshot(client)
+    finally:
+        client.close()
+    Path(output).write_text(json.dumps(snap), encoding='utf-8')
+    print(f"{len(snap['statements'])} statements saved to {output}")
+
+
+def reset():
+    client = connect()
+    try:
+        psql(client, "SELECT pg_stat_statements_reset()")
+        print("pg_stat_statements reset")
+    finally:
+        client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Slow query report from pg_stat_statements and auto_explain")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_report = sub.add_parser('report', help="diff two snapshots and rank statements")
+    p_report.add_argument('--window', type=int, default=300, help="seconds between the snapshots")
+    p_report.add_argument('--since', help="use a snapshot file from `snapshot` as the baseline")
+    p_report.add_argument('--sort', choices=sorted(SORT_KEYS), default='total')
+    p_report.add_argument('--top', type=int, default=20, help="statements shown")
+    p_report.add_argument('--plans', type=int, default=5, help="plans printed for the top N (0 to skip)")
+    p_snapshot = sub.add_parser('snapshot', help="save a baseline snapshot")
+    p_snapshot.add_argument('-o', '--output', default='pg_stat_snapshot.json')
+    sub.add_parser('reset', help="call pg_stat_statements_reset()")
+    args = parser.parse_args()
+
+    if args.command == 'report':
+        report(args.window, args.since, args.sort, args.top, args.plans)
+    elif args.command == 'snapshot':
+        snapshot(args.output)
+    else:
+        reset()
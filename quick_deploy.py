@@ -2,6 +2,8 @@ import paramiko
 import sys
 import io
 
+from deploy_log import DeployLog
+
 # Force UTF-8 output
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
@@ -10,6 +12,7 @@ def deploy():
     user = "root"
     password = "eaACMy*w+5L+_w"
     
+    log = DeployLog('quick_deploy', host)
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     
@@ -19,30 +22,30 @@ def deploy():
         print("Connected!")
         
         commands = [
-            "cd /var/www/portal/ScreenCreator && git fetch origin master",
-            "cd /var/www/portal/ScreenCreator && git reset --hard origin/master",
-            "cd /var/www/portal/ScreenCreator && npm run build",
-            "pm2 restart portal"
+            ("git fetch", "cd /var/www/portal/ScreenCreator && git fetch origin master"),
+            ("git reset", "cd /var/www/portal/ScreenCreator && git reset --hard origin/master"),
+            ("npm run build", "cd /var/www/portal/ScreenCreator && npm run build"),
+            ("pm2 restart", "pm2 restart portal")
         ]
         
-        for cmd in commands:
+        for step, cmd in commands:
             print(f"\n>>> Executing: {cmd}")
-            stdin, stdout, stderr = client.exec_command(cmd)
-            exit_status = stdout.channel.recv_exit_status()
-            out = stdout.read().decode('utf-8', 'ignore')
-            err = stderr.read().decode('utf-8', 'ignore')
+            exit_status, out, err = log.exec(client, step, cmd, timeout=600)
             if out: print(out)
             if err: print(f"STDERR: {err}")
             
             if exit_status != 0:
                 print("Command failed!")
+                log.finish(False)
                 return False
                 
         print("\n=== DEPLOY SUCCESS ===")
+        log.finish(True)
         return True
 
     except Exception as e:
         print(f"Error: {e}")
+        log.finish(False)
         return False
     finally:
         client.close()
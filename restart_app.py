@@ -2,6 +2,9 @@
 import paramiko
 import sys
 import io
+import time
+
+from deploy_log import DeployLog
 
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
@@ -10,6 +13,7 @@ USERNAME = 'root'
 PASSWORD = 'eaACMy*w+5L+_w'
 
 def restart_app():
+    log = DeployLog('restart_app', HOST)
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     
@@ -19,40 +23,31 @@ def restart_app():
         
         # Stop current PM2 process
         print("\n>>> Stopping current PM2 process")
-        stdin, stdout, stderr = client.exec_command('pm2 delete portal 2>/dev/null || true', timeout=30)
-        stdout.channel.recv_exit_status()
+        log.exec(client, 'pm2 delete', 'pm2 delete portal 2>/dev/null || true', timeout=30)
         
         # Install tsx globally
         print("\n>>> Installing tsx globally")
-        stdin, stdout, stderr = client.exec_command('npm install -g tsx', timeout=120)
-        exit_status = stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        exit_status, output, _ = log.exec(client, 'npm install -g tsx', 'npm install -g tsx', timeout=120)
         print(output[-500:] if output else "Done")
         
         # Start with PM2 using npx tsx
         print("\n>>> Starting app with PM2")
-        stdin, stdout, stderr = client.exec_command(
+        exit_status, output, error = log.exec(
+            client, 'pm2 start',
             'cd /var/www/portal/ScreenCreator && pm2 start "npx tsx server/index.ts" --name portal',
             timeout=60
         )
-        exit_status = stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
-        error = stderr.read().decode('utf-8', errors='replace')
         print(output or error or "Started")
         
         # Save PM2 config
         print("\n>>> Saving PM2 config")
-        stdin, stdout, stderr = client.exec_command('pm2 save', timeout=30)
-        stdout.channel.recv_exit_status()
+        log.exec(client, 'pm2 save', 'pm2 save', timeout=30)
         
         # Check status
         print("\n>>> Checking status...")
-        import time
         time.sleep(3)
         
-        stdin, stdout, stderr = client.exec_command('pm2 jlist', timeout=30)
-        stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        _, output, _ = log.exec(client, 'pm2 jlist', 'pm2 jlist', timeout=30)
         if '"status":"online"' in output:
             print("Status: ONLINE!")
         else:
@@ -65,9 +60,11 @@ def restart_app():
         print(f"Port 5001: {output}")
         
         print("\n=== App restarted! ===")
+        log.finish(True)
         
     except Exception as e:
         print(f"Error: {e}")
+        log.finish(False)
     finally:
         client.close()
 
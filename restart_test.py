@@ -2,7 +2,8 @@
 import paramiko
 import sys
 import io
-import time
+
+from deploy_log import DeployLog
 
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
@@ -10,9 +11,17 @@ HOST = '109.73.199.60'
 USERNAME = 'root'
 PASSWORD = 'eaACMy*w+5L+_w'
 
+READINESS_CMD = (
+    'for i in $(seq 1 60); do '
+    'curl -sf -o /dev/null http://localhost:5001/ && exit 0; sleep 1; '
+    'done; exit 1'
+)
+
 def restart_and_test():
+    log = DeployLog('restart_test', HOST)
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    ok = False
     
     try:
         client.connect(HOST, username=USERNAME, password=PASSWORD, timeout=60)
@@ -20,27 +29,24 @@ def restart_and_test():
         
         # Restart PM2
         print("\n>>> Restarting PM2...")
-        stdin, stdout, stderr = client.exec_command('pm2 restart portal', timeout=60)
-        stdout.channel.recv_exit_status()
+        log.exec(client, 'pm2 restart', 'pm2 restart portal', timeout=60)
         print("  Restarted")
         
-        # Wait for Vite to start
-        print("\n>>> Waiting 20 seconds for Vite to initialize...")
-        time.sleep(20)
+        # Wait for the app to answer (timed, instead of a fixed 20s sleep)
+        print("\n>>> Waiting for the app to answer...")
+        exit_status, _, _ = log.exec(client, 'readiness', READINESS_CMD, timeout=90)
+        print("  Ready" if exit_status == 0 else "  Not ready after 60s")
         
         # Check port
         print("\n>>> Checking port 5001...")
-        stdin, stdout, stderr = client.exec_command('ss -tlnp | grep 5001 || echo "Port not listening"', timeout=30)
-        stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        _, output, _ = log.exec(client, 'check port', 'ss -tlnp | grep 5001 || echo "Port not listening"', timeout=30)
         print(f"  {output}")
         
         # Test HTTP
         print("\n>>> Testing HTTP...")
-        stdin, stdout, stderr = client.exec_command('curl -s -o /dev/null -w "%{http_code}" http://localhost:5001/ 2>/dev/null', timeout=15)
-        stdout.channel.recv_exit_status()
-        output = stdout.read().decode('utf-8', errors='replace')
+        _, output, _ = log.exec(client, 'check http', 'curl -s -o /dev/null -w "%{http_code}" http://localhost:5001/ 2>/dev/null', timeout=15)
         print(f"  HTTP Response: {output}")
+        ok = output.strip() == '200'
         
         # Check PM2 status
         print("\n>>> PM2 Status:")
@@ -69,6 +75,8 @@ def restart_and_test():
     except Exception as e:
         print(f"Error: {e}")
     finally:
+        # One `total` event per run; the diagnostics after the HTTP check don't change it
+        log.finish(ok)
         client.close()
 
 if __name__ == '__main__':
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Install scripts/archive_chat_logs.py on the server and run it nightly from cron.
+
+The archiver moves chat_logs and chat_messages rows older than the cutoff
+into gzipped JSONL files under /var/www/portal/archives/chat, so the live
+tables (and the chat log view) stay small.
+"""
+import argparse
+import io
+import sys
+from pathlib import Path
+
+import paramiko
+
+from deploy_log import DeployLog
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+HOST = '109.73.199.60'
+USERNAME = 'root'
+PASSWORD = 'eaACMy*w+5L+_w'
+
+LOCAL_SCRIPT = Path(__file__).resolve().parent / 'ScreenCreator' / 'scripts' / 'archive_chat_logs.py'
+REMOTE_BIN = '/var/www/portal/bin'
+REMOTE_SCRIPT = f'{REMOTE_BIN}/archive_chat_logs.py'
+ARCHIVE_DIR = '/var/www/portal/archives/chat'
+CRON_FILE = '/etc/cron.d/portal-chat-archive'
+LOG_FILE = '/var/log/portal-chat-archive.log'
+
+
+def setup(days, hour):
+    log = DeployLog('setup_chat_archive_cron', HOST)
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+    try:
+        client.connect(HOST, username=USERNAME, password=PASSWORD, timeout=30)
+        print("Connected!")
+
+        print("\n>>> Installing python3-psycopg2...")
+        exit_status, _, error = log.exec(client, 'apt install', 'apt-get install -y python3-psycopg2', timeout=300)
+        if exit_status != 0:
+            print(f"ERROR: {error[-500:]}")
+            log.finish(False)
+            return
+
+        print(f"\n>>> Uploading {REMOTE_SCRIPT}...")
+        log.exec(client, 'mkdir', f'mkdir -p {REMOTE_BIN} {ARCHIVE_DIR} && chmod 700 {ARCHIVE_DIR}')
+        with log.step('upload', host=HOST):
+            sftp = client.open_sftp()
+            sftp.put(str(LOCAL_SCRIPT), REMOTE_SCRIPT)
+            sftp.chmod(REMOTE_SCRIPT, 0o755)
+            sftp.close()
+
+        print(f"\n>>> Dry run (rows older than {days} days)...")
+        exit_status, output, error = log.exec(
+            client, 'dry run', f'python3 {REMOTE_SCRIPT} --older-than-days {days} --dry-run', timeout=600)
+        print(output[-1500:] or error[-1500:])
+        if exit_status != 0:
+            print("ERROR: dry run failed, cron not installed (did the chat_summaries migration run?)")
+            log.finish(False)
+            return
+
+        print(f"\n>>> Writing {CRON_FILE} (daily at {hour:02d}:30)...")
+        cron = (
+            f"30 {hour} * * * root python3 {REMOTE_SCRIPT} --older-than-days {days} >> {LOG_FILE} 2>&1\n"
+        )
+        log.exec(client, 'write cron', f'cat > {CRON_FILE} && chmod 644 {CRON_FILE}', stdin_data=cron)
+        log.finish(True)
+
+    except Exception as e:
+        print(f"Error: {e}")
+        log.finish(False)
+    finally:
+        client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Install the nightly chat archive cron job")
+    parser.add_argument('--days', type=int, default=180, help="archive rows older than this many days")
+    parser.add_argument('--hour', type=int, default=3, help="hour of the nightly run (server time)")
+    args = parser.parse_args()
+    setup(args.days, args.hour)
@@ -3,26 +3,108 @@ import paramiko
 import sys
 import io
 
+from sync_assets import ASSET_DIRS
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 HOST = '109.73.199.60'
 USERNAME = 'root'
 PASSWORD = 'eaACMy*w+5L+_w'
 
-NGINX_CONFIG = '''server {
+NGINX_CONFIG = '''# Parsed by scripts/aggregate_page_views.py
+log_format portal_timed '$remote_addr [$time_local] "$request" $status $body_bytes_sent '
+                        '$request_time "$upstream_response_time" "$http_user_agent"';
+
+upstream portal_app {
+    server 127.0.0.1:5001;
+    # Reuse connections to Node instead of opening one per request
+    keepalive 32;
+}
+
+server {
     listen 80;
     server_name neurotrainer.life www.neurotrainer.life;
 
+    # Built client of the active release (deploy_bundle.py); the media
+    # directories inside it are symlinks to the synced asset store
+    root /var/www/portal/current/dist/public;
+
+    sendfile on;
+    tcp_nopush on;
+    open_file_cache max=2000 inactive=60s;
+    open_file_cache_valid 30s;
+    open_file_cache_min_uses 1;
+    open_file_cache_errors on;
+
+    access_log /var/log/nginx/neurotrainer.access.log portal_timed;
+
+    # .gz/.br sidecars written by scripts/precompress.py at deploy time
+    gzip_static on;
+    gzip_vary on;
+    __BROTLI_STATIC__
+
+    # Page-view beacon: answered here, counted from the access log
+    location = /api/view {
+        return 204;
+    }
+
+    location /api/ {
+        proxy_pass http://portal_app;
+        proxy_http_version 1.1;
+        proxy_set_header Connection '';
+        proxy_set_header Host $host;
+        proxy_set_header X-Real-IP $remote_addr;
+        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
+        proxy_set_header X-Forwarded-Proto $scheme;
+    }
+
+    # Vite output, file names carry a content hash
+    location /assets/ {
+        try_files $uri =404;
+        add_header Cache-Control "public, max-age=31536000, immutable";
+        access_log off;
+    }
+
+    # Content-hashed copies from scripts/publish_assets.py
+    location ^~ /media/ {
+        try_files $uri =404;
+        add_header Cache-Control "public, max-age=31536000, immutable";
+        access_log off;
+    }
+
+    # Media keep stable names, so browsers revalidate with ETag / Last-Modified
+    location ~ ^/(__ASSET_DIRS__)/ {
+        try_files $uri =404;
+        etag on;
+        add_header Cache-Control "public, max-age=3600, must-revalidate";
+        access_log off;
+    }
+
+    # Other files from public/ (favicon, logo, backgrounds), SPA routes to Node
     location / {
-        proxy_pass http://127.0.0.1:5001;
+        try_files $uri @app;
+        add_header Cache-Control "public, max-age=3600, must-revalidate";
+    }
+
+    location @app {
+        proxy_pass http://portal_app;
         proxy_http_version 1.1;
-        proxy_set_header Upgrade $http_upgrade;
-        proxy_set_header Connection 'upgrade';
+        proxy_set_header Connection '';
         proxy_set_header Host $host;
         proxy_set_header X-Real-IP $remote_addr;
         proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;
         proxy_set_header X-Forwarded-Proto $scheme;
-        proxy_cache_bypass $http_upgrade;
+    }
+}
+
+# Local-only counters for metrics_sampler.py
+server {
+    listen 127.0.0.1:8081;
+
+    location = /nginx_status {
+        stub_status;
+        allow 127.0.0.1;
+        deny all;
     }
 }
 '''
@@ -37,7 +119,20 @@ def setup_nginx_config():
         
         # Create nginx config
         print("\n>>> Creating nginx config for neurotrainer.life")
-        config_escaped = NGINX_CONFIG.replace("'", "'\\''")
+        # brotli_static needs the dynamic module, otherwise nginx -t fails
+        print(">>> Installing brotli_static module")
+        stdin, stdout, stderr = client.exec_command(
+            'apt-get install -y libnginx-mod-http-brotli-static >/dev/null 2>&1; '
+            'ls /etc/nginx/modules-enabled/ | grep -q brotli-static && echo yes || echo no',
+            timeout=300
+        )
+        stdout.channel.recv_exit_status()
+        has_brotli = stdout.read().decode('utf-8', errors='replace').strip() == 'yes'
+        print(f"  brotli_static: {'enabled' if has_brotli else 'module not available, gzip only'}")
+
+        config = NGINX_CONFIG.replace('__ASSET_DIRS__', '|'.join(ASSET_DIRS))
+        config = config.replace('__BROTLI_STATIC__', 'brotli_static on;' if has_brotli else '# brotli_static: module not installed')
+        config_escaped = config.replace("'", "'\\''")
         cmd = f"echo '{config_escaped}' > /etc/nginx/sites-available/neurotrainer.life"
         stdin, stdout, stderr = client.exec_command(cmd, timeout=30)
         stdout.channel.recv_exit_status()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Install scripts/aggregate_page_views.py on the server and run it from cron.
+
+The aggregator folds the nginx access log (portal_timed format, see
+setup_nginx_domain.py) into page_views every few minutes.
+"""
+import argparse
+import io
+import sys
+from pathlib import Path
+
+import paramiko
+
+from deploy_log import DeployLog
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+HOST = '109.73.199.60'
+USERNAME = 'root'
+PASSWORD = 'eaACMy*w+5L+_w'
+
+LOCAL_SCRIPT = Path(__file__).resolve().parent / 'ScreenCreator' / 'scripts' / 'aggregate_page_views.py'
+REMOTE_BIN = '/var/www/portal/bin'
+REMOTE_SCRIPT = f'{REMOTE_BIN}/aggregate_page_views.py'
+CRON_FILE = '/etc/cron.d/portal-page-views'
+LOG_FILE = '/var/log/portal-page-views.log'
+
+
+def setup(interval_minutes):
+    log = DeployLog('setup_page_views_cron', HOST)
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+    try:
+        client.connect(HOST, username=USERNAME, password=PASSWORD, timeout=30)
+        print("Connected!")
+
+        print("\n>>> Installing python3-psycopg2...")
+        exit_status, _, error = log.exec(client, 'apt install', 'apt-get install -y python3-psycopg2', timeout=300)
+        if exit_status != 0:
+            print(f"ERROR: {error[-500:]}")
+            log.finish(False)
+            return
+
+        print(f"\n>>> Uploading {REMOTE_SCRIPT}...")
+        log.exec(client, 'mkdir', f'mkdir -p {REMOTE_BIN}')
+        with log.step('upload', host=HOST):
+            sftp = client.open_sftp()
+            sftp.put(str(LOCAL_SCRIPT), REMOTE_SCRIPT)
+            sftp.chmod(REMOTE_SCRIPT, 0o755)
+            sftp.close()
+
+        print("\n>>> Dry run against the current access log...")
+        exit_status, output, error = log.exec(client, 'dry run', f'python3 {REMOTE_SCRIPT} --dry-run', timeout=300)
+        print(output[-1500:] or error[-1500:])
+        if exit_status != 0:
+            print("ERROR: dry run failed, cron not installed (did the page_views migration run?)")
+            log.finish(False)
+            return
+
+        print(f"\n>>> Writing {CRON_FILE} (every {interval_minutes} min)...")
+        cron = (
+            f"*/{interval_minutes} * * * * root python3 {REMOTE_SCRIPT} >> {LOG_FILE} 2>&1\n"
+        )
+        log.exec(client, 'write cron', f'cat > {CRON_FILE} && chmod 644 {CRON_FILE}', stdin_data=cron)
+
+        print("\n>>> First aggregation...")
+        exit_status, output, error = log.exec(client, 'aggregate', f'python3 {REMOTE_SCRIPT}', timeout=300)
+        print(output or error)
+        log.finish(exit_status == 0)
+
+    except Exception as e:
+        print(f"Error: {e}")
+        log.finish(False)
+    finally:
+        client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Install the page_views access-log aggregator cron job")
+    parser.add_argument('--interval', type=int, default=5, help="minutes between runs")
+    args = parser.parse_args()
+    setup(args.interval)
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+Delta-sync the media tree in ScreenCreator/client/public to the server.
+
+A sha256 manifest of the local files is compared with the manifest stored
+in the live asset release on the server. A new release is created by
+hardlinking the previous one (`cp -al`), files that changed or disappeared
+are unlinked from it, and only the changed files are uploaded - in
+parallel, over several SFTP sessions multiplexed on one SSH connection.
+`current` is then switched atomically and old releases are removed, so
+files no longer referenced by any kept release are freed.
+
+Content-hashed files under media/ are never removed with their source:
+pages already loaded and the bundle releases deploy_bundle.py can roll back
+to still request the old URLs. They are carried into each new release while
+one of the kept releases (KEEP_RELEASES) still published them, and only
+the files listed in the current asset-manifest.ts count as published.
+
+Layout on the server:
+    /var/www/portal/assets/releases/<stamp>/{manifest.json, animals/, ...}
+    /var/www/portal/assets/current -> releases/<stamp>
+"""
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import paramiko
+
+from deploy_log import DeployLog
+
+# reconfigure rather than rewrap: deploy_bundle.py imports this module
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+# CI passes the host and a deploy key through the environment
+HOST = os.environ.get('PORTAL_SSH_HOST') or '109.73.199.60'
+USERNAME = os.environ.get('PORTAL_SSH_USER') or 'root'
+PASSWORD = 'eaACMy*w+5L+_w'
+SSH_PORT = int(os.environ.get('PORTAL_SSH_PORT') or 22)
+SSH_KEY_FILE = os.environ.get('PORTAL_SSH_KEY_FILE')
+
+PUBLIC_DIR = Path(__file__).resolve().parent / 'ScreenCreator' / 'client' / 'public'
+PUBLISH_SCRIPT = Path(__file__).resolve().parent / 'ScreenCreator' / 'scripts' / 'publish_assets.py'
+ASSET_MANIFEST_TS = Path(__file__).resolve().parent / 'ScreenCreator' / 'client' / 'src' / 'lib' / 'asset-manifest.ts'
+HASHED_DIR = 'media'
+
+# Heavy media directories that are synced here instead of being shipped
+# with every build (deploy_bundle.py links them into each release).
+# media/ holds the content-hashed copies written by scripts/publish_assets.py.
+ASSET_DIRS = ['animals', 'audio', 'auditory-test', 'media', 'syllables', 'vocabulary', 'word-images']
+
+REMOTE_ASSETS = '/var/www/portal/assets'
+REMOTE_RELEASES = f'{REMOTE_ASSETS}/releases'
+REMOTE_ASSETS_CURRENT = f'{REMOTE_ASSETS}/current'
+MANIFEST_NAME = 'manifest.json'
+# As many as deploy_bundle.py keeps, so a rollback finds its hashed media
+KEEP_RELEASES = 5
+UPLOAD_WORKERS = 8
+
+
+def ssh_connect(client):
+    """Connect with the deploy key when one is given, else with the password."""
+    auth = {'key_filename': SSH_KEY_FILE} if SSH_KEY_FILE else {'password': PASSWORD}
+    client.connect(HOST, port=SSH_PORT, username=USERNAME, timeout=30, **auth)
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def published_urls():
+    """Hashed media paths the current asset-manifest.ts points at."""
+    text = ASSET_MANIFEST_TS.read_text(encoding='utf-8') if ASSET_MANIFEST_TS.exists() else ''
+    return {url.lstrip('/') for url in re.findall(r'\{ url: "([^"]+)"', text)}
+
+
+def build_local_manifest():
+    manifest = {}
+    published = published_urls()
+    for top in ASSET_DIRS:
+        root = PUBLIC_DIR / top
+        if not root.exists():
+            continue
+        for path in sorted(root.rglob('*')):
+            if path.is_file():
+                rel = path.relative_to(PUBLIC_DIR).as_posix()
+                # Superseded hashed copies stay on disk; the server decides their retention
+                if top == HASHED_DIR and rel not in published:
+                    continue
+                manifest[rel] = {'sha256': file_sha256(path), 'size': path.stat().st_size}
+    return manifest
+
+
+def release_stamps(log, client):
+    """(existing release stamps, stamp of the live release)."""
+    _, output, _ = log.exec(
+        client, 'list releases',
+        f"ls -1 {REMOTE_RELEASES} 2>/dev/null | grep -v '\\.partial$'; "
+        f"echo @@; basename \"$(readlink -f {REMOTE_ASSETS_CURRENT})\" 2>/dev/null"
+    )
+    stamps, _, current = output.partition('@@')
+    return sorted(stamps.split()), current.strip()
+
+
+def carry_hashed(remote, removed, kept, current_stamp):
+    """Hashed files gone locally that a kept release still published."""
+    carried = {}
+    for rel in removed:
+        published = remote[rel].get('published', current_stamp)
+        if rel.startswith(HASHED_DIR + '/') and published in kept:
+            carried[rel] = {**remote[rel], 'published': published}
+    return carried
+
+
+def fetch_remote_manifest(log, client, verify):
+    """Return the manifest of the live release ({} when there is none)."""
+    if verify:
+        # Rebuild from disk instead of trusting manifest.json
+        cmd = (
+            f"cd {REMOTE_ASSETS_CURRENT} 2>/dev/null && "
+            f"find . -type f ! -name {MANIFEST_NAME} -printf '%s %P\\0' | "
+            f"while IFS=' ' read -r -d '' size rel; do "
+            f"printf '%s %s %s\\n' \"$(sha256sum \"$rel\" | cut -d' ' -f1)\" \"$size\" \"$rel\"; done"
+        )
+        _, output, _ = log.exec(client, 'hash remote', cmd, timeout=600)
+        manifest = {}
+        for line in output.splitlines():
+            digest, size, rel = line.split(' ', 2)
+            manifest[rel] = {'sha256': digest, 'size': int(size)}
+        return manifest
+
+    _, output, _ = log.exec(client, 'fetch manifest', f"cat {REMOTE_ASSETS_CURRENT}/{MANIFEST_NAME} 2>/dev/null")
+    return json.loads(output) if output.strip() else {}
+
+
+def diff_manifests(local, remote):
+    changed = [rel for rel, entry in local.items() if remote.get(rel, {}).get('sha256') != entry['sha256']]
+    removed = [rel for rel in remote if rel not in local]
+    return sorted(changed), sorted(removed)
+
+
+def upload_files(transport, release_dir, files, workers):
+    """Upload files over `workers` SFTP sessions sharing one transport."""
+    sessions = [paramiko.SFTPClient.from_transport(transport) for _ in range(min(workers, len(files)))]
+    free = list(sessions)
+
+    def put(rel):
+        sftp = free.pop()
+        try:
+            sftp.put(str(PUBLIC_DIR / rel), posixpath.join(release_dir, rel))
+        finally:
+            free.append(sftp)
+        return rel
+
+    uploaded = 0
+    try:
+        with ThreadPoolExecutor(max_workers=len(sessions)) as pool:
+            for future in as_completed(pool.submit(put, rel) for rel in files):
+                future.result()
+                uploaded += 1
+                print(f"\r  Uploaded {uploaded}/{len(files)}", end='', flush=True)
+        print()
+    finally:
+        for sftp in sessions:
+            sftp.close()
+
+
+def sync_assets(verify=False, dry_run=False, workers=UPLOAD_WORKERS):
+    log = DeployLog('sync_assets', HOST)
+    print(">>> Publishing content-hashed media...")
+    with log.step('publish assets') as info:
+        info['exit_status'] = subprocess.run([sys.executable, str(PUBLISH_SCRIPT)]).returncode
+    if info['exit_status'] != 0:
+        print("ERROR: publish_assets.py failed")
+        log.finish(False)
+        return False
+
+    print(f"\n>>> Hashing {PUBLIC_DIR}...")
+    started = time.time()
+    with log.step('hash local') as info:
+        local = build_local_manifest()
+        info['files'] = len(local)
+    total_size = sum(e['size'] for e in local.values())
+    print(f"  {len(local)} files, {total_size / 1024 / 1024:.1f} MB in {time.time() - started:.1f}s")
+
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+    try:
+        ssh_connect(client)
+        print("Connected!")
+
+        print("\n>>> Fetching server manifest...")
+        remote = fetch_remote_manifest(log, client, verify)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        stamps, current_stamp = release_stamps(log, client)
+        # Releases left after this sync's garbage collection
+        kept = set(sorted(stamps + [stamp])[-KEEP_RELEASES:])
+        changed, removed = diff_manifests(local, remote)
+        carried = carry_hashed(remote, removed, kept, current_stamp)
+        removed = [rel for rel in removed if rel not in carried]
+        changed_size = sum(local[rel]['size'] for rel in changed)
+        print(f"  {len(remote)} files on server")
+        print(f"  {len(changed)} changed ({changed_size / 1024 / 1024:.1f} MB), {len(removed)} removed, "
+              f"{len(carried)} superseded hashed files kept")
+
+        if not changed and not removed and remote:
+            print("\n=== Assets already up to date ===")
+            log.finish(True)
+            return True
+        if dry_run:
+            for rel in changed:
+                print(f"  M {rel}")
+            for rel in removed:
+                print(f"  D {rel}")
+            return True
+
+        release_dir = f"{REMOTE_RELEASES}/{stamp}"
+        print(f"\n>>> Preparing {release_dir} (hardlinking previous release)...")
+        exit_status, _, error = log.exec(
+            client, 'hardlink release',
+            f"mkdir -p {REMOTE_RELEASES} && "
+            f"if [ -d {REMOTE_ASSETS_CURRENT}/ ]; then cp -al {REMOTE_ASSETS_CURRENT}/. {release_dir}.partial; "
+            f"else mkdir {release_dir}.partial; fi"
+        )
+        if exit_status != 0:
+            print(f"ERROR: {error[-500:]}")
+            log.finish(False)
+            return False
+        staging = f"{release_dir}.partial"
+
+        # Changed files must be unlinked before upload: writing into a
+        # hardlinked inode would modify the live release as well.
+        stale = changed + removed
+        if stale:
+            log.exec(client, 'unlink stale', f"cd {staging} && xargs -0 rm -f", stdin_data='\0'.join(stale))
+        dirs = sorted({posixpath.dirname(rel) for rel in changed})
+        if dirs:
+            log.exec(client, 'mkdir', f"cd {staging} && xargs -0 mkdir -p", stdin_data='\0'.join(dirs))
+
+        if changed:
+            print(f"\n>>> Uploading {len(changed)} files with {workers} parallel streams...")
+            started = time.time()
+            with log.step('upload', host=HOST) as info:
+                upload_files(client.get_transport(), staging, changed, workers)
+                info.update(files=len(changed), bytes_sent=changed_size)
+            elapsed = time.time() - started
+            print(f"  {changed_size / 1024 / 1024:.1f} MB in {elapsed:.1f}s")
+
+        print("\n>>> Writing manifest and switching current...")
+        manifest = {rel: {**entry, 'published': stamp} for rel, entry in local.items()}
+        manifest.update(carried)
+        manifest_json = json.dumps(manifest, indent=0, sort_keys=True)
+        log.exec(client, 'write manifest', f"cat > {staging}/{MANIFEST_NAME}", stdin_data=manifest_json)
+        exit_status, _, error = log.exec(
+            client, 'switch current',
+            f"find {staging} -depth -type d -empty -delete; "
+            f"mv {staging} {release_dir} && "
+            f"ln -sfn {release_dir} {REMOTE_ASSETS_CURRENT}.next && "
+            f"mv -Tf {REMOTE_ASSETS_CURRENT}.next {REMOTE_ASSETS_CURRENT}"
+        )
+        if exit_status != 0:
+            print(f"ERROR: {error[-500:]}")
+            log.finish(False)
+            return False
+
+        print(f"\n>>> Garbage-collecting old releases (keeping {KEEP_RELEASES})...")
+        log.exec(
+            client, 'gc releases',
+            f"rm -rf {REMOTE_RELEASES}/*.partial; "
+            f"ls -1dt {REMOTE_RELEASES}/*/ | tail -n +{KEEP_RELEASES + 1} | xargs -r rm -rf"
+        )
+        _, output, _ = log.exec(client, 'du', f"du -sh {REMOTE_RELEASES} | cut -f1")
+        print(f"  Asset store size: {output.strip()}")
+
+        print("\n=== Asset sync complete ===")
+        log.finish(True)
+        return True
+
+    except Exception as e:
+        print(f"Error: {e}")
+        log.finish(False)
+        return False
+    finally:
+        client.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Delta-sync client/public media to the server")
+    parser.add_argument('--verify', action='store_true', help="hash files on the server instead of trusting its manifest")
+    parser.add_argument('--dry-run', action='store_true', help="only list what would be transferred")
+    parser.add_argument('--workers', type=int, default=UPLOAD_WORKERS, help="parallel SFTP streams")
+    args = parser.parse_args()
+    sys.exit(0 if sync_assets(args.verify, args.dry_run, args.workers) else 1)